@@ -23,7 +23,8 @@ from betse.util.cli.clicmd import (
     CLISubcommandYAMLOnly,
 )
 from betse.util.cli.clicmdabc import CLISubcommandableABC
-from betse.util.cli.cliopt import CLIOptionBoolTrue
+from betse.util.cli.cliopt import (
+    CLIOptionArgInt, CLIOptionArgStr, CLIOptionBoolTrue)
 from betse.util.io.log import logs
 from betse.util.os import displays
 from betse.util.path import files, pathnames
@@ -37,10 +38,21 @@ class BetseCLI(CLISubcommandableABC):
 
     Attributes (of :attr:`_args`)
     ----------
+    baseline : str
+        Filename of the JSON file saved by a prior benchmark against which the
+        ``bench`` subcommand compares its results *or* the empty string if no
+        comparison is requested. Defaults to the empty string.
     is_headless : bool
         ``True`` only if the active Python interpreter is to be coerced into
         running **headless** (i.e., with *no* access to a GUI display).
         Defaults to ``False``.
+    is_resume : bool
+        ``True`` only if the ``sim`` subcommand is to resume an interrupted
+        simulation from its most recent checkpoint. Defaults to ``False``.
+    jobs : int
+        Maximum number of processes with which the ``sweep`` subcommand
+        simulates and the ``plot init`` and ``plot sim`` subcommands export in
+        parallel, where 0 implies one process per processor.
     '''
 
     # ..................{ SUPERCLASS ~ property : commands  }..................
@@ -102,7 +114,22 @@ Simulate the previously initialized cell cluster defined by the passed
 configuration file. Simulation results will be saved to output files defined by
 this configuration, while the previously initialized cell cluster will be loaded
 from input files defined by this configuration.
-''',),
+
+If the "checkpoint interval" option of this configuration is positive, the
+simulation is periodically checkpointed to the simulation output directory. If
+passed "--resume", an interrupted simulation resumes from its most recent
+checkpoint rather than from the beginning.
+''',
+                    options=(
+                        CLIOptionBoolTrue(
+                            long_name='--resume',
+                            synopsis=(
+                                'resume an interrupted simulation from its '
+                                'most recent checkpoint if any'
+                            ),
+                        ),
+                    ),
+                ),
 
 
                 CLISubcommandYAMLOnly(
@@ -121,6 +148,89 @@ defined by this configuration.
 ''',),
 
 
+                CLISubcommandYAMLOnly(
+                    name='sweep',
+                    help_synopsis=(
+                        'simulate a config file across a parameter grid'),
+                    help_description='''
+Simulate the base configuration file referenced by the passed parameter sweep
+file at each point of the parameter grid defined by that file, running up to
+"--jobs" simulations in parallel. For example, given a sweep file
+"my_sweep.yaml" in the current directory resembling:
+
+;    sim config: my_sim.yaml
+;    sweep directory: SWEEP
+;    parameters:
+;      internal parameters/alpha_NaK: [5.0e-8, 1.0e-7, 2.0e-7]
+;      variable settings/gap junctions/gap junction surface area: [0.01, 0.1]
+
+the following command simulates all six combinations of these values:
+
+;    betse sweep my_sweep.yaml
+
+Each key of the "parameters" mapping is the "/"-delimited path of a base
+configuration option. Each combination is simulated from its own copy of that
+configuration saved to its own "run_"-prefixed subdirectory of the sweep
+directory. If no swept option affects the cell cluster, all runs share a
+single seed; if all swept options only affect the simulation phase (e.g.,
+scheduled interventions), all runs also share a single initialization.
+
+Summary metrics of each run (e.g., final mean Vmem) are tabulated to the
+"sweep_summary.csv" file of the sweep directory.
+''',
+                    options=(
+                        CLIOptionArgInt(
+                            long_name='--jobs',
+                            synopsis=(
+                                'maximum number of simulations to run in '
+                                'parallel (0 for one per processor) '
+                                '[default: {default}]'
+                            ),
+                            default_value=0,
+                        ),
+                    ),
+                ),
+
+
+                CLISubcommandYAMLOnly(
+                    name='bench',
+                    help_synopsis=(
+                        'benchmark each phase of a config file'),
+                    help_description='''
+Benchmark the wall time and peak memory of the seed, initialization,
+simulation, and export phases of the passed configuration file, each run in its
+own subprocess. This file is either a simulation configuration benchmarked as
+is or a benchmark file resembling:
+
+;    sim config: my_sim.yaml
+;    bench directory: BENCH
+;    phases: [seed, init, sim, plot]
+;    parameters:
+;      world options/world size: [100e-6, 200e-6, 400e-6]
+;      general options/simulate extracellular spaces: [False, True]
+
+which benchmarks all six combinations of these values. Each key of the
+"parameters" mapping is the "/"-delimited path of a base configuration option.
+Each combination is benchmarked from its own copy of that configuration saved to
+its own "run_"-prefixed subdirectory of the bench directory.
+
+Results are saved to a "bench_"-prefixed JSON file of the bench directory named
+by the current Git commit (if any). If passed "--baseline", these results are
+also compared against those of the passed JSON file saved by a prior benchmark.
+''',
+                    options=(
+                        CLIOptionArgStr(
+                            long_name='--baseline',
+                            synopsis=(
+                                'JSON file of a prior benchmark to compare '
+                                'results against'
+                            ),
+                            default_value='',
+                        ),
+                    ),
+                ),
+
+
                 CLISubcommandParent(
                     name='plot',
                     help_synopsis=(
@@ -221,7 +331,23 @@ Plot the previously initialized cell cluster defined by the passed configuration
 file. Plot results will be saved to output files defined by this configuration,
 while the previously initialized cell cluster will be loaded from input files
 defined by this configuration.
-''',),
+
+If passed "--jobs", plots, animations, and CSV files are exported in parallel
+by that many forked processes rather than serially by the current process.
+Exports are always serial when displayed rather than only saved.
+''',
+                    options=(
+                        CLIOptionArgInt(
+                            long_name='--jobs',
+                            synopsis=(
+                                'maximum number of processes to export in '
+                                'parallel (0 for one per processor) '
+                                '[default: {default}]'
+                            ),
+                            default_value=1,
+                        ),
+                    ),
+                ),
 
 
                 CLISubcommandYAMLOnly(
@@ -233,8 +359,23 @@ Plot the previously simulated cell cluster defined by the passed configuration
 file. Plot results will be saved to output files defined by this configuration,
 while the previously simulated cell cluster will be loaded from input files
 defined by this configuration.
+
+If passed "--jobs", plots, animations, and CSV files are exported in parallel
+by that many forked processes rather than serially by the current process.
+Exports are always serial when displayed rather than only saved.
 ''',
-            ),
+                    options=(
+                        CLIOptionArgInt(
+                            long_name='--jobs',
+                            synopsis=(
+                                'maximum number of processes to export in '
+                                'parallel (0 for one per processor) '
+                                '[default: {default}]'
+                            ),
+                            default_value=1,
+                        ),
+                    ),
+                ),
 
 
                 CLISubcommandYAMLOnly(
@@ -306,6 +447,33 @@ from input files defined by this configuration.
         # Create and return a simulation runner for this configuration.
         return SimRunner(p=p)
 
+    @property
+    def _jobs(self) -> int:
+        '''
+        Maximum number of processes to run in parallel passed to the
+        ``--jobs`` option of the current subcommand, where 0 signifies one
+        process per processor.
+
+        Raises
+        ----------
+        BetseCLIArgException
+            If this number is negative.
+        '''
+
+        # Defer heavyweight imports.
+        from betse.exceptions import BetseCLIArgException
+
+        # If this number is negative, raise an exception.
+        if self._args.jobs < 0:
+            raise BetseCLIArgException(
+                'Option "--jobs" value {} invalid '
+                '(i.e., neither 0 for one process per processor '
+                'nor a positive number of processes).'.format(
+                    self._args.jobs))
+
+        # Else, return this number.
+        return self._args.jobs
+
     # ..................{ SUBCOMMANDS                       }..................
     def _do_info(self) -> None:
         '''
@@ -340,6 +508,11 @@ from input files defined by this configuration.
         else:
             self._do_config()
 
+        # Default all options accepted by the subcommands run below, which the
+        # "try" subcommand itself does *NOT* accept.
+        self._args.is_resume = False
+        self._args.jobs = 1
+
         # Run all general-purposes phases, thus excluding network-isolated
         # phases (e.g., "_do_sim_grn"), in the expected order.
         self._do_seed()
@@ -388,7 +561,7 @@ from input files defined by this configuration.
         Run the ``sim`` subcommand and return the result of doing so.
         '''
 
-        return self._sim_runner.sim()
+        return self._sim_runner.sim(resume=self._args.is_resume)
 
 
     def _do_sim_grn(self) -> object:
@@ -399,6 +572,34 @@ from input files defined by this configuration.
         return self._sim_runner.sim_grn()
 
 
+    def _do_sweep(self) -> object:
+        '''
+        Run the ``sweep`` subcommand and return the result of doing so.
+        '''
+
+        # Defer heavyweight imports.
+        from betse.science import simsweep
+
+        return simsweep.sweep_conf(
+            conf_filename=self._args.conf_filename,
+            jobs=self._jobs or None,
+        )
+
+
+    def _do_bench(self) -> object:
+        '''
+        Run the ``bench`` subcommand and return the result of doing so.
+        '''
+
+        # Defer heavyweight imports.
+        from betse.science import simbench
+
+        return simbench.bench_conf(
+            conf_filename=self._args.conf_filename,
+            baseline_filename=self._args.baseline or None,
+        )
+
+
     def _do_plot_seed(self) -> object:
         '''
         Run the ``plot`` subcommand's ``seed`` subcommand and return the result
@@ -414,7 +615,7 @@ from input files defined by this configuration.
         of doing so.
         '''
 
-        return self._sim_runner.plot_init()
+        return self._sim_runner.plot_init(jobs=self._jobs)
 
 
     def _do_plot_sim(self) -> object:
@@ -423,7 +624,7 @@ from input files defined by this configuration.
         of doing so.
         '''
 
-        return self._sim_runner.plot_sim()
+        return self._sim_runner.plot_sim(jobs=self._jobs)
 
 
     def _do_plot_sim_grn(self) -> object:
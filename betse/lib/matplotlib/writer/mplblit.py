@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Matplotlib-specific **blitting** (i.e., rendering only the artists changing
+between animation frames over a cached rendering of all remaining artists)
+facilities, writing the resulting raw RGBA frames directly to animation writers
+rather than indirectly via the :meth:`Figure.savefig` method.
+'''
+
+# ....................{ IMPORTS                           }....................
+import numpy as np
+from betse.exceptions import BetseMatplotlibException
+from betse.lib.matplotlib.writer.mplcls import ImageMovieWriter
+from betse.util.type.types import type_check
+from contextlib import contextmanager
+from matplotlib.animation import FileMovieWriter, MovieWriter
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from numpy import ndarray
+
+# ....................{ CLASSES                           }....................
+class FigureBlitter(object):
+    '''
+    **Figure blitter** (i.e., renderer of the frames of an animation whose
+    figure contains exactly one animated axes), rendering all static artists of
+    this figure exactly once and only the dynamic artists of these axes for
+    each frame.
+
+    **Static artists** are all artists of this figure *except* the dynamic
+    artists of these axes, including the spines, ticks, tick labels, and axis
+    labels of these axes as well as *all* artists of all other axes (e.g., the
+    colorbar) and of this figure itself (e.g., the figure supertitle). Static
+    artists are assumed to remain unchanged across all frames.
+
+    **Dynamic artists** are all remaining artists of these axes, including the
+    axes title and all artists added by layers (e.g., cell mosaics, streamlines,
+    cell labels). Since layers may replace rather than update these artists on
+    each frame, these artists are rediscovered on each frame.
+
+    Static artists of the animated axes overlaying dynamic artists (e.g.,
+    spines bordering a cell mosaic) are rendered with these dynamic artists in
+    z-order for each frame, preserving the appearance of a full rendering.
+
+    Attributes
+    ----------
+    _axes : Axes
+        Animated axes of this figure.
+    _background : object
+        Backend-specific opaque object encapsulating the cached rendering of
+        all static artists of this figure if the first frame has already been
+        rendered *or* ``None`` otherwise.
+    _figure : Figure
+        Figure to be rendered.
+    _artists_overlay : frozenset
+        Set of all static artists of the animated axes overlaying (i.e., with
+        z-orders exceeding that of) one or more dynamic artists of these axes
+        if the first frame has already been rendered *or* ``None`` otherwise.
+        These artists are rendered for each frame.
+    _artists_static : frozenset
+        Set of all static artists of the animated axes *except* the background
+        patch of these axes, which is unconditionally rendered first.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        figure: Figure,
+        axes: Axes,
+        dpi: int,
+        is_transparent: bool,
+    ) -> None:
+        '''
+        Initialize this blitter.
+
+        Parameters
+        ----------
+        figure : Figure
+            Figure to be rendered.
+        axes : Axes
+            Animated axes of this figure.
+        dpi : int
+            Dots per inch (DPI) of each frame to be rendered.
+        is_transparent : bool
+            ``True`` only if painting frame backgrounds transparently rather
+            than as a solid color, equivalent to passing the ``transparent``
+            parameter to the :meth:`Figure.savefig` method.
+        '''
+
+        # Classify all passed parameters.
+        self._figure = figure
+        self._axes = axes
+
+        # Default all remaining attributes.
+        self._background = None
+        self._artists_overlay = None
+        self._artists_static = frozenset(
+            (axes.xaxis, axes.yaxis) + tuple(axes.spines.values()))
+
+        # Render all frames at this DPI. Since frames are rendered by this
+        # figure's canvas rather than by the Figure.savefig() method, the DPI
+        # of this figure itself *MUST* be permanently set.
+        figure.set_dpi(dpi)
+
+        # If painting frame backgrounds transparently, do so permanently in
+        # the same manner as the Figure.savefig() method does so temporarily.
+        if is_transparent:
+            for patch in (figure.patch,) + tuple(
+                figure_axes.patch for figure_axes in figure.axes):
+                patch.set_facecolor('none')
+                patch.set_edgecolor('none')
+
+    # ..................{ RENDERERS                         }..................
+    def render(self) -> ndarray:
+        '''
+        Render the current frame of this figure, returning a read-only view of
+        the resulting raw RGBA pixel buffer as a three-dimensional Numpy array
+        whose shape is ``(height, width, 4)``.
+
+        If this is the first frame to be rendered, this method first renders
+        and caches all static artists of this figure. Else, this method
+        restores that cached rendering. In either case, this method then
+        renders only the dynamic artists of the animated axes over that
+        rendering. Since this view is overwritten by the next call to this
+        method, callers should write this view before doing so.
+        '''
+
+        # Canvas of this figure.
+        canvas = self._figure.canvas
+
+        # Dynamic artists of the animated axes for this frame.
+        artists_dynamic = self._get_artists_dynamic()
+
+        # If this is the first frame, render all static artists by rendering
+        # the entire figure with all dynamic artists temporarily excluded.
+        if self._background is None:
+            with _excluding_artists(artists_dynamic):
+                canvas.draw()
+
+            # Cache this rendering for all subsequent frames.
+            self._background = canvas.copy_from_bbox(self._figure.bbox)
+        # Else, restore this rendering.
+        else:
+            canvas.restore_region(self._background)
+
+        # Render all dynamic artists over this rendering in z-order.
+        for artist in sorted(artists_dynamic, key=lambda a: a.get_zorder()):
+            self._axes.draw_artist(artist)
+
+        # Return a view of this canvas' pixel buffer.
+        return np.asarray(canvas.buffer_rgba())
+
+    # ..................{ PRIVATE ~ getters                 }..................
+    def _get_artists_dynamic(self) -> list:
+        '''
+        List of all visible dynamic artists of the animated axes for the
+        current frame, including all static artists of these axes overlaying
+        any such dynamic artist.
+
+        Since static artists of these axes (e.g., spines, ticks) may overlay
+        dynamic artists (e.g., cell mosaics), these static artists are excluded
+        from the cached rendering of static artists and instead rendered with
+        these dynamic artists in z-order, preserving the rendering order of a
+        full rendering of this figure.
+        '''
+
+        # List of all visible artists of these axes for this frame.
+        artists = [
+            artist for artist in self._axes.get_children()
+            if artist.get_visible() and artist is not self._axes.patch]
+
+        # If the static artists overlaying dynamic artists have yet to be
+        # decided (i.e., this is the first frame), decide these artists. To
+        # guarantee that the same artists excluded from the cached rendering
+        # are rendered for all subsequent frames, these artists are decided
+        # only once.
+        if self._artists_overlay is None:
+            zorder_min = min((
+                artist.get_zorder() for artist in artists
+                if artist not in self._artists_static), default=None)
+            self._artists_overlay = frozenset(
+                artist for artist in self._artists_static
+                if zorder_min is not None and artist.get_zorder() > zorder_min)
+
+        # Return all visible dynamic and overlaying static artists.
+        return [
+            artist for artist in artists
+            if (artist not in self._artists_static or
+                artist in self._artists_overlay)
+        ]
+
+# ....................{ TESTERS                           }....................
+@type_check
+def is_writer_rgba(writer: MovieWriter) -> bool:
+    '''
+    ``True`` only if the passed animation writer accepts raw RGBA frames
+    rendered by a :class:`FigureBlitter` via the :func:`grab_frame_rgba`
+    function.
+
+    Specifically, this function returns ``True`` only if this writer either:
+
+    * Is a :class:`ImageMovieWriter` writing raster images supported by the
+      :meth:`ImageMovieWriter.grab_frame_rgba` method.
+    * Pipes raw RGBA frames to the standard input of an external encoder
+      subprocess (e.g., :class:`matplotlib.animation.FFMpegWriter`) rather
+      than writing temporary image files to be encoded after the fact (e.g.,
+      :class:`matplotlib.animation.FFMpegFileWriter`).
+    '''
+
+    # If this writer writes images, defer to this writer.
+    if isinstance(writer, ImageMovieWriter):
+        return writer.is_frame_rgba
+    # Else, this writer encodes video.
+    else:
+        return (
+            not isinstance(writer, FileMovieWriter) and
+            writer.frame_format == 'rgba'
+        )
+
+# ....................{ WRITERS                           }....................
+@type_check
+def grab_frame_rgba(writer: MovieWriter, frame_rgba: ndarray) -> None:
+    '''
+    Write the passed raw RGBA frame to the passed animation writer.
+
+    Unlike the :meth:`MovieWriter.grab_frame` method, this function writes
+    this frame as is rather than rendering the figure of this writer.
+
+    Parameters
+    ----------
+    writer : MovieWriter
+        Animation writer satisfying the :func:`is_writer_rgba` tester.
+    frame_rgba : ndarray
+        Three-dimensional Numpy array whose shape is ``(height, width, 4)``,
+        typically returned by the :meth:`FigureBlitter.render` method.
+
+    Raises
+    ----------
+    BetseMatplotlibException
+        If the dimensions of this frame differ from the frame size of this
+        writer (e.g., due to this writer having been setup with a different
+        DPI than this frame was rendered at).
+    '''
+
+    # If this writer writes images, defer to this writer.
+    if isinstance(writer, ImageMovieWriter):
+        writer.grab_frame_rgba(frame_rgba)
+        return
+
+    # Width and height in pixels of this frame.
+    frame_size = (frame_rgba.shape[1], frame_rgba.shape[0])
+
+    # If this frame is *NOT* of the size this writer's encoder expects, raise
+    # an exception. Silently writing this frame would corrupt this video.
+    if frame_size != writer.frame_size:
+        raise BetseMatplotlibException(
+            'Frame size {} differs from video frame size {}.'.format(
+                frame_size, writer.frame_size))
+
+    # Pipe this frame to the standard input of this writer's encoder.
+    writer._proc.stdin.write(frame_rgba.tobytes())
+
+# ....................{ PRIVATE ~ context managers        }....................
+@contextmanager
+def _excluding_artists(artists: list):
+    '''
+    Context manager temporarily excluding all passed artists from full
+    renderings of their figure for the duration of this context.
+
+    These artists are marked as animated rather than hidden, as Matplotlib
+    still lays out animated artists. Hiding axes titles instead would displace
+    these titles on the next full rendering. Since Matplotlib renders animated
+    images regardless, images are hidden instead.
+    '''
+
+    # Exclude these artists.
+    for artist in artists:
+        if isinstance(artist, AxesImage):
+            artist.set_visible(False)
+        else:
+            artist.set_animated(True)
+
+    # Yield control to the body of the caller's "with" block.
+    try:
+        yield
+    # Include these artists even if that block raised an exception.
+    finally:
+        for artist in artists:
+            artist.set_visible(True)
+            artist.set_animated(False)
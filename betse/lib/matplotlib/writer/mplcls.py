@@ -14,6 +14,17 @@ from betse.exceptions import BetseMatplotlibException
 from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
 from matplotlib.animation import writers, MovieWriter
+from numpy import ndarray
+
+# ....................{ CONSTANTS                          }....................
+_FRAME_FORMATS_RGBA = frozenset(('png', 'tif', 'tiff', 'webp',))
+'''
+Set of all filetypes of raster images to which the
+:meth:`ImageMovieWriter.grab_frame_rgba` method writes raw RGBA frames
+directly, identical to the filetypes for which the Agg backend's
+:meth:`Figure.savefig` implementation defers to :func:`matplotlib.image.imsave`
+on the RGBA buffer of the rendered figure without further processing.
+'''
 
 # ....................{ CLASSES                            }....................
 @writers.register('noop')
@@ -117,6 +128,16 @@ class ImageMovieWriter(NoopMovieWriter):
         0-based index of the next frame to be written.
     '''
 
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def is_frame_rgba(self) -> bool:
+        '''
+        ``True`` only if the :meth:`grab_frame_rgba` method supports the
+        filetype of the frames written by this writer.
+        '''
+
+        return self.frame_format in _FRAME_FORMATS_RGBA
+
     # ..................{ SUPERCLASS                        }..................
     def setup(self, *args, **kwargs) -> None:
         '''
@@ -238,3 +259,52 @@ class ImageMovieWriter(NoopMovieWriter):
             dpi=self.dpi,
             **kwargs
         )
+
+
+    def grab_frame_rgba(self, frame_rgba: ndarray) -> None:
+        '''
+        Write the passed raw RGBA frame to the image file defined by the
+        current filename template.
+
+        Unlike the :meth:`grab_frame` method, this method writes this frame as
+        is rather than rendering the current figure via the
+        :meth:`Figure.savefig` method. Callers are responsible for rendering
+        this frame at the DPI this writer was setup with (e.g., with the
+        :class:`betse.lib.matplotlib.writer.mplblit.FigureBlitter` class).
+
+        Parameters
+        ----------
+        frame_rgba : ndarray
+            Three-dimensional Numpy array whose shape is ``(height, width, 4)``.
+
+        Raises
+        ----------
+        BetseMatplotlibException
+            If the :attr:`is_frame_rgba` property is ``False``.
+        '''
+
+        # Defer heavyweight imports.
+        from matplotlib import image
+
+        # If this filetype is unsupported, raise an exception.
+        if not self.is_frame_rgba:
+            raise BetseMatplotlibException(
+                'Frame filetype "{}" unsupported for raw RGBA frames '
+                '(i.e., not in "{}").'.format(
+                    self.frame_format, str(sorted(_FRAME_FORMATS_RGBA))))
+
+        # Filename of the current frame to be written.
+        frame_filename = self.outfile.format(self._frame_number)
+
+        # Increment the number of the next frame to be written.
+        self._frame_number += 1
+
+        # Write the current frame exactly as the Figure.savefig() method
+        # writes the RGBA buffer of the Agg backend for these filetypes.
+        image.imsave(
+            frame_filename,
+            frame_rgba,
+            format=self.frame_format,
+            origin='upper',
+            dpi=self.dpi,
+        )
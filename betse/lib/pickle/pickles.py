@@ -103,8 +103,9 @@ class BetsePickler(dill.Pickler):
         # attribute is accessed directly below rather than indirectly via the
         # vars() builtin. While feasible, the latter is mildly less efficient.
         if hasattr(obj, '__dict__'):
-            # For the name of each such attribute...
-            for obj_attr_name in obj.__dict__.keys():
+            # For the name of each such attribute... Iterate over a copy of
+            # these names, as this iteration deletes attributes.
+            for obj_attr_name in tuple(obj.__dict__.keys()):
                 # If this attribute is prefixed by a substring implying this
                 # attribute to be a private instance variable to which some
                 # caching decorators (e.g., @property_cached) has cached the
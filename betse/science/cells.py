@@ -9,17 +9,20 @@ import numpy as np
 from numpy import ndarray
 from scipy import interpolate as interp
 from scipy.ndimage import gaussian_filter
-from scipy.spatial import cKDTree  # Voronoi
+from scipy import sparse
+from scipy.spatial import cKDTree, Delaunay  # Voronoi
 from betse.exceptions import BetseSequenceException, BetseSimConfException
 from betse.science import filehandling as fh
-from betse.science.enum.enumconf import CellLatticeType
+from betse.science.enum.enumconf import CellLatticeType, MatrixBackendType
 from betse.science.math import finitediff as fd
+from betse.science.math import matrices
 from betse.science.math import toolbox as tb
 # from betse.util.math.geometry.polygon.geopolyconvex import clip_counterclockwise
 # from betse.util.math.geometry.polygon.geopoly import orient_counterclockwise, is_convex
 from betse.science.phase.phasecls import SimPhase
 from betse.util.io.log import logs
-from betse.util.type.decorator.decmemo import property_cached
+from betse.util.type.decorator.decmemo import (
+    PROPERTY_CACHED_VAR_NAME_PREFIX, property_cached)
 from xml.dom import minidom
 from betse.util.type.types import (
     type_check, NumericOrSequenceTypes, SequenceTypes)
@@ -160,8 +163,11 @@ class Cells(object):
     num_mems : ndarray
         One-dimensional Numpy array indexing each cell such that each item
         is the number of cell membranes contained by the current cell.
-    M_sum_mems : ndarray
-        Numpy matrix (i.e., two-dimensional array) of size ``m x n``, where:
+    M_sum_mems : object
+        Matrix of size ``m x n`` whose representation (i.e., either a dense
+        Numpy array *or* a sparse SciPy CSR matrix) is dictated by the
+        :attr:`betse.science.parameters.Parameters.matrix_backend` setting
+        this cell cluster was seeded with, where:
 
         * `m` is the total number of cells.
         * `n` is the total number of cell membranes.
@@ -178,6 +184,8 @@ class Cells(object):
         another Numpy vector of size ``m`` containing cell-specific data
         totalized for each cell over all membranes this cell contains, where
         ``m`` and ``n`` are as defined above.
+        Since this matrix may be sparse, this product *must* be computed as
+        ``M_sum_mems.dot(data)`` rather than ``np.dot(M_sum_mems, data)``.
 
     Attributes (Cell Membrane Vertices)
     ----------
@@ -374,6 +382,19 @@ class Cells(object):
         attribute (replacing "cell" with "Voronoi region").
     '''
 
+    # ..................{ CLASS CONSTANTS                   }..................
+    _MATRICES_CACHED_NAMES = (
+        'matrixMap2Verts',
+        'membranes_midpoint_to_cells_centre',
+        'gradTheta',
+        'lapGJmem_inv',
+        'divCell_inv',
+    )
+    '''
+    Tuple of the names of all properties lazily creating and caching matrices
+    evicted by the :meth:`evict_matrices` method.
+    '''
+
     # ..................{ INITIALIZERS                      }..................
     #FIXME: Refactor this method as follows:
     #
@@ -501,7 +522,8 @@ class Cells(object):
 
         # Avoid storing the non-inverse matrix, which only consumes memory.
         bdic = {'N': 'value', 'S': 'value', 'E': 'value', 'W': 'value'}
-        _, self.lapENVinv = self.grid_obj.makeLaplacian(bound=bdic)
+        _, self.lapENVinv = self.grid_obj.makeLaplacian(
+            bound=bdic, backend=phase.p.matrix_backend)
 
         # Notify the sink callback of the current state of progress.
         phase.callbacks.progressed_next(
@@ -509,7 +531,8 @@ class Cells(object):
 
         # Avoid storing the non-inverse matrix, which only consumes memory.
         bdic = {'N': 'flux', 'S': 'flux', 'E': 'flux', 'W': 'flux'}
-        _, self.lapENV_P_inv = self.grid_obj.makeLaplacian(bound=bdic)
+        _, self.lapENV_P_inv = self.grid_obj.makeLaplacian(
+            bound=bdic, backend=phase.p.matrix_backend)
 
         # Set all Laplacian matrices to "None" to allow for flexible creation
         # of Laplacians and inverses on the cell grid (i.e., two boundary
@@ -548,112 +571,8 @@ class Cells(object):
 
         #---------------------------------------------------
 
-        #FIXME: Uh oh! We're in Don't Repeat Yourself (DRY) trouble here. All
-        #or most of the following code appears to be duplicated verbatim from
-        #the cellVerts() method. Since this code is non-trivial and hence
-        #fragile, this is bad... Would it be feasible to simply call
-        #cellVerts() here? If not, how can we unify this logic? Max axolotl!
-
         # calculate basic properties such as volume, surface area, normals, etc for the cell array
-        self.cell_verts = []
-
-        for centre, poly in zip(self.cell_centres, ecm_verts):
-            pt_scale = []
-            for vert in poly:
-                pt_zero = vert - centre
-                pt_scale.append(p.scale_cell * pt_zero + centre)
-            self.cell_verts.append(np.asarray(pt_scale))
-
-        self.cell_verts = np.asarray(self.cell_verts)
-
-        mem_edges = []  # storage for membrane edge points
-        mem_length = []  # storage for membrane surface area values
-        mem_mids = []  # storage for membrane midpoints
-
-        # storage for various vector properties of membrane
-        cv_x = []
-        cv_y = []
-        cv_nx = []
-        cv_ny = []
-        cv_tx = []
-        cv_ty = []
-
-        for polyc in self.cell_verts:
-
-            #FIXME: Wouldn't the "mps" list of membrane midpoints be more
-            #efficiently calculatable via a single
-            #"mps = np.mean(mps, axis=0)" assignment rather than iteratively
-            #constructed via looping?
-
-            # Calculate individual membrane domains, midpoints, and vectors:
-            edge = []
-            mps = []
-            surfa = []
-
-            for i in range(0, len(polyc)):
-                pt1 = polyc[i - 1]
-                pt2 = polyc[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                edge.append([pt1, pt2])
-                mid = (pt1 + pt2) / 2  # midpoint calculation
-                mps.append(mid.tolist())
-
-                lgth = np.sqrt((pt2[0] - pt1[0]) ** 2 + (pt2[1] - pt1[1]) ** 2)  # length of membrane domain
-
-                # sa = lgth * p.cell_height  # surface area of membrane
-                surfa.append(lgth)
-
-                tang_a = pt2 - pt1  # tangent
-                tang = tang_a / np.linalg.norm(tang_a)
-                # normal = np.array([-tang[1],tang[0]])
-                normal = np.array([tang[1], -tang[0]])
-                cv_x.append(mid[0])
-                cv_y.append(mid[1])
-                cv_nx.append(normal[0])
-                cv_ny.append(normal[1])
-                cv_tx.append(tang[0])
-                cv_ty.append(tang[1])
-
-            mem_edges.append(edge)
-            mem_mids.append(mps)
-            mem_length.append(surfa)
-
-        self.mem_vects_flat = np.array([cv_x, cv_y, cv_nx, cv_ny, cv_tx, cv_ty]).T
-
-        # ---post processing and calculating peripheral structures-----------------------------------------------------
-
-        self.mem_mids_flat, indmap_mem, _ = tb.flatten(mem_mids)
-        self.mem_mids_flat = np.asarray(self.mem_mids_flat)  # convert the data structure to an array
-
-        # Finish up by creating indices vectors and converting to Numpy arrays
-        # where needed:
-        self.cell_i = [x for x in range(0, len(self.cell_centres))]
-        self.mem_i =  [x for x in range(0, len(self.mem_mids_flat))]
-
-        # convert mem_length into a flat vector
-        mem_length, _, _ = tb.flatten(mem_length)
-        mem_length = np.asarray(mem_length)
-
-        self.mem_sa = mem_length * p.cell_height
-
-        self.mem_edges_flat, _, _ = tb.flatten(mem_edges)
-        self.mem_edges_flat = np.asarray(self.mem_edges_flat)
-
-        # create a flattened version of cell_verts that will serve as membrane verts:
-        self.mem_verts, _, _ = tb.flatten(self.cell_verts)
-        self.mem_verts = np.asarray(self.mem_verts)
-
-        # structures for plotting interpolated data and streamlines:
-        self.plot_xy = np.vstack((self.mem_mids_flat, self.mem_verts))
-
-        # cell surface area:
-        self.cell_sa = []
-        for grp in self.cell_to_mems:
-            cell_sa = sum(self.mem_sa[grp])
-            self.cell_sa.append(cell_sa)
-
-        self.cell_sa = np.asarray(self.cell_sa)
+        self._make_membranes(p, ecm_verts)
 
         #------------------------------------------------------
         # next obtain the set of *unique* vertex points from the total ecm_verts arrangement:
@@ -1004,167 +923,29 @@ class Cells(object):
         self.gj_len = p.cell_space      # distance between gap junction (as "pipe length")
 
         # calculate basic properties such as volume, surface area, normals, etc for the cell array
-        self.cell_verts = []
-
-        for centre,poly in zip(self.cell_centres,self.ecm_verts):
-            pt_scale = []
-            for vert in poly:
-                pt_zero = vert - centre
-                pt_scale.append(p.scale_cell*pt_zero + centre)
-            self.cell_verts.append(np.asarray(pt_scale))
-
-        self.cell_verts = np.asarray(self.cell_verts, dtype=object)
-
-        # self.cell_vol = []   # storage for cell volumes
-        self.cell_sa = []    # whole cell surface areas
-        self.cell_area = []
-
-        mem_edges = []  # storage for membrane edge points
-        mem_length = []   # storage for membrane surface area values
-        mem_mids = []   # storage for membrane midpoints
-
-        # storage for various vector properties of membrane
-        cv_x=[]
-        cv_y=[]
-        cv_nx=[]
-        cv_ny=[]
-        cv_tx=[]
-        cv_ty=[]
-
-        for polyc in self.cell_verts:
-            # # First calculate individual cell volumes from cell vertices:
-            # poly = [x for x in reversed(polyc)]
-            # self.cell_vol.append(p.cell_height*tb.area(poly))
-
-            # Next calculate individual membrane domains, midpoints, and vectors:
-            edge = []
-            mps = []
-            surfa = []
-
-            for i in range(0,len(polyc)):
-                pt1 = polyc[i-1]
-                pt2 = polyc[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                edge.append([pt1,pt2])
-                mid = (pt1 + pt2)/2       # midpoint calculation
-                mps.append(mid.tolist())
-
-                lgth = np.sqrt((pt2[0] - pt1[0])**2 + (pt2[1]-pt1[1])**2)  # length of membrane domain
-                # sa = lgth*p.cell_height    # surface area of membrane
-                surfa.append(lgth)
-
-                tang_a = pt2 - pt1       # tangent
-                tang = tang_a/np.linalg.norm(tang_a)
-                # normal = np.array([-tang[1],tang[0]])
-                normal = np.array([tang[1],-tang[0]])
-                cv_x.append(mid[0])
-                cv_y.append(mid[1])
-                cv_nx.append(normal[0])
-                cv_ny.append(normal[1])
-                cv_tx.append(tang[0])
-                cv_ty.append(tang[1])
-
-            mem_edges.append(edge)
-            mem_mids.append(mps)
-            mem_length.append(surfa)
-
-        #FIXME: For readability, it would be great if we could extract the
-        #last four columns of this array into two new arrays with
-        #human-readable names resembling the "mem_mids_flat" array: e.g.,
-        #
-        #* "self.mem_norms_flat", providing the normal membrane unit vectors.
-        #* "self.mem_tangs_flat", providing the tangent membrane unit vectors.
-        #
-        #Currently, we reference these columns with non-human-readable magic
-        #numbers like "self.mem_vects_flat[:,3]", which is fairly hard to
-        #mentally parse when perusing the code. Calm qualms in an oceanic quay!
-        #FIXME: The first two columns of this array are exact duplicates of the
-        #first (and only) two columns of the "mem_mids_flat" array, defined
-        #below. Since the "mem_mids_flat" array is more human-readable than
-        #this array, that array should probably be preferred everywhere for
-        #obtaining the coordinates of membrane midpoints, in which case the
-        #first two columns of this array (i.e., "cv_x" and "cv_y") should
-        #probably be removed entirely from this array. Idle Ides of March!
-        self.mem_vects_flat = np.array([cv_x,cv_y,cv_nx,cv_ny,cv_tx,cv_ty]).T
+        self._make_membranes(p, self.ecm_verts)
 
         #---post processing and calculating peripheral structures-----------------------------------------------------
 
-        self.mem_mids = np.asarray(mem_mids, dtype=object)
-
-        self.mem_mids_flat, indmap_mem, _ = tb.flatten(mem_mids)
-        self.mem_mids_flat = np.asarray(self.mem_mids_flat)  # convert the data structure to an array
-
-        #FIXME: This logic has been duplicated in both deformWorld() and
-        #quickVerts() methods, which... isn't the best. Consider centralizing
-        #these duplicated variable assignments into a common private method.
-
-        # Finish up by creating indices vectors and converting to Numpy arrays where needed:
-        self.cell_i = [x for x in range(0,len(self.cell_centres))]
-        self.mem_i  = [x for x in range(0,len(self.mem_mids_flat))]
-
-        # convert mem_length into a flat vector
-        mem_length,_,_ = tb.flatten(mem_length)
-        mem_length = np.asarray(mem_length)
-
-        self.mem_sa = mem_length*p.cell_height
-
-        self.mem_edges_flat, _, _ = tb.flatten(mem_edges)
-        self.mem_edges_flat = np.asarray(self.mem_edges_flat)
+        # Number of membranes of each cell and index of the first membrane of each cell.
+        mems_count = np.bincount(self.mem_to_cells, minlength=len(self.cell_i))
+        mems_offset = np.cumsum(mems_count) - mems_count
 
-        # create a flattened version of cell_verts that will serve as membrane verts:
-        self.mem_verts,_,_ = tb.flatten(self.cell_verts)
-        self.mem_verts = np.asarray(self.mem_verts)
-
-        # structures for plotting interpolated data and streamlines:
-        self.plot_xy = np.vstack((self.mem_mids_flat,self.mem_verts))
-
-        # define map allowing a dispatch from cell index to each respective membrane -------------------------------
-        indmap_mem = np.asarray(indmap_mem)
-
-        #Indexing by "[self.mem_i]" is superfluous here. Lively jumping snakes!
-        self.mem_to_cells = indmap_mem[:,0]   # gives cell index for each mem_i index placeholder
+        self.mem_mids = _split_ragged(self.mem_mids_flat, mems_count)
 
         # construct a mapping giving membrane index for each cell_i------------------------------------------------
-        self.cell_to_mems = []
-
-        for cell_index in self.cell_i:
-            # One-dimensional Numpy array of the indices of all membranes of
-            # the current cell. Note that:
-            #
-            # * "self.mem_to_cells == cell_index" is a Numpy boolean array.
-            # * ndarray.nonzero() returns an n-tuple of the indices of all items
-            #   of this boolean array evaluating to True, where "n" is the
-            #   number of dimensions of the "mem_to_cells" array. Since this
-            #   array is one-dimensional, this is guaranteed to be a 1-tuple
-            #   whose first item providing this array is indexed at "[0]".
-            #
-            # It is confusing. It is Numpy.
-            mems_index = (self.mem_to_cells == cell_index).nonzero()[0]
-            self.cell_to_mems.append(mems_index)
-
-        self.cell_to_mems = np.asarray(self.cell_to_mems, dtype=object)
-
-        #----------------------------------------------------------
-        # cell surface area:
-        self.cell_sa = []
-        for grp in self.cell_to_mems:
-            cell_sa = sum(self.mem_sa[grp])
-            self.cell_sa.append(cell_sa)
-
-        self.cell_sa = np.asarray(self.cell_sa)
+        # As membranes are grouped by cell, the membranes of each cell are a contiguous range of membrane indices.
+        self.cell_to_mems = _split_ragged(np.arange(len(self.mem_i)), mems_count)
 
         #----------------------------------------------------------------------
-        # Construct an array indexing vertices of the membrane vertices array.
-        cellVertTree = cKDTree(self.mem_verts)
-
-        self.index_to_mem_verts = []
-        for cell_nest in mem_edges:
-            for mem_points in cell_nest:
-                _, pt_ind1 = cellVertTree.query(mem_points[0])
-                _, pt_ind2 = cellVertTree.query(mem_points[1])
-                self.index_to_mem_verts.append([pt_ind1, pt_ind2])
-        self.index_to_mem_verts = np.asarray(self.index_to_mem_verts)
+        # Construct an array indexing vertices of the membrane vertices array. As each membrane vertex is also the
+        # second vertex of the membrane it starts, each membrane spans the prior vertex of that cell and the vertex
+        # sharing the index of that membrane.
+        mems_offset = np.repeat(mems_offset, mems_count)
+        mems_count = np.repeat(mems_count, mems_count)
+        mems_index = np.arange(len(self.mem_i))
+        self.index_to_mem_verts = np.column_stack((
+            mems_offset + (mems_index - mems_offset - 1) % mems_count, mems_index))
 
         # create radial vectors for each cell, defined from their centre to each membrane midpoint
         self.rads = self.mem_mids_flat - self.cell_centres[self.mem_to_cells]
@@ -1177,101 +958,90 @@ class Cells(object):
     def quickVerts(self, p):
 
         # calculate basic properties such as volume, surface area, normals, etc for the cell array
-        self.cell_verts = []
-
-        for centre,poly in zip(self.cell_centres,self.ecm_verts):
-            pt_scale = []
-            for vert in poly:
-                pt_zero = vert - centre
-                pt_scale.append(p.scale_cell*pt_zero + centre)
-            self.cell_verts.append(np.asarray(pt_scale))
-
-        self.cell_verts = np.asarray(self.cell_verts)
-
-        mem_edges = []  # storage for membrane edge points
-        mem_length = []   # storage for membrane surface area values
-        mem_mids = []   # storage for membrane midpoints
-
-        # storage for various vector properties of membrane
-        cv_x=[]
-        cv_y=[]
-        cv_nx=[]
-        cv_ny=[]
-        cv_tx=[]
-        cv_ty=[]
-
-        for polyc in self.cell_verts:
-            # # First calculate individual cell volumes from cell vertices:
-            # poly = [x for x in reversed(polyc)]
-            # self.cell_vol.append(p.cell_height*tb.area(poly))
-
-            # Next calculate individual membrane domains, midpoints, and vectors:
-            edge = []
-            mps = []
-            surfa = []
-
-            for i in range(0,len(polyc)):
-                pt1 = polyc[i-1]
-                pt2 = polyc[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                edge.append([pt1,pt2])
-                mid = (pt1 + pt2)/2       # midpoint calculation
-                mps.append(mid.tolist())
-
-                lgth = np.sqrt((pt2[0] - pt1[0])**2 + (pt2[1]-pt1[1])**2)  # length of membrane domain
-                # sa = lgth*p.cell_height    # surface area of membrane
-                surfa.append(lgth)
-
-                tang_a = pt2 - pt1       # tangent
-                tang = tang_a/np.linalg.norm(tang_a)
-                # normal = np.array([-tang[1],tang[0]])
-                normal = np.array([tang[1],-tang[0]])
-                cv_x.append(mid[0])
-                cv_y.append(mid[1])
-                cv_nx.append(normal[0])
-                cv_ny.append(normal[1])
-                cv_tx.append(tang[0])
-                cv_ty.append(tang[1])
-
-            mem_edges.append(edge)
-            mem_mids.append(mps)
-            mem_length.append(surfa)
-
-        self.mem_vects_flat = np.array([cv_x,cv_y,cv_nx,cv_ny,cv_tx,cv_ty]).T
+        self._make_membranes(p, self.ecm_verts)
 
-        #---post processing and calculating peripheral structures-----------------------------------------------------
+    def _make_membranes(self, p, ecm_verts) -> None:
+        '''
+        Scale in the passed vertices of each closed and clipped Voronoi polygon
+        to create the unique vertices of each cell *and* calculate the
+        geometry (e.g., midpoints, lengths, normal and tangent unit vectors) of
+        all membranes of these cells.
 
-        self.mem_mids_flat, indmap_mem, _ = tb.flatten(mem_mids)
-        self.mem_mids_flat = np.asarray(self.mem_mids_flat)  # convert the data structure to an array
+        Since each cell has as many membranes as vertices, all such geometry is
+        calculated in a vectorized manner over the flattened array of all cell
+        vertices, where the membrane of each cell at index ``i`` spans the
+        cell vertices at indices ``i - 1`` and ``i`` (wrapping around).
 
-        # Finish up by creating indices vectors and converting to Numpy arrays where needed:
-        self.cell_i = [x for x in range(0,len(self.cell_centres))]
-        self.mem_i =  [x for x in range(0,len(self.mem_mids_flat))]
+        Parameters
+        ----------
+        p : Parameters
+            Current simulation configuration.
+        ecm_verts : SequenceTypes
+            Sequence of the vertices of each Voronoi polygon, ordered to
+            :attr:`cell_centres`.
+        '''
 
-        # convert mem_length into a flat vector
-        mem_length,_,_ = tb.flatten(mem_length)
-        mem_length = np.asarray(mem_length)
+        # Number of vertices (and hence membranes) of each cell.
+        mems_count = np.fromiter(
+            (len(poly) for poly in ecm_verts), dtype=int, count=len(ecm_verts))
 
-        self.mem_sa = mem_length*p.cell_height
+        # Index of the cell of each membrane and of the first membrane of that cell.
+        self.mem_to_cells = np.repeat(np.arange(len(ecm_verts)), mems_count)
+        mems_offset = np.repeat(np.cumsum(mems_count) - mems_count, mems_count)
+
+        # Vertices of each cell, scaled in from the Voronoi polygon vertices about each cell centre.
+        mems_centre = self.cell_centres[self.mem_to_cells]
+        ecm_verts_flat = np.concatenate([
+            np.asarray(poly, dtype=float).reshape(-1, 2) for poly in ecm_verts])
+        self.mem_verts = p.scale_cell*(ecm_verts_flat - mems_centre) + mems_centre
+        self.cell_verts = _split_ragged(self.mem_verts, mems_count)
+
+        # First and second points of each membrane, the former being the prior vertex of the same cell.
+        mems_index = np.arange(len(self.mem_verts))
+        pt1 = self.mem_verts[
+            mems_offset + (mems_index - mems_offset - 1) % mems_count[self.mem_to_cells]]
+        pt2 = self.mem_verts
+
+        self.mem_edges_flat = np.stack((pt1, pt2), axis=1)
+        self.mem_mids_flat = (pt1 + pt2)/2       # midpoint calculation
+
+        tang_a = pt2 - pt1       # tangent
+        mem_length = np.sqrt(tang_a[:, 0]**2 + tang_a[:, 1]**2)  # length of membrane domain
+        tang = tang_a/mem_length[:, None]
+
+        #FIXME: For readability, it would be great if we could extract the
+        #last four columns of this array into two new arrays with
+        #human-readable names resembling the "mem_mids_flat" array: e.g.,
+        #
+        #* "self.mem_norms_flat", providing the normal membrane unit vectors.
+        #* "self.mem_tangs_flat", providing the tangent membrane unit vectors.
+        #
+        #Currently, we reference these columns with non-human-readable magic
+        #numbers like "self.mem_vects_flat[:,3]", which is fairly hard to
+        #mentally parse when perusing the code. Calm qualms in an oceanic quay!
+        #FIXME: The first two columns of this array are exact duplicates of the
+        #first (and only) two columns of the "mem_mids_flat" array, defined
+        #below. Since the "mem_mids_flat" array is more human-readable than
+        #this array, that array should probably be preferred everywhere for
+        #obtaining the coordinates of membrane midpoints, in which case the
+        #first two columns of this array (i.e., "cv_x" and "cv_y") should
+        #probably be removed entirely from this array. Idle Ides of March!
+        # normal = np.array([-tang[1],tang[0]])
+        self.mem_vects_flat = np.column_stack((
+            self.mem_mids_flat, tang[:, 1], -tang[:, 0], tang[:, 0], tang[:, 1]))
 
-        self.mem_edges_flat, _, _ = tb.flatten(mem_edges)
-        self.mem_edges_flat = np.asarray(self.mem_edges_flat)
+        # Finish up by creating indices vectors and converting to Numpy arrays where needed:
+        self.cell_i = [x for x in range(0,len(self.cell_centres))]
+        self.mem_i  = [x for x in range(0,len(self.mem_mids_flat))]
 
-        # create a flattened version of cell_verts that will serve as membrane verts:
-        self.mem_verts,_,_ = tb.flatten(self.cell_verts)
-        self.mem_verts = np.asarray(self.mem_verts)
+        self.mem_sa = mem_length*p.cell_height
 
         # structures for plotting interpolated data and streamlines:
         self.plot_xy = np.vstack((self.mem_mids_flat,self.mem_verts))
 
         # cell surface area:
-        self.cell_sa = []
-        for grp in self.cell_to_mems:
-            cell_sa = sum(self.mem_sa[grp])
-            self.cell_sa.append(cell_sa)
-
-        self.cell_sa = np.asarray(self.cell_sa)
+        self.cell_sa = np.bincount(
+            self.mem_to_cells, weights=self.mem_sa, minlength=len(self.cell_i))
 
     def cellMatrices(self, p) -> None:
         '''
@@ -1282,6 +1052,9 @@ class Cells(object):
         logs.log_info(
             'Creating computational matrices for cell-cell transfers...')
 
+        # Evict all matrices lazily created from the prior matrices (if any).
+        self.evict_matrices()
+
         #----------------MATRIX CALCULATIONs----------------------------------------
 
         # create a matrix that will map and interpolate data on mem mids to the mem verts -----------------------------
@@ -1294,66 +1067,41 @@ class Cells(object):
         #     self.matrixMap2Verts[i, indices[1]] = 1/2
 
         # matrix for summing property on membranes for each cell and a count of number of mems per cell:---------------
-        self.M_sum_mems = np.zeros((len(self.cell_i),len(self.mem_i)))
-        self.num_mems = []
-
-        for i, inds in enumerate(self.cell_to_mems):
-            n = 0
-            for j in inds:
-                self.M_sum_mems[i,j] = 1
-                n = n+1
-
-            self.num_mems.append(n)
+        # As each membrane belongs to exactly one cell, each column of this matrix contains exactly one non-zero entry.
+        self.num_mems = np.bincount(self.mem_to_cells, minlength=len(self.cell_i))  # number of membranes per cell
+
+        self.M_sum_mems = matrices.make_matrix(
+            backend=p.matrix_backend,
+            data=np.ones(len(self.mem_i)),
+            row_indices=self.mem_to_cells,
+            col_indices=self.mem_i,
+            shape=(len(self.cell_i), len(self.mem_i)),
+        )
 
-        self.M_sum_mems_inv = np.linalg.pinv(self.M_sum_mems)  # matrix inverse of M_sum_mems for div-free cell calcs
-        self.num_mems = np.asarray(self.num_mems)  # number of membranes per cell
+        # Matrix inverse of M_sum_mems for div-free cell calcs. As the rows of M_sum_mems are disjoint, the product
+        # M_sum_mems * M_sum_mems.T is the diagonal matrix of num_mems, and the Moore-Penrose pseudo-inverse of
+        # M_sum_mems reduces to M_sum_mems.T * diag(1/num_mems), avoiding an expensive dense pinv() call:
+        self.M_sum_mems_inv = matrices.scale_columns(self.M_sum_mems.T, 1/self.num_mems)
         self.mem_distance = p.cell_space + 2*p.tm # distance between two adjacent intracellluar spaces
         self.cell_number = self.cell_centres.shape[0]
 
-        # matrix for calculating gradients around the cell circumference:
-        self.gradTheta = np.zeros((len(self.mem_i), len(self.mem_i)))
-
-        # matrix for averaging points from mem-mids to companion polygon midpoints:
-        # self.aveTheta = np.zeros((len(self.mem_i), len(self.mem_i)))
-
-        # matrix storing the radial length:
+        # matrix storing the distance between the midpoints of each membrane and the prior membrane of the same cell.
+        # The matrix for calculating gradients around the cell circumference is lazily created by self.gradTheta.
+        mems, mems_prev = self._get_membranes_rolled(shift=1)
         self.radial_len = np.zeros(len(self.mem_i))
-
-        for cell_i, mem_i in enumerate(self.cell_to_mems):
-
-            mem_io = np.roll(mem_i, 1)
-
-            # distance between points:
-            li = self.mem_mids_flat[mem_i] - self.mem_mids_flat[mem_io]
-            lm = np.sqrt(li[:, 0] ** 2 + li[:, 1] ** 2)
-
-            self.radial_len[mem_i] = np.abs(lm)
-
-            self.gradTheta[mem_i, mem_i] = 1 / lm
-            self.gradTheta[mem_i, mem_io] = -1 / lm
-            #
-            # self.aveTheta[mem_i, mem_i] = 1/2
-            # self.aveTheta[mem_i, mem_io] = 1/2
+        self.radial_len[mems] = np.linalg.norm(
+            self.mem_mids_flat[mems] - self.mem_mids_flat[mems_prev], axis=1)
 
     def memLaplacian(self):
+        '''
+        Create the :attr:`lapGJmem_inv` matrix inverting the Laplacian of data
+        defined on the membranes of each cell patch.
 
-        # matrix for computing divergence of a property defined on a membrane of each cell patch:
-        lapGJmem = np.zeros((len(self.mem_i), len(self.mem_i)))
-
-        for cell_i, mem_i in enumerate(self.cell_to_mems):
-
-            num_mems = self.num_mems[cell_i]
-
-            for nj, j in enumerate(mem_i):
-
-                mem_j = np.roll(mem_i, -1 - nj)
-
-                memjj = mem_j[0:-1]
-
-                lapGJmem[j, j] = ((num_mems - 1)/num_mems)*(self.mem_sa[j]/self.mem_vol[j])
-                lapGJmem[j, memjj] = -(1/num_mems)*(self.mem_sa[memjj]/self.mem_vol[memjj])
+        Since this matrix is now lazily created on first access, this method
+        merely forces that creation and is retained for backward compatibility.
+        '''
 
-        self.lapGJmem_inv = np.linalg.pinv(lapGJmem)
+        self.lapGJmem_inv
 
     def cell_vols(self, p) -> None:
         '''
@@ -1382,7 +1130,7 @@ class Cells(object):
         self.mem_vol = (1 / 2) * self.R_rads * self.mem_sa
 
         # calaculate cell volume by suming up the large pies:
-        self.cell_vol = np.dot(self.M_sum_mems, self.mem_vol)
+        self.cell_vol = self.M_sum_mems.dot(self.mem_vol)
 
         self.R = ((3 / 4) * (self.cell_vol / math.pi)) ** (1 / 3)  # effective radius of each cell
 
@@ -1404,72 +1152,58 @@ class Cells(object):
         memTree = cKDTree(self.mem_mids_flat)
 
         mem_nn_o = memTree.query_ball_point(self.mem_mids_flat, sc)
-        mem_nn = [[] for x in self.mem_i]
-        mem_bound = []
-
-        for i, ind_pair in enumerate(mem_nn_o):
-            if len(ind_pair) == 1:
-                mem_bound.append(i)
-                mem_nn[i].append(i)
-                mem_nn[i].append(i)
-
-            elif len(ind_pair) == 2:
-                mem_nn[i].append(ind_pair[0])
-                mem_nn[i].append(ind_pair[1])
-
-            #FIXME: It'd be great if we could document exactly what and how
-            #this algorithm is doing. Are we searching multiple possible
-            #neighboring membranes for the nearest neighboring of the current
-            #membrane to find the membranes participating in this gap junction?
-            elif len(ind_pair) > 2:
-                i_n = [self.mem_vects_flat[i,2],self.mem_vects_flat[i,3]]
-
-                for j in ind_pair:
-                    a = [self.mem_vects_flat[j,2],self.mem_vects_flat[j,3]]
-                    ia = round(np.dot(i_n,a),1)
-
-                    if ia == -1.0:
-                        mem_nn[i] = []
-                        mem_nn[i].append(i)
-                        mem_nn[i].append(j)
-
-                    else:  # in rare cases, tag as self instead of leaving a blank spot:
-                        mem_nn[i] =[]
-                        mem_nn[i].append(i)
-                        mem_nn[i].append(i)
+        mem_nn_len = np.fromiter(
+            (len(ind_pair) for ind_pair in mem_nn_o), dtype=int, count=len(mem_nn_o))
+
+        # By default, tag each membrane as its own partner, as for membranes on the boundary (i.e., with no other
+        # membrane in range).
+        mems_index = np.arange(len(self.mem_i))
+        mem_nn = np.column_stack((mems_index, mems_index))
+        mem_bound = np.flatnonzero(mem_nn_len == 1)
+
+        # Membranes with exactly one other membrane in range pair with that membrane.
+        mems_pair = np.flatnonzero(mem_nn_len == 2)
+        if len(mems_pair):
+            mem_nn[mems_pair] = np.asarray(mem_nn_o[mems_pair].tolist(), dtype=int)
+
+        #FIXME: It'd be great if we could document exactly what and how
+        #this algorithm is doing. Are we searching multiple possible
+        #neighboring membranes for the nearest neighboring of the current
+        #membrane to find the membranes participating in this gap junction?
+        # Membranes with multiple other membranes in range pair with the last such membrane if antiparallel to that
+        # membrane; in rare cases, tag as self instead of leaving a blank spot.
+        for i in np.flatnonzero(mem_nn_len > 2):
+            j = mem_nn_o[i][-1]
+            ia = round(np.dot(self.mem_vects_flat[i, 2:4], self.mem_vects_flat[j, 2:4]), 1)
+
+            if ia == -1.0:
+                mem_nn[i] = (i, j)
 
         #---------------------------------------------------------------------------------------------------------------
 
-        self.mem_nn = np.asarray(mem_nn)
+        self.mem_nn = mem_nn
 
         # Tag membranes and cells on the outer boundary of the cell cluster---------------------------------------------
-        self.bflags_mems = np.asarray(mem_bound)
+        self.bflags_mems = mem_bound
 
          # get the boundary cells associated with these membranes:
-        self.bflags_cells = []
-
-        for mem_i in self.bflags_mems:
-
-            cell_i = self.mem_to_cells[mem_i]
-
-            self.bflags_cells.append(cell_i)
-
-        self.bflags_cells = np.asarray(self.bflags_cells)
+        self.bflags_cells = self.mem_to_cells[self.bflags_mems]
 
         # midpoints of extracellular matrix lattice:
         # calculate midpoints of each ecm (voronoi cell) segment:
-        ecm_mids = set()
-
-        for verts in self.ecm_verts:
-            for i in range(0,len(verts)):
-                pt1 = verts[i-1]
-                pt2 = verts[i]
-                pt1 = np.asarray(pt1)
-                pt2 = np.asarray(pt2)
-                mid = (pt1 + pt2)/2       # midpoint calculation
-                mx = mid[0]
-                my = mid[1]
-                ecm_mids.add((mx,my))
+        ecm_verts_count = np.fromiter(
+            (len(verts) for verts in self.ecm_verts), dtype=int, count=len(self.ecm_verts))
+        ecm_verts_flat = np.concatenate([
+            np.asarray(verts, dtype=float).reshape(-1, 2) for verts in self.ecm_verts])
+        ecm_verts_offset = np.repeat(np.cumsum(ecm_verts_count) - ecm_verts_count, ecm_verts_count)
+        ecm_verts_index = np.arange(len(ecm_verts_flat))
+        pt1 = ecm_verts_flat[
+            ecm_verts_offset +
+            (ecm_verts_index - ecm_verts_offset - 1) % np.repeat(ecm_verts_count, ecm_verts_count)]
+        pt2 = ecm_verts_flat
+
+        # Unique midpoints, preserving the order of the set previously iteratively constructed here.
+        ecm_mids = set(map(tuple, ((pt1 + pt2)/2).tolist()))
 
         ecm_mids = list(ecm_mids)
         self.ecm_mids = np.asarray(ecm_mids)
@@ -1495,83 +1229,38 @@ class Cells(object):
         Uses scipy spatial KDTree search algorithm
         """
 
-        self.nn_i = [] # gives the partnering membrane index at the vectors' index
-        self.cell_nn_i = [[] for x in self.mem_i] # stores the two connecting cell indices at a shared membrane
-
-        for i, (mem_i,mem_j) in enumerate(self.mem_nn):
-
-            if mem_i == mem_j:  # we're on a boundary cell
-
-                self.nn_i.append(i)
-                cell_i = self.mem_to_cells[i]
-                self.cell_nn_i[mem_i].append(cell_i)
-                self.cell_nn_i[mem_i].append(cell_i)
-
-            elif i == mem_i and i != mem_j:
-
-                self.nn_i.append(mem_j)
-                cell_i = self.mem_to_cells[mem_i]
-                cell_j = self.mem_to_cells[mem_j]
+        mems_index = np.arange(len(self.mem_i))
+        mem_nn = np.asarray(self.mem_nn)
 
-                self.cell_nn_i[i].append(cell_i)
-                self.cell_nn_i[i].append(cell_j)
+        # Partnering membrane of each membrane, being the other membrane of the nearest neighbour pair containing
+        # that membrane *OR* that membrane itself if on a boundary cell.
+        self.nn_i = np.where(mem_nn[:, 0] == mems_index, mem_nn[:, 1], mem_nn[:, 0])
 
-            elif i == mem_j and i != mem_i:
+        mems_unplaced = (mem_nn[:, 0] != mems_index) & (mem_nn[:, 1] != mems_index)
+        if mems_unplaced.any():
+            logs.log_info("WARNING: entry not placed in seed nearest neighbour construction. "
+                             "Results may not be accurate.")
+            self.nn_i[mems_unplaced] = mems_index[mems_unplaced]
 
-                self.nn_i.append(mem_i)
-                cell_i = self.mem_to_cells[mem_j]
-                cell_j = self.mem_to_cells[mem_i]
+        # stores the two connecting cell indices at a shared membrane
+        self.cell_nn_i = np.column_stack((self.mem_to_cells, self.mem_to_cells[self.nn_i]))
 
-                self.cell_nn_i[i].append(cell_i)
-                self.cell_nn_i[i].append(cell_j)
+        # Next find the nearest neighbour set for each cell, ignoring neighbourless boundary membranes and
+        # cross-checking that values are not the same:
+        mems = np.concatenate(self.cell_to_mems).astype(int)
+        mems_cell_i, mems_cell_j = self.cell_nn_i[mems].T
+        mems_nn = (self.nn_i[mems] != mems) & (mems_cell_i != mems_cell_j)
+        self.num_nn = np.bincount(mems_cell_i[mems_nn], minlength=len(self.cell_i))
+        self.cell_nn = _split_ragged(mems_cell_j[mems_nn], self.num_nn, is_list=True)
 
-            else:
-                logs.log_info("WARNING: entry not placed in seed nearest neighbour construction. "
-                                 "Results may not be accurate.")
-
-        self.nn_i = np.asarray(self.nn_i)
-        self.cell_nn_i = np.asarray(self.cell_nn_i)
-
-        # Next find the nearest neighbour set for each cell:
-        self.cell_nn = []
-        for cell_i, mem_i_set in enumerate(self.cell_to_mems):
-
-            cell_neigh_set = []
-
-            for mem_i in mem_i_set:
-
-                mem_j = self.nn_i[mem_i]  # find the partner to this membrane...
-
-                if mem_j == mem_i:  # if the indices are equal, we're on a neighborless boundary cell
-                    pass
-
-                else:
-
-                    cell_j = self.mem_to_cells[mem_j]
-
-                    if cell_i != cell_j:  # cross-check that values are not the same
-                        cell_neigh_set.append(cell_j)
-
-            self.cell_nn.append(cell_neigh_set)
-
-        self.num_nn = []  # initialize a list that will hold number of nns to a cell
-
-        for indices in self.cell_nn:
-            self.num_nn.append(len(indices))
-
-        self.average_nn = (sum(self.num_nn)/len(self.num_nn))
-        self.num_nn = np.asarray(self.num_nn)
-        self.cell_nn = np.asarray(self.cell_nn, dtype=object)
+        self.average_nn = self.num_nn.sum()/len(self.num_nn)
 
         # Nearest neighbours to the boundary cells.
         nn_bound = self.cell_nn[self.bflags_cells]
-        nn_bound, _,_ = tb.flatten(nn_bound)
-
-        self.nn_bound = []
-        for ind in nn_bound:  # take out the shared values:
-            if ind not in self.bflags_cells:
-                self.nn_bound.append(ind)
+        nn_bound = np.asarray(tb.flatten(nn_bound)[0], dtype=int)
 
+        # take out the shared values:
+        self.nn_bound = nn_bound[~np.isin(nn_bound, self.bflags_cells)].tolist()
 
     def makeECM(self,p):
 
@@ -1625,95 +1314,45 @@ class Cells(object):
         # where 'ecm' is different than the environmental grid points defined in self.xypts and corresponds
         # to the shared membrane midpoint between two cells (e.g. a true 'extracellular' matrix point).
 
-        bflags_ecm_o = [] # flags for ecm points at boundaries
-        ecm_points_o = [] # the points, prior to processing
-
-        for i, (mem_i, mem_j) in enumerate(self.mem_nn): # for each membrane mid pair in mem near neighbours...
-
-            xmem = self.mem_mids_flat[:, 0]
-            ymem = self.mem_mids_flat[:, 1]
-
-            xi = (xmem[mem_i] + xmem[mem_j])/2 # average the x and y points
-            yi = (ymem[mem_i] + ymem[mem_j])/2
-
-            ecm_points_o.append([xi, yi]) # append the pair to the points list
-
-            if mem_i == mem_j:         # if membrane indices are equal, they must be a boundary:
-                bflags_ecm_o.append([xi, yi])
-
-        ecm_points_unique = np.unique(ecm_points_o, axis = 0)   # get only the unique points from the above
-        bflags_ecm_unique = np.unique(bflags_ecm_o, axis = 0)
-
-        ecm_list = ecm_points_unique.tolist()     # convert them back to a list
-        bflags_list = bflags_ecm_unique.tolist()
-
-        bflags_ecm = []
-
-        for bf in bflags_list:
-
-            bflags_ecm.append(ecm_list.index(bf))   # get the proper index for the boundary flag from points list
-
-        self.ecm_points = np.asarray(ecm_points_unique)  # assign final data structures
-        self.bflags_ecm = np.asarray(bflags_ecm)
-
-        self.ecm_i = np.asarray([ii for ii in range(len(self.ecm_points))])
-
+        # for each membrane mid pair in mem near neighbours, average the x and y points:
         xmem_mids = (self.mem_mids_flat[self.mem_nn[:,0]]
                      + self.mem_mids_flat[self.mem_nn[:,1]])/2
 
-        points_tree_ecm = cKDTree(self.ecm_points)
-
-
-        mem_to_ecm = []
-        for xm in xmem_mids:
-
-            _,ei = points_tree_ecm.query(xm)
-            mem_to_ecm.append(ei)
-
-        self.mem_to_ecm = np.asarray(mem_to_ecm)
+        # get only the unique points from the above *AND* the index of the unique point of each membrane:
+        ecm_points_unique, mem_to_ecm = np.unique(xmem_mids, axis=0, return_inverse=True)
 
+        self.ecm_points = ecm_points_unique  # assign final data structures
+        self.mem_to_ecm = mem_to_ecm.reshape(-1)
 
-        cell_to_ecm = []
-        for ci, mem_is in enumerate(self.cell_to_mems):
+        # if membrane indices are equal, they must be a boundary:
+        self.bflags_ecm = np.unique(self.mem_to_ecm[self.mem_nn[:,0] == self.mem_nn[:,1]])
 
-            mem_pts = xmem_mids[mem_is] # get membrane mids surrounding this cell
-            _, eci = points_tree_ecm.query(mem_pts)
-            cell_to_ecm.append(eci.tolist())
+        self.ecm_i = np.arange(len(self.ecm_points))
 
-        self.cell_to_ecm = np.asarray(cell_to_ecm, dtype=object)
+        self.cell_to_ecm = np.empty(len(self.cell_to_mems), dtype=object)
+        self.cell_to_ecm[:] = [self.mem_to_ecm[mem_is].tolist() for mem_is in self.cell_to_mems]
 
         self.all_points = np.vstack((self.cell_centres, self.ecm_points))
         self.all_points_imap = np.hstack((self.cell_i, self.ecm_i))
-        self.all_i = np.asarray([ii for ii in range(len(self.all_points))])
+        self.all_i = np.arange(len(self.all_points))
         self.all_points_ecm_i = len(self.cell_i) + self.ecm_i
         self.all_points_cell_i = self.cell_i
         self.adl = len(self.all_points)
 
         points_tree_mems = cKDTree(self.mem_mids_flat)
-        ecm_to_mems_o = points_tree_mems.query_ball_point(
+        self.ecm_to_mems = points_tree_mems.query_ball_point(
             self.ecm_points, r=10*p.cell_space)
 
-        ecm_to_mems = []
-        ecm_to_cells = []
+        ecm_to_mems_count = np.fromiter(
+            (len(ecm_is) for ecm_is in self.ecm_to_mems), dtype=int, count=len(self.ecm_to_mems))
+        ecm_to_mems_flat = np.fromiter(
+            (mem_i for ecm_is in self.ecm_to_mems for mem_i in ecm_is), dtype=int, count=ecm_to_mems_count.sum())
+        self.ecm_to_cells = _split_ragged(self.mem_to_cells[ecm_to_mems_flat], ecm_to_mems_count)
 
-        for i, ecm_is in enumerate(ecm_to_mems_o):
-            ecm_to_mems.append(ecm_is)
-            ecm_to_cells.append(self.mem_to_cells[ecm_is])
-
-        self.ecm_to_mems = np.asarray(ecm_to_mems, dtype=object)
-        self.ecm_to_cells = np.asarray(ecm_to_cells, dtype=object)
-
-        # Surface area and volume of ecm spaces:
-        self.ecm_vol = []
-        self.ecm_sa = []
-
-        for mis in self.ecm_to_mems:
-            esa = self.mem_sa[mis[0]]
-            self.ecm_vol.append(esa*p.cell_space)
-            self.ecm_sa.append(esa*1)
-
-        self.ecm_vol = np.asarray(self.ecm_vol)
-        self.ecm_sa = np.asarray(self.ecm_sa)
+        # Surface area and volume of ecm spaces, as that of the first membrane in range of each:
+        esa = self.mem_sa[ecm_to_mems_flat[np.cumsum(ecm_to_mems_count) - ecm_to_mems_count]]
+        self.ecm_vol = esa*p.cell_space
+        self.ecm_sa = esa*1
 
         self.ecmdl = len(self.ecm_points)
 
@@ -1790,32 +1429,22 @@ class Cells(object):
         _, self.bR_k = self.points_tree.query(bR_pts)
 
         # get a mapping specifying which mem mids an ecm space interacts with:
-        self.map_ecm2mem = [[] for ind in self.xypts]
-
-        for ind_mem, ind_ecm in enumerate(self.map_mem2ecm):
-            self.map_ecm2mem[ind_ecm].append(ind_mem)
+        mems_per_env = np.bincount(self.map_mem2ecm, minlength=len(self.xypts))
+        self.map_ecm2mem = _split_ragged(
+            np.argsort(self.map_mem2ecm, kind='stable'), mems_per_env, is_list=True).tolist()
 
         # next, find out the total set of ecm spaces that interact with membranes
         # and develop the "weight-paint" functions:
-        self.envInds_inClust = []
-        self.memSa_per_envSquare = np.zeros(len(self.xypts))
-        self.mems_per_envSquare = np.zeros(len(self.xypts))
+        self.envInds_inClust = np.flatnonzero(mems_per_env)
+        self.memSa_per_envSquare = np.bincount(
+            self.map_mem2ecm, weights=self.mem_sa, minlength=len(self.xypts))
+        self.mems_per_envSquare = mems_per_env.astype(float)
 
         # create an array to hold the "true" extracellullar volume,
         # and populate it initially with the environmental square volume:
         self.true_ecm_vol = np.ones(len(self.xypts))*self.ecm_vol
-
-        for ind_ecm, lst in enumerate(self.map_ecm2mem):
-
-            if len(lst) > 0:
-                self.envInds_inClust.append(ind_ecm)
-                sas = np.sum(self.mem_sa[lst])
-                self.memSa_per_envSquare[ind_ecm] = sas
-                self.mems_per_envSquare[ind_ecm] = len(lst)
-
-                self.true_ecm_vol[ind_ecm] = sas*p.cell_space*(1/2)
-
-        self.envInds_inClust = np.asarray(self.envInds_inClust)
+        self.true_ecm_vol[self.envInds_inClust] = (
+            self.memSa_per_envSquare[self.envInds_inClust]*p.cell_space*(1/2))
 
         # correction coefficient for converting from cell to env divergences:
         self.cell2env_corrF = (self.cell_vol / self.true_ecm_vol[self.map_cell2ecm]) * (self.ecm_sa / self.cell_sa)
@@ -1835,12 +1464,13 @@ class Cells(object):
         # create the matrix that allows individual membrane normal fluxes to be mapped to each ecm square:
         # If Fmem is the normal component of a vector field wrt individual membranes,
         # the result of M_divmap_mem2ecm *dot* Fmem  is the divergence of the flux wrt the environment.
-        self.M_divmap_mem2ecm = np.zeros((len(self.xypts), len(self.mem_i)))
-
-        for mem_i, ecm_i in enumerate(self.map_mem2ecm):
-            mem_sa = self.mem_sa[mem_i]
-            self.M_divmap_mem2ecm[ecm_i, mem_i] += (mem_sa)
-            # self.M_divmap_mem2ecm[ecm_i, mem_i] += (mem_sa) / (p.cell_height*(self.delta**2))
+        self.M_divmap_mem2ecm = matrices.make_matrix(
+            backend=p.matrix_backend,
+            data=self.mem_sa,
+            row_indices=self.map_mem2ecm,
+            col_indices=self.mem_i,
+            shape=(len(self.xypts), len(self.mem_i)),
+        )
 
     def graphLaplacian(self, p) -> None:
         '''
@@ -1855,6 +1485,7 @@ class Cells(object):
         Creates
         ----------
         self.lapGJinv          Solver for Poisson equation with Neumann (zero gradient) boundary
+        self.lapGJ             Direct Laplacian operator on the cell network
         '''
 
         # Log this action.
@@ -1862,36 +1493,33 @@ class Cells(object):
 
 
         #----DEC matrix creation
-        # Hodge star for edge length ratios:
-        star_eij = np.diag(self.mesh.vor_edge_len/self.mesh.tri_edge_len)
-
-        # First term in the laplacian matrix:
-        L1 = np.dot(star_eij, self.mesh.delta_tri_0)
-
-        star_a = np.diag(1/self.mesh.vor_sa)
-
-        L2 = np.dot(star_a, -self.mesh.delta_tri_0.T)
+        # Exterior derivative of the triangulation, mapping vertices to edges:
+        delta_tri_0 = matrices.convert_matrix(
+            self.mesh.delta_tri_0, p.matrix_backend)
 
-        # Inverse terms:
         # Hodge star for edge length ratios:
-        star_eij_inv = np.diag(self.mesh.tri_edge_len/self.mesh.vor_edge_len)
-
-        # First term in the laplacian matrix:
-        L1_inv = np.dot(self.mesh.delta_tri_0_inv, star_eij_inv)
-
-        star_a_inv = np.diag(self.mesh.vor_sa)
-
-        L2_inv = np.dot(-self.mesh.delta_tri_0_inv.T, star_a_inv)
-
-
-        self.lapGJinv = np.dot(L1_inv, L2_inv)
-
-        # if p.td_deform is True:
-        #     # if time0dependent deformation is selected, also save the direct Laplacian operator:
-        self.lapGJ = np.dot(L2, L1)
+        star_eij = self.mesh.vor_edge_len/self.mesh.tri_edge_len
+
+        # Symmetric (negative semi-definite) graph Laplacian, the product of the
+        # transposed exterior derivative with the Hodge-starred exterior derivative:
+        lap_sym = -delta_tri_0.T.dot(matrices.scale_rows(delta_tri_0, star_eij))
+
+        # Direct Laplacian operator, normalizing the above by each Voronoi cell area:
+        self.lapGJ = matrices.scale_rows(lap_sym, 1/self.mesh.vor_sa)
+
+        # Solver for the Poisson equation with Neumann (zero gradient) boundary
+        # conditions. As the above operator is singular and non-symmetric, this
+        # solver instead factorizes the symmetric Laplacian and rescales each
+        # right-hand side by each Voronoi cell area:
+        self.lapGJinv = matrices.LinearSolver(
+            matrix=lap_sym,
+            backend=p.matrix_backend,
+            is_singular=True,
+            rhs_factors=self.mesh.vor_sa,
+        )
 
         # weighting function for the voronoi lattice:
-        self.geom_weight = np.dot(self.M_sum_mems, self.mem_sa / self.mem_vol) * p.cell_height
+        self.geom_weight = self.M_sum_mems.dot(self.mem_sa / self.mem_vol) * p.cell_height
 
     def cellDivM(self, p):
 
@@ -1916,26 +1544,8 @@ class Cells(object):
 
         """
 
-        # matrix for computing divergence of a property defined on a membrane of each cell patch:
-        divCell = np.zeros((len(self.cell_i), len(self.mem_i)))
-
-        for i, inds in enumerate(self.cell_to_mems):
-
-            # get the volume for the cell:
-            cell_vol = self.cell_vol[i]
-
-            for j in inds:
-                # self.M_sum_mems[i,j] = 1
-
-                # get the membrane surface area for this membrane patch:
-                mem_sa = self.mem_sa[j]
-
-                # set the divergence term:
-                divCell[i, j] = mem_sa/cell_vol
-
-
-        # calculate the inverse of the divergence matrix:
-        self.divCell_inv = np.linalg.pinv(divCell)
+        # This matrix is now lazily created on first access.
+        self.divCell_inv
 
     @type_check
     def redo_gj(self, phase: SimPhase) -> None:
@@ -2022,100 +1632,36 @@ class Cells(object):
         Used in deformation sequence.
         '''
 
-        self.nn_mids = []
-        self.nn_tx = []  # tangent vector to gap junction (through neighboring cell centres)
-        self.nn_ty = []
-        self.nn_len = []  # distance between neighbouring cell centres
-
-        self.nn_edges = [[] for x in self.mem_i]  # line segment between neighbouring cell centres
-
-        for mem_i, mem_j in enumerate(self.nn_i):
-            cell_i, cell_j = self.cell_nn_i[mem_i]
-
-            # calculate vectors for the pairing:
-            pt1_mem = self.mem_mids_flat[mem_i]
-            pt2_mem = self.mem_mids_flat[mem_j]
-
-            pt1_cell = self.cell_centres[cell_i]
-            pt2_cell = self.cell_centres[cell_j]
-
-            tang_o = pt2_mem - pt1_mem
-
-            tang_x_o = tang_o[0]
-            tang_y_o = tang_o[1]
-
-            tang_mag = np.sqrt(tang_x_o**2 + tang_y_o**2)
-
-            if tang_mag == 0.0:
-                tang_x = 0
-                tang_y = 0
-            else:
-                tang_x = tang_x_o/tang_mag
-                tang_y = tang_y_o/tang_mag
+        # calculate vectors for the pairing:
+        pt1_mem = self.mem_mids_flat
+        pt2_mem = self.mem_mids_flat[self.nn_i]
 
-            mid = (pt1_mem + pt2_mem)/2
-            self.nn_mids.append(mid)
+        pt1_cell = self.cell_centres[self.cell_nn_i[:, 0]]
+        pt2_cell = self.cell_centres[self.cell_nn_i[:, 1]]
 
-            # calculate length
-            len_o = pt2_cell - pt1_cell
+        # tangent vector to gap junction (through neighboring cell centres), zero for boundary membranes:
+        self.nn_tx, self.nn_ty = _get_unit_vectors(pt2_mem - pt1_mem)
 
-            len_xo  = len_o[0]
-            len_yo = len_o[1]
+        self.nn_mids = (pt1_mem + pt2_mem)/2
 
-            len_mag = np.sqrt(len_xo**2 + len_yo**2)
+        # distance between neighbouring cell centres:
+        len_o = pt2_cell - pt1_cell
+        self.nn_len = np.sqrt(len_o[:, 0]**2 + len_o[:, 1]**2)
+        self.nn_len[self.nn_len == 0.0] = -1 # FIXME -- this seems like a horrific idea...
 
-            if len_mag == 0.0:
-                self.nn_len.append(-1) # FIXME -- this seems like a horrific idea...
-            else:
-                self.nn_len.append(len_mag)
+        # line segment between neighbouring cell centres:
+        self.nn_edges = np.stack((pt1_cell, pt2_cell), axis=1)
 
-            self.nn_tx.append(tang_x)
-            self.nn_ty.append(tang_y)
+        self.cell_nn_tx, self.cell_nn_ty = _get_unit_vectors(len_o)
 
-            self.nn_edges[mem_i].append(pt1_cell)
-            self.nn_edges[mem_i].append(pt2_cell)
+        # Mapping between gap junction index and cell, for each gap junction that's not a boundary membrane:
+        gj_i = np.flatnonzero(self.cell_nn_i[:, 0] != self.cell_nn_i[:, 1])
+        gj_cells = np.concatenate((self.cell_nn_i[gj_i, 0], self.cell_nn_i[gj_i, 1]))
+        gj_i = np.concatenate((gj_i, gj_i))
+        gj_order = np.lexsort((gj_i, gj_cells))
 
-        self.nn_mids = np.asarray(self.nn_mids)
-
-        self.nn_tx = np.asarray(self.nn_tx)
-        self.nn_ty = np.asarray(self.nn_ty)
-        self.nn_len = np.asarray(self.nn_len)
-        self.nn_edges = np.asarray(self.nn_edges)
-
-        self.cell_nn_tx = []
-        self.cell_nn_ty = []
-
-        for cell_i, cell_j in self.cell_nn_i:
-            pt1 = self.cell_centres[cell_i]
-            pt2 = self.cell_centres[cell_j]
-
-            tang_o = pt2 - pt1
-            norm_tang = np.sqrt(tang_o[0]**2 + tang_o[1]**2)
-
-            if norm_tang != 0:
-                tang = tang_o/norm_tang
-            else:
-                norm_tang = 1
-                tang = tang_o/norm_tang
-                tang[0] = 0
-                tang[1] = 0
-
-            self.cell_nn_tx.append(tang[0])
-            self.cell_nn_ty.append(tang[1])
-
-        self.cell_nn_tx = np.asarray(self.cell_nn_tx)
-        self.cell_nn_ty = np.asarray(self.cell_nn_ty)
-
-        # Mapping between gap junction index and cell:
-        self.cell_to_nn_full = [[] for x in range(len(self.cell_i))]
-
-        for i, (cell_i, cell_j) in enumerate(self.cell_nn_i):
-            # If it's not a boundary membrane...
-            if cell_i != cell_j:
-                self.cell_to_nn_full[cell_i].append(i)
-                self.cell_to_nn_full[cell_j].append(i)
-
-        self.cell_to_nn_full = np.asarray(self.cell_to_nn_full, dtype=object)
+        self.cell_to_nn_full = _split_ragged(
+            gj_i[gj_order], np.bincount(gj_cells, minlength=len(self.cell_i)), is_list=True)
 
 
     @type_check
@@ -2242,24 +1788,25 @@ class Cells(object):
         # a matrix that will take a continuous gradient for a value on a cell
         # membrane: returns gradient tangent to cell membrane.
 
-        self.gradMem = np.zeros((len(self.mem_i),len(self.mem_i)))
-
-        #FIXME: "i" appears to be unused here. In optimistic theory, this
-        #implies that this loop should be reducible to:
-        #    for inds in self.cell_to_mems:
-        #Maybe? Unshroud the penultimate technique, Dagalfor!
-        for i, inds in enumerate(self.cell_to_mems):
-
-            inds = np.asarray(inds)
-
-            inds_p1 = np.roll(inds,1)
-            inds_o = np.roll(inds,0)
-
-            dist = self.mem_mids_flat[inds_p1] - self.mem_mids_flat[inds_o]
-            len_mem = np.sqrt(dist[:,0]**2 + dist[:,1]**2)
-
-            self.gradMem[inds_o,inds_p1] = 1/len_mem.mean()
-            self.gradMem[inds_o,inds_o] = -1/len_mem.mean()
+        mems, mems_prev = self._get_membranes_rolled(shift=1)
+
+        # Mean distance between adjacent membrane midpoints of each cell,
+        # broadcast to each membrane of that cell.
+        len_mem = np.linalg.norm(
+            self.mem_mids_flat[mems_prev] - self.mem_mids_flat[mems], axis=1)
+        len_mem_mean = (
+            np.bincount(
+                self.mem_to_cells[mems], weights=len_mem,
+                minlength=len(self.cell_i)) /
+            self.num_mems)[self.mem_to_cells[mems]]
+
+        self.gradMem = matrices.make_matrix(
+            backend=self._matrix_backend,
+            data=np.concatenate((1/len_mem_mean, -1/len_mem_mean)),
+            row_indices=np.concatenate((mems, mems)),
+            col_indices=np.concatenate((mems_prev, mems)),
+            shape=(len(self.mem_i), len(self.mem_i)),
+        )
 
     # SVG processing functions-----------------------------------------------------------------------------------------
     @type_check
@@ -2347,8 +1894,8 @@ class Cells(object):
         Takes vector quantity (Smx, Smy) defined at membranes and calculates the averaged
         single vector at the cell centre.
         """
-        Scx = np.dot(self.M_sum_mems, Smx * self.mem_sa) / self.cell_sa
-        Scy = np.dot(self.M_sum_mems, Smy * self.mem_sa) / self.cell_sa
+        Scx = self.M_sum_mems.dot(Smx * self.mem_sa) / self.cell_sa
+        Scy = self.M_sum_mems.dot(Smy * self.mem_sa) / self.cell_sa
 
         return Scx, Scy
 
@@ -2393,7 +1940,7 @@ class Cells(object):
         if cbound is True: # close the boundary (zero-flux boundary condition)
             gSn[self.bflags_mems] = 0.0
 
-        divS = np.dot(self.M_sum_mems, gSn * self.mem_sa) / self.cell_vol
+        divS = self.M_sum_mems.dot(gSn * self.mem_sa) / self.cell_vol
 
         return divS
 
@@ -2441,7 +1988,7 @@ class Cells(object):
         fmemi = (fmem[self.nn_i] + fmem[self.mem_i])/2
 
         # average the values at the cell centre point:
-        fcent = (1/2)*(f + (np.dot(self.M_sum_mems, fmemi)/self.num_mems))
+        fcent = (1/2)*(f + (self.M_sum_mems.dot(fmemi)/self.num_mems))
 
         return fcent, fmemi
 
@@ -2474,7 +2021,7 @@ class Cells(object):
 
             curlF_o = dFy_dx - dFx_dy
 
-            curl_z = np.dot(self.M_sum_mems,curlF_o)/self.num_mems
+            curl_z = self.M_sum_mems.dot(curlF_o)/self.num_mems
 
             curl_x = 0
             curl_y = 0
@@ -2489,8 +2036,8 @@ class Cells(object):
             curl_phi_x_o = dphi_dy_o
             curl_phi_y_o = -dphi_dx_o
 
-            curl_x = np.dot(self.M_sum_mems,curl_phi_x_o)/self.num_mems
-            curl_y = np.dot(self.M_sum_mems,curl_phi_y_o)/self.num_mems
+            curl_x = self.M_sum_mems.dot(curl_phi_x_o)/self.num_mems
+            curl_y = self.M_sum_mems.dot(curl_phi_y_o)/self.num_mems
 
             curl_z = 0
 
@@ -2522,12 +2069,12 @@ class Cells(object):
         """
 
         # calculate divergence as the sum of this vector x each surface area, divided by cell volume:
-        div_F = (np.dot(self.M_sum_mems, Fn * self.mem_sa) / self.cell_vol)
+        div_F = (self.M_sum_mems.dot(Fn * self.mem_sa) / self.cell_vol)
 
         fxo = Fn*self.nn_tx
         fyo = Fn*self.nn_ty
 
-        Phi = np.dot(self.lapGJinv, div_F + rho)
+        Phi = self.lapGJinv.solve(div_F + rho)
 
         gPhi = (Phi[self.cell_nn_i[:, 1]] - Phi[self.cell_nn_i[:, 0]]) / (self.nn_len)
 
@@ -2542,8 +2089,8 @@ class Cells(object):
 
 
         # calculate the net displacement of cell centres under the applied force under incompressible conditions:
-        F_cell_x = np.dot(self.M_sum_mems, Fx) / self.num_mems
-        F_cell_y = np.dot(self.M_sum_mems, Fy) / self.num_mems
+        F_cell_x = self.M_sum_mems.dot(Fx) / self.num_mems
+        F_cell_y = self.M_sum_mems.dot(Fy) / self.num_mems
 
         return Fn, F_cell_x, F_cell_y
 
@@ -2579,7 +2126,7 @@ class Cells(object):
 
         # if bounds_closed is True:
 
-        AA = np.dot(self.lapGJinv, -curlF)
+        AA = self.lapGJinv.solve(-curlF)
 
         Ax, Ay, _ = self.curl(0, 0, AA)
 
@@ -2592,17 +2139,17 @@ class Cells(object):
 
             Fn = Fxm * nx + Fym * ny
 
-            divF = np.dot(self.M_sum_mems, Fn * self.mem_sa) / self.cell_vol
+            divF = self.M_sum_mems.dot(Fn * self.mem_sa) / self.cell_vol
 
-            BB = np.dot(self.lapGJinv, divF)
+            BB = self.lapGJinv.solve(divF)
 
             gBB = (BB[self.cell_nn_i[:, 1]] - BB[self.cell_nn_i[:, 0]]) / (self.nn_len)
 
             Bxm = gBB * nx
             Bym = gBB * ny
 
-            Bx = np.dot(self.M_sum_mems, Bxm) / self.num_mems
-            By = np.dot(self.M_sum_mems, Bym) / self.num_mems
+            Bx = self.M_sum_mems.dot(Bxm) / self.num_mems
+            By = self.M_sum_mems.dot(Bym) / self.num_mems
 
         else:
             BB = 0
@@ -2614,7 +2161,7 @@ class Cells(object):
     def single_cell_div_free(self, uxo, uyo):
         # now, make the transport field divergence-free wrt individual cells (divergence-free is the way to be!
         divU = self.div(uxo, uyo, cbound=False)  # divergence of the field at each membrane
-        Pi = np.dot(self.M_sum_mems_inv, divU) * (
+        Pi = self.M_sum_mems_inv.dot(divU) * (
             self.cell_vol[self.mem_to_cells] / self.mem_sa)  # 'pressure" field to create div-free case
 
         ux = uxo - Pi * self.mem_vects_flat[:, 2]  # corrected vector at the membrane
@@ -2647,9 +2194,10 @@ class Cells(object):
     # ..........{ PROPERTIES ~ mappers                   }.....................
     #FIXME: For readability, rename to membranes_midpoint_to_vertices().
     @property_cached
-    def matrixMap2Verts(self) -> ndarray:
+    def matrixMap2Verts(self) -> object:
         '''
-        Numpy matrix (i.e., two-dimensional array) of size ``m x n``, where:
+        Matrix of size ``m x n`` represented with the matrix backend of this
+        cell cluster (see :attr:`_matrix_backend`), where:
 
         * ``m`` is the total number of cell membranes.
         * ``n`` is the total number of cell membrane vertices.
@@ -2659,37 +2207,173 @@ class Cells(object):
 
         * 0 if this vertex is *not* one of the two vertices defining this
           membrane. Since most vertices do *not* define most membranes, most
-          entries of this matrix are zero, implying this matrix to typically
-          (but *not* necessarily) be sparse.
+          entries of this matrix are zero, implying this matrix to be sparse
+          with exactly two non-zero entries per row.
         * 0.5 if this vertex is one of the two vertices defining this membrane,
           thus averaging membrane data defined at membrane midpoints over the
           vertex pairs defining these membranes.
 
         Usage
         -----------
-        The dot product of a Numpy vector (i.e., one-dimensional array) of size
-        ``m`` containing membrane-specific data by this matrix yields another
-        Numpy vector of size ``n`` containing membrane vertex-specific data
-        interpolated from these membranes over these vertices, where ``m`` and
-        ``n`` are as defined above.
+        The dot product of the transpose of this matrix by a Numpy vector
+        (i.e., one-dimensional array) of size ``m`` containing membrane-specific
+        data yields another Numpy vector of size ``n`` containing membrane
+        vertex-specific data interpolated from these membranes over these
+        vertices, where ``m`` and ``n`` are as defined above: e.g.,
+
+            >>> verts_data = cells.matrixMap2Verts.T.dot(mems_data)
+
+        This matrix is cached *only* on the first access of this property.
         '''
 
-        # Zero this matrix to the expected dimensions.
-        matrixMap2Verts = np.zeros(
-            (len(self.mem_mids_flat), len(self.mem_verts)))
+        # Number of cell membranes.
+        mems_count = len(self.mem_mids_flat)
 
         # For the indices of each membrane and the two vertices terminating
         # that membrane, interpolate arbitrary data defined at the former over
         # the latter.
-        for cell_membrane_index, cell_membrane_vertices_index in enumerate(
-            self.index_to_mem_verts):
-            matrixMap2Verts[
-                cell_membrane_index, cell_membrane_vertices_index[0]] = 1/2
-            matrixMap2Verts[
-                cell_membrane_index, cell_membrane_vertices_index[1]] = 1/2
+        return matrices.make_matrix(
+            backend=self._matrix_backend,
+            data=np.full(2*mems_count, 1/2),
+            row_indices=np.repeat(np.arange(mems_count), 2),
+            col_indices=np.asarray(self.index_to_mem_verts).ravel(),
+            shape=(mems_count, len(self.mem_verts)),
+        )
 
-        # Cache this matrix.
-        return matrixMap2Verts
+
+    @property_cached
+    def gradTheta(self) -> object:
+        '''
+        Matrix of size ``m x m`` represented with the matrix backend of this
+        cell cluster (see :attr:`_matrix_backend`) computing the gradients of
+        arbitrary data spatially situated at cell membrane midpoints around the
+        circumference of each cell, where ``m`` is the total number of cell
+        membranes.
+
+        Each row of this matrix contains exactly two non-zero entries,
+        differencing the data at that membrane and the prior membrane of the
+        same cell over the distance between their midpoints (see
+        :attr:`radial_len`).
+
+        This matrix is cached *only* on the first access of this property.
+        '''
+
+        # Indices of all membranes and of the prior membrane of the same cell.
+        mems, mems_prev = self._get_membranes_rolled(shift=1)
+
+        # Inverse distances between these membrane midpoints.
+        radial_len_inv = 1 / self.radial_len[mems]
+
+        return matrices.make_matrix(
+            backend=self._matrix_backend,
+            data=np.concatenate((radial_len_inv, -radial_len_inv)),
+            row_indices=np.concatenate((mems, mems)),
+            col_indices=np.concatenate((mems, mems_prev)),
+            shape=(len(self.mem_i), len(self.mem_i)),
+        )
+
+
+    @property_cached
+    def lapGJmem_inv(self) -> object:
+        '''
+        Matrix of size ``m x m`` represented with the matrix backend of this
+        cell cluster (see :attr:`_matrix_backend`) inverting the Laplacian of
+        arbitrary data spatially situated at the cell membrane midpoints of each
+        individual cell, where ``m`` is the total number of cell membranes.
+
+        Since membranes of different cells are uncoupled, this Laplacian (and
+        hence its Moore-Penrose pseudo-inverse) is block-diagonal with one
+        dense ``k x k`` block per cell, where ``k`` is the number of membranes
+        of that cell. Each block is pseudo-inverted independently, vectorized
+        over all cells with the same number of membranes, reducing both space
+        and time from quadratic and cubic in ``m`` to linear.
+
+        This matrix is cached *only* on the first access of this property.
+        '''
+
+        # Indices of all membranes grouped by cell and the number of membranes
+        # of each cell.
+        mems, _ = self._get_membranes_rolled(shift=0)
+        mems_counts = np.fromiter(
+            (len(cell_mems) for cell_mems in self.cell_to_mems),
+            dtype=int, count=len(self.cell_to_mems))
+        mems_offsets = np.cumsum(mems_counts) - mems_counts
+
+        # Ratio of the surface area to volume of each membrane.
+        mems_weight = self.mem_sa / self.mem_vol
+
+        # Lists of the non-zero entries of this matrix and the row and column
+        # indices of these entries, aggregated over all block sizes.
+        data = []
+        row_indices = []
+        col_indices = []
+
+        # For each number of membranes per cell...
+        for mems_count in np.unique(mems_counts):
+            # Two-dimensional array of the membrane indices of all cells with
+            # this number of membranes, indexed first by cell.
+            cells_mems = mems[
+                mems_offsets[mems_counts == mems_count][:, np.newaxis] +
+                np.arange(mems_count)]
+
+            # Three-dimensional array of the Laplacian block of each such cell,
+            # whose entry "[j, k]" is "(delta_jk - 1/mems_count)*weight_k".
+            cells_lap = (
+                (np.eye(mems_count) - 1/mems_count)[np.newaxis] *
+                mems_weight[cells_mems][:, np.newaxis, :])
+
+            data.append(np.linalg.pinv(cells_lap).ravel())
+            row_indices.append(np.broadcast_to(
+                cells_mems[:, :, np.newaxis], cells_lap.shape).ravel())
+            col_indices.append(np.broadcast_to(
+                cells_mems[:, np.newaxis, :], cells_lap.shape).ravel())
+
+        return matrices.make_matrix(
+            backend=self._matrix_backend,
+            data=np.concatenate(data),
+            row_indices=np.concatenate(row_indices),
+            col_indices=np.concatenate(col_indices),
+            shape=(len(self.mem_i), len(self.mem_i)),
+        )
+
+
+    @property_cached
+    def divCell_inv(self) -> object:
+        '''
+        Matrix of size ``m x n`` represented with the matrix backend of this
+        cell cluster (see :attr:`_matrix_backend`) inverting the divergence of
+        arbitrary data spatially situated at the cell membrane midpoints of each
+        individual cell, where:
+
+        * ``m`` is the total number of cell membranes.
+        * ``n`` is the total number of cells.
+
+        This matrix is the Moore-Penrose pseudo-inverse of the ``n x m``
+        divergence matrix whose entry ``[i, j]`` is the ratio of the surface
+        area of membrane ``j`` to the volume of cell ``i`` if that cell contains
+        that membrane and 0 otherwise. As the rows of that matrix are disjoint,
+        this pseudo-inverse reduces to the transpose of that matrix with each
+        column divided by the squared norm of the corresponding row, avoiding an
+        expensive dense :func:`numpy.linalg.pinv` call.
+
+        This matrix is cached *only* on the first access of this property.
+        '''
+
+        # Divergence term of each membrane with respect to its cell.
+        mems_div = self.mem_sa / self.cell_vol[self.mem_to_cells]
+
+        # Divergence matrix.
+        divCell = matrices.make_matrix(
+            backend=self._matrix_backend,
+            data=mems_div,
+            row_indices=self.mem_to_cells,
+            col_indices=self.mem_i,
+            shape=(len(self.cell_i), len(self.mem_i)),
+        )
+
+        # Pseudo-inverse of this matrix.
+        return matrices.scale_columns(
+            divCell.T, 1 / self.M_sum_mems.dot(mems_div**2))
 
 
     #FIXME: Eventually we want to switch this up. This data structure should
@@ -2736,13 +2420,84 @@ class Cells(object):
         #   "num_mems" is a row vector of length m whose elements are the
         #   number of membranes in that cell, each column of this transpose is
         #   divided by the corresponding element of this row vector.
-        return self.M_sum_mems.T / self.num_mems
+        return matrices.scale_columns(self.M_sum_mems.T, 1 / self.num_mems)
+
+    # ..........{ PROPERTIES ~ private                   }.....................
+    @property
+    def _matrix_backend(self) -> MatrixBackendType:
+        '''
+        Type of matrix backend with which this cell cluster was seeded, as
+        inferred from the type of the :attr:`M_sum_mems` matrix.
+
+        All matrices lazily created by properties of this cell cluster are
+        represented with this backend.
+        '''
+
+        return (
+            MatrixBackendType.SPARSE if matrices.is_sparse(self.M_sum_mems) else
+            MatrixBackendType.DENSE)
+
+    # ..........{ EVICTORS                               }.....................
+    def evict_matrices(self) -> None:
+        '''
+        Evict all matrices lazily created by properties of this cell cluster
+        (e.g., :attr:`matrixMap2Verts`, :attr:`lapGJmem_inv`) and all
+        interpolators cached by the :meth:`map_cells_centre_to_points` method,
+        releasing the memory consumed by these objects.
+
+        Each such matrix is transparently recreated on its next access. Callers
+        may thus call this method whenever memory is scarce (e.g., between
+        exporting successive visuals). This method is also implicitly called
+        by the :meth:`cellMatrices` method, as (re)creating the matrices of
+        this cell cluster (e.g., after cutting cells) invalidates all such
+        matrices.
+        '''
+
+        for property_name in self._MATRICES_CACHED_NAMES:
+            self.__dict__.pop(
+                PROPERTY_CACHED_VAR_NAME_PREFIX + property_name, None)
+
+        self.__dict__.pop('_cells_centre_interpolators', None)
+
+    # ..........{ GETTERS ~ private                      }.....................
+    def _get_membranes_rolled(self, shift: int) -> tuple:
+        '''
+        2-tuple ``(mems, mems_rolled)`` of one-dimensional Numpy arrays, where
+        ``mems`` is the indices of all membranes grouped by cell in cell order
+        and ``mems_rolled`` is ``mems`` with the indices of the membranes of
+        each cell rolled by the passed shift as if by :func:`numpy.roll`.
+
+        This method vectorizes the idiom
+        ``for mem_i in cells.cell_to_mems: mem_io = np.roll(mem_i, shift)``.
+        '''
+
+        # Number of membranes of each cell.
+        mems_counts = np.fromiter(
+            (len(cell_mems) for cell_mems in self.cell_to_mems),
+            dtype=int, count=len(self.cell_to_mems))
+
+        # Indices of all membranes grouped by cell.
+        mems = np.concatenate([
+            np.asarray(cell_mems, dtype=int)
+            for cell_mems in self.cell_to_mems])
+
+        # Index into "mems" of the first membrane of the cell of each membrane
+        # *AND* the number of membranes of that cell.
+        mems_cell_offset = np.repeat(
+            np.cumsum(mems_counts) - mems_counts, mems_counts)
+        mems_cell_count = np.repeat(mems_counts, mems_counts)
+
+        # Position of each membrane in its cell, rolled by this shift.
+        mems_position_rolled = (
+            np.arange(len(mems)) - mems_cell_offset - shift) % mems_cell_count
+
+        return mems, mems[mems_cell_offset + mems_position_rolled]
 
     # ..........{ MAPPERS                                }.....................
     #FIXME: To reduce code duplication:
     #
     #    # Globally replace all instances of this...
-    #    np.dot(cells.M_sum_mems, some_array) / cells.num_mems
+    #    cells.M_sum_mems.dot(some_array) / cells.num_mems
     #
     #    # ...with this.
     #    cells.calculate_divergence(some_array)
@@ -2817,9 +2572,11 @@ class Cells(object):
 
         # Map this array from cell membrane midpoints onto cell centres. By
         # design, this efficiently supports both one- and two-dimensional input
-        # arrays as is.
-        return np.dot(
-            membranes_midpoint_data, self.membranes_midpoint_to_cells_centre)
+        # arrays as is. Since the "M_sum_mems" matrix may be sparse, this
+        # matrix is applied from the left to the transpose of this array rather
+        # than right-applied with np.dot() to this array.
+        return self.M_sum_mems.dot(
+            membranes_midpoint_data.T).T / self.num_mems
 
     # ..........{ MAPPERS ~ cells centre                  }.....................
     def map_cells_centre_to_grids_centre(
@@ -2922,7 +2679,11 @@ class Cells(object):
         interp_method : optional[str]
             Interpolation type to pass to the
             :func:`scipy.interpolate.gridddata` function (e.g., ``nearest``,
-            ``linear``, ``cubic``). Defaults to ``linear``.
+            ``linear``, ``cubic``). Defaults to ``linear``. For the ``nearest``
+            and ``linear`` types, all source data is instead interpolated by a
+            single multiplication by a sparse matrix cached with this cell
+            cluster (see :meth:`_get_cells_centre_interpolator`), avoiding the
+            costly triangulation of all cell centres on each call.
         data_factor : NumericOrSequenceTypes
             Integer, float, or one-dimensional sequence of integers or floats
             by which to multiply all elements of the returned array. Defaults to
@@ -2966,6 +2727,29 @@ class Cells(object):
                 '(i.e., first dimension length {} not 2).'.format(
                     len(target_points)))
 
+        # 2-tuple of the shape of these target points *AND* a two-dimensional
+        # Numpy array whose rows are the X and Y coordinates of these points.
+        target_points = np.broadcast_arrays(*target_points)
+        target_points_shape = target_points[0].shape
+        target_points_xy = np.column_stack(
+            (target_points[0].ravel(), target_points[1].ravel()))
+
+        # Sparse operator interpolating from cell centres onto these target
+        # points if this interpolation type is linear in the source data *OR*
+        # "None" otherwise.
+        interpolator = self._get_cells_centre_interpolator(
+            target_points_xy=target_points_xy, interp_method=interp_method)
+
+        # If this operator exists, interpolate all source data (regardless of
+        # dimensionality) via a single sparse matrix multiplication. Since
+        # this operator expects cells along its second dimension, this operator
+        # is applied from the left to the transpose of this data.
+        if interpolator is not None:
+            cells_centre_data_interpolated = interpolator.dot(
+                cells_centre_data.T).T
+            return data_factor * cells_centre_data_interpolated.reshape(
+                cells_centre_data.shape[:-1] + target_points_shape)
+
         # 2-tuple of the X and Y coordinates of all cell centres.
         cell_centres = (self.cell_centres[:, 0], self.cell_centres[:, 1])
 
@@ -2976,7 +2760,7 @@ class Cells(object):
             'points': cell_centres,
 
             # 2-tuple of all target X and Y coordinates to interpolate onto.
-            'xi': target_points,
+            'xi': tuple(target_points),
 
             # Machine-readable string specifying the interpolation type.
             'method': interp_method,
@@ -3015,3 +2799,161 @@ class Cells(object):
 
             # Return this output list converted back to an output array.
             return nparray.from_iterable(cells_centre_data_interpolated)
+
+
+    def _get_cells_centre_interpolator(
+        self, target_points_xy: ndarray, interp_method: str) -> object:
+        '''
+        SciPy-based sparse matrix of size ``m x n`` interpolating arbitrary
+        data spatially situated at cell centres onto the passed target points
+        via the passed interpolation type if this type is linear in this data
+        *or* ``None`` otherwise, where:
+
+        * ``m`` is the total number of target points.
+        * ``n`` is the total number of cells.
+
+        This matrix reproduces the :func:`scipy.interpolate.griddata` function
+        to within roundoff error (including the 0 fill value of the
+        :meth:`map_cells_centre_to_points` method) for the ``nearest`` and
+        ``linear`` interpolation types. Since the ``cubic`` interpolation type
+        estimates gradients globally, this type is unsupported.
+
+        Since the Delaunay triangulation of all cell centres and the barycentric
+        coordinates of all target points within this triangulation are costly
+        to compute, this matrix is cached per cell cluster. Since cell centres
+        are modified by cutting events and deformations, each cached matrix is
+        validated against the cell centres and target points it was created
+        for before being reused.
+
+        Parameters
+        ----------
+        target_points_xy : ndarray
+            Two-dimensional Numpy array whose rows are the X and Y coordinates
+            of all target points to interpolate onto.
+        interp_method : str
+            Interpolation type (e.g., ``nearest``, ``linear``).
+
+        Returns
+        ----------
+        (scipy.sparse.csr_matrix, NoneType)
+            Either this matrix if this interpolation type is supported *or*
+            ``None`` otherwise.
+        '''
+
+        # If this interpolation type is unsupported, return "None".
+        if interp_method not in {'nearest', 'linear'}:
+            return None
+
+        # Dictionary mapping from the 2-tuple "(interp_method, target_count)"
+        # to the 3-tuple "(cell_centres, target_points_xy, interpolator)" of
+        # the most recently created matrix for that key, created on demand for
+        # compatibility with previously pickled cell clusters.
+        interpolators = getattr(self, '_cells_centre_interpolators', None)
+        if interpolators is None:
+            interpolators = self._cells_centre_interpolators = {}
+
+        # If a matrix valid for these cell centres and target points has
+        # already been created, return this matrix as is.
+        interpolator_key = (interp_method, len(target_points_xy))
+        interpolator_cached = interpolators.get(interpolator_key)
+        if (
+            interpolator_cached is not None and
+            np.array_equal(interpolator_cached[0], self.cell_centres) and
+            np.array_equal(interpolator_cached[1], target_points_xy)
+        ):
+            return interpolator_cached[2]
+
+        # Number of target points and cells.
+        target_count = len(target_points_xy)
+        cell_count = len(self.cell_centres)
+
+        # If interpolating from the nearest cell centre, each target point
+        # receives the data of that centre.
+        if interp_method == 'nearest':
+            _, cells_index = cKDTree(self.cell_centres).query(target_points_xy)
+            targets_index = np.arange(target_count)
+            weights = np.ones(target_count)
+        # Else, each target point residing inside the convex hull of all cell
+        # centres receives the data of the vertices of the Delaunay triangle
+        # containing that point weighted by its barycentric coordinates with
+        # respect to that triangle. All other target points receive 0.
+        else:
+            triangulation = Delaunay(self.cell_centres)
+
+            # Indices of all target points residing in some triangle and of
+            # these triangles.
+            triangles_index = triangulation.find_simplex(target_points_xy)
+            targets_index = np.flatnonzero(triangles_index >= 0)
+            triangles_index = triangles_index[targets_index]
+
+            # Barycentric coordinates of these target points, computed exactly
+            # as LinearNDInterpolator does.
+            transforms = triangulation.transform[triangles_index]
+            barycentric = np.einsum(
+                'ijk,ik->ij',
+                transforms[:, :2],
+                target_points_xy[targets_index] - transforms[:, 2],
+            )
+            weights = np.column_stack(
+                (barycentric, 1 - barycentric.sum(axis=1))).ravel()
+
+            cells_index = triangulation.simplices[triangles_index].ravel()
+            targets_index = np.repeat(targets_index, 3)
+
+        # Create and cache this matrix.
+        interpolator = sparse.csr_matrix(
+            (weights, (targets_index, cells_index)),
+            shape=(target_count, cell_count),
+        )
+        interpolators[interpolator_key] = (
+            self.cell_centres.copy(), target_points_xy.copy(), interpolator)
+        return interpolator
+
+# ....................{ PRIVATE ~ helpers                 }....................
+def _split_ragged(
+    array: ndarray, counts: ndarray, is_list: bool = False) -> ndarray:
+    '''
+    One-dimensional Numpy object array of the consecutive subarrays of the
+    passed array whose lengths are the passed counts, replacing the idiom of
+    appending per-cell (or per-membrane) lists in a Python loop.
+
+    Unlike :func:`numpy.asarray` passed ``dtype=object``, this function
+    unconditionally creates a one-dimensional array (even if all subarrays
+    share the same length).
+
+    Parameters
+    ----------
+    array : ndarray
+        Numpy array to be split along its first dimension.
+    counts : ndarray
+        One-dimensional Numpy array of the length of each subarray, whose sum
+        is the length of this array.
+    is_list : bool
+        ``True`` only if each subarray is to be converted into a :class:`list`.
+        Defaults to ``False``.
+    '''
+
+    subarrays = np.split(array, np.cumsum(counts)[:-1])
+    ragged = np.empty(len(subarrays), dtype=object)
+
+    # Assign each subarray individually, as assigning a list of subarrays
+    # sharing the same length would coerce that list into a two-dimensional
+    # array first.
+    for subarray_index, subarray in enumerate(subarrays):
+        ragged[subarray_index] = subarray.tolist() if is_list else subarray
+    return ragged
+
+
+def _get_unit_vectors(vects: ndarray) -> tuple:
+    '''
+    2-tuple ``(unit_x, unit_y)`` of the X and Y components of the unit vectors
+    parallel to the passed two-dimensional Numpy array of vectors, whose rows
+    are the X and Y components of each vector. Zero vectors map to zero unit
+    vectors.
+    '''
+
+    vects_mag = np.sqrt(vects[:, 0]**2 + vects[:, 1]**2)
+    vects_unit = np.zeros(vects.shape)
+    np.divide(
+        vects, vects_mag[:, None], out=vects_unit, where=vects_mag[:, None] != 0)
+    return vects_unit[:, 0], vects_unit[:, 1]
@@ -60,6 +60,7 @@ class CationABC(ChannelsABC, metaclass=ABCMeta):
         # V = vm * 1000 + self.v_corr
 
         self._init_state(V)
+        self._init_gating_table(p)
 
         self.ions = ['Na', 'K', 'Ca']
         self.rel_perm = [self._pmNa, 1.0, self._pmCa]
@@ -78,7 +79,7 @@ class CationABC(ChannelsABC, metaclass=ABCMeta):
 
         V = vm[self.targets]*1000
 
-        self._calculate_state(V)
+        self._update_gating(V)
 
         self._implement_state(V, p)
 
@@ -90,8 +91,7 @@ class CationABC(ChannelsABC, metaclass=ABCMeta):
         # calculate the open-probability of the channel:
         P = (self.m ** self._mpower) * (self.h ** self._hpower)
 
-        self.P = np.zeros(self.mdl)
-        self.P[self.targets] = P
+        self._set_open_probability(P)
 
 
     @abstractmethod
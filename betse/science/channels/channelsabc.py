@@ -9,8 +9,19 @@ Abstract base classes of all channel classes.
 # ....................{ IMPORTS                            }....................
 from abc import ABCMeta, abstractmethod
 import numpy as np
+from betse.exceptions import BetseSimConfException
 from betse.science import sim_toolbox as stb
 from betse.science.math import toolbox as tb
+from betse.util.io.log import logs
+
+# ....................{ CONSTANTS                          }....................
+GATING_VAR_NAMES = ('_mInf', '_mTau', '_hInf', '_hTau')
+'''
+Names of all instance variables to which the ``_calculate_state`` method of
+each voltage-gated channel assigns the voltage-dependent **gating kinetics**
+(i.e., equilibrium values and time constants of the m and h gates) of that
+channel.
+'''
 
 # ....................{ BASE                               }....................
 class ChannelsABC(object, metaclass=ABCMeta):
@@ -19,7 +30,36 @@ class ChannelsABC(object, metaclass=ABCMeta):
 
     Attributes
     ----------
+    _gating_table : ndarray or None
+        If gating tables are enabled by the simulation configuration *and* the
+        gating kinetics of this channel vary with voltage, two-dimensional
+        Numpy array whose rows are the voltage-dependent gating kinetics named
+        by :attr:`_gating_table_names` and whose columns are the uniformly
+        spaced voltages ``_gating_table_vmem_min + i*_gating_table_vmem_step``
+        in mV; else, ``None``.
+    _gating_table_names : tuple
+        Names of all gating kinetics tabulated by :attr:`_gating_table`.
+    _gating_table_slopes : ndarray
+        Two-dimensional Numpy array of the differences between successive
+        columns of :attr:`_gating_table`.
+    _gating_table_vmem_max : float
+        Largest voltage in mV tabulated by :attr:`_gating_table`.
+    _gating_table_vmem_min : float
+        Smallest voltage in mV tabulated by :attr:`_gating_table`.
+    _gating_table_vmem_step : float
+        Spacing in mV between voltages tabulated by :attr:`_gating_table`.
+    _P_mems : ndarray or None
+        One-dimensional Numpy array of the open probabilities of this channel
+        over all membranes, preallocated by the first call to the
+        :meth:`_set_open_probability` method and reused by subsequent calls
+        if this channel targets a subset of membranes; else, ``None``.
     '''
+
+    # Default the gating table and open probabilities to none for channels
+    # pickled by older versions.
+    _gating_table = None
+    _P_mems = None
+
     @abstractmethod
     def init(self, vm, cells, p, targets = None):
         '''
@@ -37,6 +77,240 @@ class ChannelsABC(object, metaclass=ABCMeta):
         '''
         pass
 
+    def _init_gating_table(self, p):
+        '''
+        Precompute the voltage-indexed gating table of this channel from the
+        analytic gating kinetics assigned by the ``_calculate_state`` method
+        of this channel if enabled by the passed simulation configuration.
+
+        This table samples these kinetics over the configured voltage range and
+        resolution, replacing non-finite samples (e.g., at removable
+        singularities of these expressions) by interpolation from their finite
+        neighbours. The accuracy of this table is then checked against these
+        expressions at the midpoints between all samples (i.e., where linear
+        interpolation is least accurate). If the largest error of any gating
+        kinetic relative to the largest magnitude of that kinetic exceeds the
+        configured tolerance, this table is discarded with a warning and these
+        kinetics are evaluated analytically instead.
+
+        This table is computed entirely into local variables, leaving all
+        gating kinetics of this channel as assigned before this call *except*
+        kinetics independent of voltage (e.g., constant time constants of leak
+        channels), which are assigned once if this table is retained.
+        '''
+
+        # Default to evaluating these kinetics analytically.
+        self._gating_table = None
+
+        # If gating tables are disabled, reduce to a noop.
+        if not p.is_channel_gating_tabled:
+            return
+
+        # If this range is empty, raise an exception.
+        if not (
+            p.channel_gating_vmem_min < p.channel_gating_vmem_max and
+            p.channel_gating_vmem_step > 0
+        ):
+            raise BetseSimConfException(
+                'Gating table range [{}, {}] mV empty or step {} mV '
+                'not positive.'.format(
+                    p.channel_gating_vmem_min, p.channel_gating_vmem_max,
+                    p.channel_gating_vmem_step))
+
+        # Uniform grid of voltages spanning the configured range [mV].
+        vmem_min = p.channel_gating_vmem_min
+        vmem_step = p.channel_gating_vmem_step
+        vmem_count = int(np.ceil(
+            (p.channel_gating_vmem_max - vmem_min)/vmem_step)) + 1
+        vmem_grid = vmem_min + vmem_step*np.arange(vmem_count)
+
+        # Names and values of all gating kinetics varying with voltage over
+        # this grid *AND* the values of all other gating kinetics.
+        gating_names, gating_table, gating_constants = (
+            self._get_gating_analytic(vmem_grid))
+
+        # If no gating kinetics vary with voltage, reduce to a noop.
+        if not gating_names:
+            return
+
+        # Replace all non-finite samples by interpolation from their finite
+        # neighbours.
+        for gating_row in gating_table:
+            is_finite = np.isfinite(gating_row)
+            if not is_finite.all() and is_finite.any():
+                gating_row[~is_finite] = np.interp(
+                    vmem_grid[~is_finite],
+                    vmem_grid[is_finite], gating_row[is_finite])
+
+        # Differences between successive samples, padded by a trailing zero
+        # such that the largest tabulated voltage indexes this table safely.
+        gating_slopes = np.diff(
+            gating_table, axis=1, append=gating_table[:, -1:])
+
+        # Check the accuracy of this table at the midpoints between samples.
+        vmem_mids = vmem_grid[:-1] + vmem_step/2
+        _, gating_exact, _ = self._get_gating_analytic(vmem_mids)
+        gating_approx = _interp_table(
+            vmem_mids, vmem_min, vmem_step, gating_table, gating_slopes)
+
+        for gating_name, gating_exact_row, gating_approx_row in zip(
+            gating_names, gating_exact, gating_approx):
+            is_finite = np.isfinite(gating_exact_row)
+            gating_error = (
+                np.abs(gating_approx_row - gating_exact_row)[is_finite].max(
+                    initial=0.0) /
+                np.abs(gating_exact_row)[is_finite].max(initial=1.0))
+
+            # If this error exceeds the tolerance, discard this table.
+            if not gating_error <= p.channel_gating_tolerance:
+                logs.log_warning(
+                    'Channel "%s" gating table error %g for "%s" exceeds '
+                    'tolerance %g; evaluating gating kinetics analytically.',
+                    type(self).__name__, gating_error, gating_name,
+                    p.channel_gating_tolerance)
+                return
+
+        # Classify this table *AFTER* validating this table.
+        self._gating_table = gating_table
+        self._gating_table_names = gating_names
+        self._gating_table_slopes = gating_slopes
+        self._gating_table_vmem_min = vmem_min
+        self._gating_table_vmem_max = vmem_grid[-1]
+        self._gating_table_vmem_step = vmem_step
+
+        # Since interpolating this table assigns only the kinetics varying
+        # with voltage, assign all other kinetics once here.
+        for gating_name, gating_value in gating_constants.items():
+            setattr(self, gating_name, gating_value)
+
+        logs.log_debug(
+            'Tabulated channel "%s" gating kinetics over [%g, %g] mV.',
+            type(self).__name__,
+            self._gating_table_vmem_min, self._gating_table_vmem_max)
+
+
+    def _update_gating(self, V):
+        '''
+        Update the gating kinetics of this channel for the passed voltages in
+        mV, interpolated from the gating table of this channel if any *and*
+        all these voltages lie within the range of this table or evaluated
+        analytically by the ``_calculate_state`` method of this channel
+        otherwise.
+        '''
+
+        # If these kinetics are untabulated or any voltage lies outside this
+        # table (e.g., a scalar voltage or a pathological transmembrane
+        # voltage), evaluate these kinetics analytically.
+        if (
+            self._gating_table is None or
+            np.ndim(V) == 0 or
+            V.min() < self._gating_table_vmem_min or
+            V.max() > self._gating_table_vmem_max
+        ):
+            self._calculate_state(V)
+        # Else, interpolate these kinetics from this table.
+        else:
+            for gating_name, gating_values in zip(
+                self._gating_table_names, self._interp_gating_table(V)):
+                setattr(self, gating_name, gating_values)
+
+
+    def _get_gating_analytic(self, V):
+        '''
+        3-tuple ``(gating_names, gating_values, gating_constants)`` of the
+        names of all gating kinetics of this channel varying with voltage, the
+        two-dimensional Numpy array of the values of these kinetics (one row
+        per kinetic) evaluated analytically at the passed one-dimensional Numpy
+        array of voltages in mV, *and* the dictionary mapping from the name of
+        each other gating kinetic to its value.
+
+        Since the ``_calculate_state`` method assigns these kinetics to
+        instance variables of this channel, all instance variables of this
+        channel are restored on returning from this method.
+        '''
+
+        # Instance variables of this channel, restored below.
+        channel_vars = self.__dict__.copy()
+
+        # Evaluate these kinetics, ignoring floating point errors at removable
+        # singularities and extreme voltages of these expressions.
+        try:
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                self._calculate_state(V)
+
+            gating_values_all = {
+                gating_name: getattr(self, gating_name)
+                for gating_name in GATING_VAR_NAMES
+                if hasattr(self, gating_name)
+            }
+        finally:
+            self.__dict__.clear()
+            self.__dict__.update(channel_vars)
+
+        gating_names = tuple(
+            gating_name for gating_name, gating_value in
+            gating_values_all.items() if np.ndim(gating_value) == 1)
+        gating_values = np.array([
+            gating_values_all[gating_name] for gating_name in gating_names],
+            dtype=np.float64).reshape(len(gating_names), len(V))
+        gating_constants = {
+            gating_name: gating_value
+            for gating_name, gating_value in gating_values_all.items()
+            if gating_name not in gating_names
+        }
+
+        return gating_names, gating_values, gating_constants
+
+
+    def _interp_gating_table(self, V):
+        '''
+        List of one-dimensional Numpy arrays of the gating kinetics tabulated
+        by this channel (one array per kinetic), linearly interpolated at the
+        passed one-dimensional Numpy array of voltages in mV within the range
+        of this table.
+
+        See Also
+        ----------
+        :func:`_interp_table`
+            Further details.
+        '''
+
+        return _interp_table(
+            V,
+            self._gating_table_vmem_min,
+            self._gating_table_vmem_step,
+            self._gating_table,
+            self._gating_table_slopes,
+        )
+
+
+    def _set_open_probability(self, P):
+        '''
+        Set the open probabilities :attr:`P` of this channel to the passed
+        open probabilities of all membranes targeted by this channel.
+
+        If this channel targets a subset of membranes, these probabilities are
+        scattered into an array over all membranes zeroed on the first call
+        and reused by subsequent calls, whose untargeted membranes thus remain
+        zero without reallocating that array each time step; else, these
+        probabilities are assigned as is. Callers must thus treat :attr:`P`
+        as read-only.
+
+        If the ``mdl`` attribute of this channel is ``None`` (e.g., as with
+        the evaluator of a :class:`betse.science.channels.channelsbatch.ChannelsBatch`),
+        these probabilities are also assigned as is.
+        '''
+
+        if self.targets is None or self.mdl is None:
+            self.P = P
+        else:
+            if self._P_mems is None or len(self._P_mems) != self.mdl:
+                self._P_mems = np.zeros(self.mdl)
+
+            self._P_mems[self.targets] = P
+            self.P = self._P_mems
+
+
     def update_mh(self, p, time_unit = 1e3):
         """
         Updates the 'm' and 'h' gating functions of the channel model for
@@ -69,3 +343,45 @@ class ChannelsABC(object, metaclass=ABCMeta):
 
         dt = p.dt * self.time_unit
         self.m = (self.m + (dt * self.Phi * self._mInf / self._mTau)) / (1 + ((dt * self.Phi) / self._mTau))
+
+# ....................{ PRIVATE                            }....................
+def _interp_table(V, vmem_min, vmem_step, table, slopes):
+    '''
+    List of one-dimensional Numpy arrays of the rows of the passed gating table
+    (one array per row), linearly interpolated at the passed one-dimensional
+    Numpy array of voltages in mV within the range of this table.
+
+    The index and weight of each voltage into this table are computed once
+    and shared between all rows, each of which is then gathered from its own
+    contiguous row of this table.
+
+    Parameters
+    ----------
+    V : ndarray
+        Voltages to interpolate at [mV].
+    vmem_min : float
+        Smallest voltage tabulated by this table [mV].
+    vmem_step : float
+        Spacing between voltages tabulated by this table [mV].
+    table : ndarray
+        Two-dimensional Numpy array whose rows are gating kinetics and whose
+        columns are the voltages ``vmem_min + i*vmem_step``.
+    slopes : ndarray
+        Two-dimensional Numpy array of the differences between successive
+        columns of this table.
+    '''
+
+    # Real-valued indices of these voltages into this table, split into
+    # integer indices and fractional weights.
+    vmem_weight = V - vmem_min
+    vmem_weight *= 1/vmem_step
+    vmem_index = vmem_weight.astype(np.intp)
+    vmem_weight -= vmem_index
+
+    gating_values = []
+    for gating_row, gating_slopes in zip(table, slopes):
+        gating_value = gating_row.take(vmem_index)
+        gating_value += vmem_weight*gating_slopes.take(vmem_index)
+        gating_values.append(gating_value)
+
+    return gating_values
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Channel batch** (i.e., fused evaluator of multiple instances of the same
+channel class, each targeting its own subset of membranes) facilities.
+'''
+
+# ....................{ IMPORTS                            }....................
+import copy
+import numpy as np
+from betse.exceptions import BetseSimException
+from betse.science.channels.channelsabc import ChannelsABC
+from betse.util.type.types import type_check, SequenceTypes
+
+# ....................{ CLASSES                            }....................
+class ChannelsBatch(object):
+    '''
+    **Channel batch** (i.e., fused evaluator of two or more instances of the
+    same channel class, each targeting its own subset of membranes).
+
+    Each time step, this batch gathers the voltages of the concatenation of
+    all membranes targeted by these channels once, updates the gating kinetics
+    and gate states of these membranes by a single call to the ``run`` method
+    of a private evaluator and scatters the resulting open probabilities of
+    each channel into the preallocated array of that channel. The per-step
+    cost of these channels thus scales with the number of channel classes
+    rather than channel instances.
+
+    Membranes targeted by multiple channels (e.g., channels of the same class
+    applied to overlapping tissue profiles) are concatenated rather than
+    merged, preserving the independent gate states of each channel at these
+    membranes. Each channel thus evolves exactly as if run in isolation.
+
+    Attributes
+    ----------
+    channels : tuple
+        Tuple of all channels evaluated by this batch.
+    _evaluator : ChannelsABC
+        Shallow copy of the first such channel whose targets and gate states
+        are the concatenation of the targets and gate states of all such
+        channels and whose open probabilities are left unscattered.
+    _slices : tuple
+        Tuple of slices, each selecting the targets of the channel with the
+        same index in :attr:`channels` from those of :attr:`_evaluator`.
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    @type_check
+    def __init__(self, channels: SequenceTypes) -> None:
+        '''
+        Initialize this batch from the current gate states of the passed
+        channels.
+
+        Parameters
+        ----------
+        channels : SequenceTypes
+            Sequence of two or more initialized instances of the same channel
+            class, each targeting a subset of membranes.
+
+        Raises
+        ----------
+        BetseSimException
+            If these channels are either fewer than two, instances of different
+            classes or target all membranes.
+        '''
+
+        # Classify this parameter.
+        self.channels = tuple(channels)
+
+        # If these channels are unbatchable, raise an exception.
+        if len(self.channels) < 2:
+            raise BetseSimException(
+                'Channel batch requires two or more channels.')
+        channel_cls = type(self.channels[0])
+        for channel in self.channels:
+            if type(channel) is not channel_cls:
+                raise BetseSimException(
+                    'Channel batch of "{}" channels contains "{}" channel.'.format(
+                        channel_cls.__name__, type(channel).__name__))
+            if channel.targets is None:
+                raise BetseSimException(
+                    'Channel "{}" targets all membranes.'.format(
+                        channel_cls.__name__))
+
+        # Slices of the concatenated targets of these channels.
+        targets_end = np.cumsum([len(channel.targets) for channel in channels])
+        self._slices = tuple(
+            slice(target_start, target_end)
+            for target_start, target_end in zip(
+                np.concatenate(((0,), targets_end[:-1])), targets_end))
+
+        # Evaluator sharing the kinetic parameters and gating table of the
+        # first channel, but whose targets and gate states are concatenated.
+        # Scalar gate states (e.g., of channels lacking an inactivation gate)
+        # are broadcast over the targets of their channels.
+        self._evaluator = copy.copy(self.channels[0])
+        self._evaluator.targets = np.concatenate(
+            [channel.targets for channel in self.channels])
+        self._evaluator.mdl = None
+        self._evaluator._P_mems = None
+        for gate_name in ('m', 'h'):
+            if hasattr(self._evaluator, gate_name):
+                setattr(self._evaluator, gate_name, np.concatenate([
+                    np.broadcast_to(
+                        np.asarray(getattr(channel, gate_name), dtype=np.float64),
+                        (len(channel.targets),))
+                    for channel in self.channels]))
+
+    # ..................{ RUNNERS                            }..................
+    def run(self, vm, p) -> None:
+        '''
+        Run all channels evaluated by this batch for the current time step.
+
+        Parameters
+        ----------
+        vm : ndarray
+            One-dimensional Numpy array of all transmembrane voltages in V.
+        p : betse.science.parameters.Parameters
+            Current simulation configuration.
+        '''
+
+        # Update the gate states and open probabilities of all targets at once.
+        self._evaluator.run(vm, p)
+
+        # Distribute these states and probabilities back to each channel. Gate
+        # states are exposed as views into the states of this evaluator.
+        for channel, target_slice in zip(self.channels, self._slices):
+            channel.m = self._evaluator.m[target_slice]
+            if hasattr(self._evaluator, 'h'):
+                channel.h = self._evaluator.h[target_slice]
+            channel._set_open_probability(self._evaluator.P[target_slice])
+
+# ....................{ BATCHERS                           }....................
+@type_check
+def batch_channels(channels: SequenceTypes) -> list:
+    '''
+    List of **channel runners** (i.e., objects defining a ``run(vm, p)``
+    method) evaluating all passed channels, batching all channels of the same
+    class targeting subsets of membranes into a single :class:`ChannelsBatch`.
+
+    Channels whose class is shared by no other such channel or targeting all
+    membranes are run as is. Runners are ordered by the first occurrence of
+    their channels in the passed sequence.
+
+    Parameters
+    ----------
+    channels : SequenceTypes
+        Sequence of initialized channels.
+
+    Returns
+    ----------
+    list
+        List of all :class:`ChannelsABC` and :class:`ChannelsBatch` instances
+        evaluating these channels.
+    '''
+
+    # Dictionary mapping from each channel class to a list of all channels
+    # of that class targeting subsets of membranes, preserving their order.
+    cls_to_channels = {}
+
+    # List of all channel runners, each initially either a channel or the
+    # list of all batchable channels of the same class.
+    runners = []
+
+    for channel in channels:
+        assert isinstance(channel, ChannelsABC), (
+            '"{}" not a channel.'.format(channel))
+
+        if channel.targets is None:
+            runners.append(channel)
+        else:
+            channel_cls = type(channel)
+            if channel_cls not in cls_to_channels:
+                cls_to_channels[channel_cls] = []
+                runners.append(cls_to_channels[channel_cls])
+            cls_to_channels[channel_cls].append(channel)
+
+    return [
+        (runner if not isinstance(runner, list) else
+         runner[0] if len(runner) == 1 else
+         ChannelsBatch(runner))
+        for runner in runners
+    ]
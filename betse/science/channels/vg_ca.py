@@ -68,6 +68,7 @@ class VgCaABC(ChannelsABC, metaclass=ABCMeta):
             V = vm[self.targets] * 1000 + self.v_corr
 
         self._init_state(V)
+        self._init_gating_table(p)
 
         self.ions = ['Ca']
         self.rel_perm = [1.0]
@@ -91,7 +92,7 @@ class VgCaABC(ChannelsABC, metaclass=ABCMeta):
 
             V = vm[self.targets] * 1000 + self.v_corr
 
-        self._calculate_state(V)
+        self._update_gating(V)
 
         self._implement_state(V, p)
 
@@ -103,13 +104,7 @@ class VgCaABC(ChannelsABC, metaclass=ABCMeta):
         # calculate the open-probability of the channel:
         P = (self.m ** self._mpower) * (self.h ** self._hpower)
 
-        if self.targets is None:
-
-            self.P = P
-
-        else:
-            self.P = np.zeros(self.mdl)
-            self.P[self.targets] = P
+        self._set_open_probability(P)
 
 
     @abstractmethod
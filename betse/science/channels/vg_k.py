@@ -69,6 +69,7 @@ class VgKABC(ChannelsABC, metaclass=ABCMeta):
             V = vm[self.targets] * 1000 + self.v_corr
 
         self._init_state(V)
+        self._init_gating_table(p)
 
         self.ions = ['K']
         self.rel_perm = [1.0]
@@ -93,7 +94,7 @@ class VgKABC(ChannelsABC, metaclass=ABCMeta):
             V = vm[self.targets] * 1000 + self.v_corr
 
 
-        self._calculate_state(V)
+        self._update_gating(V)
 
         self._implement_state(V, p)
 
@@ -105,13 +106,7 @@ class VgKABC(ChannelsABC, metaclass=ABCMeta):
         # calculate the open-probability of the channel:
         P = (self.m ** self._mpower) * (self.h ** self._hpower)
 
-        if self.targets is None:
-
-            self.P = P
-
-        else:
-            self.P = np.zeros(self.mdl)
-            self.P[self.targets] = P
+        self._set_open_probability(P)
 
 
     @abstractmethod
@@ -61,6 +61,7 @@ class VgKABC(ChannelsABC, metaclass=ABCMeta):
             V = vm[self.targets] * 1000
 
         self._init_state(V)
+        self._init_gating_table(p)
 
     def run(self, vm, p):
         '''
@@ -81,7 +82,7 @@ class VgKABC(ChannelsABC, metaclass=ABCMeta):
 
             V = vm[self.targets] * 1000
 
-        self._calculate_state(V)
+        self._update_gating(V)
 
         if self.kinetic_gate: # If the gate dynamics are time-dependent:
 
@@ -91,13 +92,7 @@ class VgKABC(ChannelsABC, metaclass=ABCMeta):
 
             self.m = self._mInf
 
-        if self.targets is None:
-
-            self.P = self.m
-
-        else:
-            self.P = np.zeros(self.mdl)
-            self.P[self.targets] = self.m
+        self._set_open_probability(self.m)
 
 
     @abstractmethod
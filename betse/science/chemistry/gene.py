@@ -29,6 +29,7 @@ import numpy as np
 from betse.science import filehandling as fh
 from betse.science.chemistry.netplot import set_net_opts
 from betse.science.chemistry.networks import MasterOfNetworks
+from betse.science.enum.enumconf import GrnIntegratorType
 from betse.science.organelles.microtubules import Mtubes
 from betse.science.phase.phasecls import SimPhase
 from betse.science.visual.plot import plotutil as viz
@@ -208,6 +209,7 @@ class MasterOfGenes(object):
             self.core.target_vmem = float(config_dic['optimization']['target Vmem'])
             self.core.opti_T = float(config_dic['optimization']['optimization T'])
             self.core.opti_step = float(config_dic['optimization']['optimization step'])
+            self.core.opti_chains = int(config_dic['optimization'].get('optimization chains', 1))
             # self.core.opti_run = config_dic['optimization']['run from optimization']
 
             if opti:
@@ -248,27 +250,52 @@ class MasterOfGenes(object):
         p.init_time_total = p.grn_total_time
         p.init_time_sampling = p.grn_tsample
 
-        p.init_tsteps = int(p.init_time_total / p.dt)
         p.resample = p.init_time_sampling
         p.total_time = p.init_time_total
 
-        # Number of time steps (including sampled and unsampled) between each
-        # unsampled time step, including that unsampled time step itself.
-        p.t_resample = p.resample / p.dt
+        # If reactions are integrated explicitly, preserve the historical time
+        # steps and samples.
+        if p.grn_integrator is GrnIntegratorType.EULER:
+            p.init_tsteps = int(p.init_time_total / p.dt)
+
+            # Number of time steps (including sampled and unsampled) between
+            # each unsampled time step, including that unsampled time step
+            # itself.
+            p.t_resample = p.resample / p.dt
+
+            # specify a time vector
+            loop_time_step_max = p.init_tsteps
+            # Maximum number of seconds simulated by the current run.
+            loop_seconds_max = loop_time_step_max * p.dt
+            # Time-steps vector appropriate for the current run.
+            tt = np.linspace(0, loop_seconds_max, loop_time_step_max)
+
+            tsamples = set()
+            i = 0
+            while i < len(tt) - p.t_resample:
+                i = int(i + p.t_resample)
+                # logs.log_debug('Time sample i: {!r}'.format(i))
+                tsamples.add(tt[i])
+        # Else, reactions are integrated implicitly, typically with time steps
+        # approaching the sampling rate. Since the above time vector only
+        # samples near multiples of the sampling rate when the time step is
+        # much smaller than the sampling rate, split each sampling interval
+        # evenly into the fewest time steps no larger than the configured time
+        # step instead, sampling at exactly each multiple of the sampling rate.
+        else:
+            logs.log_info(
+                'Integrating network reactions with the "%s" integrator...',
+                p.grn_integrator.name.lower())
+
+            p.t_resample = max(int(np.ceil(p.resample / p.dt - 1e-9)), 1)
+            p.dt = p.resample / p.t_resample
 
-        # specify a time vector
-        loop_time_step_max = p.init_tsteps
-        # Maximum number of seconds simulated by the current run.
-        loop_seconds_max = loop_time_step_max * p.dt
-        # Time-steps vector appropriate for the current run.
-        tt = np.linspace(0, loop_seconds_max, loop_time_step_max)
+            sample_count = max(int(p.init_time_total / p.resample + 1e-9), 1)
+            p.init_tsteps = sample_count * p.t_resample
 
-        tsamples = set()
-        i = 0
-        while i < len(tt) - p.t_resample:
-            i = int(i + p.t_resample)
-            # logs.log_debug('Time sample i: {!r}'.format(i))
-            tsamples.add(tt[i])
+            # Time-steps vector appropriate for the current run.
+            tt = np.arange(p.init_tsteps + 1) * p.dt
+            tsamples = set(tt[p.t_resample::p.t_resample])
 
         # if p.grn_runmodesim:
         self.reinitialize(phase)
@@ -305,7 +332,8 @@ class MasterOfGenes(object):
             if self.transporters:
                 self.core.run_loop_transporters(t, sim, cells, p)
 
-            self.core.run_loop(phase=phase, t=t)
+            self.core.run_loop(
+                phase=phase, t=t, integrator=p.grn_integrator)
 
             # if p.use_microtubules: # update the microtubules:
             #     sim.mtubes.update_mtubes(cells, sim, p)
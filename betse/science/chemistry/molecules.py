@@ -190,6 +190,7 @@ class MasterOfMolecules(object):
             self.core.target_vmem = float(config_dic['optimization']['target Vmem'])
             self.core.opti_T = float(config_dic['optimization']['optimization T'])
             self.core.opti_step = float(config_dic['optimization']['optimization step'])
+            self.core.opti_chains = int(config_dic['optimization'].get('optimization chains', 1))
 
             if opti:
                 logs.log_info(
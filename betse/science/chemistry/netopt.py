@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Gene regulatory network (GRN) **optimization** (i.e., fitting of the maximum
+rates of all reactions of a network to user-specified steady-state target
+concentrations and transmembrane voltage by basin-hopping) facilities.
+
+The chi-squared objective minimized by this optimization is compiled once into
+a :class:`NetworkObjective` whose Jacobian is evaluated as a single matrix
+operation over the network matrix. Multiple independent basin-hopping chains
+are run in a process pool where the platform supports forking, the best result
+of all chains being retained.
+'''
+
+# ....................{ IMPORTS                           }....................
+import csv, multiprocessing, time
+import numpy as np
+from betse.util.io.log import logs
+from betse.util.path import dirs
+from betse.util.type.types import type_check, SequenceTypes
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from scipy.optimize import OptimizeResult, basinhopping
+
+# ....................{ CONSTANTS                         }....................
+OPTIMIZATION_PROGRESS_BASENAME = 'OptimizationProgress.csv'
+'''
+Basename of the CSV file tabulating the progress of each basin-hopping chain
+of a network optimization, saved to the results directory of that network.
+'''
+
+
+_JACOBIAN_STEP = 0.05
+'''
+Absolute step of the forward finite differences approximating the Jacobian of
+the network objective with respect to the relative maximum rate of each
+reaction.
+'''
+
+
+_PROGRESS_COLUMN_NAMES = (
+    'chain', 'iteration', 'chi_sqr', 'accepted', 'chi_sqr_min', 'seconds')
+'''
+Names of all progress metrics recorded for each basin-hopping iteration.
+'''
+
+# ....................{ GLOBALS                           }....................
+_chain_objective = None
+'''
+Network objective minimized by all basin-hopping chains of the current
+optimization.
+
+Since this objective references the entire simulation, this objective is
+inherited by forked chain subprocesses rather than pickled to each.
+'''
+
+# ....................{ CLASSES                           }....................
+class NetworkObjective(object):
+    '''
+    **Network objective** (i.e., chi-squared error of the steady-state
+    concentration changes and transmembrane voltage of a network, as a
+    function of the maximum rates of all reactions of that network relative
+    to their user-specified values).
+
+    For each vector of relative maximum rates, this objective estimates the
+    transmembrane voltage of the network by the Goldman equation, assigns that
+    voltage to the simulation, evaluates the compiled rate of each reaction of
+    the network at that voltage and sums the squares of the resulting
+    concentration changes and the deviation of that voltage from its target.
+    Since this voltage depends only on the membrane permeabilities rather than
+    the reaction rates, the Jacobian of this objective with respect to all
+    relative rates leaving this voltage unchanged is computed from the rates
+    at the current point as a single matrix operation; only relative rates
+    varying this voltage (i.e., membrane permeabilities and channels) require
+    reevaluating these rates.
+
+    Attributes
+    ----------
+    network_matrix : ndarray
+        Two-dimensional Numpy array whose rows are the concentration changes
+        and transmembrane current of the network and whose columns are the
+        reactions of the network.
+    _goldman_den : ndarray
+        One-dimensional Numpy array of the contribution of the relative rate
+        of each reaction to the denominator of the Goldman equation.
+    _goldman_num : ndarray
+        One-dimensional Numpy array of the contribution of the relative rate
+        of each reaction to the numerator of the Goldman equation.
+    _last_eval : tuple
+        5-tuple ``(v, chi_sqr, rates, outputs, vmem_error)`` of the relative
+        rates last passed to the :meth:`__call__` method and the objective
+        value, reaction rates, concentration changes and squared voltage error
+        at those rates, reused by the :meth:`jacobian` method.
+    _rate_args : tuple
+        Tuple of all positional arguments passed to each rate function.
+    _rate_funcs : tuple
+        Tuple of all rate functions, one for each reaction.
+    _sim : Simulator
+        Simulation to which the estimated transmembrane voltage is assigned
+        before evaluating these rate functions.
+    _vmem_factor : float
+        Factor ``R*T/F`` of the Goldman equation in volts.
+    _vmem_target : float
+        Target transmembrane voltage in volts.
+    _vmem_rate_indices : ndarray
+        One-dimensional Numpy array of the indices of all reactions whose
+        relative rates vary the transmembrane voltage.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        rate_funcs: SequenceTypes,
+        rate_args: tuple,
+        sim: object,
+        network_matrix: SequenceTypes,
+        goldman_num: SequenceTypes,
+        goldman_den: SequenceTypes,
+        vmem_factor: float,
+        vmem_target: float,
+    ) -> None:
+        '''
+        Initialize this objective.
+
+        Parameters
+        ----------
+        rate_funcs : SequenceTypes
+            Sequence of one compiled function for each reaction of the network,
+            each passed the ``rate_args`` positional arguments and returning
+            the rate of that reaction as a scalar or array (whose mean is then
+            taken).
+        rate_args : tuple
+            Tuple of all positional arguments passed to each rate function
+            (e.g., ``(network, sim, cells, p)``).
+        sim : Simulator
+            Simulation whose ``vm`` attribute is assigned the estimated
+            transmembrane voltage before evaluating these rate functions.
+        network_matrix : SequenceTypes
+            Two-dimensional array whose rows are the concentration changes and
+            transmembrane current of the network and whose columns are the
+            reactions of the network.
+        goldman_num : SequenceTypes
+            One-dimensional array of the contribution of the relative rate of
+            each reaction to the numerator of the Goldman equation (e.g., the
+            membrane permeability to a cation scaled by the environmental
+            concentration of that cation), zero for reactions leaving the
+            transmembrane voltage unchanged.
+        goldman_den : SequenceTypes
+            One-dimensional array of the contribution of the relative rate of
+            each reaction to the denominator of the Goldman equation.
+        vmem_factor : float
+            Factor ``R*T/F`` of the Goldman equation in volts.
+        vmem_target : float
+            Target transmembrane voltage in volts.
+        '''
+
+        # Classify all passed parameters.
+        self._rate_funcs = tuple(rate_funcs)
+        self._rate_args = rate_args
+        self._sim = sim
+        self.network_matrix = np.asarray(network_matrix, dtype=np.float64)
+        self._goldman_num = np.asarray(goldman_num, dtype=np.float64)
+        self._goldman_den = np.asarray(goldman_den, dtype=np.float64)
+        self._vmem_factor = vmem_factor
+        self._vmem_target = vmem_target
+
+        # Indices of all reactions whose relative rates vary this voltage.
+        self._vmem_rate_indices = np.flatnonzero(
+            (self._goldman_num != 0) | (self._goldman_den != 0))
+
+        # Nullify all remaining instance variables for safety.
+        self._last_eval = None
+
+    # ..................{ EVALUATORS                        }..................
+    def __call__(self, v) -> float:
+        '''
+        Chi-squared error of the network at the passed one-dimensional Numpy
+        array of relative maximum rates of all reactions of this network.
+        '''
+
+        # Absolute relative rates, permitting the unconstrained minimizers
+        # employed by basin-hopping to explore negative rates.
+        v_abs = np.abs(v)
+
+        # Estimate the transmembrane voltage and evaluate all reaction rates
+        # at that voltage.
+        vmem = self._get_vmem(v_abs)
+        self._sim.vm = vmem
+        rates = np.array([
+            np.mean(rate_func(*self._rate_args))
+            for rate_func in self._rate_funcs])
+
+        # Concentration changes and transmembrane current at these rates.
+        outputs = self.network_matrix.dot(v_abs*rates)
+
+        vmem_error = ((vmem - self._vmem_target)*1e3)**2
+        chi_sqr = float(outputs.dot(outputs) + vmem_error)
+
+        # Cache this evaluation for reuse by the jacobian() method.
+        self._last_eval = (np.array(v, dtype=np.float64), chi_sqr, rates,
+                           outputs, vmem_error)
+
+        return chi_sqr
+
+
+    def jacobian(self, v) -> np.ndarray:
+        '''
+        Forward finite-difference approximation of the gradient of this
+        objective at the passed one-dimensional Numpy array of relative maximum
+        rates of all reactions of this network.
+
+        Each component of this gradient perturbs only the corresponding
+        relative rate. Components leaving the transmembrane voltage unchanged
+        (and thus all reaction rates unchanged) are computed together by a
+        single matrix operation from the concentration changes at the passed
+        point; all remaining components reevaluate this objective.
+        '''
+
+        # Objective at this point, reusing the last evaluation if at this point
+        # (as is typical, since minimizers request the gradient of each point
+        # immediately after evaluating that point).
+        if self._last_eval is None or not np.array_equal(
+            self._last_eval[0], v):
+            self(v)
+        _, chi_sqr, rates, outputs, vmem_error = self._last_eval
+
+        # Change in the absolute relative rate of each perturbed reaction.
+        v_abs = np.abs(v)
+        v_abs_delta = np.abs(v + _JACOBIAN_STEP) - v_abs
+
+        # Concentration changes after perturbing each reaction, one column per
+        # perturbed reaction, and the resulting objective.
+        outputs_perturbed = (
+            outputs[:, np.newaxis] +
+            self.network_matrix*(v_abs_delta*rates)[np.newaxis, :])
+        chi_sqr_perturbed = np.einsum(
+            'ij,ij->j', outputs_perturbed, outputs_perturbed) + vmem_error
+
+        # Reevaluate this objective for all perturbations varying this voltage.
+        for rate_index in self._vmem_rate_indices:
+            v_perturbed = np.array(v, dtype=np.float64)
+            v_perturbed[rate_index] += _JACOBIAN_STEP
+            chi_sqr_perturbed[rate_index] = self(v_perturbed)
+
+        return (chi_sqr_perturbed - chi_sqr)/_JACOBIAN_STEP
+
+    # ..................{ PRIVATE                           }..................
+    def _get_vmem(self, v_abs) -> float:
+        '''
+        Transmembrane voltage estimated by the Goldman equation for the passed
+        absolute relative maximum rates of all reactions of this network.
+        '''
+
+        return self._vmem_factor*np.log(
+            self._goldman_num.dot(v_abs)/self._goldman_den.dot(v_abs))
+
+# ....................{ OPTIMIZERS                        }....................
+@type_check
+def optimize_network(
+    objective: NetworkObjective,
+    x0: SequenceTypes,
+    chain_count: int,
+    niter: int,
+    T: float,
+    stepsize: float,
+    method: str,
+    alt_chi_sqr_max: float = 0.015,
+) -> tuple:
+    '''
+    Minimize the passed network objective by running the passed number of
+    independent basin-hopping chains from the passed initial relative rates,
+    returning the best result of all chains.
+
+    Each chain is seeded by its 0-based index, rendering optimizations
+    reproducible. If more than one chain is requested *and* the current
+    platform supports forking, chains are run in parallel by a pool of forked
+    subprocesses inheriting this objective; else, chains are run sequentially
+    in the current process.
+
+    Parameters
+    ----------
+    objective : NetworkObjective
+        Network objective to be minimized.
+    x0 : SequenceTypes
+        One-dimensional array of the initial relative maximum rates of all
+        reactions of this network.
+    chain_count : int
+        Number of basin-hopping chains to be run.
+    niter : int
+        Number of basin-hopping iterations of each chain.
+    T : float
+        Basin-hopping temperature.
+    stepsize : float
+        Basin-hopping step size.
+    method : str
+        Name of the local minimizer (e.g., ``L-BFGS-B``) passed to the
+        :func:`scipy.optimize.minimize` function. For minimizers other than
+        ``COBYLA`` and ``Nelder-Mead``, the :meth:`NetworkObjective.jacobian`
+        method is passed as the gradient of this objective.
+    alt_chi_sqr_max : optional[float]
+        Largest objective value of any local minimum to be retained as an
+        alternative solution. Defaults to 0.015.
+
+    Returns
+    ----------
+    (OptimizeResult, list, list)
+        3-tuple ``(sol, alt_sols, progress)``, where:
+
+        * ``sol`` is the basin-hopping result of the chain finding the smallest
+          minimum, whose ``chain`` key is the 0-based index of that chain.
+        * ``alt_sols`` is the list of the relative rates of all local minima
+          of all chains whose objective values are at most
+          ``alt_chi_sqr_max``, ordered by chain.
+        * ``progress`` is the list of one dictionary for each basin-hopping
+          iteration of each chain, ordered by chain, describing the progress
+          and convergence of that chain as accepted by the
+          :func:`write_optimization_progress` function.
+    '''
+
+    global _chain_objective
+
+    # If no chains are requested, raise an exception.
+    assert chain_count >= 1, 'Chain count {} not positive.'.format(chain_count)
+
+    # Arguments passed to each chain after the index of that chain.
+    chain_args = (np.asarray(x0, dtype=np.float64), niter, T, stepsize, method,
+                  alt_chi_sqr_max)
+
+    # Results of all chains in chain order.
+    _chain_objective = objective
+    try:
+        if chain_count > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            logs.log_info(
+                'Running %d basin-hopping chains in parallel...', chain_count)
+            with ProcessPoolExecutor(
+                max_workers=min(chain_count, multiprocessing.cpu_count()),
+                mp_context=multiprocessing.get_context('fork'),
+            ) as executor:
+                chain_results = list(executor.map(
+                    _run_chain, range(chain_count),
+                    *((chain_arg,)*chain_count for chain_arg in chain_args)))
+        else:
+            chain_results = [
+                _run_chain(chain_index, *chain_args)
+                for chain_index in range(chain_count)]
+    finally:
+        _chain_objective = None
+
+    # Aggregate these results, retaining the best chain.
+    sol = None
+    alt_sols = []
+    progress = []
+    for chain_index, (chain_sol, chain_alt_sols, chain_progress) in enumerate(
+        chain_results):
+        logs.log_info(
+            'Chain %d minimum: %g', chain_index, chain_sol.fun)
+        if sol is None or chain_sol.fun < sol.fun:
+            sol = chain_sol
+        alt_sols.extend(chain_alt_sols)
+        progress.extend(chain_progress)
+
+    return sol, alt_sols, progress
+
+# ....................{ WRITERS                           }....................
+@type_check
+def write_optimization_progress(
+    filename: str, progress: SequenceTypes) -> None:
+    '''
+    Serialize the passed progress of all basin-hopping chains of a network
+    optimization to the tab-delimited CSV file with the passed filename, one
+    row per iteration of each chain.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute or relative filename of the CSV file to be written. If this
+        file already exists, this file is silently overwritten.
+    progress : SequenceTypes
+        Sequence of one dictionary for each iteration of each chain, mapping
+        from the name of each progress metric to the value of that metric, as
+        returned by the :func:`optimize_network` function.
+    '''
+
+    logs.log_debug('Writing CSV file: %s', filename)
+    dirs.make_parent_unless_dir(filename)
+
+    with open(filename, 'w', newline='') as csv_file:
+        csv_writer = csv.DictWriter(
+            csv_file, fieldnames=_PROGRESS_COLUMN_NAMES, delimiter='\t')
+        csv_writer.writeheader()
+        csv_writer.writerows(progress)
+
+# ....................{ PRIVATE ~ runners                 }....................
+def _run_chain(
+    chain_index: int,
+    x0: np.ndarray,
+    niter: int,
+    T: float,
+    stepsize: float,
+    method: str,
+    alt_chi_sqr_max: float,
+) -> tuple:
+    '''
+    Run the basin-hopping chain with the passed 0-based index minimizing the
+    current network objective, returning the 3-tuple ``(sol, alt_sols,
+    progress)`` of the result, alternative solutions and progress of this
+    chain.
+
+    This function is run either in the current process or in a forked chain
+    subprocess.
+    '''
+
+    objective = _chain_objective
+
+    # Alternative solutions and progress of this chain.
+    alt_sols = []
+    progress = []
+    chi_sqr_min = np.inf
+    start_time = time.time()
+
+    # Record the progress of each basin-hopping iteration.
+    def _record_iteration(x, f, accepted):
+        nonlocal chi_sqr_min
+
+        chi_sqr_min = min(chi_sqr_min, f)
+        logs.log_info(
+            'Chain %d: at minimum %g accepted %s', chain_index, f, accepted)
+
+        # Save alternative solutions with exceptional chi-squared values.
+        if f <= alt_chi_sqr_max:
+            alt_sols.append(np.array(x))
+
+        progress.append(OrderedDict((
+            ('chain', chain_index),
+            ('iteration', len(progress) + 1),
+            ('chi_sqr', f),
+            ('accepted', accepted),
+            ('chi_sqr_min', chi_sqr_min),
+            ('seconds', round(time.time() - start_time, 3)),
+        )))
+
+    minimizer_opts = {'method': method}
+    if method != 'COBYLA' and method != 'Nelder-Mead':
+        minimizer_opts['jac'] = objective.jacobian
+
+    sol = basinhopping(
+        objective, x0, niter=niter, T=T, stepsize=stepsize,
+        minimizer_kwargs=minimizer_opts, callback=_record_iteration,
+        seed=chain_index)
+
+    # Reduce this result to its picklable essentials.
+    sol = OptimizeResult(
+        x=sol.x, fun=sol.fun, nit=sol.nit, message=sol.message,
+        chain=chain_index)
+
+    return sol, alt_sols, progress
@@ -25,14 +25,18 @@ from betse.science.channels import vg_funny as vgfun
 from betse.science.channels import vg_k as vgk
 from betse.science.channels import vg_na as vgna
 from betse.science.channels import vg_morrislecar as vgml
+from betse.science.channels.channelsbatch import batch_channels
+from betse.science.chemistry import netopt
 from betse.science.chemistry.netplot import plot_master_network, set_net_opts
 from betse.science.config.export.visual.confexpvisabc import (
     SimConfVisualCellsNonYAML)
 from betse.science.math import finitediff as fd
 from betse.science.math import modulate as mods
+from betse.science.math import stiff
 from betse.science.math import toolbox as tb
 from betse.science.organelles.mitochondria import Mito
 from betse.science.phase.phasecls import SimPhase
+from betse.science.enum.enumconf import GrnIntegratorType
 from betse.science.enum.enumphase import SimPhaseKind
 from betse.science.visual.anim.anim import (
     AnimFlatCellsTimeSeries, AnimEnvTimeSeries)
@@ -40,11 +44,19 @@ from betse.science.visual.plot import plotutil as viz
 from betse.util.io.log import logs
 from betse.util.path import dirs, pathnames
 from betse.util.type.iterable.mapping.mapcls import DynamicValue, DynamicValueDict
-from betse.util.type.types import type_check, SequenceTypes
+from betse.util.type.types import type_check, CallableTypes, SequenceTypes
 from collections import OrderedDict
 from matplotlib import cm
 from matplotlib import colors
-from scipy.optimize import basinhopping
+from scipy import sparse
+
+# ....................{ CONSTANTS                         }....................
+_JACOBIAN_STEP = np.sqrt(np.finfo(float).eps)
+'''
+Relative step of the forward finite differences approximating the Jacobian of
+the reactions of a network, minimizing the sum of truncation and round-off
+error for smooth rate laws.
+'''
 
 # ....................{ CLASSES                           }....................
 #FIXME: if moving to have unpacked membrane concs, update transporters...
@@ -90,6 +102,16 @@ class MasterOfNetworks(object):
         # Initialize reaction rates array to None (filled in later, if applicable):
         self.reaction_rates = None
 
+        # Preallocated buffer of the rates of all growth/decay and chemical
+        # reactions in the cell zone, allocated on the first time step:
+        self._rates_buffer = None
+
+        # Channel runners evaluating all channels active in the current phase,
+        # batching channels of the same class, and the channel cores of these
+        # channels from which these runners were created (filled in later):
+        self._channel_runners = None
+        self._channel_runners_cores = None
+
         # boolean so that charge will only ever be balanced once:
         self.charge_has_been_balanced = False
 
@@ -643,10 +665,16 @@ class MasterOfNetworks(object):
         # initialize network optimization, etc:
         if p.network_config is not None:
 
-            opti = p.network_config['optimize network']
+            opti_config = p.network_config['optimization']
 
-            self.opti_method = p.network_config['optimization method']
-            self.opti_N = p.network_config['optimization steps']
+            opti = opti_config['optimize network']
+
+            self.opti_method = opti_config['optimization method']
+            self.opti_N = opti_config['optimization steps']
+            self.opti_T = float(opti_config.get('optimization T', 1.0))
+            self.opti_step = float(opti_config.get('optimization step', 0.5))
+            self.opti_chains = int(opti_config.get('optimization chains', 1))
+            self.target_vmem = float(opti_config['target Vmem'])
             # after primary initialization, check and see if optimization required:
 
             if opti is True:
@@ -2125,8 +2153,8 @@ class MasterOfNetworks(object):
 
                 vmem_tex = "V_{mem}"
 
-                in_delta_term_react = "(np.dot(cells.M_sum_mems, -self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
-                in_delta_term_prod = "(np.dot(cells.M_sum_mems, self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
+                in_delta_term_react = "(cells.M_sum_mems.dot(-self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
+                in_delta_term_prod = "(cells.M_sum_mems.dot(self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
 
                 if p.is_ecm is True:
 
@@ -2135,9 +2163,9 @@ class MasterOfNetworks(object):
                     out_delta_term_prod = "stb.div_env(self.transporters['{}'].flux, cells, p)".format(transp_name)
 
                 else:
-                    out_delta_term_react = "(np.dot(cells.M_sum_mems, -self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
+                    out_delta_term_react = "(cells.M_sum_mems.dot(-self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
 
-                    out_delta_term_prod = "(np.dot(cells.M_sum_mems, self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
+                    out_delta_term_prod = "(cells.M_sum_mems.dot(self.transporters['{}'].flux*cells.mem_sa)/cells.cell_vol)".format(transp_name)
 
                 all_alpha, alpha_tex, trans_tex_var_list = self.get_influencers(a_list, Km_a_list,
                                                                 n_a_list, i_list,
@@ -2784,7 +2812,12 @@ class MasterOfNetworks(object):
 
 
     @type_check
-    def run_loop(self, phase: SimPhase, t: float) -> None:
+    def run_loop(
+        self,
+        phase: SimPhase,
+        t: float,
+        integrator: GrnIntegratorType = GrnIntegratorType.EULER,
+    ) -> None:
         '''
         Simulate this gene regulatory network (GRN) for the passed simulation
         phase at the passed time step for all simulated molecules.
@@ -2795,6 +2828,10 @@ class MasterOfNetworks(object):
             Current simulation phase.
         t : float
             Time step at which to simulate this GRN.
+        integrator : GrnIntegratorType
+            Type of integrator advancing the growth, decay, and chemical
+            reactions of all cellular substances over this time step. Defaults
+            to explicit forward Euler. See :meth:`_get_delta_conc_implicit`.
         '''
 
         # Localize high-level phase objects for convenience.
@@ -2802,51 +2839,42 @@ class MasterOfNetworks(object):
         p     = phase.p
         sim   = phase.sim
 
-        # List locals, defaulting to the empty list.
-        gad_rates_o = []
-        gad_targs = []
-        init_rates = []
-        gad_rates = []
+        # Number of substances (and hence growth/decay reactions) and total
+        # number of growth/decay and chemical reactions in the cell zone.
+        n_mols = len(self.molecules)
+        n_rates = n_mols + len(self.reactions)
 
-        globalo = globals()
-        localo = locals()
+        # Fused buffer of the rates of all growth/decay reactions followed by
+        # all chemical reactions in the cell zone, reallocated only if the
+        # number of reactions or cells has changed (e.g., by a cutting event).
+        rates = getattr(self, '_rates_buffer', None)
+        if rates is None or rates.shape != (n_rates, sim.cdl):
+            rates = self._rates_buffer = np.zeros((n_rates, sim.cdl))
 
-        for mol in self.molecules:
-            # calculate concentrations at membranes:
-            obj = self.molecules[mol]
-
-            # print(obj.use_time_dilation)
+        # calculate concentrations at membranes:
+        for obj in self.molecules.values():
             obj.update_intra(sim, cells, p)
 
-            # calculate rates of growth/decay:
-            gad_rates_o.append(eval(self.molecules[mol].gad_eval_string, globalo, localo))
-            gad_targs.append(self.molecules[mol].growth_targets_cell)
-            init_rates.append(np.zeros(sim.cdl))
-
-        for mat, trgs, rts in zip(init_rates, gad_targs, gad_rates_o):
-            mat[trgs] = rts[trgs]
-            gad_rates.append(mat)
-
-        gad_rates = np.asarray(gad_rates)
-
-        # ... and rates of chemical reactions in cell:
-        self.reaction_rates = np.asarray(
-            [eval(self.reactions[rn].reaction_eval_string, globalo, localo) for rn in self.reactions])
-
-        # stack into an integrated data structure:
-        if len(self.reaction_rates) > 0:
-            all_rates = np.vstack((gad_rates, self.reaction_rates))
-        else:
-            all_rates = gad_rates
+        # calculate rates of growth/decay and chemical reactions in cell,
+        # timing each chemical reaction if profiling this phase:
+        self._eval_rates(rates, sim, cells, p, profiler=phase.profiler)
+        self.reaction_rates = rates[n_mols:]
 
         # calculate concentration rate of change using linear algebra:
-        self.delta_conc = np.dot(self.reaction_matrix, all_rates)
+        self.delta_conc = np.dot(self.reaction_matrix, rates)
+
+        # If an implicit integrator is requested, replace this instantaneous
+        # rate of change with the mean rate of change over this time step.
+        if integrator is not GrnIntegratorType.EULER:
+            self.delta_conc = self._get_delta_conc_implicit(
+                integrator, sim, cells, p)
 
         if self.mit_enabled and len(self.reactions_mit)>0:
             # ... rates of chemical reactions in mitochondria:
             self.reaction_rates_mit = np.asarray(
-                [eval(self.reactions_mit[rn].reaction_eval_string, globalo, localo) for
-                    rn in self.reactions_mit])
+                [compile_expr(self.reactions_mit[rn].reaction_eval_string)(
+                    self, sim, cells, p) for rn in phase.profiler.iter_timed(
+                        self.reactions_mit, zone_name='mit')])
 
             # calculate concentration rate of change using linear algebra:
             self.delta_conc_mit = np.dot(self.reaction_matrix_mit, self.reaction_rates_mit)
@@ -2855,8 +2883,9 @@ class MasterOfNetworks(object):
         if len(self.reactions_env)>0:
             # ... rates of chemical reactions in env:
             self.reaction_rates_env = np.asarray(
-                [eval(self.reactions_env[rn].reaction_eval_string, globalo, localo) for
-                    rn in self.reactions_env])
+                [compile_expr(self.reactions_env[rn].reaction_eval_string)(
+                    self, sim, cells, p) for rn in phase.profiler.iter_timed(
+                        self.reactions_env, zone_name='env')])
 
             # Calculate concentration rate of change using linear algebra.
             self.delta_conc_env = np.dot(
@@ -2902,8 +2931,8 @@ class MasterOfNetworks(object):
 
                 # Use the substance as a gating ligand (if desired).
                 if obj.ion_channel_gating:
-                    obj.gating_mod = eval(
-                        obj.gating_mod_eval_string, globalo, localo)
+                    obj.gating_mod = compile_expr(
+                        obj.gating_mod_eval_string)(self, sim, cells, p)
                     obj.gating(sim, cells, p)
 
                 # If this is the simulation phase and the global boundary for
@@ -2961,10 +2990,157 @@ class MasterOfNetworks(object):
             self.mit.update(sim, cells, p)
 
 
-    def run_loop_transporters(self, t, sim, cells, p):
+    def _eval_rates(self, rates, sim, cells, p, profiler=None) -> None:
+        '''
+        Evaluate the rates of all growth/decay reactions followed by all
+        chemical reactions in the cell zone at the current cellular
+        concentrations into the passed two-dimensional Numpy array, whose rows
+        are these reactions and whose columns are all cells.
+
+        If the passed :class:`betse.science.phase.phaseprof.SimPhaseProfiler`
+        is *not* ``None``, each chemical reaction is timed by that profiler.
+        '''
+
+        n_mols = len(self.molecules)
+
+        # Names of all chemical reactions in cell, timed if profiling.
+        reaction_names = self.reactions
+        if profiler is not None:
+            reaction_names = profiler.iter_timed(reaction_names)
+
+        for i, obj in enumerate(self.molecules.values()):
+            # calculate rates of growth/decay, restricted to targeted cells:
+            gad_rates_o = compile_expr(obj.gad_eval_string)(self, sim, cells, p)
+            gad_targs = obj.growth_targets_cell
+            rates[i] = 0.0
+            rates[i, gad_targs] = gad_rates_o[gad_targs]
+
+        # ... and rates of chemical reactions in cell:
+        for j, rn in enumerate(reaction_names):
+            rates[n_mols + j] = compile_expr(
+                self.reactions[rn].reaction_eval_string)(self, sim, cells, p)
+
+
+    def _get_delta_conc_implicit(
+        self, integrator: GrnIntegratorType, sim, cells, p) -> np.ndarray:
+        '''
+        Mean rate of change over the current time step of the concentrations of
+        all cellular substances due to growth, decay, and chemical reactions in
+        the cell zone, integrated by the passed implicit integrator.
+
+        The reactions of each cell depend only upon the concentrations of that
+        cell, so the Jacobian of this system is block-diagonal with one block
+        per pair of substances. This Jacobian is assembled as a sparse matrix
+        from the :attr:`reaction_matrix` and the derivatives of all reaction
+        rates with respect to each substance, approximated by finite
+        differences perturbing that substance in all cells at once. Each
+        Jacobian thus costs one reaction rate evaluation per substance,
+        regardless of the number of cells.
+
+        All other quantities referenced by these rates (e.g., membrane and
+        environmental concentrations, transmembrane voltages) are held constant
+        over this time step. Substances unchanged by all reactions (e.g., ions
+        not participating in any reaction) are excluded from this system.
+
+        Parameters
+        ----------
+        integrator : GrnIntegratorType
+            Type of implicit integrator to advance these reactions with.
+
+        Returns
+        ----------
+        ndarray
+            Two-dimensional Numpy array of the same shape as the
+            :attr:`reaction_matrix` multiplied by the reaction rates, such that
+            the explicit update ``conc + delta_conc*p.dt`` performed by
+            :meth:`run_loop` yields the integrated concentrations.
+        '''
 
-        globalo = globals()
-        localo = locals()
+        # Names of all cellular substances and the indices of those changed by
+        # at least one reaction.
+        conc_names = list(self.cell_concs.keys())
+        react_i = np.flatnonzero(np.any(self.reaction_matrix != 0.0, axis=1))
+        react_names = [conc_names[i] for i in react_i]
+        react_matrix = self.reaction_matrix[react_i]
+
+        # Concentrations of these substances at the start of this time step,
+        # copied as evaluating trial states below overwrites these arrays.
+        conc_old = np.array([self.cell_concs[name] for name in react_names])
+        conc_shape = conc_old.shape
+        n_react, n_cells = conc_shape
+
+        # Buffer of trial rates, preserving the rates at the start of this time
+        # step previously evaluated into "self.reaction_rates".
+        rates = np.zeros((self.reaction_matrix.shape[1], n_cells))
+
+        def get_rates(y):
+            # Rate laws are undefined for negative concentrations (e.g., Hill
+            # functions with non-integer coefficients), which trial states of
+            # large implicit steps may briefly produce.
+            for name, conc in zip(react_names, y.reshape(conc_shape)):
+                self.cell_concs[name] = np.maximum(conc, 0.0)
+
+            self._eval_rates(rates, sim, cells, p)
+            return rates
+
+        def func(y):
+            return react_matrix.dot(get_rates(y)).ravel()
+
+        def jac(y):
+            conc = y.reshape(conc_shape)
+            rates_y = get_rates(y).copy()
+            jac_blocks = np.empty((n_react, n_react, n_cells))
+
+            for m in range(n_react):
+                # Perturb this substance in all cells at once, scaling each
+                # step to the magnitude of the corresponding concentration.
+                step = _JACOBIAN_STEP*np.maximum(np.abs(conc[m]), 1.0e-3)
+                conc_step = conc.copy()
+                conc_step[m] += step
+
+                rates_diff = (get_rates(conc_step) - rates_y)/step
+                jac_blocks[:, m] = react_matrix.dot(rates_diff)
+
+            # Map block (i, m) of each cell to entry (i*n_cells + cell,
+            # m*n_cells + cell) of the flattened system.
+            block_i = np.arange(n_react)*n_cells
+            cell_i = np.arange(n_cells)
+            rows = np.broadcast_to(
+                block_i[:, None, None] + cell_i, jac_blocks.shape)
+            cols = np.broadcast_to(
+                block_i[None, :, None] + cell_i, jac_blocks.shape)
+
+            return sparse.csc_matrix(
+                (jac_blocks.ravel(), (rows.ravel(), cols.ravel())),
+                shape=(n_react*n_cells, n_react*n_cells))
+
+        y_old = conc_old.ravel()
+
+        try:
+            if integrator is GrnIntegratorType.ROSENBROCK:
+                y_new = stiff.step_rosenbrock(func, jac, y_old, p.dt)
+            elif integrator is GrnIntegratorType.BDF:
+                y_new = stiff.step_bdf(func, jac, y_old, p.dt)
+            else:
+                raise BetseSimConfException(
+                    'Network integrator "{}" unrecognized.'.format(
+                        integrator))
+        # Restore the concentrations at the start of this time step.
+        finally:
+            for name, conc in zip(react_names, conc_old):
+                self.cell_concs[name] = conc
+
+        # Clip the negligible negative overshoot that implicit methods (which
+        # unlike the explicit update need not preserve positivity) may produce
+        # for substances decaying towards zero.
+        conc_new = np.maximum(y_new.reshape(conc_shape), 0.0)
+
+        delta_conc = np.zeros((len(conc_names), n_cells))
+        delta_conc[react_i] = (conc_new - conc_old)/p.dt
+        return delta_conc
+
+
+    def run_loop_transporters(self, t, sim, cells, p):
 
         # call statement to evaluate:
         for name in self.transporters:
@@ -2975,8 +3151,8 @@ class MasterOfNetworks(object):
             targ_env = self.transporters[name].transporter_targets_env
 
             # calculate the flux
-            self.transporters[name].flux = sim.rho_pump*eval(self.transporters[name].transporter_eval_string,
-                globalo, localo)
+            self.transporters[name].flux = sim.rho_pump*compile_expr(
+                self.transporters[name].transporter_eval_string)(self, sim, cells, p)
 
 
             self.extra_J_mem += self.transporters[name].net_z*self.transporters[name].flux*p.F
@@ -2989,7 +3165,7 @@ class MasterOfNetworks(object):
 
                 # obtain the change for the reactant
 
-                delta_react = coeff*eval(delc, globalo, localo)
+                delta_react = coeff*compile_expr(delc)(self, sim, cells, p)
 
                 # finally, update the concentrations using the final eval statements:
                 if self.transporters[name].react_transport_tag[i] == 'mem_concs':
@@ -3039,7 +3215,7 @@ class MasterOfNetworks(object):
                 self.transporters[name].products_coeff)):
 
                 # obtain the change for the product
-                delta_prod = coeff*eval(delc, globalo, localo)
+                delta_prod = coeff*compile_expr(delc)(self, sim, cells, p)
 
                 # finally, update the concentrations using the final eval statements:
                 if self.transporters[name].prod_transport_tag[i] == 'mem_concs':
@@ -3106,8 +3282,8 @@ class MasterOfNetworks(object):
         cells = phase.cells
         p = phase.p
 
-        globalo = globals()
-        localo = locals()
+        # Update the state of all channels active in this phase.
+        self._run_channel_cores(phase)
 
         # get the object corresponding to the specific channel:
         for i, name in enumerate(self.channels):
@@ -3123,14 +3299,11 @@ class MasterOfNetworks(object):
 
                 # compute the channel activity
                 # calculate the value of the channel modulation constant:
-                moddy = eval(chan.alpha_eval_string, globalo, localo)
+                moddy = compile_expr(chan.alpha_eval_string)(self, sim, cells, p)
 
                 # set the modulator state in the channel core
                 chan.channel_core.modulator = moddy
 
-                # run the channel to update its state:
-                chan.channel_core.run(sim.vm, p)
-
                 # update concentrations according to the channel state:
                 for ion, rel_perm in zip(chan.channel_core.ions, chan.channel_core.rel_perm):
 
@@ -3208,8 +3381,8 @@ class MasterOfNetworks(object):
         cells = phase.cells
         p = phase.p
 
-        globalo = globals()
-        localo = locals()
+        # Update the state of all channels active in this phase.
+        self._run_channel_cores(phase)
 
         # get the object corresponding to the specific channel:
         for i, name in enumerate(self.channels):
@@ -3226,14 +3399,11 @@ class MasterOfNetworks(object):
 
                 # compute the channel activity
                 # calculate the value of the channel modulation constant:
-                moddy = eval(chan.alpha_eval_string, globalo, localo)
+                moddy = compile_expr(chan.alpha_eval_string)(self, sim, cells, p)
 
                 # set the modulator state in the channel core
                 chan.channel_core.modulator = moddy
 
-                # run the channel to update its state:
-                chan.channel_core.run(sim.vm, p)
-
                 # update concentrations according to the channel state:
                 for ion, rel_perm in zip(chan.channel_core.ions, chan.channel_core.rel_perm):
 
@@ -3247,7 +3417,7 @@ class MasterOfNetworks(object):
 
                     G_Chan = stb.get_conductivity(DChan, zzz, sim.cbar_dic[ion], p.tm, p)*sim.geo_conv
 
-                    # G_Chan = np.dot(cells.M_sum_mems, G_Chano)/cells.num_mems
+                    # G_Chan = cells.M_sum_mems.dot(G_Chano)/cells.num_mems
 
                     # J_ED = G_Chan * (sim.vm - sim.rev_E_dic[ion]) * (1 / cells.num_mems[cells.mem_to_cells])
                     J_ED = G_Chan*(sim.vm - sim.rev_E_dic[ion])
@@ -3258,10 +3428,55 @@ class MasterOfNetworks(object):
                     # Store channel flux specific to the channel as well:
                     chan.channel_core.chan_flux = J_ED/(zzz*p.F)
 
-    def run_loop_modulators(self, sim, cells, p):
+    @type_check
+    def _run_channel_cores(self, phase: SimPhase) -> None:
+        '''
+        Update the gate states and open probabilities of the channel cores of
+        all dynamic channels active in the passed phase for the current
+        simulation time step.
+
+        Channel cores of the same class (e.g., the same voltage-gated channel
+        applied to different tissue profiles) are evaluated by a single
+        :class:`betse.science.channels.channelsbatch.ChannelsBatch` over the
+        concatenation of their targets, created on the first call to this
+        method and recreated only when the set of such channel cores changes
+        (e.g., on transitioning from the initialization to the simulation
+        phase). Since no channel modifies transmembrane voltages, updating all
+        such cores before computing their fluxes is equivalent to updating
+        each core immediately before computing its fluxes.
 
-        globalo = globals()
-        localo = locals()
+        Parameters
+        --------
+        phase : SimPhase
+            Current simulation phase.
+        '''
+
+        # Channel cores of all channels active in this phase.
+        channel_cores = [
+            chan.channel_core for chan in self.channels.values()
+            if not (
+                phase.kind is SimPhaseKind.INIT and chan.init_active is False)
+        ]
+
+        # If these cores differ from those previously batched (or no cores
+        # were previously batched, as with networks pickled by older versions),
+        # (re)batch these cores.
+        channel_runners_cores = getattr(self, '_channel_runners_cores', None)
+        if channel_runners_cores is None or not (
+            len(channel_cores) == len(channel_runners_cores) and all(
+                channel_core is channel_runners_core
+                for channel_core, channel_runners_core in zip(
+                    channel_cores, channel_runners_cores))
+        ):
+            self._channel_runners = batch_channels(channel_cores)
+            self._channel_runners_cores = channel_cores
+
+        # Run these cores.
+        for channel_runner in self._channel_runners:
+            channel_runner.run(phase.sim.vm, phase.p)
+
+
+    def run_loop_modulators(self, sim, cells, p):
 
         # get the object corresponding to the specific transporter:
         for i, name in enumerate(self.modulators):
@@ -3269,7 +3484,8 @@ class MasterOfNetworks(object):
             obj = self.modulators[name]
 
             # calculate the value of the channel modulation constant:
-            modulator = obj.max_val*eval(obj.alpha_eval_string, globalo, localo)
+            modulator = obj.max_val*compile_expr(obj.alpha_eval_string)(
+                self, sim, cells, p)
 
             if obj.target_label == 'GJ':
                 sim.gj_block = modulator
@@ -3322,9 +3538,17 @@ class MasterOfNetworks(object):
         value of the set of calculated versus target concentrations given a
         certain maximum rate vector.
 
+        The objective is compiled once and its Jacobian evaluated as a single
+        matrix operation over the network matrix (see
+        :class:`betse.science.chemistry.netopt.NetworkObjective`). If the
+        ``optimization chains`` option requests multiple independent
+        basin-hopping chains, these chains are run in parallel and the best
+        result of all chains is retained.
+
         Calling this method will write a CSV file containing the optimized
-        reaction rates to the results folder of the main simulation. It also
-        prints these values to the screen, and generates a graph of the
+        reaction rates to the results folder of the main simulation as well as
+        a CSV file tabulating the progress and convergence of each chain. It
+        also prints these values to the screen, and generates a graph of the
         reaction network that has been optimized.
         '''
 
@@ -3332,19 +3556,15 @@ class MasterOfNetworks(object):
 
         # -----------------------------------------------------
 
-        self.globals = globals()
-        self.locals = locals()
+        # If either NetworkX or PyDot are unimportable, raise an exception.
+        libs.die_unless_runtime_optional('networkx', 'pydot')
 
-        # Defer importation of optional runtime dependencies until necessary.
-        # Since the logic below implicitly but *NOT* explicitly requires PyDot,
-        # we validate the importability of PyDot and then discard the returned
-        # "pydot" module object.
-        networkx, _ = libs.import_runtime_optional('networkx', 'pydot')
-        nx_pydot = networkx.networkx
+        # Import NetworkX's PyDot interface.
+        from networkx import nx_pydot
 
         # Log this optimization.
-        logs.log_info('Optimizing with %s in %s iterations...',
-            self.opti_method, self.opti_Nmssg)
+        logs.log_info('Optimizing with %s in %s iterations of %d chain(s)...',
+            self.opti_method, self.opti_N, self.opti_chains)
 
         # Set the Vmem to target value requested by user.
         sim.vm = self.target_vmem
@@ -3438,15 +3658,19 @@ class MasterOfNetworks(object):
         # build a network matrix in order to easily organize reaction relationships needed for the optimization:
         self.network_opt_M = np.zeros((len(self.conc_handler), len(self.react_handler)))
 
+        # attributes of each node, indexed in a manner supported by all
+        # NetworkX versions:
+        network_nodes = dict(network.nodes(data=True))
+
         # build the reaction matrix based on the network reaction graph:
         for node_a, node_b in network.edges():
 
             # get the coefficient of stoichiometry used in the reaction relationship:
-            edge_coeff = network.edge[node_a][node_b][0]['coeff']
+            edge_coeff = network[node_a][node_b][0]['coeff']
 
             # when building the graph, the node shape was used to signify the item:
-            node_type_a = network.node[node_a].get('shape', None)
-            node_type_b = network.node[node_b].get('shape', None)
+            node_type_a = network_nodes[node_a].get('shape', None)
+            node_type_b = network_nodes[node_b].get('shape', None)
 
             # if node a is a concentration and b is a reaction, we must be dealing with a reactant:
             if node_type_a is self.conc_shape and node_type_b == self.reaction_shape:
@@ -3555,13 +3779,13 @@ class MasterOfNetworks(object):
 
                 for li in self.transporters[k].transport_in_list:
                     z = self.zmol[li]
-                    coeff = self.net_graph.edge[k][li][0]['coeff']
+                    coeff = self.net_graph[k][li][0]['coeff']
                     Jrow[i] += -coeff * z * ff
                     self.Jpumps[i] += -coeff * z * ff
 
                 for lo in self.transporters[k].transport_out_list:
                     z = self.zmol[lo]
-                    coeff = self.net_graph.edge[lo][k][0]['coeff']
+                    coeff = self.net_graph[lo][k][0]['coeff']
                     Jrow[i] += coeff * z * ff
                     self.Jpumps[i] += coeff * z * ff
 
@@ -3686,133 +3910,73 @@ class MasterOfNetworks(object):
         c_base[zero_c] = 1.0
         c_fix[zero_c] = 0.0
 
-        # define Pmem indices to access in the vmax vector:
-        iNa = self.react_handler_index['Na_ed']
-        iK = self.react_handler_index['K_ed']
-
-        if 'Cl_ed' in self.react_handler_index:
-
-            iCl = self.react_handler_index['Cl_ed']
-
-
-        else:
-
-            iCl = None
-
-        # define an optimization function: this one solves for Vmem using the Goldman equation and the present
-        # fit's value of Pmem adjustments. It then recalculates r_base and optimizes steady-state by
-        # finding minimum concentration changes,
-        # zero transmembrane currents, and target Vmem values:
-
-        def opt_funk(v_base_o):
-
-            r_base = [eval(self.react_handler[rea], self.globals, self.locals).mean() for rea in self.react_handler]
-
-            outputs = np.dot(MM, np.abs(v_base_o) * r_base)
-
-            # pump_current = np.dot(self.Jpumps, np.abs(v_base_o) * r_base)
-
-            # # Total current across the membrane for use in Goldman equation Vmem estimate:
-            # gg = pump_current * p.tm * (1 / p.F)
-            #
-            # recalculate Vmem:
-            if iCl is None:
-
-                # remake the membrane diffusion constants
-
-                DmK_dyn = np.abs(v_base_o[iK]) * self.Dmem['K']
-                DmNa_dyn = np.abs(v_base_o[iNa]) * self.Dmem['Na']
-
-                for dmNa, jNa in zip(self.Dm_extra['Na'], self.channel_index['Na']):
-                    DmNa_dyn += dmNa * np.abs(v_base_o[jNa])
-
-                for dmK, jK in zip(self.Dm_extra['K'], self.channel_index['K']):
-                    DmK_dyn += dmK * np.abs(v_base_o[jK])
-
-                sim.vm = (p.R * sim.T / p.F) * np.log(
-                    (DmNa_dyn * self.conc_handler['Na_env'] +
-                     DmK_dyn * self.conc_handler['K_env']
-                     ) /
-                    (DmNa_dyn * self.conc_handler['Na'] +
-                     DmK_dyn * self.conc_handler['K']
-                     ))
-
-            else:
-
-                # remake the membrane diffusion constants
-
-                DmK_dyn = np.abs(v_base_o[iK]) * self.Dmem['K']
-                DmNa_dyn = np.abs(v_base_o[iNa]) * self.Dmem['Na']
-                DmCl_dyn = np.abs(v_base_o[iCl]) * self.Dmem['Cl']
-
-                for dmNa, jNa in zip(self.Dm_extra['Na'], self.channel_index['Na']):
-                    DmNa_dyn += dmNa * np.abs(v_base_o[jNa])
-
-                for dmK, jK in zip(self.Dm_extra['K'], self.channel_index['K']):
-                    DmK_dyn += dmK * np.abs(v_base_o[jK])
-
-                for dmCl, jCl in zip(self.Dm_extra['Cl'], self.channel_index['Cl']):
-                    DmCl_dyn += dmCl * np.abs(v_base_o[jCl])
-
-                sim.vm = (p.R * sim.T / p.F) * np.log(
-                    (DmNa_dyn * self.conc_handler['Na_env'] +
-                     DmK_dyn * self.conc_handler['K_env'] +
-                     DmCl_dyn * self.conc_handler['Cl']) /
-                    (DmNa_dyn * self.conc_handler['Na'] +
-                     DmK_dyn * self.conc_handler['K'] +
-                     DmCl_dyn * self.conc_handler['Cl_env'])
-                )
-
-            delta_c = (outputs) ** 2
-
-            cc2 = ((sim.vm - self.target_vmem) * 1e3) ** 2
-
-            chi_sqr = np.sum(delta_c) + np.sum(cc2)
-            # chi_sqr = np.sum(delta_c)
-
-            return chi_sqr
-
-        # Calculate a "Jacobian" estimate for the minimization function:
-        def opt_jac(v_base_o):
-
-            deltag = 0.05
-            vv = v_base_o * 1
-
-            jac_base = opt_funk(v_base_o)
-            jj = []
-
-            for i, vi in enumerate(v_base_o):
-                vv[i] = v_base_o[i] + deltag
-                jj.append(opt_funk(vv))
-
-            jaco = np.asarray((jj - jac_base) / deltag)
-
-            return jaco
-
-        # initialize a list that will hold alternative solutions:
-        alt_sols = []
-
-        # and a messaging function to give feedback to the user on basin hopping progress:
-        def print_fun(x, f, accepted):
-
-            mssg = "at minimum {} accepted {}".format(f, accepted)
-            logs.log_info(mssg)
-
-            if f <= 0.015:
-                # save alternative solutions with exceptional chi sqr values
-                alt_sols.append(x * origin_o)
-
-        minimizer_opts = {'method': self.opti_method}
+        # Contributions of the relative rate of each reaction to the numerator
+        # and denominator of the Goldman equation estimating Vmem from the
+        # present fit's value of Pmem adjustments. Chloride only contributes
+        # if the network electrodiffuses chloride:
+        goldman_num = np.zeros(len(self.react_handler))
+        goldman_den = np.zeros(len(self.react_handler))
+
+        for ion, is_anion in (('Na', False), ('K', False), ('Cl', True)):
+
+            ion_ed = ion + '_ed'
+
+            if ion_ed not in self.react_handler_index:
+                continue
+
+            conc_num = self.conc_handler[ion if is_anion else ion + '_env']
+            conc_den = self.conc_handler[ion + '_env' if is_anion else ion]
+
+            for dm, j in zip(
+                [self.Dmem[ion]] + self.Dm_extra[ion],
+                [self.react_handler_index[ion_ed]] + self.channel_index[ion]):
+
+                goldman_num[j] += dm * conc_num
+                goldman_den[j] += dm * conc_den
+
+        # Define the optimization function, compiling each reaction rate
+        # expression exactly once: this one solves for Vmem using the Goldman
+        # equation and the present fit's value of Pmem adjustments. It then
+        # recalculates r_base at that Vmem and optimizes steady-state by
+        # finding minimum concentration changes, zero transmembrane currents,
+        # and target Vmem values:
+        objective = netopt.NetworkObjective(
+            rate_funcs=[
+                compile_expr(self.react_handler[rea])
+                for rea in self.react_handler],
+            rate_args=(self, sim, cells, p),
+            sim=sim,
+            network_matrix=MM,
+            goldman_num=goldman_num,
+            goldman_den=goldman_den,
+            vmem_factor=float(p.R * sim.T / p.F),
+            vmem_target=float(self.target_vmem),
+        )
 
-        if self.opti_method != 'COBYLA' and self.opti_method != 'Nelder-Mead':
-            minimizer_opts['jac'] = opt_jac
+        # run the basin hopping algorithm in one or more independent chains,
+        # retaining the best result:
+        sol, alt_sols, opti_progress = netopt.optimize_network(
+            objective=objective,
+            x0=vmax_o,
+            chain_count=self.opti_chains,
+            niter=self.opti_N,
+            T=self.opti_T,
+            stepsize=self.opti_step,
+            method=self.opti_method,
+        )
 
-        # run the basin hopping algorithm
-        sol = basinhopping(opt_funk, vmax_o, T=self.opti_T, stepsize=self.opti_step, niter=self.opti_N,
-                           minimizer_kwargs=minimizer_opts, callback=print_fun)
+        # save alternative solutions with exceptional chi sqr values:
+        alt_sols = [x * origin_o for x in alt_sols]
 
         rkeys = list(self.react_handler.keys())
 
+        # Absolute path to write the progress and convergence of all chains:
+        netopt.write_optimization_progress(
+            filename=pathnames.join(
+                self.resultsPath, netopt.OPTIMIZATION_PROGRESS_BASENAME),
+            progress=opti_progress,
+        )
+
         # Absolute path to  write alt solutions:
         saveAlts = pathnames.join(self.resultsPath, 'OptimizationTargetConcsVmem.csv')
         with open(saveAlts, 'w', newline='') as csvfile:
@@ -3969,7 +4133,7 @@ class MasterOfNetworks(object):
         for ind, mol in self.molecules.items():
             self.rho_at_mem += mol.z*p.F*mol.cc_at_mem*cells.diviterm[cells.mem_to_cells]
 
-        self.rho_cells = np.dot(cells.M_sum_mems, self.rho_at_mem)/cells.num_mems
+        self.rho_cells = cells.M_sum_mems.dot(self.rho_at_mem)/cells.num_mems
 
 
     def energy_charge(self, sim):
@@ -4197,12 +4361,11 @@ class MasterOfNetworks(object):
 
             obj = self.molecules[name]
 
+            # Since these lists store rather than copy each appended array,
+            # each array is copied exactly once.
             obj.c_mems_time.append(obj.cc_at_mem*1)
             obj.c_cells_time.append(obj.c_cells*1)
-
-            cc_env = np.copy(obj.c_env*1)
-
-            obj.c_env_time.append(cc_env*1)
+            obj.c_env_time.append(obj.c_env*1)
 
             if self.mit_enabled:
                 obj.c_mit_time.append(obj.c_mit*1)
@@ -4227,7 +4390,7 @@ class MasterOfNetworks(object):
             obj = self.reactions[name]
 
             if self.reaction_rates is not None:
-                obj.rate_time.append(self.reaction_rates[i])
+                obj.rate_time.append(self.reaction_rates[i]*1)
 
         if self.mit_enabled:
             self.vmit_time.append(self.mit.Vmit[:])
@@ -6064,7 +6227,7 @@ class Molecule(object):
                 for obj_cenv in self.c_env_time]
         else:
             cenv = [
-                np.dot(cells.M_sum_mems, obj_cenv) / cells.num_mems
+                cells.M_sum_mems.dot(obj_cenv) / cells.num_mems
                 for obj_cenv in self.c_env_time]
 
         headr = headr + 'Env_Conc_' + self.name + '_mmol/L' + ','
@@ -6649,6 +6812,76 @@ class Modulator(object):
                                            "available. Available choices "
                                            "are: 'GJ', 'Na/K-ATPase' and 'MT' ")
 
+# ....................{ COMPILERS                         }....................
+_EXPR_NAME_TO_FUNC = {}
+'''
+Dictionary mapping from the source of each **network expression** (i.e.,
+string of Python code computing the rate of a reaction, transporter, channel,
+or modulator of a gene regulatory network) previously compiled by the
+:func:`compile_expr` function to the corresponding compiled function.
+'''
+
+
+def compile_expr(expr: str) -> CallableTypes:
+    '''
+    Function evaluating the passed network expression.
+
+    The returned function accepts the ``self``, ``sim``, ``cells``, and ``p``
+    parameters (i.e., the :class:`MasterOfNetworks`, :class:`Simulator`,
+    :class:`Cells`, and :class:`Parameters` instances) referenced by this
+    expression and returns the result of evaluating this expression against
+    these parameters.
+
+    Each expression is compiled exactly once on the first call to this
+    function passed that expression, avoiding the cost of reparsing that
+    expression on each time step. Since compiled functions are cached in a
+    module-scoped dictionary rather than as instance attributes, networks
+    referencing these expressions remain safely picklable.
+
+    Parameters
+    -----------
+    expr : str
+        Network expression to be compiled.
+
+    Returns
+    ----------
+    CallableTypes
+        Function evaluating this expression.
+
+    Raises
+    ----------
+    BetseSimConfException
+        If this expression is syntactically invalid.
+    '''
+
+    # Function previously compiled from this expression if any *OR* "None".
+    expr_func = _EXPR_NAME_TO_FUNC.get(expr)
+
+    # If this expression has yet to be compiled, do so now.
+    if expr_func is None:
+        # Source code of a function returning the value of this expression.
+        expr_func_code = (
+            'def network_expr(self, sim, cells, p):\n'
+            '    return ({})\n'.format(expr))
+
+        # Compile this function with the globals of this submodule (e.g.,
+        # "np", "stb") referenced by these expressions.
+        expr_func_locals = {}
+        try:
+            exec(
+                compile(expr_func_code, '<network expression>', 'exec'),
+                globals(), expr_func_locals)
+        except SyntaxError as exception:
+            raise BetseSimConfException(
+                'Network expression "{}" invalid.'.format(expr)
+            ) from exception
+
+        # Cache this function.
+        expr_func = _EXPR_NAME_TO_FUNC[expr] = expr_func_locals['network_expr']
+
+    # Return this function.
+    return expr_func
+
 # ....................{ CONVERTERS                        }....................
 def rgba2hex(rgb_col, alpha_val):
     '''
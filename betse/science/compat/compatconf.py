@@ -471,6 +471,50 @@ def _upgrade_sim_conf_to_1_0_0(p: Parameters) -> None:
     # Define a default uniquified name for each pipelined export.
     _upgrade_sim_conf_to_1_0_0_exports_name(p)
 
+    # If the matrix backend is undefined, default to sparse matrices.
+    p._conf['solver options'].setdefault('matrix backend', 'sparse')
+
+    # If memory-mapped time series are undefined, default to in-memory.
+    p._conf['solver options'].setdefault('memory map time series', False)
+
+    # If the time series format is undefined, default to per-variable files.
+    p._conf['solver options'].setdefault('time series format', 'npy')
+
+    # If the checkpoint interval is undefined, default to no checkpoints.
+    p._conf['solver options'].setdefault('checkpoint interval', 0)
+
+    # If solver profiling is undefined, default to no profiling.
+    p._conf['solver options'].setdefault('profile stages', False)
+
+    # If adaptive time stepping is undefined, default to fixed time steps.
+    p._conf['solver options'].setdefault('adaptive time step', {
+        'enabled': False,
+        'min factor': 0.1,
+        'max factor': 10.0,
+        'Vmem tolerance': 1.0e-5,
+        'concentration tolerance': 1.0e-4,
+    })
+
+    # If channel gating tables are undefined, default to analytic gating.
+    p._conf['solver options'].setdefault('gating tables', {
+        'enabled': False,
+        'Vmem min': -150.0,
+        'Vmem max': 100.0,
+        'Vmem step': 0.05,
+        'tolerance': 1.0e-4,
+    })
+
+    # If the network integrator is undefined, default to explicit Euler.
+    p._conf['gene regulatory network settings']['sim-grn settings'].setdefault(
+        'integrator', 'euler')
+
+    # If fast animation frames are undefined, default to rendering each
+    # animation frame in full.
+    results_dict['save']['animations'].setdefault('fast frames', False)
+
+    # If the export cache size is undefined, default to 1GiB.
+    results_dict.setdefault('cache size', 1024)
+
     # If the "visuals" subsection is undefined, define this subsection.
     if 'visuals' not in results_dict:
         results_dict['visuals'] = {
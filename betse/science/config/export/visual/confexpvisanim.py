@@ -56,6 +56,15 @@ class SimConfExportAnims(YamlABC):
         YAML-backed list of all post-simulation animations to be animated.
         Ignored if :attr:`is_after_sim` is ``False``.
 
+    Attributes (Frames)
+    ----------
+    is_frames_fast : bool
+        ``True`` only if this configuration renders each saved animation frame
+        by redrawing only the artists changing between frames over a cached
+        rendering of all other artists and writes the raw pixels of that frame
+        directly to all animation writers. See the
+        :class:`betse.lib.matplotlib.writer.mplblit.FigureBlitter` class.
+
     Attributes (Images)
     ----------
     is_images_save : bool
@@ -147,6 +156,10 @@ class SimConfExportAnims(YamlABC):
     is_after_sim_show = yaml_alias(
         "['results options']['after solving']['animations']['show']", bool)
 
+    # ..................{ ALIASES ~ save : frames           }..................
+    is_frames_fast = yaml_alias(
+        "['results options']['save']['animations']['fast frames']", bool)
+
     # ..................{ ALIASES ~ save : images           }..................
     is_images_save = yaml_alias(
         "['results options']['save']['animations']['images']['enabled']", bool)
@@ -55,6 +55,40 @@ PERCENT : enum
 ''')
 
 # ....................{ ENUMS ~ grn                       }....................
+GrnIntegratorType = enums.make_enum(
+    class_name='GrnIntegratorType',
+    member_names=('EULER', 'ROSENBROCK', 'BDF',),
+    doc='''
+Enumeration of all supported types of gene regulatory network (GRN)-specific
+**integrators** (i.e., numerical method advancing the concentrations of all
+cellular substances by the growth, decay, and chemical reactions of the
+current network on each time step of the ``betse sim-grn`` subcommand).
+
+Regardless of integrator, all other network phenomena (e.g., transport,
+pumping, gating, mitochondrial and environmental reactions) are advanced
+explicitly. Since stiff networks are typically limited by their reactions,
+the implicit integrators permit time steps much larger than the
+:attr:`EULER` integrator tolerates.
+
+Attributes
+----------
+EULER : enum
+    Explicit forward Euler method. This integrator is the cheapest per time
+    step but becomes unstable for stiff networks unless the time step is
+    sufficiently small.
+ROSENBROCK : enum
+    Linearly implicit, second-order, L-stable Rosenbrock method (ROS2),
+    solving one sparse linear system of the network Jacobian per time step.
+    This integrator remains stable for arbitrarily large time steps and is
+    recommended for stiff networks.
+BDF : enum
+    Implicit, variable-order backward differentiation formula (BDF) method,
+    adaptively subdividing each time step to satisfy fixed error tolerances.
+    This integrator is the most accurate but also the most expensive per time
+    step.
+''')
+
+
 GrnUnpicklePhaseType = enums.make_enum(
     class_name='GrnUnpicklePhaseType',
     member_names=('SEED', 'INIT', 'SIM',),
@@ -117,6 +151,50 @@ CUSTOM : enum
 ''')
 
 # ....................{ ENUMS ~ solver                    }....................
+MatrixBackendType = enums.make_enum(
+    class_name='MatrixBackendType',
+    member_names=('DENSE', 'SPARSE',),
+    doc='''
+Enumeration of all supported types of **matrix backends** (i.e., in-memory
+representations of the linear operators mapping between the membranes, cells,
+and environmental grid of a cell cluster).
+
+Attributes
+----------
+DENSE : enum
+    Dense backend, representing these operators as dense Numpy arrays. Since
+    these operators are extremely sparse (e.g., with only one non-zero entry
+    per column), this backend scales quadratically in both space and time with
+    the number of cell membranes and is principally intended for debugging.
+SPARSE : enum
+    Sparse backend, representing these operators as compressed sparse row
+    (CSR) SciPy matrices. This backend scales linearly in both space and time
+    with the number of cell membranes and is strongly recommended.
+''')
+
+
+TimeSeriesFormatType = enums.make_enum(
+    class_name='TimeSeriesFormatType',
+    member_names=('NPY', 'PICKLE',),
+    doc='''
+Enumeration of all supported **time series formats** (i.e., on-disk
+representations of the data sampled at each time step of an initialization or
+simulation, such as transmembrane voltages).
+
+Attributes
+----------
+NPY : enum
+    Per-variable format, saving each time series to a separate uncompressed
+    ``.npy`` file in a subdirectory of the pickle directory alongside a YAML
+    index describing these files. The pickled simulator then references rather
+    than embeds these files, each lazily memory-mapped only when first
+    accessed (e.g., by an exporter requiring that time series).
+PICKLE : enum
+    Monolithic format, embedding all time series in the pickled simulator.
+    Unpickling this simulator thus loads all time series into memory.
+''')
+
+
 SolverType = enums.make_enum(
     class_name='SolverType',
     #FIXME: Replace this set of members with the following when sufficient time
@@ -13,8 +13,11 @@ simulation objects.
 #* Rename this module to "simpickler.py".
 
 # ....................{ IMPORTS                            }....................
+from betse.exceptions import BetseSimException
 from betse.lib.pickle import pickles
 from betse.science.compat import compatsim
+from betse.science.math import matrices, timeseries
+from betse.util.path import pathnames
 from betse.util.type.types import type_check
 from collections.abc import Sequence
 
@@ -41,7 +44,10 @@ def saveSim(savePath: str, datadump: Sequence) -> None:
         List of all objects to be pickled.
     '''
 
-    pickles.save(datadump, filename=savePath, is_overwritable=True)
+    # Pickle all file-backed time series relative to the directory containing
+    # this file, permitting this directory to be subsequently moved.
+    with timeseries.pickling_relative_to(_get_pickle_dirname(savePath)):
+        pickles.save(datadump, filename=savePath, is_overwritable=True)
 
 # ....................{ LOADERS                            }....................
 #FIXME: We should probably perform basic sanity checks on loaded objects --
@@ -80,10 +86,16 @@ def loadSim(loadPath) -> tuple:
     # Preserve backward importability with obsolete pickled objects.
     compatsim.upgrade_sim_imports()
 
-    # Unpickle these objects *AFTER* preserving backward importability.
-    sim, cells, p = pickles.load(loadPath)
+    # Unpickle these objects *AFTER* preserving backward importability,
+    # resolving all file-backed time series relative to the directory
+    # containing this file.
+    with timeseries.pickling_relative_to(_get_pickle_dirname(loadPath)):
+        sim, cells, p = pickles.load(loadPath)
+
+    # If this cell cluster is obsolete, raise an exception.
+    _die_if_cells_obsolete(cells=cells, pickle_filename=loadPath)
 
-    #FIXME: Validate these objects.
+    #FIXME: Validate the remaining objects.
 
     # Return these objects.
     return sim, cells, p
@@ -112,7 +124,46 @@ def loadWorld(loadPath) -> tuple:
     # Unpickle these objects *AFTER* preserving backward importability.
     cells, p = pickles.load(loadPath)
 
-    #FIXME: Validate these objects.
+    # If this cell cluster is obsolete, raise an exception.
+    _die_if_cells_obsolete(cells=cells, pickle_filename=loadPath)
+
+    #FIXME: Validate the remaining objects.
 
     # Return these objects.
     return cells, p
+
+# ....................{ PRIVATE                            }....................
+def _die_if_cells_obsolete(cells: object, pickle_filename: str) -> None:
+    '''
+    Raise an exception if the passed cell cluster unpickled from the file with
+    the passed filename was seeded by an obsolete version of this application
+    incompatible with the current version.
+
+    Specifically, cell clusters seeded by older versions pickled the inverse of
+    the gap junction Laplacian as a dense Numpy array rather than a
+    :class:`betse.science.math.matrices.LinearSolver` factorizing that Laplacian.
+    Since solving with such an array fails only partway through a subsequent
+    simulation, this condition is detected here instead.
+
+    Raises
+    ----------
+    BetseSimException
+        If this cell cluster is obsolete.
+    '''
+
+    if not isinstance(
+        getattr(cells, 'lapGJinv', None), matrices.LinearSolver):
+        raise BetseSimException(
+            'Cell cluster pickled to "{}" obsolete '
+            '(i.e., seeded by an older version of this application). '
+            'Please rerun "betse seed" and try again.'.format(
+                pickle_filename))
+
+
+def _get_pickle_dirname(pickle_filename: str) -> str:
+    '''
+    Absolute dirname of the directory containing the pickled file with the
+    passed absolute or relative filename.
+    '''
+
+    return pathnames.get_dirname(pathnames.canonicalize(pickle_filename))
@@ -23,6 +23,12 @@ class SimPhaseCaches(object):
 
     Attributes
     ----------
+    lru : SimPhaseCacheLRU
+        Least recently used (LRU) cache registering all large-scale objects
+        cached by all subcaches of this phase, evicting the least recently used
+        such objects on exceeding the configured byte budget. Callers may
+        introspect the current size of these objects via the
+        :attr:`SimPhaseCacheLRU.size` property.
     upscaled : SimPhaseCacheCellsUpscaled
         Subcache of all upscaled objects constructed for this phase.
     vector : SimPhaseCacheVectorCells
@@ -44,12 +50,16 @@ class SimPhaseCaches(object):
         '''
 
         # Avoid circular import dependencies.
+        from betse.science.math.cache.cachelru import SimPhaseCacheLRU
         from betse.science.math.cache.cacheupscaled import (
             SimPhaseCacheUpscaled)
         from betse.science.math.cache.cachevec import SimPhaseCacheVectorCells
         from betse.science.math.cache.cachevecfld import (
             SimPhaseCacheVectorFieldCells)
 
+        # Classify the LRU cache *BEFORE* all subcaches registering with it.
+        self.lru = SimPhaseCacheLRU(phase)
+
         # Classify all subcaches imported above.
         self.upscaled = SimPhaseCacheUpscaled(phase)
         self.vector = SimPhaseCacheVectorCells(phase)
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **simulation phase least recently used (LRU) cache** (i.e.,
+memory-bounded registry of all large-scale objects cached by the subcaches of a
+simulation phase, evicting the least recently used such objects when the total
+size of these objects exceeds a configurable byte budget) functionality.
+'''
+
+# ....................{ IMPORTS                            }....................
+import mmap, weakref
+import numpy as np
+from betse.science.phase.phasecls import SimPhase
+from betse.util.io.log import logs
+from betse.util.py import pyref
+from betse.util.type.decorator.decmemo import CALLABLE_CACHED_VAR_NAME_PREFIX
+from betse.util.type.types import type_check, CallableTypes, PropertyType
+from collections import OrderedDict
+from functools import wraps
+
+# ....................{ CONSTANTS                          }....................
+PHASE_PROPERTY_CACHED_VAR_NAME_PREFIX = (
+    f'{CALLABLE_CACHED_VAR_NAME_PREFIX}phase_property_')
+'''
+Substring prefixing the names of all private instance variables to which the
+:func:`phase_property_cached` decorator dynamically caches the value returned
+by the decorated property method.
+
+Since this prefix is prefixed by the prefix of all callable caches, these
+values are excluded from pickling in the same manner as those cached by the
+:func:`betse.util.type.decorator.decmemo.property_cached` decorator.
+'''
+
+# ....................{ CLASSES                            }....................
+class SimPhaseCacheLRU(object):
+    '''
+    Simulation phase-specific **least recently used (LRU) cache**, registering
+    all large-scale objects cached by the :func:`phase_property_cached`
+    decorator for a single simulation phase and evicting the least recently
+    used such objects whenever the total size of these objects exceeds the
+    byte budget configured for this phase.
+
+    Each such object remains cached as a private instance variable of the
+    object declaring the decorated property (e.g., a vector subcache), such
+    that access of a cached object is no less efficient than that of an object
+    cached by the :func:`betse.util.type.decorator.decmemo.property_cached`
+    decorator. Eviction merely deletes that variable, forcing that object to be
+    recreated on the next access of that property. Since these objects are
+    *always* safely recreatable, eviction is transparent to callers.
+
+    Attributes
+    ----------
+    _entries : OrderedDict
+        Ordered dictionary mapping from the 2-tuple ``(owner_id, var_name)``
+        uniquely identifying each cached object, where ``owner_id`` is the
+        :func:`id` of the object declaring the decorated property and
+        ``var_name`` the name of the instance variable caching this object, to
+        a weak reference to that declaring object. This dictionary is ordered
+        from the least to most recently used cached object.
+    _phase : SimPhase
+        Parent simulation phase, whose configuration defines the byte budget of
+        this cache.
+    '''
+
+    # ..................{ INITIALIZORS                       }..................
+    @type_check
+    def __init__(self, phase: SimPhase) -> None:
+        '''
+        Initialize this LRU cache.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Parent simulation phase.
+        '''
+
+        # Classify all passed parameters as weak rather than strong reference,
+        # circumventing circular references and complications thereof.
+        self._phase = pyref.proxy_weak(phase)
+
+        # Default all remaining attributes.
+        self._entries = OrderedDict()
+
+    # ..................{ DUNDERS                            }..................
+    def __len__(self) -> int:
+        '''
+        Number of objects currently cached by this cache.
+        '''
+
+        return len(self._entries)
+
+    # ..................{ PROPERTIES                         }..................
+    @property
+    def size(self) -> int:
+        '''
+        Total size in bytes of all Numpy arrays transitively referenced by all
+        objects currently cached by this cache that evicting these objects
+        would free.
+
+        See Also
+        ----------
+        :meth:`_get_sizes`
+            Further details.
+        '''
+
+        return sum(self._get_sizes().values())
+
+
+    @property
+    def size_max(self) -> int:
+        '''
+        Maximum total size in bytes of all objects cached by this cache (i.e.,
+        the byte budget of this cache), configured by the ``cache size`` option
+        in megabytes (MiB) of the simulation configuration of the parent phase.
+        '''
+
+        return self._phase.p.export_cache_size_mb * 1024 * 1024
+
+    # ..................{ TESTERS                            }..................
+    @type_check
+    def is_fitting(self, size: int) -> bool:
+        '''
+        ``True`` only if an object of the passed size in bytes fits within the
+        byte budget of this cache (i.e., would *not* be immediately evicted
+        on exceeding that budget by itself).
+
+        Callers may call this tester to decide between materializing a large
+        object in full *or* lazily computing only the requisite slices of that
+        object on demand (e.g., a single time step of a time series).
+        '''
+
+        return size <= self.size_max
+
+    # ..................{ CACHERS                            }..................
+    def add(self, owner: object, var_name: str) -> None:
+        '''
+        Register the object cached as the instance variable with the passed
+        name of the passed owner as the most recently used cached object and
+        evict the least recently used cached objects until the total size of
+        all cached objects falls within the byte budget of this cache.
+
+        This object itself is never evicted by this call, guaranteeing that
+        the caller may safely return this object.
+        '''
+
+        # Key uniquely identifying this object.
+        key = (id(owner), var_name)
+
+        # Register this object, weakly referring to this owner such that this
+        # object is unregistered on this owner being garbage-collected.
+        self._entries[key] = weakref.ref(
+            owner, lambda owner_weak: self._entries.pop(key, None))
+        self._entries.move_to_end(key)
+
+        # Evict the least recently used objects exceeding this budget.
+        self._evict_excess()
+
+
+    def touch(self, owner: object, var_name: str) -> None:
+        '''
+        Mark the object cached as the instance variable with the passed name of
+        the passed owner as the most recently used cached object.
+        '''
+
+        # Key uniquely identifying this object.
+        key = (id(owner), var_name)
+
+        # If this object is still registered, mark this object as such. (This
+        # object is guaranteed to be registered unless cleared externally.)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+
+
+    def clear(self) -> None:
+        '''
+        Evict all objects currently cached by this cache.
+        '''
+
+        while self._entries:
+            self._evict_oldest()
+
+    # ..................{ PRIVATE ~ evicters                 }..................
+    def _evict_excess(self) -> None:
+        '''
+        Evict the least recently used cached objects *except* the most recently
+        used cached object until the total size of all cached objects falls
+        within the byte budget of this cache.
+        '''
+
+        # Byte budget of this cache.
+        size_max = self.size_max
+
+        # Dictionary mapping from the key of each cached object to the size of
+        # that object *AND* the total size of all such objects, computed once
+        # rather than on each eviction below.
+        sizes = self._get_sizes()
+        size = sum(sizes.values())
+
+        # While this budget is exceeded by any object other than the most
+        # recently used object, evict the least recently used object. Since
+        # memory shared between cached objects is attributed to the most
+        # recently used such object, evicting the least recently used object
+        # frees exactly the memory attributed to that object.
+        while len(self._entries) > 1 and size > size_max:
+            size -= sizes.get(next(iter(self._entries)), 0)
+            self._evict_oldest()
+
+
+    def _evict_oldest(self) -> None:
+        '''
+        Evict the least recently used cached object.
+        '''
+
+        # Remove the least recently used entry.
+        (_, var_name), owner_weak = self._entries.popitem(last=False)
+
+        # Object declaring the property whose value is to be evicted.
+        owner = owner_weak()
+
+        # If this owner has yet to be garbage-collected, delete this value.
+        if owner is not None:
+            logs.log_debug(
+                'Evicting cached "%s.%s" exceeding cache size...',
+                type(owner).__name__,
+                var_name[len(PHASE_PROPERTY_CACHED_VAR_NAME_PREFIX):])
+            owner.__dict__.pop(var_name, None)
+
+    # ..................{ PRIVATE ~ getters                  }..................
+    def _get_sizes(self) -> dict:
+        '''
+        Dictionary mapping from the key of each object currently cached by this
+        cache to the size in bytes of all Numpy arrays transitively referenced
+        by that object that evicting that object would free.
+
+        Specifically, the size of each such array is the size of the base array
+        owning the memory of that array, excluding:
+
+        * Base arrays already attributed to a more recently used cached object
+          (e.g., the original array of a vector returned as is by one of its
+          properties), such that each base array is counted only once.
+        * Base arrays also referenced by **live attributes** (i.e., instance
+          variables *not* cached by the :func:`phase_property_cached`
+          decorator) of the object declaring the property caching that object
+          (e.g., the original array of a vector) *or* by the simulator of the
+          parent phase (e.g., a time series viewed rather than copied by a
+          vector), which evicting that object fails to free.
+        * Memory-mapped base arrays, which the operating system pages in and
+          out of memory on demand. Since :func:`numpy.asarray` reduces
+          memory-mapped arrays to views of type :class:`numpy.ndarray`, the
+          base array of each array is tested rather than that array.
+        '''
+
+        # Set of the IDs of all base arrays referenced by the simulator of the
+        # parent phase if any.
+        base_ids_live_sim = _get_base_ids(getattr(self._phase, 'sim', None))
+
+        # Set of the IDs of all base arrays attributed to cached objects.
+        base_ids_counted = set()
+
+        # Dictionary to be returned, iterated from the most to least recently
+        # used cached object and hence in the reverse of the desired order.
+        sizes = {}
+        for key, owner_weak in reversed(self._entries.items()):
+            # Object declaring the property caching this object.
+            owner = owner_weak()
+            var_name = key[1]
+
+            # If this object has since been garbage-collected *OR* evicted,
+            # this object occupies no space.
+            if owner is None or var_name not in owner.__dict__:
+                sizes[key] = 0
+                continue
+
+            # Set of the IDs of all base arrays referenced by live attributes.
+            base_ids_live = base_ids_live_sim | _get_base_ids(vars(owner))
+
+            # Size of all base arrays referenced by only this object.
+            sizes[key] = 0
+            for array in _iter_arrays(owner.__dict__[var_name], set()):
+                array_base = _get_array_base(array)
+                if not (
+                    array_base is None or
+                    id(array_base) in base_ids_live or
+                    id(array_base) in base_ids_counted
+                ):
+                    base_ids_counted.add(id(array_base))
+                    sizes[key] += array_base.nbytes
+
+        # Return this dictionary in the desired order.
+        return dict(reversed(sizes.items()))
+
+# ....................{ DECORATORS                         }....................
+@type_check
+def phase_property_cached(property_method: CallableTypes) -> PropertyType:
+    '''
+    Decorate the passed property method of a simulation phase subcache to
+    cache the value returned by the first implicit call of this method into the
+    :class:`SimPhaseCacheLRU` of the parent simulation phase.
+
+    This decorator is a drop-in replacement for the
+    :func:`betse.util.type.decorator.decmemo.property_cached` decorator, which
+    caches the value returned by this method forever. This decorator instead
+    caches this value only until evicted by that LRU cache, in which case this
+    method is transparently recalled on the next access of this property.
+
+    Caveats
+    ----------
+    **The object to which this method is bound must provide a** ``_phase``
+    **attribute** referring to the parent simulation phase, as do all
+    :class:`betse.science.math.cache.cacheabc.SimPhaseCacheABC` subclasses.
+    '''
+
+    # Name of the private instance variable to which this decorator caches the
+    # value returned by the decorated property method.
+    property_var_name = (
+        PHASE_PROPERTY_CACHED_VAR_NAME_PREFIX + property_method.__name__)
+
+    @wraps(property_method)
+    def property_method_cached(self):
+
+        # Attempt to return the previously cached value, marking this value as
+        # the most recently used by the LRU cache of this phase.
+        try:
+            property_value = self.__dict__[property_var_name]
+            self._phase.cache.lru.touch(self, property_var_name)
+        # If no such value has been cached (or this value has been evicted),
+        # create, cache, and register this value with that LRU cache. Since
+        # registering this value may evict other values but never this value,
+        # this value is guaranteed to be safely returnable.
+        except KeyError:
+            property_value = self.__dict__[property_var_name] = (
+                property_method(self))
+            self._phase.cache.lru.add(self, property_var_name)
+
+        # Return this value.
+        return property_value
+
+    # Return this wrapper as a read-only property.
+    return property(property_method_cached)
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _get_array_base(array: np.ndarray) -> object:
+    '''
+    **Base array** (i.e., array owning the memory viewed by the passed array,
+    which is the passed array itself if that array owns its memory) of the
+    passed array if that memory resides in memory *or* ``None`` if that memory
+    is memory-mapped.
+    '''
+
+    # Ascend from this array through each array it views.
+    while True:
+        # If this array is memory-mapped, this memory is memory-mapped.
+        if isinstance(array, np.memmap):
+            return None
+        # If this array views another array, ascend to that array.
+        elif isinstance(array.base, np.ndarray):
+            array = array.base
+        # Else, this array is the base array. If this array views a memory map
+        # (e.g., loaded by np.load() in memory-mapped mode and then viewed by
+        # np.asarray()), this memory is memory-mapped.
+        elif isinstance(array.base, mmap.mmap):
+            return None
+        else:
+            return array
+
+
+def _get_base_ids(obj: object) -> set:
+    '''
+    Set of the IDs of all in-memory base arrays (see :func:`_get_array_base`)
+    of all Numpy arrays transitively referenced by the passed object.
+    '''
+
+    return {
+        id(array_base)
+        for array_base in (
+            _get_array_base(array) for array in _iter_arrays(obj, set()))
+        if array_base is not None
+    }
+
+# ....................{ PRIVATE ~ iterators                }....................
+def _iter_arrays(obj: object, obj_ids_visited: set):
+    '''
+    Generator yielding each Numpy array transitively referenced by the passed
+    object that has yet to be visited, recording the IDs of all objects
+    visited by this call into the passed set.
+
+    This generator recurses into the items of dictionaries, lists, and tuples
+    *and* the instance variables of all other objects providing a ``__dict__``
+    (e.g., vectors, time series) *except* those cached by the
+    :func:`phase_property_cached` decorator, which are registered with the LRU
+    cache as separate objects, and weak proxies (e.g., to the parent
+    simulation phase).
+    '''
+
+    # If this object has already been visited, ignore this object.
+    if id(obj) in obj_ids_visited:
+        return
+    obj_ids_visited.add(id(obj))
+
+    # If this object is a weak proxy (e.g., to a simulation phase), ignore this
+    # object. The referent of this proxy is owned by another object.
+    if isinstance(obj, weakref.ProxyTypes):
+        return
+    # If this object is a Numpy array, yield this array.
+    elif isinstance(obj, np.ndarray):
+        yield obj
+    # If this object is a dictionary (e.g., of instance variables), yield the
+    # arrays of all values of this dictionary *EXCEPT* cached values.
+    elif isinstance(obj, dict):
+        for var_name, var_value in obj.items():
+            if not (
+                isinstance(var_name, str) and
+                var_name.startswith(PHASE_PROPERTY_CACHED_VAR_NAME_PREFIX)
+            ):
+                yield from _iter_arrays(var_value, obj_ids_visited)
+    # If this object is a list or tuple (e.g., of ion concentrations), yield
+    # the arrays of all items of this sequence.
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            yield from _iter_arrays(item, obj_ids_visited)
+    # If this object has instance variables, yield the arrays of these
+    # variables.
+    elif hasattr(obj, '__dict__') and not isinstance(obj, type):
+        yield from _iter_arrays(vars(obj), obj_ids_visited)
+
+    # Else, this object is assumed to reference no arrays.
@@ -12,8 +12,8 @@ import numpy as np
 from betse.exceptions import BetseSimVectorException
 from betse.science.math import mathunit
 from betse.science.math.cache.cacheabc import SimPhaseCacheABC
+from betse.science.math.cache.cachelru import phase_property_cached
 from betse.science.math.vector.veccls import VectorCellsCache
-from betse.util.type.decorator.decmemo import property_cached
 
 # ....................{ SUBCLASSES                         }....................
 class SimPhaseCacheVectorCells(SimPhaseCacheABC):
@@ -42,7 +42,7 @@ class SimPhaseCacheVectorCells(SimPhaseCacheABC):
 
     # ..................{ PROPERTIES ~ ions                  }..................
     #FIXME: Decorate to require that calcium ions be enabled.
-    @property_cached
+    @phase_property_cached
     def ion_calcium_intra(self) -> VectorCellsCache:
         '''
         Vector cache of all upscaled cellular calcium ion (Ca2+) concentrations
@@ -54,7 +54,7 @@ class SimPhaseCacheVectorCells(SimPhaseCacheABC):
 
 
     #FIXME: Decorate to require that hydrogen ions be enabled.
-    @property_cached
+    @phase_property_cached
     def ion_hydrogen_intra(self) -> VectorCellsCache:
         '''
         Vector cache of all logarithmically scaled cellular hydrogen ion (H+)
@@ -75,7 +75,7 @@ class SimPhaseCacheVectorCells(SimPhaseCacheABC):
                 for ions_concentration in self._phase.sim.cc_time])
 
     # ..................{ PROPERTIES ~ voltage               }..................
-    @property_cached
+    @phase_property_cached
     def voltage_extra(self) -> VectorCellsCache:
         '''
         Vector cache of all upscaled **extracellular voltages** (i.e., voltages
@@ -104,7 +104,7 @@ class SimPhaseCacheVectorCells(SimPhaseCacheABC):
                 self._phase.sim.venv_time).reshape(voltage_extra_shape))
 
 
-    @property_cached
+    @phase_property_cached
     def voltage_membrane(self) -> VectorCellsCache:
         '''
         Vector cache of all upscaled **transmembrane voltages** (i.e., voltages
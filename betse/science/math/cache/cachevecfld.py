@@ -11,9 +11,9 @@ High-level vector field subcache functionality.
 from betse.lib.numpy import nparray
 from betse.science.math import mathunit
 from betse.science.math.cache.cacheabc import SimPhaseCacheABC
+from betse.science.math.cache.cachelru import phase_property_cached
 from betse.science.math.vector.veccls import VectorCellsCache
 from betse.science.math.vector.vecfldcls import VectorFieldCellsCache
-from betse.util.type.decorator.decmemo import property_cached
 
 # FIXME: Sess, why the heck would you put these plotting functions into math?!?!?
 
@@ -25,7 +25,7 @@ class SimPhaseCacheVectorFieldCells(SimPhaseCacheABC):
     '''
 
     # ..................{ PROPERTIES ~ currents              }..................
-    @property_cached
+    @phase_property_cached
     def currents_intra(self) -> VectorFieldCellsCache:
         '''
         Vector field cache of all intracellular current densities over all time
@@ -48,7 +48,7 @@ class SimPhaseCacheVectorFieldCells(SimPhaseCacheABC):
         )
 
 
-    @property_cached
+    @phase_property_cached
     def currents_extra(self) -> VectorFieldCellsCache:
         '''
         Vector field cache of all exracellular current densities over all time
@@ -73,10 +73,10 @@ class SimPhaseCacheVectorFieldCells(SimPhaseCacheABC):
 
     # ..................{ PROPERTIES ~ deform                }..................
     #FIXME: Raise an exception unless deformations are enabled. To do so sanely,
-    #we'll want to define a new @phase_property_cached decorator accepting an
+    #we'll want to extend the @phase_property_cached decorator to accept an
     #optional "requirements" parameter, much like the existing @piperunner
     #decorator. (For now, simply ignore this for simplicity.)
-    @property_cached
+    @phase_property_cached
     def deform_total(self) -> VectorFieldCellsCache:
         '''
         Vector field cache of all upscaled **total cellular displacements**
@@ -100,7 +100,7 @@ class SimPhaseCacheVectorFieldCells(SimPhaseCacheABC):
         )
 
     # ..................{ PROPERTIES ~ electric              }..................
-    @property_cached
+    @phase_property_cached
     def electric_intra(self) -> VectorFieldCellsCache:
         '''
         Vector field cache of the intracellular electric field over all sampled
@@ -118,7 +118,7 @@ class SimPhaseCacheVectorFieldCells(SimPhaseCacheABC):
         )
 
 
-    @property_cached
+    @phase_property_cached
     def electric_extra(self) -> VectorFieldCellsCache:
         '''
         Vector field cache of the extracellular electric field over all sampled
@@ -163,7 +163,7 @@ class SimPhaseCacheVectorFieldCells(SimPhaseCacheABC):
     #     )
 
     # ..................{ PROPERTIES ~ voltage               }..................
-    @property_cached
+    @phase_property_cached
     def voltage_polarity(self) -> VectorFieldCellsCache:
         '''
         Vector field cache of all cellular voltage polarities over all time
@@ -6,6 +6,8 @@
 import math
 import numpy as np
 # import scipy.ndimage
+from betse.science.enum.enumconf import MatrixBackendType
+from betse.science.math import matrices
 from scipy.spatial import Delaunay, cKDTree
 
 # ....................{ CLASSES                            }....................
@@ -249,193 +251,57 @@ class FiniteDiffSolver(object):
 
         self.map_ij2k_u = np.asarray(self.map_ij2k_u)
 
-    def makeLaplacian(self, bound = {'N':'value','S':'value','E':'value','W':'value'}):
+    def makeLaplacian(
+        self,
+        bound = {'N':'value','S':'value','E':'value','W':'value'},
+        backend: MatrixBackendType = MatrixBackendType.SPARSE,
+    ) -> tuple:
         """
         Calculate a Laplacian operator matrix suitable for solving a 2D Poisson equation
         on a regular Cartesian grid with square boundaries. Note: the graph must have
         equal spacing in the x and y directions (the same delta in x and y directions).
 
+        Returns a 2-tuple ``(A, A_solver)`` of this matrix and a
+        :class:`betse.science.math.matrices.LinearSolver` instance solving the
+        Laplace and Poisson equations against this matrix, both represented
+        with the passed matrix backend.
         """
 
-        size_rows = self.cents_shape[0]
-        size_cols = self.cents_shape[1]
-
-        sze = size_rows*size_cols
-
-        A = np.zeros((sze,sze))
-
-        for k, (i,j) in enumerate(self.map_ij2k_cents):
-
-            # if we're not on a main boundary:
-            if i != 0 and j != 0 and i != size_rows-1 and j != size_cols-1:
-
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                A[k, k_ip1_j] = 1
-                A[k, k_in1_j] = 1
-                A[k, k_i_jp1] = 1
-                A[k, k_i_jn1] = 1
-                A[k,k] = -4
-
-
-            elif i == 0 and j != 0 and j != size_cols -1: # if on the bottom (South) boundary:
-
-                if bound['S'] == 'flux':
-
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k, k_ip1_j] = 1
-                    A[k, k_i_jp1] = 1
-                    A[k, k_i_jn1] = 1
-
-                    A[k,k] = -3
-
-                elif bound['S'] == 'value':
-
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-
-                    A[k,k] = 1
-                    # A[k,k_ip1_j] = 1
-
-            elif i == size_rows -1 and j != 0 and j != size_cols -1: # if on the top (North) boundary:
-
-                if bound['N'] == 'flux':
-
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k, k_in1_j] = 1
-                    A[k, k_i_jp1] = 1
-                    A[k, k_i_jn1] = 1
-
-                    A[k,k] = -3
-
-                elif bound['N'] == 'value':
-
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-
-                    A[k,k] = 1
-                    # A[k,k_in1_j] = 1
-
-            elif j == 0 and i != 0 and i != size_rows -1:  # if on the left (West) boundary:
+        return self._make_laplacian_and_solver(
+            bound=bound, backend=backend, screening=0.0)
 
-                if bound['W'] == 'flux':
-
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-
-                    A[k, k_i_jp1] = 1
-                    A[k, k_ip1_j] = 1
-                    A[k, k_in1_j] = 1
-
-                    A[k,k] = -3
-
-                elif bound['W'] == 'value':
-
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-
-                    A[k,k] = 1
-                    # A[k,k_i_jp1] = 1
-
-            elif j == size_cols -1 and i != 0 and i != size_rows -1: # if on the right (East) boundary:
-
-                if bound['E'] == 'flux':
-
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-
-                    A[k, k_i_jn1] = 1
-                    A[k, k_ip1_j] = 1
-                    A[k, k_in1_j] = 1
-
-                    A[k,k] = -3
-
-                elif bound['E'] == 'value':
-
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k,k] = 1
-                    # A[k,k_i_jn1] = 1
-
-            # corners:
-            elif i == 0 and j == 0: # SW corner
-
-                if bound['S'] == 'flux':
-
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-
-                    A[k, k_i_jp1] = 1
-                    A[k, k_ip1_j] = 1
-                    A[k,k] = -2
-
-                else:
-                    A[k,k] = 1
-
-            elif i == size_rows - 1 and j == 0: # NW corner
-
-                if bound['N'] == 'flux':
-
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-
-                    A[k, k_i_jp1] = 1
-                    A[k, k_in1_j] = 1
-                    A[k,k] = -2
-
-                else:
-                    A[k,k] = 1
-
-            elif i == 0 and j == size_cols - 1: # SE corner
-
-                if bound['E'] == 'flux':
-
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k, k_i_jn1] = 1
-                    A[k, k_ip1_j] = 1
-                    A[k,k] = -2
-
-                else:
-                    A[k,k] = 1
-
-            elif i == size_rows - 1 and j == size_cols - 1: # NE corner
-
-                if bound['E'] == 'flux':
-
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k, k_i_jn1] = 1
-                    A[k, k_in1_j] = 1
-                    A[k,k] = -2
-
-                else:
-                    A[k,k] = 1
-
-
-        A = A/(self.delta**2)
+    def makeScreenedLaplacian(
+        self,
+        ko=1.0e9,
+        bound = {'N':'value','S':'value','E':'value','W':'value'},
+        backend: MatrixBackendType = MatrixBackendType.SPARSE,
+    ) -> tuple:
+        """
+        Calculate a screened Laplacian operator matrix (i.e., the Laplacian
+        minus ``ko**2`` along the diagonal) suitable for solving a 2D
+        screened Poisson equation on a regular Cartesian grid with square
+        boundaries. Note: the graph must have equal spacing in the x and y
+        directions (the same delta in x and y directions).
 
-        # calculate the inverse, which is stored for solution calculation of Laplace and Poisson equations
-        Ainv = np.linalg.pinv(A)
+        Returns a 2-tuple ``(A, A_solver)`` as for :meth:`makeLaplacian`.
+        """
 
-        return A, Ainv
+        return self._make_laplacian_and_solver(
+            bound=bound, backend=backend, screening=(self.delta**2)*(ko**2))
 
-    def makeScreenedLaplacian(self, ko=1.0e9, bound = {'N':'value','S':'value','E':'value','W':'value'}):
+    def _make_laplacian_and_solver(
+        self, bound, backend: MatrixBackendType, screening: float) -> tuple:
         """
-        Calculate a Laplacian operator matrix suitable for solving a 2D Poisson equation
-        on a regular Cartesian grid with square boundaries. Note: the graph must have
-        equal spacing in the x and y directions (the same delta in x and y directions).
-
+        Calculate a (possibly screened) Laplacian operator matrix on the
+        centres of this grid and a linear solver for this matrix.
+
+        Each grid point whose boundary condition is ``'flux'`` (including all
+        interior points) is connected to all adjacent grid points, with a
+        diagonal entry of the negated number of such points less the passed
+        screening term. Each grid point whose boundary condition is ``'value'``
+        is fixed, with a diagonal entry of 1. The boundary condition of each
+        corner is that of the bottom (South), top (North), or right (East)
+        boundary for the SW, NW, and SE/NE corners respectively.
         """
 
         size_rows = self.cents_shape[0]
@@ -443,172 +309,67 @@ class FiniteDiffSolver(object):
 
         sze = size_rows*size_cols
 
-        A = np.zeros((sze,sze))
-
-        for k, (i,j) in enumerate(self.map_ij2k_cents):
-
-            # if we're not on a main boundary:
-            if i != 0 and j != 0 and i != size_rows-1 and j != size_cols-1:
-
-                k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                A[k, k_ip1_j] = 1
-                A[k, k_in1_j] = 1
-                A[k, k_i_jp1] = 1
-                A[k, k_i_jn1] = 1
-                A[k,k] = -4 - (self.delta**2)*(ko**2)
-
-
-            elif i == 0 and j != 0 and j != size_cols -1: # if on the bottom (South) boundary:
-
-                if bound['S'] == 'flux':
-
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k, k_ip1_j] = 1
-                    A[k, k_i_jp1] = 1
-                    A[k, k_i_jn1] = 1
-
-                    A[k,k] = -3 - (self.delta**2)*(ko**2)
-
-                elif bound['S'] == 'value':
-
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-
-                    A[k,k] = 1
-                    # A[k,k_ip1_j] = 1
-
-            elif i == size_rows -1 and j != 0 and j != size_cols -1: # if on the top (North) boundary:
-
-                if bound['N'] == 'flux':
-
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k, k_in1_j] = 1
-                    A[k, k_i_jp1] = 1
-                    A[k, k_i_jn1] = 1
-
-                    A[k,k] = -3 - (self.delta**2)*(ko**2)
-
-                elif bound['N'] == 'value':
-
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-
-                    A[k,k] = 1
-                    # A[k,k_in1_j] = 1
-
-            elif j == 0 and i != 0 and i != size_rows -1:  # if on the left (West) boundary:
-
-                if bound['W'] == 'flux':
-
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-
-
-                    A[k, k_i_jp1] = 1
-                    A[k, k_ip1_j] = 1
-                    A[k, k_in1_j] = 1
-
-                    A[k,k] = -3 - (self.delta**2)*(ko**2)
-
-                elif bound['W'] == 'value':
-
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-
-                    A[k,k] = 1
-                    # A[k,k_i_jp1] = 1
-
-            elif j == size_cols -1 and i != 0 and i != size_rows -1: # if on the right (East) boundary:
-
-                if bound['E'] == 'flux':
-
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i-1,j])
-
-                    A[k, k_i_jn1] = 1
-                    A[k, k_ip1_j] = 1
-                    A[k, k_in1_j] = 1
-
-                    A[k,k] = -3 - (self.delta**2)*(ko**2)
-
-                elif bound['E'] == 'value':
-
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k,k] = 1
-                    # A[k,k_i_jn1] = 1
-
-            # corners:
-            elif i == 0 and j == 0: # SW corner
-
-                if bound['S'] == 'flux':
-
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-
-                    A[k, k_i_jp1] = 1
-                    A[k, k_ip1_j] = 1
-                    A[k,k] = -2 - (self.delta**2)*(ko**2)
-
-                else:
-                    A[k,k] = 1
-
-            elif i == size_rows - 1 and j == 0: # NW corner
-
-                if bound['N'] == 'flux':
-
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jp1 = self.map_ij2k_cents.tolist().index([i,j+1])
-
-                    A[k, k_i_jp1] = 1
-                    A[k, k_in1_j] = 1
-                    A[k,k] = -2 - (self.delta**2)*(ko**2)
-
-                else:
-                    A[k,k] = 1
-
-            elif i == 0 and j == size_cols - 1: # SE corner
-
-                if bound['E'] == 'flux':
-
-                    k_ip1_j = self.map_ij2k_cents.tolist().index([i + 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k, k_i_jn1] = 1
-                    A[k, k_ip1_j] = 1
-                    A[k,k] = -2 - (self.delta**2)*(ko**2)
-
-                else:
-                    A[k,k] = 1
-
-            elif i == size_rows - 1 and j == size_cols - 1: # NE corner
-
-                if bound['E'] == 'flux':
-
-                    k_in1_j = self.map_ij2k_cents.tolist().index([i - 1,j])
-                    k_i_jn1 = self.map_ij2k_cents.tolist().index([i,j-1])
-
-                    A[k, k_i_jn1] = 1
-                    A[k, k_in1_j] = 1
-                    A[k,k] = -2 - (self.delta**2)*(ko**2)
-
-                else:
-                    A[k,k] = 1
-
+        # (i, j) grid indices of each grid point, flattened in row-major order
+        # and hence ordered identically to the "map_ij2k_cents" array:
+        I, J = np.meshgrid(
+            np.arange(size_rows), np.arange(size_cols), indexing='ij')
+        I = I.ravel()
+        J = J.ravel()
+        K = np.arange(sze)
+
+        # boolean masks of grid points on each main boundary:
+        on_S = I == 0
+        on_N = I == size_rows - 1
+        on_W = J == 0
+        on_E = J == size_cols - 1
+
+        # boolean mask of all grid points with fixed-value boundary conditions:
+        is_value = np.zeros(sze, dtype=bool)
+        is_value |= (on_S & ~on_E) & (bound['S'] != 'flux')  # S edge and SW corner
+        is_value |= (on_N & ~on_E) & (bound['N'] != 'flux')  # N edge and NW corner
+        is_value |= (on_W & ~on_S & ~on_N) & (bound['W'] != 'flux')  # W edge
+        is_value |= on_E & (bound['E'] != 'flux')  # E edge and SE, NE corners
+        is_flux = ~is_value
+
+        rows = []
+        cols = []
+
+        # off-diagonal entries connecting each non-fixed grid point to each of
+        # its adjacent grid points:
+        for di, dj, has_nbr in (
+            ( 1,  0, ~on_N),
+            (-1,  0, ~on_S),
+            ( 0,  1, ~on_E),
+            ( 0, -1, ~on_W),
+        ):
+            mask = is_flux & has_nbr
+            rows.append(K[mask])
+            cols.append((I[mask] + di)*size_cols + J[mask] + dj)
+
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+
+        # diagonal entries of all grid points:
+        num_nbrs = np.bincount(rows, minlength=sze)
+        diag = np.where(is_flux, -num_nbrs - screening, 1.0)
+
+        A = matrices.make_matrix(
+            backend=backend,
+            data=np.concatenate((np.ones(len(rows)), diag)),
+            row_indices=np.concatenate((rows, K)),
+            col_indices=np.concatenate((cols, K)),
+            shape=(sze, sze),
+        )
 
         A = A/(self.delta**2)
 
-        # calculate the inverse, which is stored for solution calculation of Laplace and Poisson equations
-        Ainv = np.linalg.pinv(A)
+        # create the solver, which is stored for solution calculation of
+        # Laplace and Poisson equations. If all boundaries are zero-flux,
+        # this unscreened Laplacian is singular (i.e., defined only up to
+        # an additive constant):
+        is_singular = screening == 0.0 and not is_value.any()
+        Ainv = matrices.LinearSolver(
+            matrix=A, backend=backend, is_singular=is_singular)
 
         return A, Ainv
 
@@ -1233,82 +994,77 @@ def laplacian(F,delx,dely=None):
 
     return ddF
 
-def gradient(F,delx,dely=None):
-    # gradient using numpy slicing:
+def gradient(F,delx,dely=None,out=None):
+    # gradient using numpy slicing. Any leading axes of F (e.g., indexing ions)
+    # are treated as a stack of independent 2D grids. If passed, "out" is a
+    # 2-tuple of preallocated arrays of the same shape as F into which the X
+    # and Y components of this gradient are written:
 
     if dely is None:
         dely = delx
 
-    # calculate the discrete central first derivatives on the internal mesh points:
-    dF_interior_y = -(F[:-2,:] - F[2:,:])/(2*dely)
-    dF_interior_x = -(F[:,:-2] - F[:,2:])/(2*delx)
-
-    # calculate the discrete forward or backward first derivatives on the boundary points:
-    dF_B = (F[1,:] - F[0,:])/dely
-    dF_T = (F[-1,:] - F[-2,:])/dely
-    dF_L = (F[:,1] - F[:,0])/delx
-    dF_R = (F[:,-1] - F[:,-2])/delx
-
     # initialize the dFx and dFy arrays:
-    dFx = np.zeros(F.shape)
-    dFy = np.zeros(F.shape)
+    if out is None:
+        dFx = np.zeros(F.shape)
+        dFy = np.zeros(F.shape)
+    else:
+        dFx, dFy = out
 
-    # build the final dFx and dFy arrays by splicing together internal and boundary derivatives:
-    dFx[:,1:-1] = dF_interior_x
-    dFy[1:-1,:] = dF_interior_y
+    # calculate the discrete central first derivatives on the internal mesh points:
+    _diff_central(F[...,:,:-2], F[...,:,2:], 2*delx, dFx[...,:,1:-1])
+    _diff_central(F[...,:-2,:], F[...,2:,:], 2*dely, dFy[...,1:-1,:])
 
-    dFx[:,0] = dF_L
-    dFx[:,-1] = dF_R
+    # calculate the discrete forward or backward first derivatives on the boundary points:
+    dFx[...,:,0] = (F[...,:,1] - F[...,:,0])/delx
+    dFx[...,:,-1] = (F[...,:,-1] - F[...,:,-2])/delx
 
-    dFy[0,:] = dF_B
-    dFy[-1,:] = dF_T
+    dFy[...,0,:] = (F[...,1,:] - F[...,0,:])/dely
+    dFy[...,-1,:] = (F[...,-1,:] - F[...,-2,:])/dely
 
     return dFx, dFy
 
-def diff(F,delx,axis=0):
-    # dertivative using numpy slicing:
+def diff(F,delx,axis=0,out=None):
+    # dertivative using numpy slicing, treating any leading axes of F as a
+    # stack of independent 2D grids. If passed, "out" is a preallocated array
+    # of the same shape as F into which this derivative is written:
+
+    dF = np.zeros(F.shape) if out is None else out
 
     if axis == 1:
         # calculate the discrete central first derivatives on the internal mesh points:
-        dF_interior = -(F[:-2,:] - F[2:,:])/(2*delx)
+        _diff_central(F[...,:-2,:], F[...,2:,:], 2*delx, dF[...,1:-1,:])
 
         # calculate the discrete forward or backward first derivatives on the boundary points:
-        dF_B = -(F[1,:] - F[0,:])/delx
-        dF_T = -(F[-1,:] - F[-2,:])/delx
-
-        dF = np.zeros(F.shape)
-
-        dF[1:-1,:] = dF_interior
-
-        dF[0,:] = dF_B
-        dF[-1,:] = dF_T
+        dF[...,0,:] = -(F[...,1,:] - F[...,0,:])/delx
+        dF[...,-1,:] = -(F[...,-1,:] - F[...,-2,:])/delx
 
 
     elif axis == 0:
         # calculate the discrete central first derivatives on the internal mesh points:
-        dF_interior = -(F[:,:-2] - F[:,2:])/(2*delx)
+        _diff_central(F[...,:,:-2], F[...,:,2:], 2*delx, dF[...,:,1:-1])
 
         # calculate the discrete forward or backward first derivatives on the boundary points:
-        dF_L = (F[:,0] - F[:,1])/delx
-        dF_R = (F[:,-2] - F[:,-1])/delx
-
-        dF = np.zeros(F.shape)
+        dF[...,:,0] = (F[...,:,0] - F[...,:,1])/delx
+        dF[...,:,-1] = (F[...,:,-2] - F[...,:,-1])/delx
 
-        dF[:,1:-1] = dF_interior
 
-        dF[:,0] = dF_L
-        dF[:,-1] = dF_R
+    return dF
 
+def _diff_central(F_prev, F_next, delx2, out):
+    # central difference -(F_prev - F_next)/delx2 computed in-place in the
+    # passed array (typically a view of a preallocated derivative array):
 
-    return dF
+    np.subtract(F_prev, F_next, out=out)
+    np.negative(out, out=out)
+    np.divide(out, delx2, out=out)
 
-def divergence(Fx,Fy,delx,dely):
+def divergence(Fx,Fy,delx,dely,out=None):
 
-    gx = diff(Fx, delx, axis=0)
+    gx = diff(Fx, delx, axis=0, out=out)
     gy = diff(Fy, dely, axis=1)
-    div = gx + gy
+    gx += gy
 
-    return div
+    return gx
 
 def curl(Fx, Fy, delx,dely):
 
@@ -1476,38 +1232,39 @@ def boundTag(points,delta,alpha=1.0):
 #
 #     return F
 
-def integrator(P, sharp = 0.5):
+def integrator(P, sharp = 0.5, out = None):
     """
     Averages nearest neighbours of the environmental array with a weighting
     given by the "sharp" option.
 
-    P: some 2D matrix
+    P: some 2D matrix, or a stack of 2D matrices whose last two axes are the grid
     sharp: weighting of the neigbouring averages; 0.5 is standard finite volume smoothing; 1.0 is no smoothing
+    out: optional preallocated array of the same shape as P (but distinct from P) receiving the result
 
     Thanks Sess!
 
     """
 
-    F = np.zeros(P.shape)
+    F = np.zeros(P.shape) if out is None else out
 
-    eP = P[:,1:] # east midpoints
-    wP = P[:,0:-1] # west midpoints
-    nP = P[1:,:] # north midpoints
-    sP = P[0:-1,:] # south midpoints
+    eP = P[...,:,1:] # east midpoints
+    wP = P[...,:,0:-1] # west midpoints
+    nP = P[...,1:,:] # north midpoints
+    sP = P[...,0:-1,:] # south midpoints
 
     sides = (1-sharp)/4
 
-    F[:, :] = sharp * P
-    F[0:-1, :] += sides * nP
-    F[1:, :] += sides * sP
-    F[:, 0:-1] += sides * eP
-    F[:, 1:] += sides * wP
+    F[...] = sharp * P
+    F[...,0:-1, :] += sides * nP
+    F[...,1:, :] += sides * sP
+    F[...,:, 0:-1] += sides * eP
+    F[...,:, 1:] += sides * wP
 
     # reset boundary values:
-    F[:, 0] = P[:, 0]
-    F[:, -1] = P[:, -1]
-    F[0, :] = P[0, :]
-    F[-1, :] = P[-1, :]
+    F[...,:, 0] = P[...,:, 0]
+    F[...,:, -1] = P[...,:, -1]
+    F[...,0, :] = P[...,0, :]
+    F[...,-1, :] = P[...,-1, :]
 
     return F
 
@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **matrix** (i.e., two-dimensional linear operators mapping data
+between the membranes, cells, and environmental grid of a cell cluster) and
+**linear solver** (i.e., object solving linear systems of such matrices)
+facilities.
+
+Matrices created by this submodule are either dense Numpy arrays *or* sparse
+SciPy matrices, depending on the **matrix backend** (i.e.,
+:class:`MatrixBackendType` member) selected by the current simulation
+configuration. Since both types of matrices define the same ``dot()`` method,
+callers should *always* apply these matrices to data as ``matrix.dot(data)``
+rather than ``np.dot(matrix, data)``. Whereas the former is backend-agnostic,
+the latter silently fails for sparse matrices.
+'''
+
+# ....................{ IMPORTS                           }....................
+import numpy as np
+from betse.science.enum.enumconf import MatrixBackendType
+from betse.util.type.types import (
+    type_check, SequenceTypes, SequenceOrNoneTypes)
+from numpy import ndarray
+from scipy import sparse
+from scipy.sparse import csgraph, linalg as splinalg
+
+# ....................{ TESTERS                           }....................
+def is_sparse(matrix: object) -> bool:
+    '''
+    ``True`` only if the passed matrix is a sparse SciPy matrix rather than a
+    dense Numpy array.
+    '''
+
+    return sparse.issparse(matrix)
+
+# ....................{ MAKERS                            }....................
+@type_check
+def make_matrix(
+    backend: MatrixBackendType,
+    data: SequenceTypes,
+    row_indices: SequenceTypes,
+    col_indices: SequenceTypes,
+    shape: tuple,
+) -> object:
+    '''
+    Matrix of the passed shape whose non-zero entries are the passed data at
+    the passed row and column indices, represented with the passed backend.
+
+    Duplicate row and column index pairs are summed, preserving the semantics
+    of the ``matrix[row_i, col_i] += data_i`` idiom previously used to
+    iteratively populate dense matrices.
+
+    Parameters
+    ----------
+    backend : MatrixBackendType
+        Type of matrix to be created.
+    data : SequenceTypes
+        One-dimensional sequence of all non-zero entries of this matrix.
+    row_indices : SequenceTypes
+        One-dimensional sequence of the row index of each such entry.
+    col_indices : SequenceTypes
+        One-dimensional sequence of the column index of each such entry.
+    shape : tuple
+        2-tuple ``(row_count, col_count)`` of the shape of this matrix.
+
+    Returns
+    ----------
+    object
+        Either:
+
+        * If ``backend`` is :attr:`MatrixBackendType.SPARSE`, a compressed
+          sparse row (CSR) SciPy matrix.
+        * If ``backend`` is :attr:`MatrixBackendType.DENSE`, a dense
+          two-dimensional Numpy array.
+    '''
+
+    # If creating a sparse matrix, defer to SciPy. By design, the COO format
+    # sums duplicate entries on conversion into the CSR format.
+    if backend is MatrixBackendType.SPARSE:
+        return sparse.coo_matrix(
+            (data, (row_indices, col_indices)), shape=shape).tocsr()
+
+    # Else, create a dense matrix, summing duplicate entries.
+    matrix = np.zeros(shape)
+    np.add.at(
+        matrix, (np.asarray(row_indices), np.asarray(col_indices)), data)
+    return matrix
+
+# ....................{ SCALERS                           }....................
+@type_check
+def scale_columns(matrix: object, factors: ndarray) -> object:
+    '''
+    Copy of the passed matrix with each column multiplied by the
+    corresponding item of the passed one-dimensional Numpy array.
+
+    The returned matrix is of the same backend as the passed matrix (i.e.,
+    sparse if the passed matrix is sparse and dense otherwise).
+    '''
+
+    # If this matrix is sparse, right-multiply by the equivalent diagonal
+    # matrix, preserving both sparsity and the CSR format.
+    if is_sparse(matrix):
+        return (matrix @ sparse.diags(factors)).tocsr()
+
+    # Else, this matrix is dense. Broadcast these factors across all rows.
+    return matrix * factors
+
+@type_check
+def scale_rows(matrix: object, factors: ndarray) -> object:
+    '''
+    Copy of the passed matrix with each row multiplied by the corresponding
+    item of the passed one-dimensional Numpy array.
+
+    The returned matrix is of the same backend as the passed matrix (i.e.,
+    sparse if the passed matrix is sparse and dense otherwise).
+    '''
+
+    # If this matrix is sparse, left-multiply by the equivalent diagonal
+    # matrix, preserving both sparsity and the CSR format.
+    if is_sparse(matrix):
+        return (sparse.diags(factors) @ matrix).tocsr()
+
+    # Else, this matrix is dense. Broadcast these factors across all columns.
+    return matrix * factors[:, np.newaxis]
+
+# ....................{ CONVERTERS                        }....................
+@type_check
+def convert_matrix(matrix: object, backend: MatrixBackendType) -> object:
+    '''
+    Passed matrix converted into the passed backend if this matrix is *not*
+    already of that backend *or* this matrix as is otherwise.
+    '''
+
+    if backend is MatrixBackendType.SPARSE:
+        return matrix.tocsr() if is_sparse(matrix) else sparse.csr_matrix(matrix)
+    else:
+        return matrix.toarray() if is_sparse(matrix) else matrix
+
+# ....................{ CLASSES                           }....................
+class LinearSolver(object):
+    '''
+    **Linear solver** (i.e., object efficiently solving the linear system
+    ``A x = b`` for the unknown vector ``x`` given a fixed square matrix ``A``
+    and arbitrarily many right-hand side vectors ``b``).
+
+    Depending on the matrix backend this solver is instantiated with, this
+    solver either:
+
+    * If :attr:`MatrixBackendType.SPARSE`, caches a sparse LU factorization of
+      this matrix. Each solution then reduces to sparse forward and back
+      substitution, consuming space and time linear in the number of non-zero
+      entries of this matrix.
+    * If :attr:`MatrixBackendType.DENSE`, caches the dense Moore-Penrose
+      pseudo-inverse of this matrix. Each solution then reduces to a dense
+      matrix-vector product, consuming space and time quadratic in the size of
+      this matrix.
+
+    Since SciPy's LU factorizations are unpicklable, the sparse factorization
+    is *not* pickled but instead lazily recomputed on the first solution after
+    unpickling this solver.
+
+    Attributes
+    ----------
+    is_singular : bool
+        ``True`` only if this matrix is singular, in which case this matrix is
+        assumed to be symmetric with null space spanned by the indicator
+        vectors of the connected components of its graph (e.g., as is the case
+        for Laplacians with pure Neumann boundary conditions). Solutions to
+        this system are then the minimum-norm least-squares solutions, matching
+        those produced by this matrix's pseudo-inverse.
+    rhs_factors : ndarray or None
+        One-dimensional Numpy array of the factors by which to multiply each
+        right-hand side vector before solving if any *or* ``None`` otherwise.
+        If non-``None``, this solver effectively solves the non-symmetric
+        system ``diag(1/rhs_factors) A x = b`` while only factorizing the
+        (typically symmetric) matrix ``A``.
+    size : int
+        Number of rows and columns of this matrix.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        matrix: object,
+        backend: MatrixBackendType,
+        is_singular: bool = False,
+        rhs_factors: SequenceOrNoneTypes = None,
+    ) -> None:
+        '''
+        Initialize this solver.
+
+        Parameters
+        ----------
+        matrix : object
+            Square matrix to be solved for, either a dense Numpy array *or*
+            a sparse SciPy matrix.
+        backend : MatrixBackendType
+            Type of matrix backend with which to solve this matrix.
+        is_singular : optional[bool]
+            ``True`` only if this matrix is singular. See the class docstring.
+            Defaults to ``False``.
+        rhs_factors : optional[ndarray]
+            Factors by which to multiply each right-hand side vector. See the
+            class docstring. Defaults to ``None``.
+        '''
+
+        # Classify all passed parameters.
+        self.is_singular = is_singular
+        self.rhs_factors = rhs_factors
+        self.size = matrix.shape[0]
+
+        # Dense pseudo-inverse of this matrix if using the dense backend *OR*
+        # "None" otherwise.
+        self._matrix_inv = None
+
+        # Sparse matrix to be factorized if using the sparse backend *OR*
+        # "None" otherwise.
+        self._matrix = None
+
+        # Callable solving this factorized matrix if this matrix has been
+        # factorized *OR* "None" otherwise.
+        self._matrix_factorized = None
+
+        # If this matrix is singular, one-dimensional Numpy arrays of:
+        # * The connected component label of each row of this matrix.
+        # * The number of rows in each such component.
+        # * Whether each row is "free" (i.e., *NOT* pinned to zero as the first
+        #   row of its component).
+        self._component_labels = None
+        self._component_sizes = None
+        self._is_row_free = None
+
+        # If using the dense backend, cache this matrix's pseudo-inverse.
+        if backend is MatrixBackendType.DENSE:
+            self._matrix_inv = np.linalg.pinv(
+                convert_matrix(matrix, MatrixBackendType.DENSE))
+        # Else, cache this matrix in the CSC format expected by SuperLU.
+        else:
+            matrix = sparse.csc_matrix(matrix)
+
+            # If this matrix is singular, pin the solution at the first row of
+            # each connected component by removing that row and column,
+            # rendering the remaining system non-singular.
+            if is_singular:
+                _, self._component_labels = csgraph.connected_components(
+                    matrix, directed=False)
+                self._component_sizes = np.bincount(self._component_labels)
+                _, rows_pinned = np.unique(
+                    self._component_labels, return_index=True)
+                self._is_row_free = np.ones(self.size, dtype=bool)
+                self._is_row_free[rows_pinned] = False
+                matrix = matrix[self._is_row_free][:, self._is_row_free]
+
+            self._matrix = matrix.tocsc()
+
+    # ..................{ PICKLERS                          }..................
+    def __getstate__(self) -> dict:
+        '''
+        Pickle this solver, excluding the unpicklable sparse factorization.
+        '''
+
+        state = self.__dict__.copy()
+        state['_matrix_factorized'] = None
+        return state
+
+    # ..................{ SOLVERS                           }..................
+    def solve(self, rhs: ndarray) -> ndarray:
+        '''
+        Solve this linear system for the passed right-hand side vector,
+        returning the solution vector ``x`` satisfying ``A x = rhs``.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            One-dimensional Numpy array of length :attr:`size`.
+
+        Returns
+        ----------
+        ndarray
+            One-dimensional Numpy array of length :attr:`size`.
+        '''
+
+        # If scaling the right-hand side, do so.
+        if self.rhs_factors is not None:
+            rhs = self.rhs_factors*rhs
+
+        # If using the dense backend, apply this matrix's pseudo-inverse.
+        if self._matrix_inv is not None:
+            return self._matrix_inv.dot(rhs)
+
+        # If this matrix has yet to be factorized, do so now.
+        if self._matrix_factorized is None:
+            self._matrix_factorized = splinalg.factorized(self._matrix)
+
+        # Coerce this vector into the contiguous float array expected by
+        # SuperLU.
+        rhs = np.ascontiguousarray(rhs, dtype=np.float64)
+
+        # If this matrix is non-singular, trivially solve this system.
+        if not self.is_singular:
+            return self._matrix_factorized(rhs)
+
+        # Else, this matrix is singular. Project the right-hand side onto the
+        # range of this matrix (i.e., the orthogonal complement of its null
+        # space), solve the pinned system, and project the solution onto that
+        # same complement, yielding the minimum-norm least-squares solution.
+        rhs = rhs - self._get_component_means(rhs)
+        sol = np.zeros(self.size)
+        sol[self._is_row_free] = self._matrix_factorized(
+            np.ascontiguousarray(rhs[self._is_row_free]))
+        sol -= self._get_component_means(sol)
+        return sol
+
+    # ..................{ PRIVATE                           }..................
+    def _get_component_means(self, vector: ndarray) -> ndarray:
+        '''
+        One-dimensional Numpy array of the mean of the passed vector over the
+        connected component containing each row of this singular matrix.
+        '''
+
+        component_sums = np.bincount(
+            self._component_labels, weights=vector,
+            minlength=len(self._component_sizes))
+        return (component_sums/self._component_sizes)[self._component_labels]
+
+
+class PseudoInverseSolver(object):
+    '''
+    **Pseudo-inverse solver** (i.e., object efficiently applying the
+    Moore-Penrose pseudo-inverse ``pinv(A)`` of a fixed sparse rectangular
+    matrix ``A`` *and* the transpose ``pinv(A).T`` of that pseudo-inverse to
+    arbitrarily many vectors *without* forming that dense pseudo-inverse).
+
+    Each such application yields the minimum-norm least-squares solution of
+    the system ``A x = b`` (or ``A.T x = b``, respectively), matching that
+    produced by the dense pseudo-inverse. This solver is intended for
+    **incidence matrices** (e.g., discrete exterior derivatives mapping mesh
+    vertices to edges or edges to faces), whose pseudo-inverses are dense and
+    hence scale quadratically in space and cubically in time with mesh size.
+
+    This solver caches a :class:`LinearSolver` factorizing a **Gram matrix**
+    of ``A``, such that:
+
+    * If :attr:`is_rows_independent` is ``False`` (e.g., vertices to edges),
+      ``pinv(A) = pinv(A.T A) A.T``. The Gram matrix ``A.T A`` is assumed to be
+      singular only along the indicator vectors of the connected components of
+      its graph, as is the case for incidence matrices of vertices to edges
+      (whose Gram matrices are graph Laplacians).
+    * Else (e.g., edges to faces), ``pinv(A) = A.T inv(A A.T)``. All rows of
+      ``A`` containing only zeroes are ignored. The Gram matrix ``A A.T`` of
+      all remaining rows is assumed to be non-singular (i.e., these rows are
+      assumed to be linearly independent), as is the case for incidence
+      matrices of edges to faces of planar meshes.
+
+    Since the normal equations square the condition number of ``A``, this
+    solver is unsuitable for ill-conditioned matrices. Incidence matrices are
+    well-conditioned in practice.
+
+    Attributes
+    ----------
+    is_rows_independent : bool
+        ``True`` only if all non-zero rows of this matrix are linearly
+        independent. See the class docstring.
+    shape : tuple
+        2-tuple ``(row_count, col_count)`` of the shape of this matrix.
+    _is_row_nonzero : ndarray or None
+        If :attr:`is_rows_independent` is ``True``, one-dimensional Numpy array
+        of whether each row contains one or more non-zero entries *or*
+        ``None`` otherwise.
+    _matrix : sparse.csr_matrix
+        This matrix, excluding all rows containing only zeroes if
+        :attr:`is_rows_independent` is ``True``.
+    _solver_gram : LinearSolver
+        Solver of the Gram matrix of this matrix.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self, matrix: object, is_rows_independent: bool = False) -> None:
+        '''
+        Initialize this solver.
+
+        Parameters
+        ----------
+        matrix : object
+            Rectangular matrix whose pseudo-inverse is to be applied, either a
+            dense Numpy array *or* a sparse SciPy matrix.
+        is_rows_independent : optional[bool]
+            ``True`` only if all non-zero rows of this matrix are linearly
+            independent. See the class docstring. Defaults to ``False``.
+        '''
+
+        # Cache this matrix in the CSR format.
+        matrix = convert_matrix(matrix, MatrixBackendType.SPARSE)
+
+        # Classify all passed parameters.
+        self.is_rows_independent = is_rows_independent
+        self.shape = matrix.shape
+        self._is_row_nonzero = None
+
+        # If these rows are possibly dependent, factorize the possibly singular
+        # Gram matrix "A.T A" of the columns of this matrix.
+        if not is_rows_independent:
+            self._solver_gram = LinearSolver(
+                matrix=matrix.T @ matrix,
+                backend=MatrixBackendType.SPARSE,
+                is_singular=True,
+            )
+        # Else, factorize the non-singular Gram matrix "A A.T" of the non-zero
+        # rows of this matrix.
+        else:
+            self._is_row_nonzero = np.diff(matrix.indptr) > 0
+            matrix = matrix[self._is_row_nonzero]
+            self._solver_gram = LinearSolver(
+                matrix=matrix @ matrix.T, backend=MatrixBackendType.SPARSE)
+
+        self._matrix = matrix
+
+    # ..................{ SOLVERS                           }..................
+    def solve(self, rhs: ndarray) -> ndarray:
+        '''
+        Apply the pseudo-inverse of this matrix to the passed vector, returning
+        the minimum-norm least-squares solution ``x`` of ``A x = rhs``.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            One-dimensional Numpy array whose length is the number of rows of
+            this matrix.
+
+        Returns
+        ----------
+        ndarray
+            One-dimensional Numpy array whose length is the number of columns
+            of this matrix.
+        '''
+
+        # If these rows are possibly dependent, "pinv(A) b = pinv(A.T A) A.T b".
+        if not self.is_rows_independent:
+            return self._solver_gram.solve(self._matrix.T.dot(rhs))
+
+        # Else, "pinv(A) b = A.T inv(A A.T) b" over all non-zero rows.
+        return self._matrix.T.dot(
+            self._solver_gram.solve(rhs[self._is_row_nonzero]))
+
+
+    def solve_transpose(self, rhs: ndarray) -> ndarray:
+        '''
+        Apply the transpose of the pseudo-inverse of this matrix to the passed
+        vector, returning the minimum-norm least-squares solution ``x`` of
+        ``A.T x = rhs``.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            One-dimensional Numpy array whose length is the number of columns
+            of this matrix.
+
+        Returns
+        ----------
+        ndarray
+            One-dimensional Numpy array whose length is the number of rows of
+            this matrix.
+        '''
+
+        # If these rows are possibly dependent, "pinv(A).T b = A pinv(A.T A) b".
+        if not self.is_rows_independent:
+            return self._matrix.dot(self._solver_gram.solve(rhs))
+
+        # Else, "pinv(A).T b = inv(A A.T) A b" over all non-zero rows, whose
+        # remaining rows are zero.
+        sol = np.zeros(self.shape[0])
+        sol[self._is_row_nonzero] = self._solver_gram.solve(
+            self._matrix.dot(rhs))
+        return sol
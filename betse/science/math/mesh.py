@@ -22,9 +22,13 @@ from betse.util.math.geometry.polygon.geopoly import (
     is_convex, is_cyclic_quad, orient_counterclockwise,)
 from betse.util.math.geometry.polygon.geopolyconvex import (
     clip_counterclockwise)
+from betse.science.enum.enumconf import MatrixBackendType
+from betse.science.math.matrices import (
+    make_matrix, LinearSolver, PseudoInverseSolver)
 from betse.util.io.log import logs
 from matplotlib import ticker
-from numpy import array
+from numpy import array, ndarray
+from scipy import sparse
 from scipy.spatial import cKDTree, Delaunay
 # from matplotlib import colors
 # from matplotlib import colorbar
@@ -627,18 +631,15 @@ class DECMesh(object):
         self.tri_edges = np.asarray(list(unique_edges))
         self.n_tedges = len(self.tri_edges)  # number of edges in trimesh
 
-        # Process edges to create flags of edge indices:
-        tri_edges = self.tri_edges.tolist()
-
-        bflags_tedges = []
+        # Process edges to create flags of edge indices, mapping each edge in
+        # either orientation to its index in constant time.
+        tri_edge_to_index = {}
+        for ei, (vi, vj) in enumerate(self.tri_edges.tolist()):
+            tri_edge_to_index[(vj, vi)] = ei
+            tri_edge_to_index[(vi, vj)] = ei
 
-        for vi, vj in hull_edges:
-
-            if [vi, vj] in tri_edges:
-                kk = tri_edges.index([vi, vj])
-            elif [vj, vi] in tri_edges:
-                kk = tri_edges.index([vj, vi])
-            bflags_tedges.append(kk)
+        bflags_tedges = [
+            tri_edge_to_index[(int(vi), int(vj))] for vi, vj in hull_edges]
 
         # Indices of edges on the boundary.
         self.bflags_tedges = np.asarray(bflags_tedges)
@@ -1170,21 +1171,21 @@ class DECMesh(object):
         Note that the transpose of these matrices are equal to the
         boundary operators, where bount_1 = (delta_0).T and bound_2 = (delta_1).T.
 
+        All such operators are sparse CSR matrices. Rather than storing their
+        dense pseudo-inverses, inverse operators (e.g., :meth:`lap_inv`) apply
+        these pseudo-inverses through cached sparse factorizations (see
+        :meth:`_get_pinv_solver`).
+
         """
 
         logs.log_info("Creating core operators...")
 
-        # exterior derivative operator for tri mesh: operates on verts to return edges:
-        delta_tri_0 = np.zeros((self.n_tedges, self.n_tverts))
-
-        for ei, (vi, vj) in enumerate(self.tri_edges):
-            delta_tri_0[ei, vj] = 1.0
-            delta_tri_0[ei, vi] = -1.0
-
-        self.delta_tri_0 = np.asarray(delta_tri_0)
+        # Discard all pseudo-inverse solvers of previously created operators.
+        self._pinv_solvers = {}
 
-        # get and store inverse:
-        self.delta_tri_0_inv = np.linalg.pinv(self.delta_tri_0)
+        # exterior derivative operator for tri mesh: operates on verts to return edges:
+        self.delta_tri_0 = _make_incidence_verts_to_edges(
+            self.tri_edges, self.n_tverts)
 
 
     def create_aux_operators(self):
@@ -1196,66 +1197,49 @@ class DECMesh(object):
         logs.log_info("Creating auxiliary operators...")
 
         # Exterior derivative operator for tri mesh operating on edges to
-        # return faces.
-        delta_tri_1 = np.zeros((self.n_tcell, self.n_tedges))
-
-        tedge_tree = cKDTree(self.tri_edges)
-
-        for ic, vertis_o in enumerate(self.tri_cells):
-            vertis_1 = np.roll(vertis_o, -1)
-
-            for vi, vj in zip(vertis_o, vertis_1):
-                disttea, ea = tedge_tree.query([vi, vj])
-                distteb, eb = tedge_tree.query([vj, vi])
-
-                if disttea == 0.0 and distteb != 0.0:
-                    delta_tri_1[ic, ea] = 1
-
-                elif distteb == 0.0 and disttea != 0.0:
-
-                    delta_tri_1[ic, eb] = -1
-
-
-
-        self.delta_tri_1 = np.asarray(delta_tri_1)
-
-        # get and store inverse:
-        self.delta_tri_1_inv = np.linalg.pinv(self.delta_tri_1)
+        # return faces, whose boundaries traverse the vertices of each face in
+        # order.
+        self.delta_tri_1 = _make_incidence_edges_to_faces(
+            self.tri_cells, self.tri_edges, self.n_tverts, vert_step=1)
 
         # exterior derivative operators for vor mesh: operates on verts to return edges
-        delta_vor_0 = np.zeros((self.n_vedges, self.n_vverts))
-
-        for ei, (vi, vj) in enumerate(self.vor_edges):
-            delta_vor_0[ei, vj] = 1.0
-            delta_vor_0[ei, vi] = -1.0
-
-        self.delta_vor_0 = np.asarray(delta_vor_0)
-
-        # get and store inverse:
-        self.delta_vor_0_inv = np.linalg.pinv(self.delta_vor_0)
+        self.delta_vor_0 = _make_incidence_verts_to_edges(
+            self.vor_edges, self.n_vverts)
 
         #The following creates the delta_vor_1 exterior derivative, which can be used to create
-        # a natural open boundary condition on the tri mesh.
-        delta_vor_1 = np.zeros((len(self.inner_tvert_i), self.n_vedges))
+        # a natural open boundary condition on the tri mesh. The boundaries of
+        # these faces traverse the vertices of each face in reverse order.
+        # Check which sign these should be depending on desired relations!
+        self.delta_vor_1 = _make_incidence_edges_to_faces(
+            self.vor_cells[self.inner_tvert_i], self.vor_edges, self.n_vverts,
+            vert_step=-1)
 
-        # vor_edges = self.vor_edges.tolist()
-        vedge_tree = cKDTree(self.vor_edges)
 
-        for ic, cell_verts in enumerate(self.vor_cells[self.inner_tvert_i]):
-
-            cell_verts_roll = np.roll(cell_verts, 1)
+    def _get_pinv_solver(self, operator_name: str) -> PseudoInverseSolver:
+        '''
+        Pseudo-inverse solver of the exterior derivative operator with the
+        passed name (e.g., ``delta_tri_0``), created and cached on the first
+        call to this method for this operator.
+
+        Operators mapping vertices to edges (i.e., ``delta_*_0``) are rank
+        deficient along the constant vectors of each connected component of
+        this mesh, whereas the faces of operators mapping edges to faces (i.e.,
+        ``delta_*_1``) are linearly independent.
+        '''
 
-            for (vi, vj) in zip(cell_verts, cell_verts_roll):
-                distvea, ea = vedge_tree.query([vi, vj])
-                distveb, eb = vedge_tree.query([vj, vi])
+        # Dictionary mapping from operator names to cached solvers, defaulting
+        # to the empty dictionary for meshes pickled by older versions.
+        pinv_solvers = self.__dict__.setdefault('_pinv_solvers', {})
 
-                if distvea == 0.0 and distveb != 0.0:
-                    delta_vor_1[ic, ea] = 1  # Check which sign these should be depending on desired relations!
-                elif distveb == 0.0 and distvea != 0.0:
-                    delta_vor_1[ic, eb] = -1
+        # If this operator's solver has yet to be created, do so.
+        pinv_solver = pinv_solvers.get(operator_name)
+        if pinv_solver is None:
+            pinv_solver = pinv_solvers[operator_name] = PseudoInverseSolver(
+                matrix=getattr(self, operator_name),
+                is_rows_independent=operator_name.endswith('_1'),
+            )
 
-        self.delta_vor_1 = np.asarray(delta_vor_1)
-        self.delta_vor_1_inv = np.linalg.pinv(self.delta_vor_1)
+        return pinv_solver
 
 
     #----Mathematical operator functions-----------
@@ -1283,8 +1267,8 @@ class DECMesh(object):
 
             Sd = self.verts_to_verts(Sv, gtype = 'tri') # interpolate to verts of dual mesh
 
-            gS_tri = (1/self.tri_edge_len)*np.dot(self.delta_tri_0, Sv) # grad with respect to tri mesh
-            gS_vor = (1/self.vor_edge_len)*np.dot(self.delta_vor_0, Sd) # grad with respect to vor mesh
+            gS_tri = (1/self.tri_edge_len)*self.delta_tri_0.dot(Sv) # grad with respect to tri mesh
+            gS_vor = (1/self.vor_edge_len)*self.delta_vor_0.dot(Sd) # grad with respect to vor mesh
 
 
         elif gtype == 'vor':
@@ -1295,8 +1279,8 @@ class DECMesh(object):
 
             Sd = self.verts_to_verts(Sv, gtype = 'vor') # interpolate to verts of dual mesh
 
-            gS_tri = (1/self.tri_edge_len)*np.dot(self.delta_tri_0, Sd) # grad with respect to tri mesh
-            gS_vor = (1/self.vor_edge_len)*np.dot(self.delta_vor_0, Sv) # grad with respect to vor mesh
+            gS_tri = (1/self.tri_edge_len)*self.delta_tri_0.dot(Sd) # grad with respect to tri mesh
+            gS_vor = (1/self.vor_edge_len)*self.delta_vor_0.dot(Sv) # grad with respect to vor mesh
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1332,7 +1316,7 @@ class DECMesh(object):
 
             assert(len(Sv) == self.n_tverts), "Length of array passed to grad is not tri_verts length"
 
-            gS = np.dot(self.delta_tri_0, Sv) # grad with respect to tri mesh
+            gS = self.delta_tri_0.dot(Sv) # grad with respect to tri mesh
 
             gradSx = (1/self.tri_edge_len)*gS*self.tri_tang[:,0]
             gradSy = (1 / self.tri_edge_len)*gS*self.tri_tang[:, 1]
@@ -1343,7 +1327,7 @@ class DECMesh(object):
 
             assert(len(Sv) == self.n_vverts), "Length of array passed to grad is not vor_verts length"
 
-            gS = np.dot(self.delta_vor_0, Sv) # grad with respect to vor mesh
+            gS = self.delta_vor_0.dot(Sv) # grad with respect to vor mesh
 
             gradSx = (1/self.vor_edge_len)*gS*self.vor_tang[:,0]
             gradSy = (1/self.vor_edge_len)*gS*self.vor_tang[:, 1]
@@ -1380,7 +1364,7 @@ class DECMesh(object):
 
             assert(len(S) == self.n_tverts), "Length of array passed to grad is not tri_verts length"
 
-            gradS = (1/self.tri_edge_len)*np.dot(self.delta_tri_0, S)
+            gradS = (1/self.tri_edge_len)*self.delta_tri_0.dot(S)
 
         elif gtype == 'vor':
 
@@ -1388,7 +1372,7 @@ class DECMesh(object):
 
             assert(len(S) == self.n_vverts), "Length of array passed to grad is not vor_verts length"
 
-            gradS = (1/self.vor_edge_len)*np.dot(self.delta_vor_0, S)
+            gradS = (1/self.vor_edge_len)*self.delta_vor_0.dot(S)
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1428,10 +1412,10 @@ class DECMesh(object):
 
             if btype == 2:
 
-                divF = (1/self.vor_sa)*np.dot(-self.delta_tri_0.T, self.vor_edge_len*FF)
+                divF = (1/self.vor_sa)*-self.delta_tri_0.T.dot(self.vor_edge_len*FF)
 
             elif btype == 1:
-                divFo = (1/self.vor_sa[self.inner_tvert_i])*np.dot(self.delta_vor_1, self.vor_edge_len*FF)
+                divFo = (1/self.vor_sa[self.inner_tvert_i])*self.delta_vor_1.dot(self.vor_edge_len*FF)
                 divF = np.zeros(len(self.tri_verts))
                 divF[self.inner_tvert_i] = divFo
 
@@ -1446,10 +1430,10 @@ class DECMesh(object):
             FF = Fx*self.vor_tang[:,0] + Fy*self.vor_tang[:,1]
 
             if btype == 2:
-                divF = (1 / self.tri_sa_o) * np.dot(-self.delta_vor_0.T, self.tri_edge_len * FF)
+                divF = (1 / self.tri_sa_o) * -self.delta_vor_0.T.dot(self.tri_edge_len * FF)
 
             elif btype == 1:
-                divFo = (1/self.tri_sa)*np.dot(self.delta_tri_1, self.tri_edge_len*FF)
+                divFo = (1/self.tri_sa)*self.delta_tri_1.dot(self.tri_edge_len*FF)
                 divF = np.zeros(len(self.vor_verts))
                 divF[self.inner_vvert_i] = divFo
 
@@ -1494,10 +1478,10 @@ class DECMesh(object):
 
             if btype == 2:
 
-                divF = (1/self.vor_sa)*np.dot(-self.delta_tri_0.T, self.vor_edge_len*Ft)
+                divF = (1/self.vor_sa)*-self.delta_tri_0.T.dot(self.vor_edge_len*Ft)
 
             elif btype == 1:
-                divFo = (1/self.vor_sa[self.inner_tvert_i])*np.dot(self.delta_vor_1, self.vor_edge_len*Ft)
+                divFo = (1/self.vor_sa[self.inner_tvert_i])*self.delta_vor_1.dot(self.vor_edge_len*Ft)
                 divF = np.zeros(len(self.tri_verts))
                 divF[self.inner_tvert_i] = divFo
 
@@ -1509,11 +1493,11 @@ class DECMesh(object):
             assert(self.make_all_operators), "This mesh hasn't computed auxillary operators to calculate vor div!"
 
             if btype == 2:
-                divF = (1 / self.tri_sa_o) * np.dot(-self.delta_vor_0.T, self.tri_edge_len * Ft)
+                divF = (1 / self.tri_sa_o) * -self.delta_vor_0.T.dot(self.tri_edge_len * Ft)
 
             elif btype == 1:
 
-                divFo = (1/self.tri_sa)*np.dot(self.delta_tri_1, self.tri_edge_len*Ft)
+                divFo = (1/self.tri_sa)*self.delta_tri_1.dot(self.tri_edge_len*Ft)
                 divF = np.zeros(len(self.vor_verts))
                 divF[self.inner_vvert_i] = divFo
 
@@ -1607,15 +1591,15 @@ class DECMesh(object):
 
             if btype == 2:
                 # calculate the inverse divergence of the grad, which is the laplacian:
-                lapS_inv = np.dot(self.delta_tri_0_inv,
+                lapS_inv = self._get_pinv_solver('delta_tri_0').solve(
                                   (self.tri_edge_len/
-                                   (self.vor_edge_len))*np.dot(-self.delta_tri_0_inv.T, S*(self.vor_sa)))
+                                   (self.vor_edge_len))*-self._get_pinv_solver('delta_tri_0').solve_transpose(S*(self.vor_sa)))
 
             elif btype == 1:
                 # calculate the inverse divergence of the grad, which is the laplacian:
-                lapS_inv = np.dot(self.delta_tri_0_inv,
+                lapS_inv = self._get_pinv_solver('delta_tri_0').solve(
                                   (self.tri_edge_len/
-                                   (self.vor_edge_len))*np.dot(self.delta_vor_1_inv,
+                                   (self.vor_edge_len))*self._get_pinv_solver('delta_vor_1').solve(
                                                                S[self.inner_tvert_i]*(self.vor_sa[self.inner_tvert_i])))
 
             else:
@@ -1630,13 +1614,13 @@ class DECMesh(object):
 
             if btype == 2:
                 # calculate inverse Laplacian of S:
-                lapS_inv = np.dot(self.delta_vor_0_inv,
-                                  (self.vor_edge_len/self.tri_edge_len) * np.dot(-self.delta_vor_0_inv.T, S * (self.tri_sa_o)))
+                lapS_inv = self._get_pinv_solver('delta_vor_0').solve(
+                                  (self.vor_edge_len/self.tri_edge_len) * -self._get_pinv_solver('delta_vor_0').solve_transpose(S * (self.tri_sa_o)))
 
             elif btype == 1:
                 # calculate inverse Laplacian of S:
-                lapS_inv = np.dot(self.delta_vor_0_inv,
-                       (self.vor_edge_len/self.tri_edge_len)*np.dot(self.delta_tri_1_inv,
+                lapS_inv = self._get_pinv_solver('delta_vor_0').solve(
+                       (self.vor_edge_len/self.tri_edge_len)*self._get_pinv_solver('delta_tri_1').solve(
                                                                     S[self.inner_vvert_i]*(self.tri_sa)))
 
             else:
@@ -1724,7 +1708,7 @@ class DECMesh(object):
             Ft = Fx*self.tri_tang[:,0] + Fy*self.tri_tang[:,1]
 
             # calculate the curl (which is a vector in the z-direction with + representing out of page):
-            curl_F = (1 / self.tri_sa_o) * np.dot(-self.delta_vor_0.T, (self.tri_edge_len) * Ft)
+            curl_F = (1 / self.tri_sa_o) * -self.delta_vor_0.T.dot((self.tri_edge_len) * Ft)
 
 
         elif gtype == 'vor':
@@ -1733,7 +1717,7 @@ class DECMesh(object):
             Ft = Fx*self.vor_tang[:,0] + Fy*self.vor_tang[:,1]
 
             # calculate the curl (which is a vector in the z-direction with + representing out of page):
-            curl_F = (1/self.vor_sa)*np.dot(-self.delta_tri_0.T, (self.vor_edge_len)*Ft)
+            curl_F = (1/self.vor_sa)*-self.delta_tri_0.T.dot((self.vor_edge_len)*Ft)
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1764,18 +1748,18 @@ class DECMesh(object):
 
         if gtype == 'tri':
             assert(len(Sv) == self.n_tverts), "Length of array passed to grad is not tri_verts length"
-            MM = np.abs(self.delta_tri_0)*(1/2)
+            MM = abs(self.delta_tri_0)*(1/2)
 
-            Sm = np.dot(MM, Sv)
+            Sm = MM.dot(Sv)
 
         elif gtype == 'vor':
 
             assert(self.make_all_operators), "This mesh hasn't computed auxillary operators to calculate vor grad"
             assert(len(Sv) == self.n_vverts), "Length of array passed to grad is not vor_verts length"
 
-            MM = np.abs(self.delta_vor_0)*(1/2)
+            MM = abs(self.delta_vor_0)*(1/2)
 
-            Sm = np.dot(MM, Sv)
+            Sm = MM.dot(Sv)
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1842,22 +1826,22 @@ class DECMesh(object):
 
         if gtype == 'tri':
             assert(len(Sm) == self.n_tedges), "Length of array passed to grad is not edges length"
-            MM_inv = np.abs(self.delta_tri_0.T)
+            MM_inv = abs(self.delta_tri_0.T)
 
-            path_len = np.dot(MM_inv, self.vor_edge_len)
+            path_len = MM_inv.dot(self.vor_edge_len)
 
-            Sv = np.dot(MM_inv, Sm*self.vor_edge_len)/(path_len + 1.0e-20)
+            Sv = MM_inv.dot(Sm*self.vor_edge_len)/(path_len + 1.0e-20)
 
         elif gtype == 'vor':
 
             assert(self.make_all_operators), "This mesh hasn't computed auxillary operators to calculate vor grad"
             assert(len(Sm) == self.n_vedges), "Length of array passed to grad is not edges length"
 
-            MM_inv = np.abs(self.delta_vor_0.T)
+            MM_inv = abs(self.delta_vor_0.T)
 
-            path_len = np.dot(MM_inv, self.tri_edge_len)
+            path_len = MM_inv.dot(self.tri_edge_len)
 
-            Sv = np.dot(MM_inv, Sm*self.tri_edge_len)/(path_len + 1.0e-20)
+            Sv = MM_inv.dot(Sm*self.tri_edge_len)/(path_len + 1.0e-20)
 
         else:
 
@@ -1884,13 +1868,13 @@ class DECMesh(object):
 
         if gtype == 'vor':
             Sv_edges = self.verts_to_mids(Sv, gtype='vor')
-            path_len_tri = np.dot(np.abs(self.delta_tri_0.T), self.vor_edge_len)
-            Sd = np.dot(np.abs(self.delta_tri_0.T), self.vor_edge_len * Sv_edges) / path_len_tri
+            path_len_tri = abs(self.delta_tri_0.T).dot(self.vor_edge_len)
+            Sd = abs(self.delta_tri_0.T).dot(self.vor_edge_len * Sv_edges) / path_len_tri
 
         elif gtype == 'tri':
             Sv_edges = self.verts_to_mids(Sv, gtype='tri')
-            path_len_vor = np.dot(np.abs(-self.delta_vor_0.T), self.tri_edge_len)
-            Sd = np.dot(np.abs(-self.delta_vor_0.T), self.tri_edge_len*Sv_edges)/path_len_vor
+            path_len_vor = abs(-self.delta_vor_0.T).dot(self.tri_edge_len)
+            Sd = abs(-self.delta_vor_0.T).dot(self.tri_edge_len*Sv_edges)/path_len_vor
 
         else:
             raise Exception("valid gtype is 'tri' or 'vor'")
@@ -1968,15 +1952,15 @@ class DECMesh(object):
             if btype == 1:
 
                 # calculate the divergence of the grad, which is the laplacian:
-                ccS_inv = np.dot(self.delta_tri_0_inv,
+                ccS_inv = self._get_pinv_solver('delta_tri_0').solve(
                                   (self.tri_edge_len/
-                                   (self.vor_edge_len))*np.dot(-self.delta_tri_0_inv.T, Fz*(self.vor_sa)))
+                                   (self.vor_edge_len))*-self._get_pinv_solver('delta_tri_0').solve_transpose(Fz*(self.vor_sa)))
 
             elif btype == 2:
 
-                ccS_inv = np.dot(self.delta_tri_0_inv,
+                ccS_inv = self._get_pinv_solver('delta_tri_0').solve(
                                   (self.tri_edge_len/
-                                   (self.vor_edge_len))*np.dot(self.delta_vor_1_inv,
+                                   (self.vor_edge_len))*self._get_pinv_solver('delta_vor_1').solve(
                                                                Fz[self.inner_tvert_i]*(self.vor_sa[self.inner_tvert_i])))
 
             else:
@@ -1991,13 +1975,13 @@ class DECMesh(object):
 
             if btype == 1:
                 # calculate inverse Laplacian of S:
-                ccS_inv = np.dot(self.delta_vor_0_inv,
-                                 (self.vor_edge_len/self.tri_edge_len) * np.dot(self.delta_vor_0_inv.T, Fz * (self.tri_sa_o)))
+                ccS_inv = self._get_pinv_solver('delta_vor_0').solve(
+                                 (self.vor_edge_len/self.tri_edge_len) * self._get_pinv_solver('delta_vor_0').solve_transpose(Fz * (self.tri_sa_o)))
 
             elif btype == 2:
                 # calculate inverse Laplacian of S:
-                ccS_inv = np.dot(self.delta_vor_0_inv,
-                       (self.vor_edge_len/self.tri_edge_len)*np.dot(-self.delta_tri_1_inv,
+                ccS_inv = self._get_pinv_solver('delta_vor_0').solve(
+                       (self.vor_edge_len/self.tri_edge_len)*-self._get_pinv_solver('delta_tri_1').solve(
                                                                     Fz[self.inner_vvert_i]*(self.tri_sa)))
 
             else:
@@ -2030,8 +2014,8 @@ class DECMesh(object):
             Ft = Fx*self.tri_tang[:,0] + Fy*self.tri_tang[:,1]
 
             # calculate the curl of the curl:
-            ccft = (1/self.vor_edge_len)*np.dot(self.delta_vor_0,
-                                                          (1/self.tri_sa)*np.dot(self.delta_tri_1,
+            ccft = (1/self.vor_edge_len)*self.delta_vor_0.dot(
+                                                          (1/self.tri_sa)*self.delta_tri_1.dot(
                                                                                  (self.tri_edge_len)*Ft))
 
             lapFx = ccft*self.tri_tang[:,0]
@@ -2044,8 +2028,8 @@ class DECMesh(object):
             Ft = Fx*self.vor_tang[:,0] + Fy*self.vor_tang[:,1]
 
             # calculate the curl of the curl:
-            ccft = -(1/self.tri_edge_len)*np.dot(self.delta_tri_0,
-                                                          (1/self.vor_sa)*np.dot(-self.delta_tri_0.T,
+            ccft = -(1/self.tri_edge_len)*self.delta_tri_0.dot(
+                                                          (1/self.vor_sa)*-self.delta_tri_0.T.dot(
                                                                                  (self.vor_edge_len)*Ft))
 
             lapFx = ccft*self.vor_tang[:,0]
@@ -2079,8 +2063,8 @@ class DECMesh(object):
             Ft = Fx * self.tri_tang[:, 0] + Fy * self.tri_tang[:, 1]
 
             # calculate the inverse curl of the curl:
-            lapFt_inv = (1/self.tri_edge_len)*np.dot(self.delta_tri_1_inv,
-                                                     self.tri_sa*np.dot(self.delta_vor_0_inv,
+            lapFt_inv = (1/self.tri_edge_len)*self._get_pinv_solver('delta_tri_1').solve(
+                                                     self.tri_sa*self._get_pinv_solver('delta_vor_0').solve(
                                                                         Ft*self.vor_edge_len))
 
             lapFx_inv = lapFt_inv*self.tri_tang[:, 0]
@@ -2093,8 +2077,8 @@ class DECMesh(object):
             Ft = Fx * self.vor_tang[:, 0] + Fy * self.vor_tang[:, 1]
 
             # calculate the inverse curl of the curl:
-            lapFt_inv = (1/self.vor_edge_len)*np.dot(-self.delta_tri_0_inv.T,
-                                                     self.vor_sa*np.dot(self.delta_tri_0_inv,
+            lapFt_inv = (1/self.vor_edge_len)*-self._get_pinv_solver('delta_tri_0').solve_transpose(
+                                                     self.vor_sa*self._get_pinv_solver('delta_tri_0').solve(
                                                                         Ft*self.tri_edge_len))
 
             lapFx_inv = lapFt_inv*self.vor_tang[:, 0]
@@ -2387,20 +2371,24 @@ class DECMesh(object):
             logs.log_info("Smoothing mesh...")
             self.removed_bad_verts = False # reset flag for empty tri_vert removal
 
-            II = np.diag(np.ones(self.n_tverts)) # Identity matrix
-            HH2 = np.diag(1 / self.vor_sa)  # Hodge star 20
-            HH1 = np.diag(self.vor_edge_len / self.tri_edge_len) # Hodge star 11
+            II = sparse.identity(self.n_tverts) # Identity matrix
+            HH2 = sparse.diags(1 / self.vor_sa)  # Hodge star 20
+            HH1 = sparse.diags(self.vor_edge_len / self.tri_edge_len) # Hodge star 11
 
-            term1 = np.dot(HH2, -self.delta_tri_0.T)
-            term2 = np.dot(HH1, self.delta_tri_0)
+            term1 = HH2 @ -self.delta_tri_0.T
+            term2 = HH1 @ self.delta_tri_0
 
-            LL = np.dot(term1, term2) # Forwards Laplacian operator
+            LL = term1 @ term2 # Forwards Laplacian operator
 
-            MM = (II - stepsize * LL)    # Matrix equation from diffusion equation
-            MM_inv = np.linalg.pinv(MM)  # Least-squares solution matrix
+            # Matrix equation from diffusion equation. Since the eigenvalues of
+            # this Laplacian are non-positive, this matrix is non-singular and
+            # hence solved by a sparse factorization rather than a dense
+            # pseudo-inverse.
+            MM = (II - stepsize * LL)
+            MM_solver = LinearSolver(MM, MatrixBackendType.SPARSE)
 
-            self.tri_verts[:,0] = np.dot(MM_inv, self.tri_verts[:,0]) # Implicit Euler update solution
-            self.tri_verts[:,1] = np.dot(MM_inv, self.tri_verts[:,1])
+            self.tri_verts[:,0] = MM_solver.solve(self.tri_verts[:,0]) # Implicit Euler update solution
+            self.tri_verts[:,1] = MM_solver.solve(self.tri_verts[:,1])
 
 
             # # # Laplacian smoothing of the mesh using explicit Euler:
@@ -3259,3 +3247,128 @@ class DECMesh(object):
 
 
 
+
+# ....................{ PRIVATE ~ makers                   }....................
+def _make_incidence_verts_to_edges(edges: ndarray, n_verts: int) -> object:
+    '''
+    Sparse CSR **vertex-to-edge incidence matrix** (i.e., discrete exterior
+    derivative of 0-forms) of the passed edges, whose rows index these edges
+    and whose columns index all ``n_verts`` vertices, such that each row
+    contains ``-1`` at the first vertex and ``1`` at the second vertex of that
+    edge.
+
+    Parameters
+    ----------
+    edges : ndarray
+        Two-dimensional Numpy array of the indices of the first and second
+        vertex of each edge, whose shape is ``(n_edges, 2)``.
+    n_verts : int
+        Number of vertices.
+    '''
+
+    edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+    n_edges = len(edges)
+
+    return make_matrix(
+        backend=MatrixBackendType.SPARSE,
+        data=np.tile((-1.0, 1.0), n_edges),
+        row_indices=np.repeat(np.arange(n_edges), 2),
+        col_indices=edges.ravel(),
+        shape=(n_edges, n_verts),
+    )
+
+
+def _make_incidence_edges_to_faces(
+    faces: ndarray, edges: ndarray, n_verts: int, vert_step: int) -> object:
+    '''
+    Sparse CSR **edge-to-face incidence matrix** (i.e., discrete exterior
+    derivative of 1-forms) of the passed faces and edges, whose rows index
+    these faces and whose columns index these edges.
+
+    Each face is traversed as the sequence of its sides ``(v[k], v[k + step])``
+    for each index ``k`` of its vertices ``v`` (wrapping around the end of
+    these vertices), where ``step`` is the passed vertex step. Each side is
+    mapped to the edge joining the same two vertices by a hash of the sorted
+    vertex indices of each edge rather than by a spatial search. The row of
+    each face then contains ``1`` for each side traversing its edge from the
+    first to the second vertex of that edge, ``-1`` for each side traversing
+    its edge in the opposite direction, and ``0`` for all other edges
+    (including sides matching no edge).
+
+    Parameters
+    ----------
+    faces : ndarray
+        Either a two-dimensional Numpy array *or* ragged one-dimensional Numpy
+        array of sequences of the indices of the vertices of each face.
+    edges : ndarray
+        Two-dimensional Numpy array of the indices of the first and second
+        vertex of each edge, whose shape is ``(n_edges, 2)``.
+    n_verts : int
+        Number of vertices.
+    vert_step : int
+        Either ``1`` if traversing the vertices of each face in order *or*
+        ``-1`` if traversing these vertices in reverse order.
+    '''
+
+    edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+    n_edges = len(edges)
+    n_faces = len(faces)
+
+    # Number of vertices of each face and the flattened vertices of all faces.
+    face_sizes = np.fromiter(
+        (len(face_verts) for face_verts in faces), dtype=np.intp,
+        count=n_faces)
+    verts = np.fromiter(
+        (vert for face_verts in faces for vert in face_verts), dtype=np.intp,
+        count=face_sizes.sum())
+
+    # Face index, index of the first vertex of that face, and position within
+    # that face of each such vertex.
+    verts_face = np.repeat(np.arange(n_faces), face_sizes)
+    verts_face_start = np.repeat(np.cumsum(face_sizes) - face_sizes, face_sizes)
+    verts_pos = np.arange(len(verts)) - verts_face_start
+
+    # Vertex following each such vertex along the boundary of its face.
+    verts_next = verts[
+        verts_face_start + (verts_pos + vert_step) % face_sizes[verts_face]]
+
+    # Hash of the sorted vertex indices of a pair of vertices, uniquely
+    # identifying each edge regardless of orientation.
+    hash_base = max(n_verts, int(verts.max(initial=-1)) + 1)
+    def _hash_edges(verts_a: ndarray, verts_b: ndarray) -> ndarray:
+        return (
+            np.minimum(verts_a, verts_b).astype(np.int64)*hash_base +
+            np.maximum(verts_a, verts_b))
+
+    # Sorted hashes of all edges and the edge index of each such hash.
+    edges_hash = _hash_edges(edges[:, 0], edges[:, 1])
+    edges_order = np.argsort(edges_hash, kind='stable')
+    edges_hash_sorted = edges_hash[edges_order]
+
+    # Edge matching each side of each face if any.
+    sides_hash = _hash_edges(verts, verts_next)
+    sides_pos = np.minimum(
+        np.searchsorted(edges_hash_sorted, sides_hash), max(n_edges - 1, 0))
+    is_side_matched = (
+        edges_hash_sorted[sides_pos] == sides_hash if n_edges else
+        np.zeros(len(verts), dtype=bool))
+    sides_edge = edges_order[sides_pos[is_side_matched]]
+    sides_face = verts_face[is_side_matched]
+
+    # Orientation of each matched side relative to its edge.
+    sides_sign = np.where(
+        edges[sides_edge, 0] == verts[is_side_matched], 1.0, -1.0)
+
+    # Ignore all sides repeating the same edge of the same face, preserving
+    # the orientation of the first such side.
+    _, sides_unique = np.unique(
+        sides_face.astype(np.int64)*max(n_edges, 1) + sides_edge,
+        return_index=True)
+
+    return make_matrix(
+        backend=MatrixBackendType.SPARSE,
+        data=sides_sign[sides_unique],
+        row_indices=sides_face[sides_unique],
+        col_indices=sides_edge[sides_unique],
+        shape=(n_faces, n_edges),
+    )
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **stiff integrator** (i.e., implicit or linearly implicit method
+stably advancing a system of ordinary differential equations whose Jacobian
+has eigenvalues of widely differing magnitudes by time steps much larger than
+explicit methods tolerate) facilities.
+
+Each integrator defined by this submodule advances an **autonomous system**
+(i.e., one whose right-hand side depends only on the current state rather than
+also on the current time) by exactly one caller-defined time step, such that
+callers remain responsible for sampling and otherwise interleaving these steps
+with the remainder of the simulation.
+'''
+
+# ....................{ IMPORTS                           }....................
+import numpy as np
+from betse.exceptions import BetseSimUnstableException
+from betse.util.type.types import type_check, CallableTypes
+from numpy import ndarray
+from scipy import sparse
+from scipy.integrate import solve_ivp
+from scipy.sparse import linalg as splinalg
+
+# ....................{ CONSTANTS                         }....................
+_ROSENBROCK_GAMMA = 1.0 + 1.0/np.sqrt(2.0)
+'''
+Diagonal coefficient of the two-stage Rosenbrock method implemented by the
+:func:`step_rosenbrock` function, selected to render that method L-stable.
+'''
+
+# ....................{ STEPPERS                          }....................
+@type_check
+def step_rosenbrock(
+    func: CallableTypes, jac: CallableTypes, y: ndarray, dt: float) -> ndarray:
+    '''
+    State of the passed autonomous system advanced from the passed state by the
+    passed time step with the two-stage, second-order, L-stable Rosenbrock
+    method ROS2 of Verwer *et al.* (1999).
+
+    This method is **linearly implicit** (i.e., solves exactly one linear
+    system of the Jacobian per time step rather than iteratively solving a
+    non-linear system), factorizing this Jacobian exactly once and evaluating
+    the right-hand side exactly twice per time step. This method thus requires
+    no step size control, as it remains stable for arbitrarily large time
+    steps; accuracy then degrades gracefully towards the steady state.
+
+    Parameters
+    ----------
+    func : CallableTypes
+        Callable accepting a one-dimensional Numpy array of the current state
+        and returning a one-dimensional Numpy array of the time derivative of
+        that state (i.e., the right-hand side of this system).
+    jac : CallableTypes
+        Callable accepting the same array and returning the Jacobian of
+        ``func`` at that state as a square sparse SciPy matrix.
+    y : ndarray
+        One-dimensional Numpy array of the state to advance from.
+    dt : float
+        Time step to advance by in seconds.
+
+    Returns
+    ----------
+    ndarray
+        One-dimensional Numpy array of the advanced state.
+    '''
+
+    # Factorize "W = I - gamma*dt*J" once for both stages.
+    w_matrix = sparse.identity(len(y), format='csc') - (
+        _ROSENBROCK_GAMMA * dt) * sparse.csc_matrix(jac(y))
+    w_solve = splinalg.factorized(w_matrix)
+
+    # Stage derivatives, where the second stage corrects the first.
+    k1 = w_solve(func(y))
+    k2 = w_solve(func(y + dt*k1) - 2.0*k1)
+
+    return y + (1.5*dt)*k1 + (0.5*dt)*k2
+
+
+@type_check
+def step_bdf(
+    func: CallableTypes,
+    jac: CallableTypes,
+    y: ndarray,
+    dt: float,
+    rtol: float = 1.0e-3,
+    atol: float = 1.0e-6,
+) -> ndarray:
+    '''
+    State of the passed autonomous system advanced from the passed state by the
+    passed time step with the variable-order, variable-step backward
+    differentiation formula (BDF) method of SciPy.
+
+    Unlike :func:`step_rosenbrock`, this method internally subdivides this time
+    step into as many substeps as required to satisfy the passed tolerances.
+    This method is thus both more accurate and more expensive per time step.
+
+    Parameters
+    ----------
+    func : CallableTypes
+        Callable accepting a one-dimensional Numpy array of the current state
+        and returning a one-dimensional Numpy array of the time derivative of
+        that state (i.e., the right-hand side of this system).
+    jac : CallableTypes
+        Callable accepting the same array and returning the Jacobian of
+        ``func`` at that state as a square sparse SciPy matrix.
+    y : ndarray
+        One-dimensional Numpy array of the state to advance from.
+    dt : float
+        Time step to advance by in seconds.
+    rtol : float
+        Relative tolerance of each substep. Defaults to 1.0e-3.
+    atol : float
+        Absolute tolerance of each substep. Defaults to 1.0e-6 (i.e., 1 nM
+        for concentrations in mmol/L).
+
+    Returns
+    ----------
+    ndarray
+        One-dimensional Numpy array of the advanced state.
+
+    Raises
+    ----------
+    BetseSimUnstableException
+        If this method fails to advance this system (e.g., as the required
+        substep fell below machine precision).
+    '''
+
+    solution = solve_ivp(
+        fun=lambda t, y_t: func(y_t),
+        t_span=(0.0, dt),
+        y0=y,
+        method='BDF',
+        jac=lambda t, y_t: jac(y_t),
+        rtol=rtol,
+        atol=atol,
+    )
+
+    # If this method failed, raise an exception.
+    if not solution.success:
+        raise BetseSimUnstableException(
+            'BDF integrator failed: {}'.format(solution.message))
+
+    # Return only the state at the end of this time step.
+    return solution.y[:, -1]
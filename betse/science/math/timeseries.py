@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Low-level **time series** (i.e., sequences of Numpy arrays of the same shape,
+one for each sampled time step of a simulation phase) facilities.
+'''
+
+# ....................{ IMPORTS                           }....................
+import numpy as np
+from betse.exceptions import BetseSimException
+from betse.util.io.log import logs
+from betse.util.path import files, pathnames
+from betse.util.type.types import (
+    type_check, GeneratorType, MappingOrNoneTypes, StrOrNoneTypes)
+from collections.abc import Sequence
+from contextlib import contextmanager
+
+# ....................{ GLOBALS                           }....................
+_pickle_dirname = None
+'''
+Absolute dirname of the directory containing the file that time series are
+currently being pickled to or unpickled from if any *or* ``None`` otherwise.
+
+See Also
+----------
+:func:`pickling_relative_to`
+    Context manager setting this global.
+'''
+
+# ....................{ CONTEXTS                          }....................
+@contextmanager
+@type_check
+def pickling_relative_to(dirname: str) -> GeneratorType:
+    '''
+    Context manager pickling and unpickling all file-backed time series for
+    the duration of this context relative to the passed directory, typically
+    the directory containing the file a simulation phase is pickled to.
+
+    Time series pickled in this context pickle the filenames of the files
+    backing their storage relative to this directory. Time series unpickled in
+    this context resolve these filenames relative to this directory on first
+    access. Pickled phases thus remain loadable after moving, copying, or
+    archiving the directory containing both these pickles and these files.
+
+    Time series pickled outside this context pickle absolute filenames, which
+    time series unpickled in this context resolve as is.
+
+    Parameters
+    -----------
+    dirname : str
+        Absolute or relative dirname of this directory.
+
+    Yields
+    -----------
+    None
+        Since this context manager yields no values, the caller's ``with``
+        statement must be suffixed by *no* ``as`` clause.
+    '''
+
+    # Dirname set by the parent context if any, restored below.
+    global _pickle_dirname
+    pickle_dirname_prior = _pickle_dirname
+
+    _pickle_dirname = pathnames.canonicalize(dirname)
+    try:
+        yield
+    finally:
+        _pickle_dirname = pickle_dirname_prior
+
+# ....................{ CLASSES                           }....................
+class TimeSeries(Sequence):
+    '''
+    **Time series** (i.e., list-like sequence of Numpy arrays of the same
+    shape, one for each sampled time step of a simulation phase) stored as a
+    single preallocated Numpy array whose first dimension indexes each sampled
+    time step.
+
+    This sequence is a drop-in replacement for the list of arrays previously
+    appended to on each sampled time step. Unlike such lists, this sequence:
+
+    * Copies each appended array into a preallocated row of this storage,
+      avoiding both the per-step allocation of a new array *and* the
+      prohibitive per-array overhead of pickling lists of arrays.
+    * Optionally persists this storage to a **memory-mapped file** (i.e.,
+      :class:`numpy.memmap`), bounding the memory consumed by long-running
+      simulations to the size of the current working set rather than the
+      entire time series.
+    * Optionally saves this storage to a standalone ``.npy`` file (see the
+      :meth:`save` method).
+
+    Pickling a time series persisted to either type of file pickles only the
+    filename, type, and shape of this storage rather than the storage itself.
+    Unpickling such a time series then defers loading this storage until
+    first accessed, at which time this file is memory-mapped in copy-on-write
+    mode. Callers unpickling simulations only to access a few time series
+    (e.g., pipeline exporters) thus load only those time series.
+
+    Since the shape and type of each array to be stored are unknown until the
+    first such array is appended, this storage is lazily allocated on the
+    first call to the :meth:`append` method. If a subsequently appended array
+    differs in shape from prior arrays (e.g., due to cells removed by a
+    cutting event), this sequence silently degrades into a conventional list
+    of array copies.
+
+    Caveats
+    ----------
+    Indexing this sequence returns views into this storage rather than
+    copies. Callers modifying these views thus modify this time series.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self, capacity: int = 0, filename: StrOrNoneTypes = None) -> None:
+        '''
+        Initialize this time series.
+
+        Parameters
+        ----------
+        capacity : optional[int]
+            Number of arrays to preallocate storage for, typically the number
+            of sampled time steps of the current simulation phase. Appending
+            more arrays than this capacity is permitted but requires
+            reallocating this storage. Defaults to 0, in which case storage is
+            preallocated for only one array.
+        filename : optional[str]
+            Absolute filename of the memory-mapped file to persist this
+            storage to if any *or* ``None`` otherwise, in which case this
+            storage is retained in memory. Defaults to ``None``.
+        '''
+
+        # Classify all passed parameters.
+        self._capacity = max(capacity, 1)
+        self._filename = filename
+
+        # Number of arrays appended to this time series.
+        self._len = 0
+
+        # Preallocated storage whose first dimension indexes each appended
+        # array if allocated *OR* "None" otherwise.
+        self._array = None
+
+        # List of all appended arrays if this time series has degraded into a
+        # list due to appending arrays of differing shapes *OR* "None".
+        self._items = None
+
+        # Absolute filename of the ".npy" file this storage was most recently
+        # saved to by the save() method if any *OR* "None" otherwise.
+        self._filename_saved = None
+
+        # 3-tuple "(filename, dtype, shape)" describing the file this storage
+        # is to be lazily loaded from on first access if this time series was
+        # unpickled from a file-backed time series *OR* "None" otherwise. If
+        # this file is a ".npy" file, "dtype" and "shape" are "None".
+        self._array_source = None
+
+        # Absolute dirname of the directory this time series was unpickled
+        # relative to if any *OR* "None" otherwise (see
+        # pickling_relative_to()). If the filename of the above file is
+        # relative, that file is resolved relative to this directory.
+        self._array_source_dirname = None
+
+    # ..................{ PICKLERS                          }..................
+    def __getstate__(self) -> dict:
+        '''
+        Pickle this time series, excluding the unused tail of its storage and,
+        if file-backed, this storage itself.
+        '''
+
+        state = self.__dict__.copy()
+
+        # If this storage was saved to a ".npy" file, pickle only this file.
+        if self._filename_saved is not None:
+            state['_array'] = None
+            state['_array_source'] = (self._filename_saved, None, None)
+        # Else if this storage has yet to be lazily loaded, pickle only the
+        # absolute filename of the file this storage is to be loaded from.
+        elif self._array_source is not None:
+            _, dtype, shape = self._array_source
+            state['_array_source'] = (
+                self._get_array_source_filename(), dtype, shape)
+        # Else if this storage is allocated...
+        elif self._array is not None:
+            # If this storage is memory-mapped, flush all pending writes and
+            # pickle only the metadata required to remap this storage.
+            if self._filename is not None:
+                self._array.flush()
+                state['_array'] = None
+                state['_array_source'] = (
+                    self._filename, self._array.dtype.str, self._array.shape)
+            # Else, pickle only the used rows of this storage.
+            else:
+                state['_array'] = self._array[:self._len]
+                state['_capacity'] = max(self._len, 1)
+
+        # If pickling this storage as a file, pickle the filename of this file
+        # relative to the directory this time series is pickled relative to.
+        if state['_array_source'] is not None and _pickle_dirname is not None:
+            filename, dtype, shape = state['_array_source']
+            state['_array_source'] = (
+                _relativize_filename(filename), dtype, shape)
+
+        # Since unpickled file-backed storage is mapped in copy-on-write mode,
+        # unpickled time series never modify the files they were loaded from.
+        state['_filename'] = None
+        state['_filename_saved'] = None
+        state['_array_source_dirname'] = None
+
+        return state
+
+
+    def __setstate__(self, state: dict) -> None:
+        '''
+        Unpickle this time series, recording the directory this time series
+        is unpickled relative to if any.
+        '''
+
+        self.__dict__.update(state)
+        self._array_source_dirname = _pickle_dirname
+
+    # ..................{ DUNDERS                           }..................
+    def __array__(self, dtype: object = None) -> np.ndarray:
+        '''
+        Numpy array of all arrays appended to this time series, enabling this
+        sequence to be efficiently passed to Numpy functions (e.g.,
+        :func:`numpy.asarray`) without copying.
+        '''
+
+        if self._items is not None:
+            return np.asarray(self._items, dtype=dtype)
+        return np.asarray(self._get_array_used(), dtype=dtype)
+
+
+    def __getitem__(self, index: object) -> object:
+        if self._items is not None:
+            return self._items[index]
+        return self._get_array_used()[index]
+
+
+    def __setitem__(self, index: object, value: object) -> None:
+        if self._items is not None:
+            self._items[index] = value
+        else:
+            self._get_array_used()[index] = value
+
+
+    def __iter__(self):
+        if self._items is not None:
+            return iter(self._items)
+        return iter(self._get_array_used())
+
+
+    def __len__(self) -> int:
+        if self._items is not None:
+            return len(self._items)
+        return self._len
+
+    # ..................{ APPENDERS                         }..................
+    def append(self, item: object) -> None:
+        '''
+        Append a copy of the passed array-like object to this time series.
+        '''
+
+        # If this time series has degraded into a list, append a copy.
+        if self._items is not None:
+            self._items.append(np.copy(item))
+            return
+
+        # Coerce this object into an array *WITHOUT* copying.
+        item = np.asarray(item)
+
+        # Any ".npy" file previously saved by the save() method is now stale.
+        self._filename_saved = None
+
+        # If this storage has yet to be allocated, do so now.
+        if self._get_array() is None:
+            self._array = self._make_array(
+                capacity=self._capacity, shape=item.shape, dtype=item.dtype)
+        # Else if this array is incompatible with this storage, degrade this
+        # time series into a list of copies of all previously appended arrays.
+        elif (
+            item.shape != self._array.shape[1:] or
+            not np.can_cast(item.dtype, self._array.dtype, casting='same_kind')
+        ):
+            self._items = [np.copy(row) for row in self._get_array_used()]
+            self._items.append(np.copy(item))
+            self._array = None
+            self._len = 0
+            return
+        # Else if this storage is full, double its capacity.
+        elif self._len == len(self._array):
+            self._grow()
+
+        # Copy this array into the next unused row of this storage.
+        self._array[self._len] = item
+        self._len += 1
+
+    # ..................{ MAPPERS                           }..................
+    @type_check
+    def remap(self, filename: str) -> None:
+        '''
+        Resume persisting this storage to the memory-mapped file with the
+        passed absolute filename if this time series was unpickled from that
+        file *or* silently reduce to a noop otherwise.
+
+        Since unpickled file-backed storage is mapped in copy-on-write mode,
+        arrays appended to an unpickled time series are otherwise retained in
+        memory. This method instead maps that file in read-write mode, such
+        that arrays subsequently appended to this time series are written to
+        that file (e.g., when resuming a checkpointed simulation phase).
+
+        Parameters
+        ----------
+        filename : str
+            Absolute filename of this memory-mapped file.
+        '''
+
+        # If this time series was *NOT* unpickled from this raw file, noop.
+        if not (
+            self._array_source is not None and
+            self._array_source[1] is not None and
+            pathnames.canonicalize(self._get_array_source_filename()) ==
+            pathnames.canonicalize(filename)
+        ):
+            return
+
+        # Map this file in copy-on-write mode *BEFORE* remapping this file in
+        # read-write mode, raising an exception if this file is not found.
+        array = self._get_array()
+        self._array = np.memmap(
+            filename, dtype=array.dtype, mode='r+', shape=array.shape)
+        self._filename = filename
+
+    # ..................{ SAVERS                            }..................
+    @type_check
+    def save(self, filename: str) -> MappingOrNoneTypes:
+        '''
+        Save all arrays appended to this time series to the ``.npy`` file with
+        the passed absolute filename, replacing this storage with a
+        copy-on-write memory map of this file.
+
+        Subsequently pickling this time series pickles only this filename
+        (see the class docstring). Appending to this time series after calling
+        this method reverts to pickling this storage.
+
+        If this time series has degraded into a list of arrays of differing
+        shapes, this method silently reduces to a noop.
+
+        Parameters
+        ----------
+        filename : str
+            Absolute filename of the ``.npy`` file to be saved.
+
+        Returns
+        ----------
+        MappingOrNoneTypes
+            Either:
+
+            * If this time series was saved, a dictionary describing this
+              file, suitable for inclusion in a time series index. This
+              dictionary maps from the key:
+
+              * ``file`` to the basename of this file.
+              * ``dtype`` to the string representation of the type of this
+                storage (e.g., ``<f8``).
+              * ``shape`` to the list of the dimensions of this storage.
+
+            * Else, ``None``.
+        '''
+
+        # If this time series has degraded into a list, do nothing.
+        if self._items is not None:
+            return None
+
+        # Absolute filename of the raw file this storage is memory-mapped to
+        # if any *OR* "None" otherwise.
+        filename_mapped = self._filename
+
+        # Save all used rows of this storage *BEFORE* replacing this storage.
+        np.save(filename, self._get_array_used())
+        self._array = np.load(filename, mmap_mode='c')
+        self._capacity = max(self._len, 1)
+        self._filename = None
+        self._filename_saved = filename
+
+        # If this storage was memory-mapped, that raw file is now redundant.
+        if filename_mapped is not None:
+            files.remove_file_if_found(filename_mapped)
+
+        # Return metadata describing this file.
+        return {
+            'file': pathnames.get_basename(filename),
+            'dtype': self._array.dtype.str,
+            'shape': list(self._array.shape),
+        }
+
+    # ..................{ PRIVATE                           }..................
+    def _get_array(self) -> object:
+        '''
+        Storage of this time series if allocated *or* ``None`` otherwise,
+        lazily mapping this storage from the file this time series was
+        unpickled from on the first call to this method.
+
+        Raises
+        ----------
+        BetseSimException
+            If this file no longer exists.
+        '''
+
+        # If this storage is to be lazily loaded, do so now.
+        if self._array_source is not None:
+            _, dtype, shape = self._array_source
+            filename = self._get_array_source_filename()
+
+            if not files.is_file(filename):
+                raise BetseSimException(
+                    'Time series file "{}" not found. '
+                    'Consider rerunning this simulation phase.'.format(
+                        filename))
+
+            # If this is a ".npy" file, defer to its header.
+            if dtype is None:
+                self._array = np.load(filename, mmap_mode='c')
+            # Else, this is a raw memory-mapped file.
+            else:
+                self._array = np.memmap(
+                    filename, dtype=np.dtype(dtype), mode='c', shape=shape)
+
+            self._array_source = None
+
+        return self._array
+
+
+    def _get_array_source_filename(self) -> str:
+        '''
+        Filename of the file this storage is to be lazily loaded from,
+        resolved relative to the directory this time series was unpickled
+        relative to if this filename is relative.
+        '''
+
+        filename = self._array_source[0]
+        if (self._array_source_dirname is not None and
+            pathnames.is_relative(filename)):
+            filename = pathnames.join(self._array_source_dirname, filename)
+        return filename
+
+
+    def _get_array_used(self) -> np.ndarray:
+        '''
+        View of only the used rows of this storage.
+        '''
+
+        array = self._get_array()
+        if array is None:
+            return np.empty((0,))
+        return array[:self._len]
+
+
+    def _make_array(
+        self, capacity: int, shape: tuple, dtype: object) -> np.ndarray:
+        '''
+        New storage for the passed number of arrays of the passed shape and
+        type, memory-mapped if this time series is memory-mapped.
+        '''
+
+        # If this storage is memory-mapped, (re)map this file. Since the
+        # "r+" mode extends existing files as needed while preserving their
+        # contents, this mode is preferred for all but the first mapping.
+        if self._filename is not None:
+            mode = 'w+' if self._array is None else 'r+'
+            return np.memmap(
+                self._filename,
+                dtype=dtype,
+                mode=mode,
+                shape=(capacity,) + shape,
+            )
+
+        return np.empty((capacity,) + shape, dtype=dtype)
+
+
+    def _grow(self) -> None:
+        '''
+        Double the capacity of this storage, preserving all used rows.
+        '''
+
+        array_old = self._array
+        capacity = 2*len(array_old)
+
+        logs.log_debug(
+            'Growing time series storage from %d to %d samples...',
+            len(array_old), capacity)
+
+        # If this storage is memory-mapped, flush all pending writes to the
+        # underlying file *BEFORE* remapping a larger region of that file.
+        # Since C-ordered rows are contiguous, all existing rows are preserved.
+        if self._filename is not None:
+            array_old.flush()
+            self._array = self._make_array(
+                capacity=capacity,
+                shape=array_old.shape[1:],
+                dtype=array_old.dtype,
+            )
+        # Else, copy all used rows into new in-memory storage.
+        else:
+            self._array = self._make_array(
+                capacity=capacity,
+                shape=array_old.shape[1:],
+                dtype=array_old.dtype,
+            )
+            self._array[:self._len] = array_old[:self._len]
+
+# ....................{ PRIVATE                           }....................
+def _relativize_filename(filename: str) -> str:
+    '''
+    Passed filename relative to the directory time series are currently being
+    pickled relative to (see :func:`pickling_relative_to`) if possible *or*
+    this filename as is otherwise (e.g., if this file resides on a different
+    Windows drive than this directory).
+    '''
+
+    try:
+        return pathnames.relativize(_pickle_dirname, filename)
+    except ValueError:
+        return filename
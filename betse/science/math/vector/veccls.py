@@ -12,9 +12,12 @@ import numpy as np
 from betse.exceptions import BetseSimVectorException
 from betse.lib.numpy import nparray
 from betse.science.math.cache.cacheabc import SimPhaseCacheABC
+from betse.science.math.cache.cachelru import (
+    PHASE_PROPERTY_CACHED_VAR_NAME_PREFIX, phase_property_cached)
 from betse.util.type.iterable import sequences
 from betse.util.type.decorator.decmemo import property_cached
-from betse.util.type.types import type_check, IterableOrNoneTypes
+from betse.util.type.types import (
+    type_check, CallableTypes, IterableOrNoneTypes)
 from numpy import ndarray
 
 # ....................{ SUPERCLASSES                      }....................
@@ -33,9 +36,19 @@ class VectorCellsCache(SimPhaseCacheABC):
     * The midpoint of each cell membrane in the simulated cluster.
     * The centre of each square grid space (in either dimension).
 
-    Each property provided by this cache (e.g., :meth:`times_cell_centres`)
+    Each property provided by this cache (e.g., :meth:`times_cells_centre`)
     then efficiently interpolates this input data from its original coordinate
     system into the corresponding output data in another coordinate system.
+    Each such array is cached until evicted by the least recently used (LRU)
+    cache of the parent simulation phase on exceeding the configured byte
+    budget, in which case this array is recreated on the next access.
+
+    Each such property is paired with a **lazy property** (e.g.,
+    :meth:`times_cells_centre_lazy`) yielding a :class:`VectorCellsTimesLazy`
+    view of the same data. If the full array fits within that budget, this view
+    simply indexes that array; else, this view interpolates only the time step
+    indexed by the caller on demand, permitting arbitrarily large time series
+    to be exported in bounded memory.
 
     Attributes
     ----------
@@ -162,7 +175,7 @@ class VectorCellsCache(SimPhaseCacheABC):
     # ..................{ PROPERTIES                        }..................
     # Read-only properties, preventing callers from setting these attributes.
 
-    @property_cached
+    @phase_property_cached
     def times_cells_centre(self) -> ndarray:
         '''
         Two-dimensional Numpy array of all arbitrary cell data for all
@@ -197,7 +210,7 @@ class VectorCellsCache(SimPhaseCacheABC):
             membranes_midpoint_data=self.times_membranes_midpoint)
 
 
-    @property_cached
+    @phase_property_cached
     def times_membranes_midpoint(self) -> ndarray:
         '''
         Two-dimensional sequence of all arbitrary cell membrane data for all
@@ -222,7 +235,7 @@ class VectorCellsCache(SimPhaseCacheABC):
             cells_centre_data=self.times_cells_centre)
 
 
-    @property_cached
+    @phase_property_cached
     def times_membranes_vertex(self) -> ndarray:
         '''
         Two-dimensional Numpy array of all arbitrary cell membrane vertex data
@@ -236,11 +249,13 @@ class VectorCellsCache(SimPhaseCacheABC):
         This array is created only on the first access of this property.
         '''
 
-        return np.dot(
-            self.times_membranes_midpoint, self._phase.cells.matrixMap2Verts)
+        # Since this matrix may be sparse, this matrix is applied from the
+        # left to the transpose of this data rather than from the right.
+        return self._phase.cells.matrixMap2Verts.T.dot(
+            np.asarray(self.times_membranes_midpoint).T).T
 
 
-    @property_cached
+    @phase_property_cached
     def times_regions_centre(self) -> ndarray:
         '''
         Two-dimensional Numpy array of all arbitrary Voronoi region centre data
@@ -270,7 +285,7 @@ class VectorCellsCache(SimPhaseCacheABC):
     #FIXME: Is this actually grid point vertices rather than grid space centres?
     #It doesn't particularly matter in terms of implementation (which clearly
     #works), but it would be useful to eliminate incorrectness in terminology.
-    @property_cached
+    @phase_property_cached
     def times_grids_centre(self) -> ndarray:
         '''
         Two-dimensional Numpy array of all arbitrary gridded cell data for all
@@ -314,3 +329,355 @@ class VectorCellsCache(SimPhaseCacheABC):
             cells_centre_data=self.times_cells_centre,
             interp_method=self._phase.p.interp_type,
         )
+
+
+    # ..................{ PROPERTIES ~ len                  }..................
+    @property
+    def time_steps_len(self) -> int:
+        '''
+        Number of sampled time steps described by this vector.
+        '''
+
+        # Original array of this vector, whose first dimension indexes these
+        # time steps.
+        for times in (
+            self._times_cells_centre,
+            self._times_grids_centre,
+            self._times_membranes_midpoint,
+        ):
+            if times is not None:
+                return len(times)
+
+    # ..................{ PROPERTIES ~ lazy                 }..................
+    @property_cached
+    def times_cells_centre_lazy(self) -> 'VectorCellsTimesLazy':
+        '''
+        Lazy view of the :meth:`times_cells_centre` array.
+        '''
+
+        return VectorCellsTimesLazy(
+            vector=self,
+            property_name='times_cells_centre',
+            time_getter=self._get_time_cells_centre,
+        )
+
+
+    @property_cached
+    def times_grids_centre_lazy(self) -> 'VectorCellsTimesLazy':
+        '''
+        Lazy view of the :meth:`times_grids_centre` array.
+        '''
+
+        return VectorCellsTimesLazy(
+            vector=self,
+            property_name='times_grids_centre',
+            time_getter=self._get_time_grids_centre,
+        )
+
+
+    @property_cached
+    def times_membranes_midpoint_lazy(self) -> 'VectorCellsTimesLazy':
+        '''
+        Lazy view of the :meth:`times_membranes_midpoint` array.
+        '''
+
+        return VectorCellsTimesLazy(
+            vector=self,
+            property_name='times_membranes_midpoint',
+            time_getter=self._get_time_membranes_midpoint,
+        )
+
+
+    @property_cached
+    def times_membranes_vertex_lazy(self) -> 'VectorCellsTimesLazy':
+        '''
+        Lazy view of the :meth:`times_membranes_vertex` array.
+        '''
+
+        return VectorCellsTimesLazy(
+            vector=self,
+            property_name='times_membranes_vertex',
+            time_getter=self._get_time_membranes_vertex,
+        )
+
+
+    @property_cached
+    def times_regions_centre_lazy(self) -> 'VectorCellsTimesLazy':
+        '''
+        Lazy view of the :meth:`times_regions_centre` array.
+        '''
+
+        return VectorCellsTimesLazy(
+            vector=self,
+            property_name='times_regions_centre',
+            time_getter=self._get_time_regions_centre,
+        )
+
+    # ..................{ TESTERS                           }..................
+    @type_check
+    def is_times_cached(self, property_name: str) -> bool:
+        '''
+        ``True`` only if the array returned by the property of this vector with
+        the passed name (e.g., ``times_grids_centre``) is currently cached
+        (i.e., has been created and has yet to be evicted).
+        '''
+
+        return (
+            PHASE_PROPERTY_CACHED_VAR_NAME_PREFIX + property_name in
+            self.__dict__)
+
+    # ..................{ PRIVATE ~ getters                 }..................
+    # Each getter below returns the one-dimensional (or, for extracellular
+    # data, two-dimensional) Numpy array of this vector for only the passed
+    # time step. If the full array for all time steps is already cached, that
+    # array is indexed; else, only that time step is interpolated in exactly
+    # the same manner as the corresponding property interpolates all steps.
+
+    def _get_times_cached(self, property_name: str) -> object:
+        '''
+        Array returned by the property of this vector with the passed name if
+        currently cached *or* ``None`` otherwise.
+        '''
+
+        return self.__dict__.get(
+            PHASE_PROPERTY_CACHED_VAR_NAME_PREFIX + property_name)
+
+
+    def _get_time_cells_centre(self, time_step: int) -> ndarray:
+
+        # If this array is cached, index this array.
+        times = self._get_times_cached('times_cells_centre')
+        if times is not None:
+            return times[time_step]
+
+        # If this vector was originally situated at cell centres, index the
+        # original array of such data.
+        if self._times_cells_centre is not None:
+            return self._times_cells_centre[time_step]
+
+        # If this vector is *NOT* situated at cell membrane midpoints, raise
+        # an exception. See the times_cells_centre() property.
+        if self._times_membranes_midpoint is None:
+            raise BetseSimVectorException(
+                'Properties "times_cells_centre" and '
+                '"times_membranes_midpoint" not convertible from '
+                'property "times_grids_centre".')
+
+        # Else, remap this time step from cell membrane midpoints to centres.
+        return self._phase.cells.map_membranes_midpoint_to_cells_centre(
+            membranes_midpoint_data=self._get_time_membranes_midpoint(
+                time_step))
+
+
+    def _get_time_grids_centre(self, time_step: int) -> ndarray:
+
+        # If this array is cached, index this array.
+        times = self._get_times_cached('times_grids_centre')
+        if times is not None:
+            return times[time_step]
+
+        # If this vector was originally situated at grid space centres, index
+        # the original array of such data.
+        if self._times_grids_centre is not None:
+            return self._times_grids_centre[time_step]
+
+        # Else, remap this time step from cell centres to grid space centres.
+        return self._phase.cells.map_cells_centre_to_grids_centre(
+            cells_centre_data=self._get_time_cells_centre(time_step),
+            interp_method=self._phase.p.interp_type,
+        )
+
+
+    def _get_time_membranes_midpoint(self, time_step: int) -> ndarray:
+
+        # If this array is cached, index this array.
+        times = self._get_times_cached('times_membranes_midpoint')
+        if times is not None:
+            return times[time_step]
+
+        # If this vector was originally situated at cell membrane midpoints,
+        # index the original array of such data.
+        if self._times_membranes_midpoint is not None:
+            return self._times_membranes_midpoint[time_step]
+
+        # Else, remap this time step from cell centres to membrane midpoints.
+        return self._phase.cells.map_cells_centre_to_membranes_midpoint(
+            cells_centre_data=self._get_time_cells_centre(time_step))
+
+
+    def _get_time_membranes_vertex(self, time_step: int) -> ndarray:
+
+        # If this array is cached, index this array.
+        times = self._get_times_cached('times_membranes_vertex')
+        if times is not None:
+            return times[time_step]
+
+        # Else, map this time step from cell membrane midpoints to vertices.
+        return self._phase.cells.matrixMap2Verts.T.dot(
+            np.asarray(self._get_time_membranes_midpoint(time_step)))
+
+
+    def _get_time_regions_centre(self, time_step: int) -> ndarray:
+
+        # If this array is cached, index this array.
+        times = self._get_times_cached('times_regions_centre')
+        if times is not None:
+            return times[time_step]
+
+        # Else, map this time step from cell to region centres.
+        regions_centre = np.zeros(len(self._phase.cells.voronoi_centres))
+        regions_centre[self._phase.cells.cell_to_grid] = (
+            self._get_time_cells_centre(time_step))
+        return regions_centre
+
+# ....................{ CLASSES                           }....................
+class VectorCellsTimesLazy(object):
+    '''
+    **Lazy vector view** (i.e., read-only sequence of the arrays returned by
+    one property of a :class:`VectorCellsCache` for each sampled time step,
+    each created only on demand).
+
+    If the full array returned by this property is currently cached *or* fits
+    within the byte budget of the least recently used (LRU) cache of the parent
+    simulation phase, this view materializes and indexes that array; else, this
+    view interpolates only the time step indexed by the caller, trading time
+    for space. In either case, this view behaves as that array for purposes of
+    indexing by time step and reduction to minimum and maximum values.
+
+    Attributes
+    ----------
+    _is_fitting : bool
+        ``True`` only if the full array fits within that byte budget *or*
+        ``None`` if this has yet to be decided.
+    _property_name : str
+        Name of the property of this vector returning the full array.
+    _time_getter : CallableTypes
+        Callable passed a time step and returning the array of this vector for
+        only that time step.
+    _vector : VectorCellsCache
+        Vector viewed by this view.
+    '''
+
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self,
+        vector: VectorCellsCache,
+        property_name: str,
+        time_getter: CallableTypes,
+    ) -> None:
+        '''
+        Initialize this lazy view.
+
+        Parameters
+        ----------
+        vector : VectorCellsCache
+            Vector viewed by this view.
+        property_name : str
+            Name of the property of this vector returning the full array.
+        time_getter : CallableTypes
+            Callable passed a time step and returning the array of this vector
+            for only that time step.
+        '''
+
+        # Classify all passed parameters.
+        self._vector = vector
+        self._property_name = property_name
+        self._time_getter = time_getter
+
+        # Default all remaining attributes.
+        self._is_fitting = None
+
+    # ..................{ DUNDERS                           }..................
+    def __len__(self) -> int:
+        return self._vector.time_steps_len
+
+
+    def __getitem__(self, time_step: object) -> ndarray:
+
+        # Full array if fitting within this budget *OR* "None" otherwise.
+        times = self._get_times_if_fitting()
+
+        # If this array is available, index this array.
+        if times is not None:
+            return times[time_step]
+        # Else if this is a single time step, interpolate only this step.
+        elif isinstance(time_step, (int, np.integer)):
+            return self._time_getter(time_step)
+        # Else, this is a slice or fancy index. Since only the full array
+        # supports such indices, materialize this array regardless of budget.
+        else:
+            return getattr(self._vector, self._property_name)[time_step]
+
+
+    def __array__(self, dtype: object = None) -> ndarray:
+        return np.asarray(
+            getattr(self._vector, self._property_name), dtype=dtype)
+
+    # ..................{ REDUCERS                          }..................
+    def min(self) -> object:
+        '''
+        Minimum value of this vector over all time steps.
+
+        If the full array does *not* fit within the byte budget, this value is
+        reduced from each time step interpolated in turn.
+        '''
+
+        return self._reduce(np.min)
+
+
+    def max(self) -> object:
+        '''
+        Maximum value of this vector over all time steps.
+
+        If the full array does *not* fit within the byte budget, this value is
+        reduced from each time step interpolated in turn.
+        '''
+
+        return self._reduce(np.max)
+
+    # ..................{ PRIVATE                           }..................
+    def _get_times_if_fitting(self) -> object:
+        '''
+        Full array of this vector for all time steps if this array is currently
+        cached *or* fits within the byte budget of the LRU cache of the parent
+        simulation phase (in which case this array is materialized and cached)
+        *or* ``None`` otherwise.
+        '''
+
+        # If this array is currently cached, return this array.
+        if self._vector.is_times_cached(self._property_name):
+            return getattr(self._vector, self._property_name)
+
+        # If whether this array fits has yet to be decided, decide this by
+        # extrapolating the size of this array from the first time step.
+        if self._is_fitting is None:
+            self._is_fitting = self._vector._phase.cache.lru.is_fitting(
+                np.asarray(self._time_getter(0)).nbytes * len(self))
+
+        # Return this array if fitting *OR* "None" otherwise.
+        return (
+            getattr(self._vector, self._property_name)
+            if self._is_fitting else None)
+
+
+    def _reduce(self, reducer: CallableTypes) -> object:
+        '''
+        Reduce all values of this vector over all time steps by the passed
+        Numpy reduction (e.g., :func:`numpy.min`).
+        '''
+
+        # Full array if fitting within this budget *OR* "None" otherwise.
+        times = self._get_times_if_fitting()
+
+        # If this array is available, reduce this array.
+        if times is not None:
+            return reducer(times)
+
+        # Else, reduce each time step in turn and then these reductions.
+        # Reducing these reductions with Numpy preserves the propagation of
+        # NaN values by the same reduction of the full array.
+        return reducer([
+            reducer(self._time_getter(time_step))
+            for time_step in range(len(self))
+        ])
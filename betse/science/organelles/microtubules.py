@@ -81,8 +81,8 @@ class Mtubes(object):
         self.mtubes_y = cells.mem_vects_flat[:,3]*self.mt_density
 
         # microtubule density function initialized:
-        mtdx = np.dot(cells.M_sum_mems, self.mtubes_x*cells.mem_sa) / cells.cell_sa
-        mtdy = np.dot(cells.M_sum_mems, self.mtubes_y*cells.mem_sa) / cells.cell_sa
+        mtdx = cells.M_sum_mems.dot(self.mtubes_x*cells.mem_sa) / cells.cell_sa
+        mtdy = cells.M_sum_mems.dot(self.mtubes_y*cells.mem_sa) / cells.cell_sa
 
         self.mtdf = ((mtdx[cells.mem_to_cells]*cells.mem_vects_flat[:,2] +
                                          mtdy[cells.mem_to_cells]*cells.mem_vects_flat[:,3]))
@@ -275,11 +275,11 @@ class Mtubes(object):
         uymto = self.mtubes_y
 
         # averages of mtube field at the cell centres:
-        # uxmt = (np.dot(cells.M_sum_mems, uxmto*cells.mem_sa)/cells.cell_sa)
-        # uymt = (np.dot(cells.M_sum_mems, uymto*cells.mem_sa)/cells.cell_sa)
+        # uxmt = (cells.M_sum_mems.dot(uxmto*cells.mem_sa)/cells.cell_sa)
+        # uymt = (cells.M_sum_mems.dot(uymto*cells.mem_sa)/cells.cell_sa)
 
-        uxmt = (np.dot(cells.M_sum_mems, uxmto)/cells.num_mems)
-        uymt = (np.dot(cells.M_sum_mems, uymto)/cells.num_mems)
+        uxmt = (cells.M_sum_mems.dot(uxmto)/cells.num_mems)
+        uymt = (cells.M_sum_mems.dot(uymto)/cells.num_mems)
 
         # average the mtube field to the centre of pie-shaped midpoints of each individual cell:
         # uxmti = (uxmt[cells.mem_to_cells] + uxmto)/2
@@ -12,7 +12,14 @@ from betse.lib.yaml import yamls
 from betse.lib.yaml.yamlalias import yaml_alias, yaml_enum_alias
 from betse.lib.yaml.abc.yamlfileabc import YamlFileDefaultABC
 from betse.science.enum.enumconf import (
-    CellLatticeType, GrnUnpicklePhaseType, IonProfileType, SolverType)
+    CellLatticeType,
+    GrnIntegratorType,
+    GrnUnpicklePhaseType,
+    IonProfileType,
+    MatrixBackendType,
+    SolverType,
+    TimeSeriesFormatType,
+)
 from betse.science.config.model.conftis import (
     SimConfCutListItem, SimConfTissueDefault, SimConfTissueListItem)
 # from betse.util.io.log import logs
@@ -32,6 +39,71 @@ class Parameters(YamlFileDefaultABC):
     solver_type : SolverType
         Type of **simulation solver** (i.e., numerical technique iteratively
         computing simulation time steps) with which to solve this simulation.
+    matrix_backend : MatrixBackendType
+        Type of **matrix backend** (i.e., in-memory representation of the
+        linear operators mapping between the membranes, cells, and
+        environmental grid of the cell cluster) with which to seed this
+        simulation.
+    is_time_series_memmapped : bool
+        ``True`` only if the time series sampled by each initialization and
+        simulation phase (e.g., transmembrane voltages) are stored in
+        memory-mapped files in the pickle directory of that phase rather than
+        in memory.
+    time_series_format : TimeSeriesFormatType
+        Type of on-disk format with which to save the time series sampled by
+        each initialization and simulation phase.
+    checkpoint_interval : int
+        Number of sampled time steps between successive **checkpoints** (i.e.,
+        pickled snapshots of the complete state of the simulation phase,
+        resumable by the ``betse sim --resume`` subcommand) of each simulation
+        phase *or* 0 if checkpointing is disabled.
+    is_solver_profiled : bool
+        ``True`` only if each initialization and simulation phase times each
+        stage of its solver's time loop *and* each network reaction, logging a
+        summary table and saving a JSON report on completing that phase (see
+        :class:`betse.science.phase.phaseprof.SimPhaseProfiler`).
+    is_time_step_adaptive : bool
+        ``True`` only if the full solver adapts the time step of each phase to
+        the estimated error of each time step of that phase (see
+        :meth:`betse.science.sim.Simulator._iter_time_steps_adaptive`) rather
+        than always stepping by the fixed time step of that phase.
+    time_step_factor_min : float
+        Smallest adapted time step as a multiple of the fixed time step of the
+        current phase. Ignored unless :attr:`is_time_step_adaptive` is ``True``.
+    time_step_factor_max : float
+        Largest adapted time step as a multiple of the fixed time step of the
+        current phase. Ignored unless :attr:`is_time_step_adaptive` is ``True``.
+    time_step_vmem_error_max : float
+        Largest desired local error in any transmembrane voltage per adapted
+        time step in volts. Ignored unless :attr:`is_time_step_adaptive` is
+        ``True``.
+    time_step_conc_error_max : float
+        Largest desired local error in any cellular ion concentration per
+        adapted time step, relative to that concentration. Ignored unless
+        :attr:`is_time_step_adaptive` is ``True``.
+    is_channel_gating_tabled : bool
+        ``True`` only if voltage-gated channels of networks interpolate their
+        voltage-dependent gating kinetics from tables precomputed on
+        initializing these channels rather than evaluating the analytic
+        expressions of these kinetics at each time step (see
+        :meth:`betse.science.channels.channelsabc.ChannelsABC._init_gating_table`).
+        These tables replace the non-finite values these expressions yield at
+        their removable singularities by values interpolated from neighbouring
+        voltages, at the cost of a bounded interpolation error.
+    channel_gating_vmem_min : float
+        Smallest transmembrane voltage in mV tabulated by these tables. Ignored
+        unless :attr:`is_channel_gating_tabled` is ``True``.
+    channel_gating_vmem_max : float
+        Largest transmembrane voltage in mV tabulated by these tables. Ignored
+        unless :attr:`is_channel_gating_tabled` is ``True``.
+    channel_gating_vmem_step : float
+        Spacing in mV between transmembrane voltages tabulated by these tables.
+        Ignored unless :attr:`is_channel_gating_tabled` is ``True``.
+    channel_gating_tolerance : float
+        Largest permissible error of any tabulated gating kinetic relative to
+        the largest magnitude of that kinetic, above which the channel falls
+        back to evaluating these kinetics analytically. Ignored unless
+        :attr:`is_channel_gating_tabled` is ``True``.
 
     Attributes (Exports)
     ----------
@@ -124,6 +196,10 @@ class Parameters(YamlFileDefaultABC):
     sim_pickle_filename : str
         Abolute filename of the pickled file providing this simulation's most
         recent simulation run.
+    sim_checkpoint_filename : str
+        Absolute filename of the pickled file providing the most recent
+        checkpoint of this simulation's current simulation run, residing in
+        the :attr:`sim_pickle_dirname` directory.
     sim_pickle_dirname : str
         Absolute dirname of the directory containing this simulation's most
         recent simulation run, guaranteed to exist.
@@ -273,6 +349,10 @@ class Parameters(YamlFileDefaultABC):
         Type of **unpickle simulation phase** (i.e., previously pickled
         simulation phase to unpickle as the computational basis for the current
         network to be run by the ``betse sim-grn`` subcommand).
+    grn_integrator : GrnIntegratorType
+        Type of **integrator** (i.e., numerical method advancing the reactions
+        of the current network on each time step) of the network run by the
+        ``betse sim-grn`` subcommand.
 
     Attributes (Ion)
     ----------
@@ -333,6 +413,40 @@ class Parameters(YamlFileDefaultABC):
 
     # ..................{ ALIASES ~ solver                  }..................
     solver_type = yaml_enum_alias("['solver options']['type']", SolverType)
+    matrix_backend = yaml_enum_alias(
+        "['solver options']['matrix backend']", MatrixBackendType)
+    is_time_series_memmapped = yaml_alias(
+        "['solver options']['memory map time series']", bool)
+    time_series_format = yaml_enum_alias(
+        "['solver options']['time series format']", TimeSeriesFormatType)
+    checkpoint_interval = yaml_alias(
+        "['solver options']['checkpoint interval']", int)
+    is_solver_profiled = yaml_alias(
+        "['solver options']['profile stages']", bool)
+    is_time_step_adaptive = yaml_alias(
+        "['solver options']['adaptive time step']['enabled']", bool)
+    time_step_factor_min = yaml_alias(
+        "['solver options']['adaptive time step']['min factor']", float)
+    time_step_factor_max = yaml_alias(
+        "['solver options']['adaptive time step']['max factor']", float)
+    time_step_vmem_error_max = yaml_alias(
+        "['solver options']['adaptive time step']['Vmem tolerance']", float)
+    time_step_conc_error_max = yaml_alias(
+        "['solver options']['adaptive time step']['concentration tolerance']",
+        float)
+    is_channel_gating_tabled = yaml_alias(
+        "['solver options']['gating tables']['enabled']", bool)
+    channel_gating_vmem_min = yaml_alias(
+        "['solver options']['gating tables']['Vmem min']", float)
+    channel_gating_vmem_max = yaml_alias(
+        "['solver options']['gating tables']['Vmem max']", float)
+    channel_gating_vmem_step = yaml_alias(
+        "['solver options']['gating tables']['Vmem step']", float)
+    channel_gating_tolerance = yaml_alias(
+        "['solver options']['gating tables']['tolerance']", float)
+
+    # ..................{ ALIASES ~ export : cache          }..................
+    export_cache_size_mb = yaml_alias("['results options']['cache size']", int)
 
     # ..................{ ALIASES ~ export : colormap       }..................
     #FIXME: Define a new yaml_set_alias() data descriptor constraining the
@@ -416,6 +530,10 @@ class Parameters(YamlFileDefaultABC):
         "['gene regulatory network settings']"
         "['sim-grn settings']['run network on']",
         GrnUnpicklePhaseType)
+    grn_integrator = yaml_enum_alias(
+        "['gene regulatory network settings']"
+        "['sim-grn settings']['integrator']",
+        GrnIntegratorType)
 
     # ..................{ ALIASES ~ ion                     }..................
     #FIXME: Consider shifting all ion-centric functionality into a dedicated
@@ -1220,6 +1338,16 @@ class Parameters(YamlFileDefaultABC):
         self.sim_pickle_filename = pathnames.join(
             self.sim_pickle_dirname, self.sim_pickle_basename)
 
+        # Absolute filename to which simulation checkpoints are pickled, named
+        # after the simulation pickle (e.g., "sim_1_checkpoint.betse.gz" for a
+        # simulation pickled to "sim_1.betse.gz").
+        sim_pickle_basename_sans_filetypes = (
+            pathnames.get_pathname_sans_filetypes(self.sim_pickle_basename))
+        self.sim_checkpoint_filename = pathnames.join(
+            self.sim_pickle_dirname,
+            sim_pickle_basename_sans_filetypes + '_checkpoint' +
+            self.sim_pickle_basename[len(sim_pickle_basename_sans_filetypes):])
+
         # Absolute dirnames to which phase results are exported.
         self.init_export_dirname = pathnames.join_and_canonicalize(
             self.conf_dirname, self.init_export_dirname_relative)
@@ -1534,6 +1662,7 @@ class Parameters(YamlFileDefaultABC):
         self.init_pickle_dirname = None
         self.init_pickle_filename = None
         self.seed_pickle_filename = None
+        self.sim_checkpoint_filename = None
         self.sim_export_dirname = None
         self.sim_pickle_dirname = None
         self.sim_pickle_filename = None
@@ -86,6 +86,9 @@ class SimPhase(object):
         Simulation for this phase.
     cache : betse.science.phase.cache.cacheabc.SimPhaseCaches
         Simulation cache for this phase.
+    profiler : betse.science.phase.phaseprof.SimPhaseProfiler
+        Solver profiler for this phase, timing each stage of the time loop
+        solving this phase if the ``profile stages`` option is enabled.
 
     Attributes (Low-level: Caller)
     ----------
@@ -141,6 +144,7 @@ class SimPhase(object):
         # Avoid circular import dependencies.
         from betse.science.cells import Cells
         from betse.science.math.cache.cacheabc import SimPhaseCaches
+        from betse.science.phase.phaseprof import SimPhaseProfiler
         from betse.science.sim import Simulator
         from betse.science.tissue.tishandler import TissueHandler
 
@@ -184,6 +188,7 @@ class SimPhase(object):
         # Classify all remaining high-level objects for this phase.
         self.cache = SimPhaseCaches(phase=self)
         self.dyna = TissueHandler(p=p)
+        self.profiler = SimPhaseProfiler(phase=self)
 
         # Initialize all kludges required by this phase.
         self._init_kludge()
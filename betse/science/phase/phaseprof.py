@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+**Simulation phase profiler** (i.e., accumulator of the wall time consumed by
+each stage of the time loop solving a simulation phase *and* by each chemical
+reaction of each biochemical network) functionality.
+'''
+
+# ....................{ IMPORTS                           }....................
+import json
+from betse.science.enum.enumphase import SimPhaseKind
+from betse.util.io.log import logs
+from betse.util.path import pathnames
+from betse.util.py import pyref
+from betse.util.type.types import GeneratorType, IterableTypes
+from collections import OrderedDict
+from time import perf_counter
+
+# ....................{ CLASSES                           }....................
+class SimPhaseProfiler(object):
+    '''
+    **Simulation phase profiler** (i.e., low-overhead accumulator of the wall
+    time consumed by and the number of calls to each stage of the time loop
+    solving a single simulation phase *and* each chemical reaction of each
+    biochemical network solved by that loop).
+
+    Solvers delimit each **stage** (i.e., contiguous block of the body of the
+    time loop, such as pumps, electrodiffusion, or gap junctions) by calling
+    the :meth:`stage` method on entering that stage and the :meth:`step_end`
+    method on completing each time step. Biochemical networks time each
+    reaction by iterating over reaction names with the :meth:`iter_timed`
+    method. On completing this phase, the :meth:`stop` method logs a summary
+    table of these timings and saves these timings as a JSON report alongside
+    the pickled results of this phase.
+
+    Profiling is opt-in. Unless the ``profile stages`` option of the current
+    simulation configuration is enabled, all methods of this profiler silently
+    reduce to noops and the :meth:`iter_timed` method returns the passed
+    iterable as is, imposing negligible overhead on each time step.
+
+    Attributes
+    ----------
+    is_profiling : bool
+        ``True`` only if this profiler is currently profiling (i.e., if the
+        :meth:`start` method has been called with profiling enabled *and* the
+        :meth:`stop` method has yet to be called).
+    _phase : SimPhase
+        Parent simulation phase, weakly referenced.
+    _reactions : OrderedDict
+        Dictionary mapping from the 3-tuple ``(stage_name, zone_name,
+        reaction_name)`` uniquely identifying each timed reaction to a 2-list
+        ``[seconds, calls]`` of the total wall time in fractional seconds
+        consumed by and the number of calls to that reaction.
+    _stage_name : StrOrNoneTypes
+        Name of the currently profiled stage if any *or* ``None`` otherwise.
+    _stage_time_start : float
+        Timestamp in fractional seconds at which the current stage began.
+    _stages : OrderedDict
+        Dictionary mapping from the name of each profiled stage, ordered by
+        the time loop's first entry of that stage, to a 2-list ``[seconds,
+        calls]`` of the total wall time in fractional seconds consumed by and
+        the number of calls to that stage.
+    _time_start : float
+        Timestamp in fractional seconds at which profiling began.
+    _time_stop : float
+        Timestamp in fractional seconds at which the most recent stage ended.
+    _time_steps : int
+        Number of time steps completed since profiling began.
+    '''
+
+    # ..................{ INITIALIZORS                      }..................
+    def __init__(self, phase: 'betse.science.phase.phasecls.SimPhase') -> None:
+        '''
+        Initialize this profiler.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Parent simulation phase.
+        '''
+
+        # Classify all passed parameters as weak rather than strong reference,
+        # circumventing circular references and complications thereof.
+        self._phase = pyref.proxy_weak(phase)
+
+        # Default all remaining attributes.
+        self.is_profiling = False
+        self._reactions = OrderedDict()
+        self._stage_name = None
+        self._stage_time_start = 0.0
+        self._stages = OrderedDict()
+        self._time_start = 0.0
+        self._time_stop = 0.0
+        self._time_steps = 0
+
+    # ..................{ STARTERS                          }..................
+    def start(self) -> None:
+        '''
+        Begin profiling the time loop of the parent simulation phase if the
+        ``profile stages`` option of the current simulation configuration is
+        enabled *or* silently reduce to a noop otherwise.
+
+        All timings accumulated by any prior profiling are discarded.
+        '''
+
+        # If profiling is disabled, silently reduce to a noop.
+        if not self._phase.p.is_solver_profiled:
+            return
+
+        # Discard all prior timings.
+        self._reactions.clear()
+        self._stages.clear()
+        self._stage_name = None
+        self._time_steps = 0
+
+        # Begin profiling.
+        self.is_profiling = True
+        self._time_start = perf_counter()
+
+
+    def stop(self) -> None:
+        '''
+        Finish profiling the time loop of the parent simulation phase if
+        currently profiling *or* silently reduce to a noop otherwise.
+
+        Specifically, this method logs a summary table of all accumulated
+        timings and saves these timings as a JSON report to the file whose
+        path is given by the :attr:`report_filename` property.
+        '''
+
+        # If not profiling, silently reduce to a noop.
+        if not self.is_profiling:
+            return
+
+        # Finish the current stage if any and cease profiling.
+        self._stop_stage(perf_counter())
+        self.is_profiling = False
+
+        # Report all accumulated timings.
+        report = self.get_report()
+        self._log_report(report)
+
+        logs.log_info(
+            'Saving solver profile to "%s"...',
+            pathnames.get_basename(self.report_filename))
+        with open(self.report_filename, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
+
+    # ..................{ TIMERS                            }..................
+    def stage(self, stage_name: str) -> None:
+        '''
+        Finish the current stage of the current time step if any and begin
+        the stage with the passed name if currently profiling *or* silently
+        reduce to a noop otherwise.
+
+        For efficiency, this method is intentionally *not* type-checked.
+        '''
+
+        # If not profiling, silently reduce to a noop.
+        if not self.is_profiling:
+            return
+
+        # Finish the current stage and begin this stage.
+        self._stage_time_start = self._stop_stage(perf_counter())
+        self._stage_name = stage_name
+
+
+    def step_end(self) -> None:
+        '''
+        Finish the current stage of the current time step if any *and* this
+        time step if currently profiling *or* silently reduce to a noop
+        otherwise.
+
+        All wall time elapsed between this call and the next call to the
+        :meth:`stage` method (e.g., adaptive time step error estimation) is
+        attributed to no stage and thus reported as unaccounted time.
+        '''
+
+        # If not profiling, silently reduce to a noop.
+        if not self.is_profiling:
+            return
+
+        # Finish the current stage and this time step.
+        self._stop_stage(perf_counter())
+        self._stage_name = None
+        self._time_steps += 1
+
+
+    def iter_timed(
+        self, reaction_names: IterableTypes, zone_name: str = 'cell',
+    ) -> IterableTypes:
+        '''
+        Iterable over the passed reaction names timing the body of the
+        caller's loop over these names as the evaluation of that reaction in
+        the current stage and passed zone if currently profiling *or* these
+        names as is otherwise.
+
+        The wall time of each such evaluation is *also* attributed to the
+        current stage. Callers should *not* break from loops over the
+        generator returned by this method, which would then silently discard
+        the timing of the last iterated reaction. For efficiency, this method
+        is intentionally *not* type-checked.
+
+        Parameters
+        ----------
+        reaction_names : IterableTypes
+            Iterable of the names of all reactions to be timed.
+        zone_name : str
+            Name of the zone these reactions occur in (e.g., ``cell``,
+            ``env``, ``mit``). Defaults to ``cell``.
+        '''
+
+        # If not profiling, return these names as is.
+        if not self.is_profiling:
+            return reaction_names
+
+        # Else, return a generator timing each reaction.
+        return self._iter_timed(reaction_names, zone_name)
+
+
+    def _iter_timed(
+        self, reaction_names: IterableTypes, zone_name: str) -> GeneratorType:
+        '''
+        Generator timing the body of the caller's loop over the passed
+        reaction names, accumulating the wall time of each iteration of that
+        body into the passed zone of the current stage.
+        '''
+
+        for reaction_name in reaction_names:
+            # Timestamp at which the caller begins evaluating this reaction.
+            time_start = perf_counter()
+
+            # Yield control to the caller, evaluating this reaction.
+            yield reaction_name
+
+            # Accumulate the wall time consumed by this reaction.
+            timing = self._reactions.setdefault(
+                (self._stage_name, zone_name, reaction_name), [0.0, 0])
+            timing[0] += perf_counter() - time_start
+            timing[1] += 1
+
+    # ..................{ PROPERTIES                        }..................
+    @property
+    def report_filename(self) -> str:
+        '''
+        Absolute filename of the JSON report saved by the :meth:`stop` method,
+        residing alongside and named after the pickled results of the parent
+        simulation phase (e.g., ``sim_1_profile.json`` for a simulation
+        pickled to ``sim_1.betse.gz``).
+        '''
+
+        # Absolute filename of the pickled results of this phase.
+        pickle_filename = (
+            self._phase.p.init_pickle_filename
+            if self._phase.kind is SimPhaseKind.INIT else
+            self._phase.p.sim_pickle_filename)
+
+        # Return this report's filename.
+        return pathnames.get_pathname_sans_filetypes(
+            pickle_filename) + '_profile.json'
+
+    # ..................{ GETTERS                           }..................
+    def get_report(self) -> OrderedDict:
+        '''
+        JSON-serializable dictionary of all timings accumulated by this
+        profiler, whose keys are:
+
+        * ``phase``, the lowercase name of the profiled phase type.
+        * ``solver``, the lowercase name of the profiled solver type.
+        * ``time_steps``, the number of profiled time steps.
+        * ``seconds``, the total wall time of profiling in seconds.
+        * ``seconds_unaccounted``, the wall time of profiling attributed to no
+          stage in seconds (e.g., adaptive time step error estimation).
+        * ``stages``, a list of dictionaries describing each stage, whose keys
+          are ``name``, ``seconds``, and ``calls``.
+        * ``reactions``, a list of dictionaries describing each reaction,
+          whose keys are ``stage``, ``zone``, ``name``, ``seconds``, and
+          ``calls``.
+        '''
+
+        # Total wall time of profiling, including that of the current stage.
+        seconds_total = (
+            (perf_counter() if self.is_profiling else self._time_stop) -
+            self._time_start)
+
+        # Wall time attributed to no stage.
+        seconds_staged = sum(timing[0] for timing in self._stages.values())
+
+        return OrderedDict((
+            ('phase', self._phase.kind.name.lower()),
+            ('solver', self._phase.p.solver_type.name.lower()),
+            ('time_steps', self._time_steps),
+            ('seconds', seconds_total),
+            ('seconds_unaccounted', max(seconds_total - seconds_staged, 0.0)),
+            ('stages', [
+                OrderedDict((
+                    ('name', stage_name),
+                    ('seconds', seconds),
+                    ('calls', calls),
+                ))
+                for stage_name, (seconds, calls) in self._stages.items()
+            ]),
+            ('reactions', [
+                OrderedDict((
+                    ('stage', stage_name),
+                    ('zone', zone_name),
+                    ('name', reaction_name),
+                    ('seconds', seconds),
+                    ('calls', calls),
+                ))
+                for (stage_name, zone_name, reaction_name), (seconds, calls) in
+                    self._reactions.items()
+            ]),
+        ))
+
+    # ..................{ PRIVATE ~ timers                  }..................
+    def _stop_stage(self, time_now: float) -> float:
+        '''
+        Accumulate the wall time elapsed from the beginning of the current
+        stage if any to the passed timestamp into that stage, returning this
+        timestamp for convenience.
+        '''
+
+        # If a stage is currently being profiled, accumulate its timing.
+        if self._stage_name is not None:
+            timing = self._stages.get(self._stage_name)
+            if timing is None:
+                timing = self._stages[self._stage_name] = [0.0, 0]
+            timing[0] += time_now - self._stage_time_start
+            timing[1] += 1
+
+        # Record this timestamp as the last time profiling was active.
+        self._time_stop = time_now
+        return time_now
+
+    # ..................{ PRIVATE ~ loggers                 }..................
+    def _log_report(self, report: OrderedDict) -> None:
+        '''
+        Log the passed report as a human-readable summary table, listing each
+        stage and then each reaction by decreasing wall time.
+        '''
+
+        # Total wall time of profiling, avoiding division by zero.
+        seconds_total = report['seconds'] or 1.0
+
+        # Format string of each row of this table.
+        row_format = '{:<40} {:>9} {:>11} {:>11} {:>7}'
+
+        # List of all rows of this table, starting with its header.
+        rows = [row_format.format(
+            'stage', 'calls', 'seconds', 'ms/call', '%')]
+
+        def _add_row(label: str, seconds: float, calls: int) -> None:
+            rows.append(row_format.format(
+                label[:40],
+                calls,
+                '{:.4f}'.format(seconds),
+                '{:.4f}'.format(1000 * seconds / calls) if calls else '-',
+                '{:.1f}'.format(100 * seconds / seconds_total),
+            ))
+
+        # Add one row for each stage and reaction by decreasing wall time.
+        for stage in sorted(
+            report['stages'], key=lambda stage: stage['seconds'],
+            reverse=True):
+            _add_row(stage['name'], stage['seconds'], stage['calls'])
+        _add_row('(unaccounted)', report['seconds_unaccounted'], 0)
+        for reaction in sorted(
+            report['reactions'], key=lambda reaction: reaction['seconds'],
+            reverse=True):
+            _add_row(
+                '{}: {}: {}'.format(
+                    reaction['stage'], reaction['zone'], reaction['name']),
+                reaction['seconds'],
+                reaction['calls'],
+            )
+
+        # Log this table.
+        logs.log_info(
+            'Solver profile (%d time steps in %.4fs):\n%s',
+            report['time_steps'], report['seconds'], '\n'.join(rows))
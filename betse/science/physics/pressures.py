@@ -37,7 +37,7 @@ def osmotic_P(sim, cells, p):
 
     if p.is_ecm is False:
 
-        op_env = np.dot(cells.M_sum_mems, sim.osmo_P_env)/cells.num_mems
+        op_env = cells.M_sum_mems.dot(sim.osmo_P_env)/cells.num_mems
 
         sim.osmo_P_delta = op_env - sim.osmo_P_cell
 
@@ -56,7 +56,7 @@ def osmotic_P(sim, cells, p):
     sim.div_u_osmo = sim.u_osmo*(cells.cell_sa/cells.cell_vol)
 
     # calculate pressure in whole network resulting from divergence :
-    sim.PP = np.dot(cells.lapGJinv, -sim.div_u_osmo * p.rho * p.dt)
+    sim.PP = cells.lapGJinv.solve(-sim.div_u_osmo * p.rho * p.dt)
 
     # ------------------------------------------------------------------------------------------------------------
     # # actual volume change is amount of flow over the cell surface area per unit time:
@@ -112,4 +112,4 @@ def osmotic_P(sim, cells, p):
     # # total mass change in cell
     # mass_change = self.mass_flux*p.dt*cells.mem_sa
     # # sum the change over the membranes to get the total mass change of salts:
-    # self.delta_m_salts = np.dot(cells.M_sum_mems,mass_change)
\ No newline at end of file
+    # self.delta_m_salts = cells.M_sum_mems.dot(mass_change)
\ No newline at end of file
@@ -9,8 +9,10 @@ aggregating runners defined by all available export pipelines) facilities.
 '''
 
 # ....................{ IMPORTS                           }....................
+import multiprocessing
 from betse.exceptions import BetseSimPipeRunnerUnsatisfiedException
 from betse.lib.matplotlib import mplfigure
+from betse.lib.matplotlib.matplotlibs import mpl_config
 from betse.science.phase.phasecls import SimPhase
 from betse.science.pipe.export.pipeexpcsv import SimPipeExportCSVs
 from betse.science.pipe.export.pipeexpanim import SimPipeExportAnimCells
@@ -19,7 +21,8 @@ from betse.science.pipe.export.plot.pipeexpplotcell import (
 from betse.science.pipe.export.plot.pipeexpplotcells import (
     SimPipeExportPlotCells)
 from betse.util.io.log import logs
-from betse.util.type.types import type_check, IterableTypes
+from betse.util.type.types import type_check, IterableTypes, SequenceTypes
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # ....................{ CONSTANTS                         }....................
 _PIPES_EXPORT_TYPE = (
@@ -39,6 +42,23 @@ responsiveness for end users:
 * Animations.
 '''
 
+# ....................{ GLOBALS                           }....................
+_phase_forked = None
+'''
+Simulation phase inherited by the current export subprocess from the parent
+process forking that subprocess *or* ``None`` if the current process is *not*
+an export subprocess. See :func:`_init_export_subprocess`.
+'''
+
+
+_runners_forked = None
+'''
+Sequence of the 2-tuples ``(runner_method, runner_conf)`` of all enabled
+pipeline runners inherited by the current export subprocess from the parent
+process forking that subprocess *or* ``None`` if the current process is *not*
+an export subprocess. See :func:`_init_export_subprocess`.
+'''
+
 # ....................{ CLASSES                           }....................
 class SimPipesExport(object):
     '''
@@ -82,7 +102,7 @@ class SimPipesExport(object):
 
     # ..................{ EXPORTERS                         }..................
     @type_check
-    def export(self, phase: SimPhase) -> None:
+    def export(self, phase: SimPhase, jobs: int = 1) -> None:
         '''
         Export (e.g., interactively display, non-interactively save) all
         exports enabled for all export pipelines enabled by the passed
@@ -107,10 +127,25 @@ class SimPipesExport(object):
 
         * Else, log an informative message and ignore that pipeline.
 
+        If the passed number of jobs is *not* 1, these runners are instead
+        dispatched to a pool of that many subprocesses forked from the current
+        process. Each subprocess thus inherits this phase (including all
+        memory-mapped time series) as copy-on-write memory rather than
+        unpickling this phase again. Runners are submitted in decreasing order
+        of expected duration (i.e., animations first), reducing the time the
+        last busy subprocess runs alone. Since exports displayed rather than
+        saved require the GUI of the current process *and* since forking is
+        unsupported under Windows, these runners are run serially in either
+        case with a non-fatal warning.
+
         Parameters
         ----------
         phase: SimPhase
             Current simulation phase.
+        jobs : int
+            Maximum number of subprocesses to export with in parallel, where 0
+            implies one subprocess per processor. Defaults to 1, exporting in
+            the current process.
         '''
 
         # List of 2-tuples "(runner_method, runner_conf)" yielding the method
@@ -133,40 +168,16 @@ class SimPipesExport(object):
         # calling that callback (e.g., SimCallbacksBC.progressed_next()).
         phase.callbacks.progress_ranged(progress_max=len(runners_enabled))
 
-        # For the method and configuration of each enabled pipeline runner...
-        for runner_method, runner_conf in runners_enabled:
-            # Metadata associated with this runner.
-            runner_metadata = runner_method.metadata
-
-            # Attempt to...
-            try:
-                # Run this runner with this phase and configuration.
-                runner_method(phase, runner_conf)
-
-                #FIXME: Refactor this low-level kludge from the BETSE codebase
-                #into a high-level implementation in the BETSEE codebase. See
-                #the prominent "FIXME" comment in the "pipeabc" submodule for
-                #preliminary work required to begin doing so. For now, this
-                #tragically suffices.
-
-                # Notify the caller of the successful completion of this
-                # runner. Since the prior call failed to raise an exception,
-                # this runner necessarily succeeded.
-                phase.callbacks.progressed_next(
-                    status='Exported {} "{}".'.format(
-                        runner_metadata.noun_singular_lowercase,
-                        runner_metadata.kind))
-            # If this runner's requirements are unsatisfied (e.g., due to the
-            # current simulation configuration disabling fluid flow), notify
-            # the caller of this non-fatal condition and continue.
-            except BetseSimPipeRunnerUnsatisfiedException as exception:
+        # If exporting in parallel, do so.
+        if jobs != 1 and self._is_export_parallel(phase, runners_enabled):
+            self._export_parallel(phase, runners_enabled, jobs)
+        # Else, export serially.
+        else:
+            # For the method and configuration of each enabled runner...
+            for runner_method, runner_conf in runners_enabled:
+                # Run this runner and notify the caller of its completion.
                 phase.callbacks.progressed_next(
-                    status='Excluding {} "{}", as {}.'.format(
-                        runner_metadata.noun_singular_lowercase,
-                        runner_metadata.kind,
-                        exception.reason))
-            # Else if this runner raises any other exception, permit this
-            # exception to propagate up the callstack without intervention.
+                    status=_run_runner(phase, runner_method, runner_conf))
 
         # Unconditionally close all currently open matplotlib figures
         # regardless of whether any of the above runners invoked matplotlib.
@@ -180,3 +191,147 @@ class SimPipesExport(object):
         # Log the directory to which all results were exported.
         logs.log_info('Simulation results exported to:')
         logs.log_info('\t%s', phase.export_dirname)
+
+    # ..................{ PRIVATE ~ exporters               }..................
+    @type_check
+    def _is_export_parallel(
+        self, phase: SimPhase, runners_enabled: SequenceTypes) -> bool:
+        '''
+        ``True`` only if the passed enabled pipeline runners are safely
+        exportable in parallel for the passed simulation phase, logging a
+        non-fatal warning if parallel export was requested but is unsafe.
+        '''
+
+        # If at most one runner is enabled, parallelism is pointless.
+        if len(runners_enabled) <= 1:
+            return False
+
+        # If displaying any exports, these exports require the GUI event loop
+        # of the current process.
+        if phase.p.plot.is_after_sim_show or phase.p.anim.is_after_sim_show:
+            logs.log_warning(
+                'Exporting serially, as displaying plots or animations '
+                'requires the current process.')
+            return False
+
+        # If the current platform cannot fork processes, each subprocess would
+        # need to unpickle this phase again.
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            logs.log_warning(
+                'Exporting serially, as this platform cannot fork processes.')
+            return False
+
+        return True
+
+
+    @type_check
+    def _export_parallel(
+        self, phase: SimPhase, runners_enabled: SequenceTypes, jobs: int,
+    ) -> None:
+        '''
+        Run the passed enabled pipeline runners for the passed simulation phase
+        in a pool of at most the passed number of forked subprocesses (where 0
+        implies one subprocess per processor).
+        '''
+
+        logs.log_info(
+            'Exporting %d results in parallel...', len(runners_enabled))
+
+        with ProcessPoolExecutor(
+            max_workers=jobs or None,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_export_subprocess,
+            initargs=(phase, runners_enabled),
+        ) as executor:
+            # Submit the index of each runner rather than that runner itself,
+            # which each subprocess already inherited. Since runners are
+            # listed in increasing order of expected duration, submit the
+            # slowest first.
+            futures = [
+                executor.submit(_run_runner_forked, runner_index)
+                for runner_index in reversed(range(len(runners_enabled)))
+            ]
+
+            # Notify the caller of the completion of each runner in the order
+            # these runners complete, re-raising any unexpected exception.
+            for future in as_completed(futures):
+                phase.callbacks.progressed_next(status=future.result())
+
+# ....................{ PRIVATE ~ runners                 }....................
+@type_check
+def _run_runner(
+    phase: SimPhase, runner_method: object, runner_conf: object) -> str:
+    '''
+    Run the passed pipeline runner with the passed simulation phase and runner
+    configuration, returning a human-readable status describing the outcome.
+
+    If this runner's requirements are unsatisfied (e.g., due to the current
+    simulation configuration disabling fluid flow), this runner is ignored and
+    this status notes this non-fatal condition. Any other exception raised by
+    this runner is permitted to propagate up the callstack.
+    '''
+
+    # Metadata associated with this runner.
+    runner_metadata = runner_method.metadata
+
+    # Attempt to...
+    try:
+        # Run this runner with this phase and configuration.
+        runner_method(phase, runner_conf)
+
+        #FIXME: Refactor this low-level kludge from the BETSE codebase into a
+        #high-level implementation in the BETSEE codebase. See the prominent
+        #"FIXME" comment in the "pipeabc" submodule for preliminary work
+        #required to begin doing so. For now, this tragically suffices.
+
+        # Describe the successful completion of this runner. Since the prior
+        # call failed to raise an exception, this runner necessarily succeeded.
+        return 'Exported {} "{}".'.format(
+            runner_metadata.noun_singular_lowercase, runner_metadata.kind)
+    # If this runner's requirements are unsatisfied (e.g., due to the current
+    # simulation configuration disabling fluid flow), describe this non-fatal
+    # condition and continue.
+    except BetseSimPipeRunnerUnsatisfiedException as exception:
+        return 'Excluding {} "{}", as {}.'.format(
+            runner_metadata.noun_singular_lowercase,
+            runner_metadata.kind,
+            exception.reason)
+    # Else if this runner raises any other exception, permit this exception to
+    # propagate up the callstack without intervention.
+
+
+def _init_export_subprocess(
+    phase: SimPhase, runners_enabled: SequenceTypes) -> None:
+    '''
+    Initialize the current export subprocess forked by the
+    :meth:`SimPipesExport._export_parallel` method.
+
+    Since this subprocess is forked, the passed objects are inherited rather
+    than pickled and are thus globalized for subsequent use by the
+    :func:`_run_runner_forked` function.
+    '''
+
+    global _phase_forked, _runners_forked
+    _phase_forked = phase
+    _runners_forked = runners_enabled
+
+    # Export with the non-GUI backend, as exports are only saved here and GUI
+    # toolkits initialized by the parent process are unsafe to reuse.
+    mpl_config.backend_name = 'Agg'
+
+
+def _run_runner_forked(runner_index: int) -> str:
+    '''
+    Run the pipeline runner with the passed index in the sequence of enabled
+    pipeline runners inherited by the current export subprocess, returning a
+    human-readable status describing the outcome.
+    '''
+
+    runner_method, runner_conf = _runners_forked[runner_index]
+
+    try:
+        return _run_runner(_phase_forked, runner_method, runner_conf)
+    # Close all figures opened by this runner, as this subprocess persists
+    # across runners.
+    finally:
+        mplfigure.close_figures_all()
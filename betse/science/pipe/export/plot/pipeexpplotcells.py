@@ -873,11 +873,9 @@ class SimPipeExportPlotCells(SimPipeExportPlotABC):
         polx = polm*phase.cells.mem_vects_flat[:,2]
         poly = polm*phase.cells.mem_vects_flat[:,3]
 
-        pcx = np.dot(
-            phase.cells.M_sum_mems,
+        pcx = phase.cells.M_sum_mems.dot(
             polx*phase.cells.mem_sa) / phase.cells.cell_sa
-        pcy = np.dot(
-            phase.cells.M_sum_mems,
+        pcy = phase.cells.M_sum_mems.dot(
             poly*phase.cells.mem_sa) / phase.cells.cell_sa
 
         plotutil.cell_quiver(pcx, pcy, ax, phase.cells, phase.p)
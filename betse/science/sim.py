@@ -4,16 +4,19 @@
 # See "LICENSE" for further details.
 
 # ....................{ IMPORTS                            }....................
-import copy, time
+import copy, os, time
 import numpy as np
-from betse.exceptions import BetseSimException, BetseSimUnstableException
+from betse.exceptions import (
+    BetseSimConfException, BetseSimException, BetseSimUnstableException)
+from betse.lib.yaml import yamls
 from betse.science import filehandling as fh
 from betse.science import sim_toolbox as stb
 from betse.science.channels.gap_junction import Gap_Junction
 from betse.science.chemistry.gene import MasterOfGenes
 from betse.science.chemistry.molecules import MasterOfMolecules
-from betse.science.enum.enumconf import SolverType
+from betse.science.enum.enumconf import SolverType, TimeSeriesFormatType
 from betse.science.math import finitediff as fd
+from betse.science.math.timeseries import TimeSeries
 from betse.science.organelles.endo_retic import EndoRetic
 from betse.science.physics.deform import (
     getDeformation, timeDeform, implement_deform_timestep)
@@ -25,11 +28,80 @@ from betse.science.enum.enumphase import SimPhaseKind
 # from betse.science.organelles.microtubules import Mtubes
 from betse.science.visual.anim.animwhile import AnimCellsWhileSolving
 from betse.util.io.log import logs
+from betse.util.path import dirs, files, pathnames
 from betse.util.type.contexts import noop_context
-from betse.util.type.types import type_check, NoneType
+from betse.util.type.decorator.decmemo import property_cached
+from betse.util.type.types import type_check, IterableTypes, NoneType
+from collections import deque
 from numpy import ndarray
 from scipy.ndimage import gaussian_filter
 
+# ....................{ CONSTANTS                          }....................
+_TIME_SERIES_NAMES = (
+    'cc_time', 'cc_env_time', 'dd_time',
+    'vm_time', 'vm_ave_time', 'vm_GHK_time', 'venv_time',
+    'time', 'gjopen_time', 'osmo_P_delta_time',
+    'I_mem_time', 'I_cell_x_time', 'I_cell_y_time',
+    'I_tot_x_time', 'I_tot_y_time',
+    'efield_gj_x_time', 'efield_gj_y_time',
+    'efield_ecm_x_time', 'efield_ecm_y_time',
+    'P_cells_time', 'rho_cells_time', 'rate_NaKATP_time',
+    'u_cells_x_time', 'u_cells_y_time', 'u_env_x_time', 'u_env_y_time',
+    'dx_cell_time', 'dy_cell_time',
+)
+'''
+Tuple of the names of all :class:`Simulator` attributes storing **time
+series** (i.e., sequences of arrays appended to on each sampled time step by
+the :meth:`Simulator.write2storage` method).
+'''
+
+
+_TIME_SERIES_SOURCES = (
+    ('vm_GHK_time', 'vm_GHK', ('GHK_calc',)),
+    ('efield_gj_x_time', 'E_gj_x', ()),
+    ('efield_gj_y_time', 'E_gj_y', ()),
+    ('cc_time', 'cc_cells', ()),
+    ('dd_time', 'Dm_cells', ()),
+    ('I_cell_x_time', 'J_cell_x', ()),
+    ('I_cell_y_time', 'J_cell_y', ()),
+    ('I_mem_time', 'I_mem', ()),
+    ('vm_time', 'vm', ()),
+    ('rate_NaKATP_time', 'rate_NaKATP', ()),
+    ('P_cells_time', 'P_cells', ()),
+    ('venv_time', 'v_env', ()),
+    ('osmo_P_delta_time', 'osmo_P_delta', ('deform_osmo',)),
+    ('dx_cell_time', 'd_cells_x', ('deformation',)),
+    ('dy_cell_time', 'd_cells_y', ('deformation',)),
+    ('u_cells_x_time', 'u_cells_x', ('fluid_flow',)),
+    ('u_cells_y_time', 'u_cells_y', ('fluid_flow',)),
+    ('gjopen_time', 'gjopen', ()),
+    ('I_tot_x_time', 'J_env_x', ()),
+    ('I_tot_y_time', 'J_env_y', ()),
+    ('efield_ecm_x_time', 'E_env_x', ('is_ecm',)),
+    ('efield_ecm_y_time', 'E_env_y', ('is_ecm',)),
+    ('u_env_x_time', 'u_env_x', ('is_ecm', 'fluid_flow',)),
+    ('u_env_y_time', 'u_env_y', ('is_ecm', 'fluid_flow',)),
+    ('vm_ave_time', 'vm_ave', ()),
+)
+'''
+Tuple of 3-tuples ``(series_name, source_name, requirement_names)``
+describing each time series sampled by the :meth:`Simulator.write2storage`
+method, where:
+
+* ``series_name`` is the name of the :class:`Simulator` attribute storing
+  this time series.
+* ``source_name`` is the name of the :class:`Simulator` attribute storing the
+  array for the current time step to be appended to this time series.
+* ``requirement_names`` is a tuple of the names of all boolean
+  :class:`betse.science.parameters.Parameters` attributes that *must* be
+  enabled for this time series to be sampled.
+
+Time series in the :data:`_TIME_SERIES_NAMES` tuple but *not* this tuple
+(e.g., ``cc_env_time``, ``rho_cells_time``) are consumed by no exporter and
+hence no longer sampled, avoiding the costly copying and storage of arrays
+spanning the entire environmental grid.
+'''
+
 # ....................{ CLASSES                            }....................
 class Simulator(object):
     '''
@@ -48,12 +120,15 @@ class Simulator(object):
     update_C(ion_i,flux, cells, p)     Updates concentration of ion with index
                                             ion_i in cell and environment for a flux leaving the cell.
 
-    update_gj(cells,p,t,i)                  Calculates the voltage gradient between two cells, the gating character of
-                                            gap junctions, and updates concentration for ion 'i' and voltage of each
-                                            cell after electrodiffusion of ion 'i' between gap junction connected cells.
+    update_gj(cells,p,t)                    Calculates the voltage gradient between two cells and the gating character
+                                            of gap junctions once per time step, then electrodiffuses all moving ions
+                                            between gap junction connected cells.
+
+    update_mem(cells,p)                     Calculates electrodiffusive transport of all moving ions across the
+                                            membranes of all cells.
 
-    update_ecm(cells,p,t,i)                 Updates the environmental spaces by calculating electrodiffusive transport
-                                            of ion 'i'.
+    update_ecm(cells,p,t)                   Updates the environmental spaces by calculating electrodiffusive transport
+                                            of all moving ions.
 
 
     get_Efield(cells,p)                     Calculates electric fields in cells and environment.
@@ -1013,7 +1088,7 @@ class Simulator(object):
 
     # ..................{ SOLVERS                           }..................
     @type_check
-    def run_sim_core(self, phase: SimPhase) -> None:
+    def run_sim_core(self, phase: SimPhase, is_resuming: bool = False) -> None:
         '''
         Perform the passed simulation phase (e.g., initialization, simulation),
         pickling the results to files defined by the configuration associated
@@ -1023,22 +1098,66 @@ class Simulator(object):
         --------
         phase : SimPhase
             Current simulation phase.
+        is_resuming : optional[bool]
+            ``True`` only if this simulator was unpickled from a checkpoint of
+            this phase (see :meth:`_checkpoint_phase`), in which case this
+            phase resumes from the time step following that checkpoint rather
+            than from the first time step. Defaults to ``False``.
+
+        Raises
+        --------
+        BetseSimException
+            If ``is_resuming`` is ``True`` but this simulator was *not*
+            unpickled from a checkpoint.
         '''
 
         # If this is neither the initialization or simulation phase, raise an
         # exception.
         phase.die_unless_kind_init_or_sim()
 
-        # Initialize all structures used for gap junctions, ion channels, and
-        # other dynamics.
-        self.init_dynamics(phase)
+        # If resuming this phase, restore all state pickled with this
+        # checkpoint but *NOT* with this simulator.
+        if is_resuming:
+            checkpoint = getattr(self, '_checkpoint', None)
+            if checkpoint is None:
+                raise BetseSimException(
+                    'Simulation not resumable '
+                    '(i.e., not unpickled from a checkpoint).')
+            self._checkpoint = None
+
+            # Replace the tissue handler created by this phase with the
+            # handler pickled with this checkpoint, preserving the state of
+            # all scheduled interventions and dynamic channels.
+            phase.dyna = self.dyna = checkpoint['dyna']
+
+            # Restore the global random number generator state, preserving
+            # the sequence of all random numbers (e.g., dynamic noise).
+            np.random.set_state(checkpoint['rng_state'])
+
+            # Resume writing all time series memory-mapped by this checkpoint
+            # to their files rather than to memory (see _init_time_series()).
+            series_dirname = self._get_time_series_dirname(phase)
+            for series_name in _TIME_SERIES_NAMES:
+                series = getattr(self, series_name, None)
+                if isinstance(series, TimeSeries):
+                    series.remap(pathnames.join(
+                        series_dirname, series_name + '.mmap'))
+        # Else, initialize this phase from scratch.
+        else:
+            # Any checkpoint of a prior run of this phase is now obsolete.
+            if phase.kind is SimPhaseKind.SIM:
+                files.remove_file_if_found(phase.p.sim_checkpoint_filename)
+
+            # Initialize all structures used for gap junctions, ion channels,
+            # and other dynamics.
+            self.init_dynamics(phase)
 
-        # Reinitialize all time-data structures
-        self.clear_storage(phase.cells, phase.p)
+            # Reinitialize all time-data structures
+            self.clear_storage(phase.cells, phase.p)
 
-        # Get the net, unbalanced charge and corresponding voltage in each cell
-        # to initialize values of voltages.
-        self.update_V(phase.cells, phase.p)
+            # Get the net, unbalanced charge and corresponding voltage in each
+            # cell to initialize values of voltages.
+            self.update_V(phase.cells, phase.p)
 
         # Calculate the following simulation phase-specific locals:
         #
@@ -1046,7 +1165,8 @@ class Simulator(object):
         # * "time_steps_sampled", this array resampled to reduce data storage.
         # * "solver_context", the context manager intended to contextualize the
         #   core time loop for this phase.
-        time_steps, time_steps_sampled, solver_context = self._plot_loop(phase)
+        time_steps, time_steps_sampled, solver_context = self._plot_loop(
+            phase, is_resuming=is_resuming)
 
         # Notify the caller of the range of work performed by this subcommand.
         # The phase.callbacks.progressed() callback is called exactly once for
@@ -1054,6 +1174,18 @@ class Simulator(object):
         # equal to the total number of sampled time steps.
         phase.callbacks.progress_ranged(progress_max=len(time_steps_sampled))
 
+        # If resuming this phase, skip all time steps preceding and including
+        # the checkpointed time step. Since these time steps are recomputed
+        # identically, this time step is guaranteed to be found.
+        if is_resuming:
+            time_steps = time_steps[np.searchsorted(
+                time_steps, checkpoint['time'], side='right'):]
+            phase.callbacks.progressed(progress=len(self.time))
+
+            logs.log_info(
+                'Resuming from checkpoint at %.4f s (%d time steps left).',
+                checkpoint['time'], len(time_steps))
+
         # Exception raised if this simulation becomes unstable, enabling safe
         # handling of this instability (e.g., by saving simulation results).
         exception_instability = None
@@ -1077,7 +1209,9 @@ class Simulator(object):
             # Log this solver type.
             logs.log_info('Solver: %s in use.', solver_label)
 
-            # Perform the time loop for this simulation phase.
+            # Perform the time loop for this simulation phase, profiling each
+            # stage of this loop if requested.
+            phase.profiler.start()
             with solver_context:
                 solver_method(
                     phase=phase,
@@ -1116,10 +1250,19 @@ class Simulator(object):
         # has occurred. In this case, these results are likely to be in an
         # inconsistent, nonsensical state and hence safely discarded.
 
+        # Report the timings of all solver stages if profiled. Timings are
+        # reported even for unstable phases, whose cost is no less of interest.
+        phase.profiler.stop()
+
         # Save this initialization or simulation and report results of
         # potential interest to the user.
         self._pickle_phase(phase)
 
+        # Since this phase is now saved, any checkpoint of this phase is
+        # obsolete.
+        if phase.kind is SimPhaseKind.SIM:
+            files.remove_file_if_found(phase.p.sim_checkpoint_filename)
+
         # If the simulation went unstable, inform the user and reraise the
         # previously raised exception to preserve the underlying cause. To
         # avoid data loss, this exception is raised *AFTER* all pertinent
@@ -1162,16 +1305,19 @@ class Simulator(object):
         # Localize frequently accessed variables for efficiency when iterating.
         p = phase.p
         cells = phase.cells
+        profiler = phase.profiler
 
         # True only on the first time step of this phase.
         is_time_step_first = True
 
-        for t in time_steps:  # run through the loop
+        # For each time step to be solved, either fixed or adapted.
+        for t in self._iter_time_steps(phase, time_steps, time_steps_sampled):
             # Start the timer to approximate time for the simulation.
             if is_time_step_first:
                 loop_measure = time.time()
 
             # Reinitialize flux storage devices.
+            profiler.stage('events')
             self.fluxes_mem.fill(0)
             self.fluxes_gj.fill(0)
 
@@ -1189,6 +1335,7 @@ class Simulator(object):
 
             # -----------------PUMPS-------------------------------------------
             # have the pump run only if the rate constant is larger than 0.0 (so people can shut it off):
+            profiler.stage('pumps')
 
             if p.alpha_NaK == 0.0:
                 self.rate_NaKATP = np.zeros(self.mdl)
@@ -1249,37 +1396,28 @@ class Simulator(object):
             # ----------------ELECTRODIFFUSION---------------------------------------------------------------------------
             # electro-diffuse all ions (except for proteins, which don't move) across the cell membrane:
 
-            # shuffle(self.movingIons)
-            for i in self.movingIons:
-                IdM = np.ones(self.mdl)
-
-                if p.is_ecm:
-                    f_ED = stb.electroflux(self.cc_env[i][cells.map_mem2ecm], self.cc_at_mem[i],
-                        self.Dm_cells[i], IdM*p.tm, self.zs[i]*IdM, self.vm, self.T, p,
-                        rho=self.rho_channel)
-                else:
-                    f_ED = stb.electroflux(self.cc_env[i],self.cc_at_mem[i],
-                                            self.Dm_cells[i],IdM*p.tm,self.zs[i]*IdM,
-                                    self.vm,self.T,p,rho=self.rho_channel)
-
-                if not p.cluster_open:
-                    f_ED[cells.bflags_mems] = 0
+            # Since no ion's electrodiffusion depends on that of any other ion
+            # within a time step, all moving ions are electrodiffused together
+            # as stacked arrays whose first dimension indexes each moving ion.
+            profiler.stage('electrodiffusion')
+            self.update_mem(cells, p)
 
-                # add membrane flux to storage
-                self.fluxes_mem[i] += f_ED
+            # update flux between cells due to gap junctions
+            profiler.stage('gap junctions')
+            self.update_gj(cells, p, t)
 
-                # update flux between cells due to gap junctions
-                self.update_gj(cells, p, t, i)
-
-                if p.is_ecm:
-                    #update concentrations in the extracellular spaces:
-                    self.update_ecm(cells, p, t, i)
+            if p.is_ecm:
+                #update concentrations in the extracellular spaces:
+                profiler.stage('extracellular')
+                self.update_ecm(cells, p, t)
 
-                # update concentration gradient to estimate concentrations at membranes:
-                self.update_intra(cells, p, i)
+            # update concentration gradient to estimate concentrations at membranes:
+            profiler.stage('intracellular')
+            self.update_intra(cells, p)
 
             # ----transport and handling of special ions-----------------------
             if p.ions_dict['Ca'] == 1:
+                profiler.stage('calcium')
                 self.ca_handler(cells, p)
 
             # update the microtubules:-----------------------------------------
@@ -1288,6 +1426,7 @@ class Simulator(object):
 
             # update the general molecules handler-----------------------------
             if p.molecules_enabled:
+                profiler.stage('molecules')
                 self.molecules.core.clear_run_loop(self)
 
                 if self.molecules.transporters:
@@ -1304,6 +1443,7 @@ class Simulator(object):
 
             # update gene regulatory network handler---------------------------
             if p.grn_enabled:
+                profiler.stage('grn')
                 self.grn.core.clear_run_loop(self)
 
                 if self.grn.transporters:
@@ -1320,6 +1460,7 @@ class Simulator(object):
 
             # dynamic noise handling-------------------------------------------
             if p.dynamic_noise == 1 and p.ions_dict['P'] == 1 and phase.kind is SimPhaseKind.SIM:
+                profiler.stage('noise')
 
                 # Add a random walk on protein concentration to generate
                 # dynamic noise.
@@ -1340,6 +1481,7 @@ class Simulator(object):
 
             #-----forces, fields, and flow-------------------------------------
             # calculate specific forces and pressures:
+            profiler.stage('forces')
 
             if p.deform_osmo:
                 osmotic_P(self,cells, p)
@@ -1354,9 +1496,11 @@ class Simulator(object):
                     getDeformation(self,cells, t, p)
 
             # Use fluxes to update all concentrations in the cells.
+            profiler.stage('concentrations')
             self.update_all_concs(cells, p)
 
             # recalculate the net, unbalanced charge and voltage in each cell:
+            profiler.stage('voltages')
             self.update_V(cells, p)
 
             # check for NaNs in voltage and stop simulation if found:
@@ -1366,6 +1510,8 @@ class Simulator(object):
             # ---------time sampling and data storage---------------------------------------------------
             # If this time step is sampled...
             if t in time_steps_sampled:
+                profiler.stage('sampling')
+
                 # Notify the caller that an additional sampled time step has
                 # been successfully simulated.
                 phase.callbacks.progressed_next()
@@ -1380,6 +1526,12 @@ class Simulator(object):
                 if anim_cells is not None:
                     anim_cells.plot_frame(time_step=-1)
 
+                # If checkpointing this phase at this time step, do so.
+                self._checkpoint_phase_if_due(phase=phase, t=t)
+
+            # Finish profiling this time step *BEFORE* logging an estimate.
+            profiler.step_end()
+
             # If this is the first time step...
             if is_time_step_first:
                 # Ignore this conditional on all subsequent time steps.
@@ -1389,6 +1541,287 @@ class Simulator(object):
                 self._log_solver_time_estimate(
                     phase=phase, step_first_time=loop_measure)
 
+
+    @type_check
+    def _iter_time_steps(
+        self,
+        phase: SimPhase,
+        time_steps: ndarray,
+        time_steps_sampled: set,
+    ) -> IterableTypes:
+        '''
+        Iterable of all time steps to be solved by the full solver for the
+        passed simulation phase.
+
+        If adaptive time stepping is enabled by this phase's configuration
+        *and* compatible with this configuration, this is the generator
+        returned by the :meth:`_iter_time_steps_adaptive` method; else, this
+        is the passed array of fixed time steps as is.
+
+        Parameters
+        --------
+        phase : SimPhase
+            Current simulation phase.
+        time_steps : ndarray
+            One-dimensional Numpy array defining the fixed time-steps vector
+            for the current phase.
+        time_steps_sampled : set
+            Subset of the ``time_steps`` array whose elements are sampled time
+            steps.
+        '''
+
+        # If adaptive time stepping is disabled, iterate fixed time steps.
+        if not phase.p.is_time_step_adaptive:
+            return time_steps
+
+        # Since deformations difference sampled displacements over the current
+        # time step, deformations assume a fixed time step.
+        if phase.p.deformation:
+            logs.log_warning(
+                'Adaptive time stepping incompatible with deformation; '
+                'solving with fixed time steps instead.')
+            return time_steps
+
+        return self._iter_time_steps_adaptive(
+            phase, time_steps, time_steps_sampled)
+
+
+    def _iter_time_steps_adaptive(
+        self,
+        phase: SimPhase,
+        time_steps: ndarray,
+        time_steps_sampled: set,
+    ) -> IterableTypes:
+        '''
+        Generator yielding each adapted time step to be solved by the full
+        solver for the passed simulation phase.
+
+        This generator sets the ``p.dt`` attribute read by each solver
+        function to the duration of each time step *before* yielding that
+        step. After the caller solves that step, this generator grows or
+        shrinks the duration of the next step (see
+        :meth:`_get_time_step_adapted`) within the bounds configured for this
+        phase. Since each interval between sampled time steps is then evenly
+        divided into the fewest time steps no longer than this duration, each
+        sampled time step is yielded exactly (i.e., as the same float in the
+        ``time_steps_sampled`` set), preserving both the number and timing of
+        all sampled data and animation frames.
+
+        Since solved time steps are always accepted rather than re-solved on
+        excessive changes, the first time step is the fixed time step of this
+        phase.
+
+        Parameters
+        --------
+        phase : SimPhase
+            Current simulation phase.
+        time_steps : ndarray
+            One-dimensional Numpy array defining the fixed time-steps vector
+            for the current phase, whose first and last elements are the first
+            and last time steps yielded by this generator.
+        time_steps_sampled : set
+            Subset of the ``time_steps`` array whose elements are sampled time
+            steps, each of which is yielded by this generator.
+
+        Raises
+        --------
+        BetseSimConfException
+            If the adaptive time step settings of this configuration are
+            invalid.
+        '''
+
+        # Localize frequently accessed variables for efficiency when iterating.
+        p = phase.p
+
+        # If these settings are invalid, raise an exception.
+        if not 0.0 < p.time_step_factor_min <= 1.0 <= p.time_step_factor_max:
+            raise BetseSimConfException(
+                'Adaptive time step factors invalid '
+                '(i.e., not 0 < min factor <= 1 <= max factor).')
+        if not (
+            p.time_step_vmem_error_max > 0.0 and
+            p.time_step_conc_error_max > 0.0
+        ):
+            raise BetseSimConfException(
+                'Adaptive time step tolerances not positive.')
+
+        # Fixed time step of this phase and the bounds of all adapted steps.
+        time_step_fixed = p.dt
+        time_step_min = time_step_fixed * p.time_step_factor_min
+        time_step_max = time_step_fixed * p.time_step_factor_max
+
+        # Duration of the next time step, ignoring sampled time steps.
+        time_step = time_step_fixed
+
+        # Current time step, initialized to the first fixed time step.
+        t = time_steps[0]
+
+        # Queue of all remaining time steps to be yielded exactly in ascending
+        # order: all sampled time steps followed by the last fixed time step
+        # if that step is unsampled.
+        time_steps_exact = deque(sorted(
+            time_step_sampled for time_step_sampled in time_steps_sampled
+            if time_step_sampled > t))
+        if time_steps[-1] > (time_steps_exact[-1] if time_steps_exact else t):
+            time_steps_exact.append(time_steps[-1])
+
+        # Rates of change of transmembrane voltages and cellular ion
+        # concentrations over the prior time step if any *OR* "None".
+        vm_rate_old = cc_rate_old = None
+
+        # Number of time steps yielded thus far.
+        time_step_count = 0
+
+        try:
+            while True:
+                # Copy all state whose rate of change governs time steps.
+                vm_old = self.vm.copy()
+                cc_cells_old = self.cc_cells.copy()
+
+                # Solve this time step.
+                yield t
+                time_step_count += 1
+
+                # If no time steps remain, halt.
+                if not time_steps_exact:
+                    break
+
+                # If no cells were removed by this time step (e.g., by a
+                # cutting event), adapt the next time step to the rates of
+                # change over this and the prior time step; else, these rates
+                # are undefined and the next time step is preserved.
+                if (
+                    vm_old.shape == self.vm.shape and
+                    cc_cells_old.shape == self.cc_cells.shape
+                ):
+                    vm_rate = (self.vm - vm_old) / p.dt
+                    cc_rate = (self.cc_cells - cc_cells_old) / p.dt
+
+                    if vm_rate_old is not None:
+                        time_step = self._get_time_step_adapted(
+                            p=p,
+                            time_step=time_step,
+                            time_step_min=time_step_min,
+                            time_step_max=time_step_max,
+                            vm_rate=vm_rate,
+                            vm_rate_old=vm_rate_old,
+                            cc_rate=cc_rate,
+                            cc_rate_old=cc_rate_old,
+                        )
+
+                    vm_rate_old = vm_rate
+                    cc_rate_old = cc_rate
+                else:
+                    vm_rate_old = cc_rate_old = None
+
+                # Evenly divide the time remaining until the next exact time
+                # step into the fewest time steps no longer than this step,
+                # tolerating roundoff error.
+                time_left = time_steps_exact[0] - t
+                substep_count = max(
+                    int(np.ceil(time_left / time_step - 1.0e-6)), 1)
+
+                # If only one such time step remains, jump to that exact time
+                # step; else, step by an even division of the time remaining.
+                if substep_count == 1:
+                    p.dt = time_left
+                    t = time_steps_exact.popleft()
+                else:
+                    p.dt = time_left / substep_count
+                    t = t + p.dt
+        # Restore the fixed time step of this phase, even if this phase was
+        # prematurely halted.
+        finally:
+            p.dt = time_step_fixed
+
+        # Log the efficiency of this adaptation.
+        logs.log_info(
+            'Solved %d adapted time steps (versus %d fixed time steps).',
+            time_step_count, len(time_steps))
+
+
+    def _get_time_step_adapted(
+        self,
+        p: 'betse.science.parameters.Parameters',
+        time_step: float,
+        time_step_min: float,
+        time_step_max: float,
+        vm_rate: ndarray,
+        vm_rate_old: ndarray,
+        cc_rate: ndarray,
+        cc_rate_old: ndarray,
+    ) -> float:
+        '''
+        Duration of the next time step, adapted to the estimated local error
+        of the most recently solved time step of duration ``p.dt``.
+
+        Since the full solver integrates transmembrane voltages and cellular
+        ion concentrations by the forward Euler method, the local error of
+        each such quantity over a time step ``dt`` is estimated as
+        ``dt/2 * |r - r_old|``, where ``r`` and ``r_old`` are the rates of
+        change of that quantity over that and the prior time step. The next
+        time step is then scaled towards the duration at which the larger of
+        these errors (each normalized by the tolerance configured for that
+        quantity) would be exactly 1, damped by a safety factor of 0.9 and
+        limited to at most halving or doubling.
+
+        Parameters
+        --------
+        p : Parameters
+            Current simulation configuration.
+        time_step : float
+            Duration of the prior adapted time step, which the most recently
+            solved time step is no longer than.
+        time_step_min : float
+            Minimum duration of the next time step.
+        time_step_max : float
+            Maximum duration of the next time step.
+        vm_rate : ndarray
+            Rates of change of transmembrane voltages over the most recently
+            solved time step.
+        vm_rate_old : ndarray
+            Rates of change of transmembrane voltages over the prior time step.
+        cc_rate : ndarray
+            Rates of change of cellular ion concentrations over the most
+            recently solved time step.
+        cc_rate_old : ndarray
+            Rates of change of cellular ion concentrations over the prior time
+            step.
+
+        Returns
+        --------
+        float
+            Duration of the next time step in seconds.
+        '''
+
+        # Largest local errors in transmembrane voltages and relative cellular
+        # concentrations, each normalized by its tolerance.
+        vm_error = (
+            0.5 * p.dt * np.max(np.abs(vm_rate - vm_rate_old)) /
+            p.time_step_vmem_error_max)
+        cc_error = (
+            0.5 * p.dt * np.max(
+                np.abs(cc_rate - cc_rate_old) /
+                (np.abs(self.cc_cells) + 1.0e-15)) /
+            p.time_step_conc_error_max)
+        error = max(vm_error, cc_error)
+
+        # Factor by which to scale the most recently solved time step. Since
+        # the local error of the forward Euler method is quadratic in the time
+        # step, this factor is the square root of the inverse of this error.
+        time_step_factor = (
+            min(max(0.9 / np.sqrt(error), 0.5), 2.0) if error > 0.0 else 2.0)
+        time_step_next = p.dt * time_step_factor
+
+        # If the most recently solved time step was shortened to land exactly
+        # on a sampled time step, avoid shrinking the next time step merely as
+        # a side effect of that shortening.
+        if time_step_factor >= 1.0:
+            time_step_next = max(time_step_next, time_step)
+
+        # Return this time step constrained to the configured bounds.
+        return float(min(max(time_step_next, time_step_min), time_step_max))
+
     # ..................{ SOLVERS ~ fast                    }..................
     def fast_sim_init(self, cells, p):
         '''
@@ -1430,7 +1863,7 @@ class Simulator(object):
         stb.ghk_calculator(self, cells, p)
 
         # get the conversion for geometry of the cluster (required to convert to conductivity):
-        # self.geo_conv = (cells.cell_sa/ np.dot(cells.M_sum_mems, cells.mem_sa))*cells.num_nn
+        # self.geo_conv = (cells.cell_sa/ cells.M_sum_mems.dot(cells.mem_sa))*cells.num_nn
         self.geo_conv = 1.0
 
         self.E_Leak = self.vm_GHK
@@ -1440,7 +1873,7 @@ class Simulator(object):
         self.cbar_all = np.mean([v for k, v in self.cbar_dic.items()])
         self.cbar_sum = np.sum([v.mean() for k, v in self.cbar_dic.items()])
 
-        self.G_Leak = (np.dot(cells.M_sum_mems, sum(sigma_mem)*cells.mem_sa)/cells.cell_sa)*self.geo_conv
+        self.G_Leak = (cells.M_sum_mems.dot(sum(sigma_mem)*cells.mem_sa)/cells.cell_sa)*self.geo_conv
 
         # get the average gap junction conductivity:
         # self.G_gj = sum(sigma_gj)*self.geo_conv*(cells.mem_sa.mean()/cells.cell_sa.mean())
@@ -1482,6 +1915,7 @@ class Simulator(object):
         # Localize frequently-accessed variables for efficiency when iterating.
         p = phase.p
         cells = phase.cells
+        profiler = phase.profiler
 
         # True only on the first time step of this phase.
         is_time_step_first = True
@@ -1492,6 +1926,7 @@ class Simulator(object):
                 loop_measure = time.time()
 
             # Reinitialize flux storage devices.
+            profiler.stage('events')
             self.fluxes_mem.fill(0)
             self.fluxes_gj.fill(0)
 
@@ -1506,6 +1941,7 @@ class Simulator(object):
 
             # update the general molecules handler-----------------------------
             if p.molecules_enabled:
+                profiler.stage('molecules')
                 self.molecules.core.clear_run_loop(self)
 
                 if self.molecules.transporters:
@@ -1522,6 +1958,7 @@ class Simulator(object):
 
             # update gene regulatory network handler---------------------------
             if p.grn_enabled:
+                profiler.stage('grn')
                 self.grn.core.clear_run_loop(self)
 
                 if self.grn.transporters:
@@ -1537,6 +1974,7 @@ class Simulator(object):
                 self.grn.core.run_loop(phase=phase, t=t)
 
             # Update gap junctions:
+            profiler.stage('gap junctions')
             self.vgj = self.vm_ave[cells.cell_nn_i[:, 1]] - self.vm_ave[cells.cell_nn_i[:, 0]]
 
             if p.v_sensitive_gj is True:
@@ -1547,15 +1985,17 @@ class Simulator(object):
             else:
                 self.gjopen = self.gj_block*np.ones(len(cells.mem_i))*cells.gj_default_weights
 
-            Jgj = self.G_gj*np.dot(cells.M_sum_mems, self.vgj)
+            profiler.stage('voltages')
+            Jgj = self.G_gj*cells.M_sum_mems.dot(self.vgj)
 
-            Jmem = np.dot(cells.M_sum_mems, self.extra_J_mem*cells.mem_sa)/cells.cell_sa
+            Jmem = cells.M_sum_mems.dot(self.extra_J_mem*cells.mem_sa)/cells.cell_sa
 
             self.vm_ave += p.dt*(1/p.cm)*(Jgj - Jmem - self.G_Leak*(self.vm_ave - self.E_Leak))
 
             self.vm = self.vm_ave[cells.mem_to_cells]
 
             # Currents:
+            profiler.stage('currents')
             Jtot = -self.vgj*self.G_gj[cells.mem_to_cells] + self.extra_J_mem
 
             self.Jn = Jtot
@@ -1569,8 +2009,8 @@ class Simulator(object):
             Jcy = self.Jn * cells.mem_vects_flat[:, 3]
 
             # average intracellular current to cell centres
-            self.J_cell_x = np.dot(cells.M_sum_mems, Jcx * cells.mem_sa) / cells.cell_sa
-            self.J_cell_y = np.dot(cells.M_sum_mems, Jcy * cells.mem_sa) / cells.cell_sa
+            self.J_cell_x = cells.M_sum_mems.dot(Jcx * cells.mem_sa) / cells.cell_sa
+            self.J_cell_y = cells.M_sum_mems.dot(Jcy * cells.mem_sa) / cells.cell_sa
 
             # intracellular electric field:
             self.E_cell_x = self.J_cell_x / (0.1 * self.sigma_cell)
@@ -1586,26 +2026,28 @@ class Simulator(object):
             # ---------time sampling and data storage---------------------------------------------------
             # If this time step is sampled...
             if t in time_steps_sampled:
+                profiler.stage('sampling')
+
                 # Notify the caller that an additional sampled time step has
                 # been successfully simulated.
                 phase.callbacks.progressed_next()
 
                 # Write data to time storage vectors.
-                self.vm_time.append(self.vm * 1)
+                self.vm_time.append(self.vm)
 
                 # # microtubules:
                 # self.mtubes_x_time.append(self.mtubes.mtubes_x * 1)
                 # self.mtubes_y_time.append(self.mtubes.mtubes_y * 1)
 
-                self.I_cell_x_time.append(self.J_cell_x * 1)
-                self.I_cell_y_time.append(self.J_cell_y * 1)
+                self.I_cell_x_time.append(self.J_cell_x)
+                self.I_cell_y_time.append(self.J_cell_y)
 
-                self.efield_gj_x_time.append(self.E_cell_x[cells.mem_to_cells] * 1)
-                self.efield_gj_y_time.append(self.E_cell_y[cells.mem_to_cells] * 1)
+                self.efield_gj_x_time.append(self.E_cell_x[cells.mem_to_cells])
+                self.efield_gj_y_time.append(self.E_cell_y[cells.mem_to_cells])
 
-                self.gjopen_time.append(self.gjopen*1)
+                self.gjopen_time.append(self.gjopen)
 
-                self.time.append(t * 1)
+                self.time.append(t)
 
                 if p.molecules_enabled:
                     self.molecules.core.write_data(self, cells, p)
@@ -1615,7 +2057,7 @@ class Simulator(object):
                     self.grn.core.write_data(self, cells, p)
                     self.grn.core.report(self, p)
 
-                self.vm_ave_time.append(self.vm_ave*1)
+                self.vm_ave_time.append(self.vm_ave)
 
                 # If animating this phase, display and/or save the next frame
                 # of this animation. For simplicity, pass "-1" implying the
@@ -1624,6 +2066,12 @@ class Simulator(object):
                 if anim_cells is not None:
                     anim_cells.plot_frame(time_step=-1)
 
+                # If checkpointing this phase at this time step, do so.
+                self._checkpoint_phase_if_due(phase=phase, t=t)
+
+            # Finish profiling this time step *BEFORE* logging an estimate.
+            profiler.step_end()
+
             # If this is the first time step...
             if is_time_step_first:
                 # Ignore this conditional on all subsequent time steps.
@@ -1780,72 +2228,163 @@ class Simulator(object):
             self.rho_channel_time = []
 
 
-    def write2storage(self,t,cells,p):
+    @type_check
+    def _init_time_series(self, phase: SimPhase, sample_count: int) -> None:
         '''
-        Append each multidimensional Numpy array covering all time steps (e.g.,
-        :attr:`cc_env_time`) with the corresponding Numpy array of fewer
-        dimensions specific to the passed time step (e.g., :attr:`cc_env`).
+        Replace each list of arrays appended to on each sampled time step of
+        the passed simulation phase with a :class:`TimeSeries` preallocated to
+        the passed number of sampled time steps.
+
+        If enabled by the current simulation configuration *or* if this is a
+        checkpointed simulation phase, each such time series is memory-mapped
+        to a file in the time series directory of this phase (see
+        :meth:`_get_time_series_dirname`). Since checkpoints pickle only the
+        filenames of memory-mapped time series, each checkpoint then writes
+        only the arrays sampled since the prior checkpoint rather than
+        repickling all arrays sampled thus far.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase.
+        sample_count : int
+            Number of sampled time steps of this phase.
         '''
 
-        if p.GHK_calc:
-            stb.ghk_calculator(self,cells,p)
-            self.vm_GHK_time.append(self.vm_GHK) # data array holding GHK vm estimates
+        # Directory to which these time series are memory-mapped if enabled
+        # *OR* "None" otherwise.
+        series_dirname = None
+
+        # If memory-mapping these time series, create this directory.
+        if phase.p.is_time_series_memmapped or (
+            phase.kind is SimPhaseKind.SIM and phase.p.checkpoint_interval > 0):
+            series_dirname = self._get_time_series_dirname(phase)
+            logs.log_debug(
+                'Memory-mapping time series to: %s', series_dirname)
+
+        # For the name of each list attribute appended to by the
+        # write2storage() method, replace that list with a time series. Lists
+        # not initialized by the clear_storage() method for this configuration
+        # (e.g., deformations if deformations are disabled) are ignored.
+        for series_name in _TIME_SERIES_NAMES:
+            if isinstance(getattr(self, series_name, None), list):
+                setattr(self, series_name, TimeSeries(
+                    capacity=sample_count,
+                    filename=(
+                        pathnames.join(series_dirname, series_name + '.mmap')
+                        if series_dirname is not None else None),
+                ))
 
-        # add the new concentration and voltage data to the time-storage matrices:
-        self.efield_gj_x_time.append(self.E_gj_x*1)
-        self.efield_gj_y_time.append(self.E_gj_y*1)
 
-        concs = np.copy(self.cc_cells)
-        self.cc_time.append(concs)
-        concs = None
+    @type_check
+    def _save_time_series(self, phase: SimPhase) -> None:
+        '''
+        Save each time series sampled by the passed simulation phase to a
+        separate ``.npy`` file in the time series directory of this phase
+        (see :meth:`_get_time_series_dirname`) *and* a YAML-formatted index
+        describing these files to the ``index.yaml`` file in this directory.
+
+        This method is intended to be called immediately *before* pickling
+        this simulator, which then references rather than embeds these files.
+
+        Parameters
+        ----------
+        phase : SimPhase
+            Current simulation phase.
+        '''
 
-        envsc = np.copy(self.cc_env)
-        self.cc_env_time.append(envsc)
-        envsc = None
+        # Directory to save these time series to.
+        series_dirname = self._get_time_series_dirname(phase)
+        logs.log_info('Saving time series to:\n\t%s', series_dirname)
+
+        # Dictionary mapping from the name of each saved time series to a
+        # dictionary describing the file this time series was saved to.
+        series_index = {}
+
+        # For the name of each time series, save this time series.
+        for series_name in _TIME_SERIES_NAMES:
+            series = getattr(self, series_name, None)
+            if isinstance(series, TimeSeries):
+                series_metadata = series.save(
+                    pathnames.join(series_dirname, series_name + '.npy'))
+
+                # If this time series was saved, index this file.
+                if series_metadata is not None:
+                    series_index[series_name] = series_metadata
+
+        # Save this index.
+        yamls.save(
+            container=series_index,
+            filename=pathnames.join(series_dirname, 'index.yaml'),
+            is_overwritable=True,
+        )
 
-        ddc = np.copy(self.Dm_cells)
-        ddc.tolist()
-        self.dd_time.append(ddc)
-        ddc = None
 
-        self.I_cell_x_time.append(self.J_cell_x*1)
-        self.I_cell_y_time.append(self.J_cell_y*1)
+    @type_check
+    def _get_time_series_dirname(self, phase: SimPhase) -> str:
+        '''
+        Absolute dirname of the **time series directory** (i.e., directory
+        containing all files persisting the time series sampled by the passed
+        simulation phase) for this phase, creating this directory if needed.
 
-        self.I_mem_time.append(self.I_mem*1)
+        This directory resides in the pickle directory of this phase and is
+        named after the pickled file of this phase (e.g., ``sim_1_series``
+        for a simulation pickled to ``sim_1.betse.gz``).
+        '''
 
-        self.vm_time.append(self.vm*1)
+        if phase.kind is SimPhaseKind.INIT:
+            pickle_dirname = phase.p.init_pickle_dirname
+            pickle_basename = phase.p.init_pickle_basename
+        else:
+            pickle_dirname = phase.p.sim_pickle_dirname
+            pickle_basename = phase.p.sim_pickle_basename
 
-        self.rho_cells_time.append(self.rho_cells*1)
-        self.rate_NaKATP_time.append(self.rate_NaKATP*1)
-        self.P_cells_time.append(self.P_cells)
+        return dirs.join_and_make_unless_dir(
+            pickle_dirname,
+            pathnames.get_pathname_sans_filetypes(pickle_basename) + '_series')
 
-        self.venv_time.append(self.v_env * 1)
 
-        if p.deform_osmo:
-            self.osmo_P_delta_time.append(self.osmo_P_delta)
+    def write2storage(self,t,cells,p):
+        '''
+        Append each multidimensional Numpy array covering all time steps (e.g.,
+        :attr:`cc_time`) with the corresponding Numpy array of fewer
+        dimensions specific to the passed time step (e.g., :attr:`cc_cells`).
+
+        All data derived only for sampling (e.g., GHK voltages) is computed
+        first. All arrays sampled by the current configuration (see the
+        :data:`_TIME_SERIES_SOURCES` tuple) are then copied into the
+        preallocated storage of the corresponding time series in a single
+        pass.
+        '''
 
-        # microtubules:
-        # self.mtubes_x_time.append(self.mtubes.mtubes_x*1)
-        # self.mtubes_y_time.append(self.mtubes.mtubes_y*1)
+        # Compute all data derived only for sampling *BEFORE* sampling below.
+        if p.GHK_calc:
+            stb.ghk_calculator(self,cells,p)
 
         if p.deformation:
             # make a copy of cells to apply deformation to:
             # self.cellso = copy.deepcopy(cells)
             implement_deform_timestep(self, self.cellso, t, p)
-            self.dx_cell_time.append(self.d_cells_x*1)
-            self.dy_cell_time.append(self.d_cells_y*1)
 
-        if p.fluid_flow:
-            self.u_cells_x_time.append(self.u_cells_x*1)
-            self.u_cells_y_time.append(self.u_cells_y*1)
+        # add the new concentration and voltage data to the time-storage
+        # matrices. Since each time series copies each appended array into its
+        # preallocated storage, these arrays need *NOT* be copied here.
+        for series_name, source_name, requirement_names in (
+            _TIME_SERIES_SOURCES):
+            if all(getattr(p, requirement_name)
+                   for requirement_name in requirement_names):
+                getattr(self, series_name).append(getattr(self, source_name))
+
+        self.time.append(t)
+
+        # microtubules:
+        # self.mtubes_x_time.append(self.mtubes.mtubes_x*1)
+        # self.mtubes_y_time.append(self.mtubes.mtubes_y*1)
 
         # if p.sim_eosmosis:
         #     self.rho_channel_time.append(self.rho_channel*1)
         #     self.rho_pump_time.append(self.rho_pump*1)
 
-        self.gjopen_time.append(self.gjopen*1)
-        self.time.append(t)
-
         if p.molecules_enabled:
             self.molecules.core.write_data(self, cells, p)
             self.molecules.core.report(self, p)
@@ -1857,19 +2396,6 @@ class Simulator(object):
         if p.Ca_dyn == 1 and p.ions_dict['Ca'] == 1:
             self.endo_retic.write_cache(self)
 
-        self.I_tot_x_time.append(self.J_env_x*1)
-        self.I_tot_y_time.append(self.J_env_y*1)
-
-        if p.is_ecm:
-            self.efield_ecm_x_time.append(self.E_env_x*1)
-            self.efield_ecm_y_time.append(self.E_env_y*1)
-
-            if p.fluid_flow:
-                self.u_env_x_time.append(self.u_env_x*1)
-                self.u_env_y_time.append(self.u_env_y*1)
-
-        self.vm_ave_time.append(self.vm_ave)
-
         # # magnetic vector potential:
         # self.Ax_time.append(self.Ax)
         # self.Ay_time.append(self.Ay)
@@ -1878,6 +2404,73 @@ class Simulator(object):
         # self.Bz_time.append(self.Bz)
 
 
+    @type_check
+    def _checkpoint_phase_if_due(self, phase: SimPhase, t: float) -> None:
+        '''
+        Checkpoint the passed simulation phase at the passed time step if this
+        phase is the simulation phase, checkpointing is enabled by the current
+        configuration, *and* the number of time steps sampled thus far is a
+        multiple of the checkpoint interval.
+
+        Checkpointing pickles this simulator, the current cell cluster, and the
+        current configuration (excluding all time series, memory-mapped to
+        files by the :meth:`_init_time_series` method) to a temporary file in
+        the same directory as the checkpoint file *before* atomically replacing
+        the latter with the former. Interrupting this phase while checkpointing
+        thus preserves the prior checkpoint if any.
+
+        Parameters
+        --------
+        phase : SimPhase
+            Current simulation phase.
+        t : float
+            Current time step in seconds.
+        '''
+
+        # If this phase is not checkpointable at this time step, noop.
+        if not (
+            phase.kind is SimPhaseKind.SIM and
+            phase.p.checkpoint_interval > 0 and
+            len(self.time) % phase.p.checkpoint_interval == 0
+        ):
+            return
+
+        # Absolute filenames of this checkpoint and the temporary file to
+        # which this checkpoint is pickled.
+        checkpoint_filename = phase.p.sim_checkpoint_filename
+        checkpoint_temp_filename = pathnames.join(
+            pathnames.get_dirname(checkpoint_filename),
+            '.' + pathnames.get_basename(checkpoint_filename),
+        )
+
+        logs.log_debug('Checkpointing simulation at %.4f s...', t)
+
+        # Pickle all state required to resume this phase *NOT* already
+        # pickled with this simulator. Since this phase recreates its tissue
+        # handler on resumption, that handler is pickled here instead.
+        self._checkpoint = {
+            'time': t,
+            'dyna': phase.dyna,
+            'rng_state': np.random.get_state(),
+        }
+
+        try:
+            fh.saveSim(
+                checkpoint_temp_filename, [self, phase.cells, phase.p])
+        finally:
+            self._checkpoint = None
+
+        # Atomically replace the prior checkpoint if any by this checkpoint.
+        # Since both files reside in the same directory, this rename is atomic
+        # on POSIX-compatible platforms, guaranteeing that either the prior or
+        # this checkpoint exists at all times.
+        os.replace(checkpoint_temp_filename, checkpoint_filename)
+
+        logs.log_info(
+            'Simulation checkpointed at %.4f s to:\n\t%s',
+            t, checkpoint_filename)
+
+
     @type_check
     def _pickle_phase(self, phase: SimPhase) -> None:
         '''
@@ -1901,6 +2494,12 @@ class Simulator(object):
             phase.cells = copy.deepcopy(self.cellso)
 
         self.cellso = None
+
+        # If saving time series to per-variable files, do so *BEFORE* pickling
+        # this simulator, which then references rather than embeds these files.
+        if phase.p.time_series_format is TimeSeriesFormatType.NPY:
+            self._save_time_series(phase)
+
         datadump = [self, phase.cells, phase.p]
 
         if phase.kind is SimPhaseKind.INIT:
@@ -1924,8 +2523,10 @@ class Simulator(object):
                     'Final average cytoplasmic concentration of %s: %g mmol/L',
                     self.ionlabel[i], endconc)
 
+            # Since environmental concentrations are no longer sampled, report
+            # the concentrations at the final time step instead.
             for i in range(0,len(self.ionlabel)):
-                endconc = np.round(np.mean(self.cc_env_time[-1][i]),6)
+                endconc = np.round(np.mean(self.cc_env[i]),6)
                 logs.log_info(
                     'Final environmental concentration of %s: %g mmol/L',
                     self.ionlabel[i], endconc)
@@ -1997,6 +2598,20 @@ class Simulator(object):
                 'Gene regulatory network (GRN) configuration: %s',
                 phase.p.grn_config_filename)
 
+    # ..................{ PROPERTIES ~ private              }..................
+    @property_cached
+    def _ecm_buffers(self) -> dict:
+        '''
+        Dictionary mapping from the shape ``(n_ions, ny, nx)`` of the stacked
+        environmental grids electrodiffused by the :meth:`update_ecm` method to
+        the 4-tuple of scratch arrays of that shape reused by each call of that
+        method, avoiding reallocating these arrays each time step.
+
+        Since this dictionary is cached, it is *not* pickled with this object.
+        '''
+
+        return {}
+
     # ..................{ UPDATERS                          }..................
     def update_V(self,cells,p):
 
@@ -2014,7 +2629,7 @@ class Simulator(object):
         if p.cell_polarizability == 0.0:  # allow users to have "simple" case behaviour
 
             # change in charge density at the membrane:
-            # Jm = np.dot(cells.M_sum_mems, self.Jn*cells.mem_sa)/cells.cell_sa
+            # Jm = cells.M_sum_mems.dot(self.Jn*cells.mem_sa)/cells.cell_sa
             # self.vm += -(1/p.cm)*Jm[cells.mem_to_cells]*p.dt
 
             # In terms of intra and extracellular charge:
@@ -2028,8 +2643,8 @@ class Simulator(object):
             #     self.vm += -self.v_env[cells.map_mem2ecm]
 
             # average vm:
-            # self.vm_ave = np.dot(cells.M_sum_mems, self.vm*cells.mem_sa)/cells.cell_sa
-            self.vm_ave = np.dot(cells.M_sum_mems, self.vm) / cells.num_mems
+            # self.vm_ave = cells.M_sum_mems.dot(self.vm*cells.mem_sa)/cells.cell_sa
+            self.vm_ave = cells.M_sum_mems.dot(self.vm) / cells.num_mems
 
             self.E_cell_x = self.J_cell_x/(self.sigma_cell)
             self.E_cell_y = self.J_cell_y/(self.sigma_cell)
@@ -2055,7 +2670,7 @@ class Simulator(object):
                        ((p.dt*self.sigma_cell[cells.mem_to_cells])/(p.cm*cells.R_rads)))
 
             # average vm:
-            self.vm_ave = np.dot(cells.M_sum_mems, self.vm) / cells.num_mems
+            self.vm_ave = cells.M_sum_mems.dot(self.vm) / cells.num_mems
 
             # True cell radii:
             Rcells = cells.R_rads*(p.true_cell_size/p.cell_radius)
@@ -2066,8 +2681,8 @@ class Simulator(object):
             gEx = -gE * cells.mem_vects_flat[:, 2]
             gEy = -gE * cells.mem_vects_flat[:, 3]
 
-            self.E_cell_x = np.dot(cells.M_sum_mems, gEx * cells.mem_sa) / cells.cell_sa
-            self.E_cell_y = np.dot(cells.M_sum_mems, gEy * cells.mem_sa) / cells.cell_sa
+            self.E_cell_x = cells.M_sum_mems.dot(gEx * cells.mem_sa) / cells.cell_sa
+            self.E_cell_y = cells.M_sum_mems.dot(gEy * cells.mem_sa) / cells.cell_sa
 
             # calculate electric field in cells using net intracellular current and cytosol conductivity:
             self.Emc = (self.E_cell_x[cells.mem_to_cells] * cells.mem_vects_flat[:, 2] +
@@ -2096,8 +2711,8 @@ class Simulator(object):
                 ignoreECM=False,
             )
 
-            delta_cgj = np.dot(
-                cells.M_sum_mems, -f_gj_i*cells.mem_sa) / cells.cell_vol
+            delta_cgj = cells.M_sum_mems.dot(
+                -f_gj_i*cells.mem_sa) / cells.cell_vol
 
             self.cc_cells[i] +=  p.dt*delta_cgj
 
@@ -2153,14 +2768,35 @@ class Simulator(object):
             self.endo_retic.update(self, cells, p)
 
 
-    def update_gj(self,cells,p,t,i):
+    def update_gj(self, cells, p, t):
+        '''
+        Electrodiffuse all moving ions between gap junction-connected cells,
+        first updating the ion-independent gap junction state once for this
+        time step and then adding the resulting per-ion transjunctional fluxes
+        to :attr:`fluxes_gj`.
+        '''
+
+        self.update_gj_state(cells, p)
+        self.update_gj_flux(cells, p)
+
+
+    def update_gj_state(self, cells, p):
+        '''
+        Update the ion-independent state of all gap junctions for the current
+        time step, including the transjunctional voltages :attr:`vgj`, the
+        transjunctional electric field :attr:`Egj` and its components, and
+        the gap junction open state :attr:`gjopen`.
+
+        Since voltage-sensitive gap junction gating is stateful, this method
+        should be called exactly once per time step.
+        '''
 
         # calculate voltage difference (gradient*len_gj) between gj-connected cells:
 
         self.vgj = self.vm[cells.nn_i]- self.vm[cells.mem_i]
 
         ## smooth the vgj:
-        # vgj_ave = np.dot(cells.M_sum_mems, self.vgj * cells.mem_sa) / cells.cell_sa
+        # vgj_ave = cells.M_sum_mems.dot(self.vgj * cells.mem_sa) / cells.cell_sa
         # self.vgj = self.smooth_weight_mem * self.vgj + vgj_ave[cells.mem_to_cells] * self.smooth_weight_o
 
         # store transjunctional electric field:
@@ -2180,13 +2816,29 @@ class Simulator(object):
             self.gjopen = self.gj_block*np.ones(len(cells.mem_i))*cells.gj_default_weights
 
 
-        conc_mem = self.cc_at_mem[i]
+    def update_gj_flux(self, cells, p):
+        '''
+        Electrodiffuse all moving ions between gap junction-connected cells
+        given the gap junction state most recently updated by the
+        :meth:`update_gj_state` method, adding the resulting transjunctional
+        fluxes to :attr:`fluxes_gj`.
+        '''
+
+        ions = self.movingIons
 
-        fgj_X = stb.electroflux(conc_mem[cells.mem_i],
-                       conc_mem[cells.nn_i],
-                       self.D_gj[i]*p.gj_surface*self.gjopen,
-                       cells.gj_len*np.ones(self.mdl),
-                       self.zs[i]*np.ones(self.mdl),
+        conc_mem = self.cc_at_mem[ions]
+
+        # diffusion constant and valence of each moving ion, broadcast across
+        # all membranes. Since diffusion constants are either scalars or
+        # arrays over all membranes, both are reshaped into rows.
+        D_gj = self.D_gj[ions].reshape((len(ions), -1))
+        zs = self.zs[ions].astype(np.float64)[:, np.newaxis]
+
+        fgj_X = stb.electroflux(conc_mem[:, cells.mem_i],
+                       conc_mem[:, cells.nn_i],
+                       D_gj*p.gj_surface*self.gjopen,
+                       cells.gj_len,
+                       zs,
                        self.vgj,
                        p.T,
                        p,
@@ -2194,23 +2846,63 @@ class Simulator(object):
                        )
 
         # enforce zero flux at outer boundary:
-        fgj_X[cells.bflags_mems] = 0.0
+        fgj_X[:, cells.bflags_mems] = 0.0
+
+        self.fluxes_gj[ions] = self.fluxes_gj[ions] + fgj_X   # store gap junction flux for each ion
 
 
-        self.fluxes_gj[i] = self.fluxes_gj[i] + fgj_X   # store gap junction flux for this ion
+    def update_mem(self, cells, p):
+        '''
+        Electrodiffuse all moving ions across the membranes of all cells,
+        adding the resulting transmembrane fluxes to :attr:`fluxes_mem`.
+        '''
+
+        ions = self.movingIons
 
+        # valence of each moving ion, broadcast across all membranes:
+        zs = self.zs[ions].astype(np.float64)[:, np.newaxis]
+
+        if p.is_ecm:
+            c_out = self.cc_env[ions][:, cells.map_mem2ecm]
+        else:
+            c_out = self.cc_env[ions]
 
-    def update_ecm(self,cells,p,t,i):
+        f_ED = stb.electroflux(c_out, self.cc_at_mem[ions], self.Dm_cells[ions],
+            p.tm, zs, self.vm, self.T, p, rho=self.rho_channel)
 
-        cenv = self.cc_env[i]
-        cenv = cenv.reshape(cells.X.shape)
+        if not p.cluster_open:
+            f_ED[:, cells.bflags_mems] = 0
 
-        cenv[:,0] =  self.c_env_bound[i]
-        cenv[:,-1] =  self.c_env_bound[i]
-        cenv[0,:] =  self.c_env_bound[i]
-        cenv[-1,:] =  self.c_env_bound[i]
+        # add membrane flux to storage
+        self.fluxes_mem[ions] += f_ED
 
-        gcx, gcy = fd.gradient(cenv, cells.delta)
+
+    def update_ecm(self, cells, p, t):
+        '''
+        Electrodiffuse all moving ions through the extracellular spaces,
+        updating both :attr:`cc_env` and the environmental fluxes
+        :attr:`fluxes_env_x` and :attr:`fluxes_env_y`.
+        '''
+
+        ions = self.movingIons
+
+        # environmental concentrations of each moving ion on the 2D grid:
+        cenv = self.cc_env[ions].reshape((len(ions),) + cells.X.shape)
+
+        c_bound = np.asarray(self.c_env_bound)[ions][:, np.newaxis]
+        cenv[:, :, 0] =  c_bound
+        cenv[:, :, -1] =  c_bound
+        cenv[:, 0, :] =  c_bound
+        cenv[:, -1, :] =  c_bound
+
+        # Scratch arrays of the same shape, reused across time steps.
+        buffers = self._ecm_buffers.get(cenv.shape)
+        if buffers is None:
+            buffers = self._ecm_buffers[cenv.shape] = tuple(
+                np.empty(cenv.shape) for _ in range(4))
+        gcx, gcy, fx, fy = buffers
+
+        fd.gradient(cenv, cells.delta, out=(gcx, gcy))
 
         if p.fluid_flow is True:
 
@@ -2219,38 +2911,42 @@ class Simulator(object):
 
         else:
 
-            ux = np.zeros(cells.X.shape)
-            uy = np.zeros(cells.X.shape)
+            # Omit advection entirely rather than advecting with zero velocity.
+            ux = None
+            uy = None
 
         denv = (
-            self.D_env[i].reshape(cells.X.shape)*
-            self.TJ_modulator[i].reshape(cells.X.shape))
+            self.D_env[ions].reshape(cenv.shape)*
+            self.TJ_modulator[ions].reshape(cenv.shape))
 
-        # This equation assumes environmental transport is electrodiffusive.
-        fx, fy = stb.nernst_planck_flux(cenv, gcx, gcy, -self.E_env_x, -self.E_env_y, ux, uy,
-                                          denv, self.zs[i], self.T, p)
+        zs = self.zs[ions][:, np.newaxis, np.newaxis]
 
+        # This equation assumes environmental transport is electrodiffusive.
+        stb.nernst_planck_flux(cenv, gcx, gcy, -self.E_env_x, -self.E_env_y, ux, uy,
+                                 denv, zs, self.T, p, out=(fx, fy))
 
-        self.fluxes_env_x[i] = fx.ravel()  # store ecm junction flux for this ion
-        self.fluxes_env_y[i] = fy.ravel()  # store ecm junction flux for this ion
+        self.fluxes_env_x[ions] = fx.reshape((len(ions), -1))  # store ecm junction flux for each ion
+        self.fluxes_env_y[ions] = fy.reshape((len(ions), -1))  # store ecm junction flux for each ion
 
-        # divergence of total flux:
-        div_fa = fd.divergence(-fx, -fy, cells.delta, cells.delta)
+        # divergence of total flux, subtracted below rather than negating the flux. As the gradient is no longer
+        # needed, its buffer is reused:
+        div_f = fd.divergence(fx, fy, cells.delta, cells.delta, out=gcx)
 
         # update concentration in the environment:
-        cenv = cenv + div_fa * p.dt
+        div_f *= p.dt
+        cenv -= div_f
 
         if p.sharpness < 1.0:
 
-            # smooth concentration in the environment:
-            cenv = fd.integrator(cenv, sharp = p.sharpness)
+            # smooth concentration in the environment into the now unused flux buffer:
+            cenv = fd.integrator(cenv, sharp = p.sharpness, out=fx)
 
-        self.cc_env[i] = cenv.ravel()
+        self.cc_env[ions] = cenv.reshape((len(ions), -1))
 
 
-    def update_intra(self, cells, p, i):
+    def update_intra(self, cells, p):
 
-        cav = self.cc_cells[i][cells.mem_to_cells]  # concentration at cell centre
+        cav = self.cc_cells[self.movingIons][:, cells.mem_to_cells]  # concentration at cell centre
         # cmi = self.cc_at_mem[i]  # concentration at membrane
         # z = self.zs[i]    # charge of ion
         # Do = 0.1*self.D_free[i]  # diffusion constant of ion, assuming diffusion in cytoplasm is 10x slower than free
@@ -2301,7 +2997,7 @@ class Simulator(object):
         # self.fluxes_intra[i] = cflux * 1
 
         # uncomment this to skip the above computational loop ---------------
-        self.cc_at_mem[i] = cav*1
+        self.cc_at_mem[self.movingIons] = cav
 
     # ..................{ GETTERS                           }..................
     def get_ion(self, ion_name: str) -> int:
@@ -2394,7 +3090,7 @@ class Simulator(object):
         self.Chi = gaussian_filter(self.Chi.reshape(cells.X.shape), 2)
 
     # ..................{ PLOTTERS                           }.................
-    def _plot_loop(self, phase: SimPhase) -> tuple:
+    def _plot_loop(self, phase: SimPhase, is_resuming: bool = False) -> tuple:
         '''
         Display and/or save an animation during solving if requested *and*
         calculate data common to solving both with and without extracellular
@@ -2404,6 +3100,10 @@ class Simulator(object):
         --------
         phase : SimPhase
             Current simulation phase.
+        is_resuming : optional[bool]
+            ``True`` only if resuming this phase from a checkpoint, in which
+            case all time series sampled before that checkpoint are preserved
+            rather than reallocated. Defaults to ``False``.
 
         Returns
         --------
@@ -2465,6 +3165,12 @@ class Simulator(object):
             len(time_steps_sampled),
         )
 
+        # Preallocate storage for all time series sampled by this phase
+        # *BEFORE* creating the animation below, which retains references to
+        # these time series.
+        if not is_resuming:
+            self._init_time_series(phase, sample_count=len(time_steps_sampled))
+
         # Mid-simulation animation of cell voltage as a function of time if
         # enabled by this configuration or None otherwise.
         solver_context = None
@@ -362,7 +362,7 @@ def vertData(data, cells, p):
     """
 
     # interpolate vmem defined on mem mids to cell vertices:
-    verts_data = np.dot(data,cells.matrixMap2Verts)
+    verts_data = cells.matrixMap2Verts.T.dot(data)
 
     # amalgamate both mem mids and verts data into one stack:
     plot_data = np.hstack((data,verts_data))
@@ -382,7 +382,7 @@ def vertData(data, cells, p):
 
     return dat_grid
 
-def nernst_planck_flux(c, gcx, gcy, gvx, gvy,ux,uy,D,z,T,p, mu = 0.0):
+def nernst_planck_flux(c, gcx, gcy, gvx, gvy,ux,uy,D,z,T,p, mu = 0.0, out = None):
     """
      Calculate the flux component of the Nernst-Planck equation
 
@@ -394,12 +394,13 @@ def nernst_planck_flux(c, gcx, gcy, gvx, gvy,ux,uy,D,z,T,p, mu = 0.0):
     gcy:   concentration gradient, y component
     gvx:   voltage gradient, x component
     gvy:   voltage gradient, y component
-    ux:    fluid velocity, x component
-    uy:    fluid velocity, y component
+    ux:    fluid velocity, x component (or None if no fluid flow, only if out is passed)
+    uy:    fluid velocity, y component (or None if no fluid flow, only if out is passed)
     D:     diffusion constant, D
     z:     ion charge
     T:     temperature
     p:     parameters object
+    out:   optional 2-tuple of preallocated arrays of the shape of c receiving the x and y fluxes
 
     Returns
     --------
@@ -407,10 +408,36 @@ def nernst_planck_flux(c, gcx, gcy, gvx, gvy,ux,uy,D,z,T,p, mu = 0.0):
     """
 
     alpha = (D*z*p.q)/(p.kb*T)
-    fx =  -D*gcx - alpha*gvx*c + ux*c - mu*c*gvx
-    fy =  -D*gcy - alpha*gvy*c + uy*c - mu*c*gvy
 
-    return fx, fy
+    if out is None:
+        fx =  -D*gcx - alpha*gvx*c + ux*c - mu*c*gvx
+        fy =  -D*gcy - alpha*gvy*c + uy*c - mu*c*gvy
+
+        return fx, fy
+
+    # Else, evaluate the same expressions term by term into the passed arrays,
+    # omitting terms that are exactly zero (i.e., advection in the absence of
+    # fluid flow and the mobility term in the absence of mobility).
+    work = np.empty(np.broadcast(alpha, gvx, c).shape)
+
+    for f, gc, gv, u in zip(out, (gcx, gcy), (gvx, gvy), (ux, uy)):
+        np.multiply(D, gc, out=f)
+        np.negative(f, out=f)
+
+        np.multiply(alpha, gv, out=work)
+        work *= c
+        f -= work
+
+        if u is not None:
+            np.multiply(u, c, out=work)
+            f += work
+
+        if mu != 0.0:
+            np.multiply(mu, c, out=work)
+            work *= gv
+            f -= work
+
+    return out
 
 def nernst_planck_vector(c, gc, gv,u,D,z,T,p):
     """
@@ -528,121 +555,81 @@ def ghk_calculator(sim, cells, p):
     Uses simulation parameters in the Goldman (GHK) equation
     to calculate an alternative Vmem for validation purposes.
 
+    For efficiency, the permeabilities and concentrations of all ions are
+    averaged from membranes to cell centres as stacked two-dimensional arrays
+    (indexed first by ion and then by cell) in a single sparse product each,
+    rather than ion by ion. Only the comparatively few network channels
+    permeable to these ions are iterated over.
     """
 
-
     # FIXME the Goldman calculator must be altered to account for network pumps and channels!!
-    # begin by initializing all summation arrays for the cell network:
-    sum_PmAnion_out = []
-    sum_PmAnion_in = []
-    sum_PmCation_out = []
-    sum_PmCation_in = []
-
-    for i, z in enumerate(sim.zs):
-
-        # tag as anion or cation
-        ion_type = np.sign(z)
 
-        # average values from membranes or environment to cell centres:
-        Dm = np.dot(cells.M_sum_mems, sim.Dm_cells[i]) / cells.num_mems
-        conc_cells = sim.cc_cells[i]
+    # Membrane permeabilities of all ions averaged from membranes to cell
+    # centres. Since the "M_sum_mems" matrix may be sparse, this matrix is
+    # applied from the left to the transpose of this data.
+    Dm_all = cells.M_sum_mems.dot(sim.Dm_cells.T).T / cells.num_mems
 
-        if p.is_ecm is True:
-            # average entities from membranes to the cell centres:
-            conc_env = np.dot(cells.M_sum_mems, sim.cc_env[i][cells.map_mem2ecm]) / cells.num_mems
-
-        else:
-
-            conc_env = np.dot(cells.M_sum_mems, sim.cc_env[i]) / cells.num_mems
+    # Environmental concentrations of all ions at each membrane, averaged from
+    # membranes to cell centres.
+    if p.is_ecm is True:
+        cc_env_mems = sim.cc_env[:, cells.map_mem2ecm]
+    else:
+        cc_env_mems = sim.cc_env
 
-        if ion_type == -1:
+    conc_env_all = cells.M_sum_mems.dot(cc_env_mems.T).T / cells.num_mems
 
-            sum_PmAnion_in.append(Dm * conc_cells * (1 / p.tm))
-            sum_PmAnion_out.append(Dm * conc_env * (1 / p.tm))
+    # Permeability-weighted intra- and extracellular concentrations of all
+    # ions, split by ion type below.
+    Pm_in_all = Dm_all * sim.cc_cells * (1 / p.tm)
+    Pm_out_all = Dm_all * conc_env_all * (1 / p.tm)
 
+    # begin by initializing all summation arrays for the cell network, tagging
+    # each ion as anion or cation:
+    is_anion = np.sign(sim.zs) == -1
+    is_cation = np.sign(sim.zs) == 1
 
-        if ion_type == 1:
+    sum_PmAnion_in = list(Pm_in_all[is_anion])
+    sum_PmAnion_out = list(Pm_out_all[is_anion])
+    sum_PmCation_in = list(Pm_in_all[is_cation])
+    sum_PmCation_out = list(Pm_out_all[is_cation])
 
-            sum_PmCation_in.append(Dm * conc_cells * (1 / p.tm))
-            sum_PmCation_out.append( Dm * conc_env * (1 / p.tm))
+    # All channels of all enabled networks, in network order.
+    channels = []
 
     if p.molecules_enabled:
-
-        for name in sim.molecules.core.channels:
-            obj = sim.molecules.core.channels[name]
-
-            for ii, relP in zip(obj.channel_core.ions, obj.channel_core.rel_perm):
-
-                ion_i = sim.get_ion(ii)
-                zi = sim.zs[ion_i]
-                conc_cells = sim.cc_cells[ion_i]
-
-                # tag as anion or cation
-                ion_type = np.sign(zi)
-
-                if p.is_ecm is True:
-                    # average entities from membranes to the cell centres:
-                    conc_env = np.dot(cells.M_sum_mems, sim.cc_env[ion_i][cells.map_mem2ecm]) / cells.num_mems
-
-                else:
-
-                    conc_env = np.dot(cells.M_sum_mems, sim.cc_env[ion_i]) / cells.num_mems
-
-                if obj.channel_core.DChan is not None:
-                    Dmo = obj.channel_core.DChan*relP
-                    Dm = np.dot(cells.M_sum_mems, Dmo) / cells.num_mems
-
-                else:
-                    Dm = 0.0
-
-                if ion_type == -1:
-                    sum_PmAnion_in.append(Dm * conc_cells * (1 / p.tm))
-                    sum_PmAnion_out.append(Dm * conc_env * (1 / p.tm))
-
-                if ion_type == 1:
-                    sum_PmCation_in.append( Dm * conc_cells * (1 / p.tm))
-                    sum_PmCation_out.append(Dm * conc_env * (1 / p.tm))
+        channels.extend(sim.molecules.core.channels.values())
 
     if p.grn_enabled:
+        channels.extend(sim.grn.core.channels.values())
 
-        for name in sim.grn.core.channels:
-            obj = sim.grn.core.channels[name]
+    for obj in channels:
 
-            for ii, relP in zip(obj.channel_core.ions, obj.channel_core.rel_perm):
+        for ii, relP in zip(obj.channel_core.ions, obj.channel_core.rel_perm):
 
-                ion_i = sim.get_ion(ii)
-                zi = sim.zs[ion_i]
-                conc_cells = sim.cc_cells[ion_i]
+            ion_i = sim.get_ion(ii)
+            conc_cells = sim.cc_cells[ion_i]
+            conc_env = conc_env_all[ion_i]
 
-                # tag as anion or cation
-                ion_type = np.sign(zi)
+            # tag as anion or cation
+            ion_type = np.sign(sim.zs[ion_i])
 
-                if p.is_ecm is True:
-                    # average entities from membranes to the cell centres:
-                    conc_env = np.dot(cells.M_sum_mems,
-                                      sim.cc_env[ion_i][cells.map_mem2ecm]) / cells.num_mems
+            if obj.channel_core.DChan is not None:
+                Dmo = obj.channel_core.DChan*relP
+                Dm = cells.M_sum_mems.dot(Dmo) / cells.num_mems
 
-                else:
-
-                    conc_env = np.dot(cells.M_sum_mems, sim.cc_env[ion_i]) / cells.num_mems
-
-                if obj.channel_core.DChan is not None:
-                    Dmo = obj.channel_core.DChan * relP
-                    Dm = np.dot(cells.M_sum_mems, Dmo) / cells.num_mems
-
-                else:
-                    Dm = 0.0
+            else:
+                Dm = 0.0
 
-                if ion_type == -1:
-                    sum_PmAnion_in.append(Dm * conc_cells * (1 / p.tm))
-                    sum_PmAnion_out.append(Dm * conc_env * (1 / p.tm))
+            if ion_type == -1:
+                sum_PmAnion_in.append(Dm * conc_cells * (1 / p.tm))
+                sum_PmAnion_out.append(Dm * conc_env * (1 / p.tm))
 
-                if ion_type == 1:
-                    sum_PmCation_in.append(Dm * conc_cells * (1 / p.tm))
-                    sum_PmCation_out.append(Dm * conc_env * (1 / p.tm))
+            if ion_type == 1:
+                sum_PmCation_in.append(Dm * conc_cells * (1 / p.tm))
+                sum_PmCation_out.append(Dm * conc_env * (1 / p.tm))
 
 
-    # NaKrate = (np.dot(cells.M_sum_mems, sim.rate_NaKATP)/cells.num_mems)
+    # NaKrate = (cells.M_sum_mems.dot(sim.rate_NaKATP)/cells.num_mems)
 
     # sum together contributions for Na and K flux across the membrane:
     # NaKflux = NaKrate - (2/3)*NaKrate
@@ -987,7 +974,7 @@ def molecule_mover(sim, cX_env_o, cX_cells, cells, p, z=0, Dm=1.0e-18, Do=1.0e-9
         # enforce zero flux at outer boundary:
         fgj_X[cells.bflags_mems] = 0.0
 
-        delta_cco = np.dot(cells.M_sum_mems, -fgj_X * cells.mem_sa) / cells.cell_vol
+        delta_cco = cells.M_sum_mems.dot(-fgj_X * cells.mem_sa) / cells.cell_vol
 
         # Calculate the final concentration change (the acceleration effectively speeds up time):
         if update_intra is False: # do the GJ transfer assuming instant mixing in the cell:
@@ -1050,7 +1037,7 @@ def molecule_mover(sim, cX_env_o, cX_cells, cells, p, z=0, Dm=1.0e-18, Do=1.0e-9
 
         flux_mtn[cells.bflags_mems] = 0.0
 
-        div_ccmt = -np.dot(cells.M_sum_mems, flux_mtn*cells.mem_sa)/cells.cell_vol
+        div_ccmt = -cells.M_sum_mems.dot(flux_mtn*cells.mem_sa)/cells.cell_vol
 
         # update cell concentration:
         cX_cells += div_ccmt*p.dt*time_dilation_factor
@@ -1174,7 +1161,7 @@ def update_Co(sim, cX_cell, cX_mem, cX_env, flux, cells, p, ignoreECM = True, up
     """
 
     # take the divergence of the flux for each enclosed cell:
-    delta_cells = np.dot(cells.M_sum_mems, flux * cells.mem_sa) / cells.cell_vol
+    delta_cells = cells.M_sum_mems.dot(flux * cells.mem_sa) / cells.cell_vol
 
     # update cell concentration of substance:
     if update_at_mems is False: # treat cell mem and centre values as equal
@@ -1188,7 +1175,7 @@ def update_Co(sim, cX_cell, cX_mem, cX_env, flux, cells, p, ignoreECM = True, up
 
     if p.is_ecm is True:
 
-        # delta_env = np.dot(cells.M_divmap_mem2ecm, -flux)
+        # delta_env = cells.M_divmap_mem2ecm.dot(-flux)
         delta_env = div_env(-flux, cells,p)
 
         # update the environmental concentrations:
@@ -1226,7 +1213,7 @@ def div_env(flux, cells, p):
 
     else:
         # Method # 2:
-        delta_env = np.dot(cells.M_divmap_mem2ecm, flux)/(p.cell_height*cells.delta**2)
+        delta_env = cells.M_divmap_mem2ecm.dot(flux)/(p.cell_height*cells.delta**2)
 
         # use the "integrator" function to conservatively distribute this exchange to nearest neighbours of the env grid:
         # delta_env = fd.integrator(delta_env.reshape(cells.X.shape), sharp = 0.5).ravel()
@@ -1260,7 +1247,7 @@ def HH_Decomp(JJx, JJy, cells, bounds = None, sigma = 1.0):
     divJr[0, :] = 0.0
     divJr[-1, :] = 0.0
 
-    AA = np.dot(cells.lapENVinv, -divJr.ravel())
+    AA = cells.lapENVinv.solve(-divJr.ravel())
 
     gAx, gAy = fd.gradient(AA.reshape(cells.X.shape), cells.delta)
 
@@ -1281,7 +1268,7 @@ def HH_Decomp(JJx, JJy, cells, bounds = None, sigma = 1.0):
     divJd[-1, :] = -Tb * (1 / cells.delta ** 2)
 
 
-    BB = np.dot(cells.lapENVinv, divJd.ravel())
+    BB = cells.lapENVinv.solve(divJd.ravel())
 
     Gx, Gy = fd.gradient(BB.reshape(cells.X.shape), cells.delta)
 
@@ -1306,7 +1293,7 @@ def div_free(Fxo, Fyo, cells):
     divF = fd.divergence(Fxo.reshape(cells.X.shape), Fyo.reshape(cells.X.shape), cells.delta, cells.delta)
 
     # value of the correcting potenial:
-    Phi = np.dot(cells.lapENVinv, divF.ravel())
+    Phi = cells.lapENVinv.solve(divF.ravel())
 
     gPhix, gPhiy = fd.gradient(Phi.reshape(cells.X.shape), cells.delta)
 
@@ -1355,8 +1342,8 @@ def map_to_cells(Fx, Fy, cells, p, smoothing=1.0):
     Fmem = (Fx_atmem * cells.mem_vects_flat[:, 2] +
             Fy_atmem * cells.mem_vects_flat[:, 3])
 
-    Fx_atcell = (np.dot(cells.M_sum_mems, Fx_atmem * cells.mem_sa) / cells.cell_sa)
-    Fy_atcell = (np.dot(cells.M_sum_mems, Fy_atmem * cells.mem_sa) / cells.cell_sa)
+    Fx_atcell = (cells.M_sum_mems.dot(Fx_atmem * cells.mem_sa) / cells.cell_sa)
+    Fy_atcell = (cells.M_sum_mems.dot(Fy_atmem * cells.mem_sa) / cells.cell_sa)
 
     return Fx_atcell, Fy_atcell, Fmem
 
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **benchmark** (i.e., measurement of the wall time and peak memory
+consumed by each phase of the same base simulation configuration across one or
+more points of a parameter grid) facilities.
+
+Each phase (i.e., seed, initialization, simulation and export) of each point
+is run sequentially in a separate forked subprocess, isolating the peak
+resident set size (RSS) of that phase from all prior phases. Results are saved
+as JSON annotated by the Git commit (if any) of this application, permitting
+results to be compared across commits.
+'''
+
+# ....................{ IMPORTS                           }....................
+import json, multiprocessing, platform, time
+import numpy as np
+from betse import metadata
+from betse.exceptions import BetseSimConfException
+from betse.science.parameters import Parameters
+from betse.science.simrunner import SimRunner
+from betse.science.simsweep import iter_sweep_points, make_sweep_conf
+from betse.util.io.log import logs
+from betse.util.path import dirs, pathnames
+from betse.util.type.types import (
+    type_check,
+    MappingType,
+    MappingOrNoneTypes,
+    SequenceTypes,
+    StrOrNoneTypes,
+)
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# ....................{ CONSTANTS                         }....................
+BENCH_PHASE_NAMES = ('seed', 'init', 'sim', 'plot')
+'''
+Tuple of the names of all benchmarkable phases in running order, where
+``plot`` exports all plots, animations and CSV files of the simulation phase.
+'''
+
+
+BENCH_RESULTS_BASENAME_TEMPLATE = 'bench_{}.json'
+'''
+Format template of the basename of the JSON file saving the results of each
+benchmark to the benchmark directory, formatted by the abbreviated Git commit
+of this application (or ``nogit`` if this application is not a Git working
+tree). Benchmarks run at different commits thus save distinct files.
+'''
+
+
+_PHASE_NAME_TO_RUNNER_METHOD_NAME = {
+    'seed': 'seed',
+    'init': 'init',
+    'sim': 'sim',
+    'plot': 'plot_sim',
+}
+'''
+Dictionary mapping from the name of each benchmarkable phase to the name of
+the :class:`SimRunner` method running that phase.
+'''
+
+# ....................{ RUNNERS                           }....................
+@type_check
+def bench(
+    # Mandatory parameters.
+    p: Parameters,
+
+    # Optional parameters.
+    grid: MappingOrNoneTypes = None,
+    phase_names: SequenceTypes = BENCH_PHASE_NAMES,
+    bench_dirname: StrOrNoneTypes = None,
+) -> OrderedDict:
+    '''
+    Benchmark the passed phases of the passed base simulation configuration at
+    each point of the passed parameter grid, returning the results also saved
+    to the JSON file of the benchmark directory named by
+    :data:`BENCH_RESULTS_BASENAME_TEMPLATE`.
+
+    The configuration of each point is saved to the ``run_{index}``
+    subdirectory of the benchmark directory, whose phases are then run in order
+    (each in a separate forked subprocess where supported). Phases failing
+    with an exception are logged and recorded as failed, skipping all
+    subsequent phases of that point rather than halting the benchmark.
+
+    Parameters
+    ----------
+    p : Parameters
+        Base simulation configuration to be benchmarked.
+    grid : optional[MappingType]
+        **Sweep grid** (i.e., dictionary mapping from each ``/``-delimited
+        configuration option to the sequence of all values to benchmark that
+        option across). See the
+        :func:`betse.science.simsweep.iter_sweep_points` function. Defaults to
+        ``None``, in which case only the base configuration is benchmarked.
+    phase_names : optional[SequenceTypes]
+        Sequence of the names of all phases to be benchmarked, each an item of
+        :data:`BENCH_PHASE_NAMES`. Since each phase loads the results of the
+        prior phase, omitting a phase requires those results to exist.
+        Defaults to :data:`BENCH_PHASE_NAMES`.
+    bench_dirname : optional[str]
+        Absolute or relative dirname of the directory to save all benchmark
+        configurations and results to. Defaults to ``None``, in which case
+        this is the ``BENCH`` subdirectory of the directory containing the
+        base configuration.
+
+    Returns
+    ----------
+    OrderedDict
+        Benchmark results. See the :func:`get_bench_header` function for the
+        metadata keys of these results, extended by the ``runs`` key whose
+        value is a list of one ordered dictionary for each point, mapping:
+
+        * ``run`` to the 1-based index of that point.
+        * ``parameters`` to that point.
+        * ``status`` to either ``ok`` or ``failed``.
+        * ``phases`` to a dictionary mapping from the name of each successfully
+          run phase to the metrics returned by the :func:`bench_phase`
+          function for that phase.
+
+    Raises
+    ----------
+    BetseSimConfException
+        If any passed phase name is unrecognized.
+    '''
+
+    # If any phase name is unrecognized, raise an exception.
+    for phase_name in phase_names:
+        if phase_name not in _PHASE_NAME_TO_RUNNER_METHOD_NAME:
+            raise BetseSimConfException(
+                'Benchmark phase "{}" unrecognized (i.e., not in {}).'.format(
+                    phase_name, BENCH_PHASE_NAMES))
+
+    # Default all unpassed parameters.
+    if grid is None:
+        grid = {}
+    if bench_dirname is None:
+        bench_dirname = pathnames.join(p.conf_dirname, 'BENCH')
+
+    # Canonicalize and create this directory if needed.
+    bench_dirname = dirs.canonicalize_and_make_unless_dir(bench_dirname)
+
+    # List of all points, validating this grid *BEFORE* running anything.
+    points = list(iter_sweep_points(grid)) if grid else [OrderedDict()]
+
+    logs.log_info(
+        'Benchmarking %d simulation(s) in "%s"...', len(points), bench_dirname)
+
+    # Benchmark results, starting with metadata identifying this benchmark.
+    results = get_bench_header()
+    results['phases'] = list(phase_names)
+    results['runs'] = []
+
+    for point_index, point in enumerate(points):
+        run = OrderedDict()
+        run['run'] = point_index + 1
+        run['parameters'] = point
+        run['status'] = 'ok'
+        run['phases'] = OrderedDict()
+        results['runs'].append(run)
+
+        p_point = make_sweep_conf(
+            p=p,
+            point=point,
+            conf_dirname=pathnames.join(
+                bench_dirname, 'run_{:03d}'.format(point_index + 1)),
+        )
+
+        for phase_name in phase_names:
+            try:
+                run['phases'][phase_name] = bench_phase(
+                    conf_filename=p_point.conf_filename, phase_name=phase_name)
+            except Exception as exception:
+                logs.log_warning(
+                    'Benchmark run %d phase "%s" failed: %s',
+                    point_index + 1, phase_name, exception)
+                run['status'] = 'failed'
+                break
+
+            logs.log_info(
+                'Benchmark run %d phase "%s": %.2f s, %.1f MiB peak RSS.',
+                point_index + 1, phase_name,
+                run['phases'][phase_name]['seconds'],
+                run['phases'][phase_name]['peak_rss_mb'] or 0.0)
+
+    # Save these results.
+    results_filename = pathnames.join(
+        bench_dirname, BENCH_RESULTS_BASENAME_TEMPLATE.format(
+            results['commit'][:12] if results['commit'] else 'nogit'))
+    write_bench_results(filename=results_filename, results=results)
+    logs.log_info('Benchmark results saved to "%s".', results_filename)
+
+    return results
+
+
+@type_check
+def bench_conf(
+    conf_filename: str, baseline_filename: StrOrNoneTypes = None) -> OrderedDict:
+    '''
+    Run the benchmark configured by the YAML-formatted file with the passed
+    filename, returning the results returned by the :func:`bench` function.
+
+    This file is either:
+
+    * A simulation configuration, in which case all phases of that
+      configuration are benchmarked as is.
+    * A **benchmark file** defining the following keys, where all relative
+      paths are relative to the directory containing this file:
+
+      * ``sim config``, the relative or absolute filename of the base
+        simulation configuration to be benchmarked.
+      * ``parameters``, the optional sweep grid mapping from each
+        ``/``-delimited configuration option to the list of all values to
+        benchmark that option across (e.g., ``world options/world size``,
+        ``general options/simulate extracellular spaces``,
+        ``general options/ion profile``).
+      * ``phases``, the optional list of the names of all phases to be
+        benchmarked. Defaults to :data:`BENCH_PHASE_NAMES`.
+      * ``bench directory``, the optional relative or absolute dirname of the
+        directory to save all benchmark configurations and results to.
+        Defaults to the ``BENCH`` subdirectory of the directory containing
+        this file.
+
+    Parameters
+    ----------
+    conf_filename : str
+        Absolute or relative filename of this file.
+    baseline_filename : optional[str]
+        Absolute or relative filename of the JSON file saved by a prior
+        benchmark to compare these results against *or* ``None`` if no
+        comparison is requested. If non-``None``, the comparison returned by
+        the :func:`compare_bench_results` function is logged. Defaults to
+        ``None``.
+    '''
+
+    # Avoid circular import dependencies.
+    from betse.lib.yaml import yamls
+
+    # Low-level dictionary deserialized from this file.
+    conf = yamls.load(filename=conf_filename)
+
+    # Absolute dirname of the directory containing this file.
+    conf_dirname = pathnames.get_dirname(
+        pathnames.canonicalize(conf_filename))
+
+    # If this is a benchmark file, benchmark the configuration it references.
+    if isinstance(conf, MappingType) and 'sim config' in conf:
+        results = bench(
+            p=Parameters.make(pathnames.join(conf_dirname, conf['sim config'])),
+            grid=conf.get('parameters') or None,
+            phase_names=conf.get('phases') or BENCH_PHASE_NAMES,
+            bench_dirname=pathnames.join(
+                conf_dirname, conf.get('bench directory', 'BENCH')),
+        )
+    # Else, this is a simulation configuration. Benchmark this file as is.
+    else:
+        results = bench(p=Parameters.make(conf_filename))
+
+    # If requested, compare these results against the passed baseline.
+    if baseline_filename is not None:
+        with open(baseline_filename) as baseline_file:
+            baseline = json.load(baseline_file)
+
+        logs.log_info(
+            'Benchmark comparison against commit %s:', baseline.get('commit'))
+        for row in compare_bench_results(baseline=baseline, results=results):
+            logs.log_info(
+                'Run %d phase "%s": %.2fx time, %.2fx peak RSS.',
+                row['run'], row['phase'], row['seconds_ratio'],
+                row['peak_rss_mb_ratio'])
+
+    return results
+
+
+@type_check
+def bench_phase(conf_filename: str, phase_name: str) -> OrderedDict:
+    '''
+    Run the phase with the passed name of the simulation configuration with
+    the passed filename in a forked subprocess if supported by the current
+    platform (or in the current process otherwise), returning the metrics
+    measured by that subprocess.
+
+    Parameters
+    ----------
+    conf_filename : str
+        Absolute or relative filename of this simulation configuration.
+    phase_name : str
+        Name of this phase, an item of :data:`BENCH_PHASE_NAMES`.
+
+    Returns
+    ----------
+    OrderedDict
+        Ordered dictionary mapping:
+
+        * ``seconds`` to the wall time in seconds consumed by this phase.
+        * ``peak_rss_mb`` to the peak resident set size in MiB of the process
+          running this phase *or* ``None`` if the current platform fails to
+          report this size (e.g., Windows). Since a forked subprocess shares
+          the pages of its parent, this size includes the size of the parent
+          process at the time of forking.
+        * ``start_rss_mb`` to the peak resident set size in MiB of the process
+          running this phase immediately before that phase *or* ``None``. If
+          this phase is run in the current process, this size includes the
+          peak size of all prior phases.
+        * ``cells`` to the number of cells of the seeded cell cluster if this
+          is the seed phase.
+    '''
+
+    # If this platform supports forking, run this phase in a new subprocess.
+    if 'fork' in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context('fork'),
+        ) as executor:
+            return executor.submit(
+                _run_bench_phase, conf_filename, phase_name).result()
+    # Else, run this phase in the current process.
+    else:
+        return _run_bench_phase(conf_filename, phase_name)
+
+# ....................{ GETTERS                           }....................
+def get_bench_header() -> OrderedDict:
+    '''
+    Ordered dictionary of the metadata identifying benchmarks run by the
+    current process, mapping:
+
+    * ``betse_version`` to the version of this application.
+    * ``commit`` to the full Git commit hash of this application if this
+      application is a Git working tree *or* ``None`` otherwise.
+    * ``python_version`` to the version of the active Python interpreter.
+    * ``numpy_version`` to the version of Numpy.
+    * ``machine`` to the name of the current platform and processor.
+    * ``time`` to the current local time in ISO 8601 format.
+    '''
+
+    header = OrderedDict()
+    header['betse_version'] = metadata.VERSION
+    header['commit'] = _get_commit_or_none()
+    header['python_version'] = platform.python_version()
+    header['numpy_version'] = np.__version__
+    header['machine'] = '{} {}'.format(platform.platform(), platform.machine())
+    header['time'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    return header
+
+
+@type_check
+def compare_bench_results(
+    baseline: MappingType, results: MappingType) -> list:
+    '''
+    List of the ratios of the wall times and peak resident set sizes of each
+    phase of each run of the passed results to those of the run with the
+    same parameters of the passed baseline results.
+
+    Runs and phases absent from either results are silently ignored.
+
+    Parameters
+    ----------
+    baseline : MappingType
+        Benchmark results to compare against, typically deserialized from the
+        JSON file saved by a benchmark run at a prior commit.
+    results : MappingType
+        Benchmark results to be compared.
+
+    Returns
+    ----------
+    list
+        List of one ordered dictionary for each compared phase of each
+        compared run, mapping ``run`` to the 1-based index of that run in the
+        passed results, ``phase`` to the name of that phase and each of
+        ``seconds_ratio`` and ``peak_rss_mb_ratio`` to the corresponding ratio
+        (``nan`` if either value is missing or zero).
+    '''
+
+    # Dictionary mapping from the JSON serialization of the parameters of each
+    # baseline run to the phases of that run.
+    params_to_baseline_phases = {
+        _get_params_key(run['parameters']): run['phases']
+        for run in baseline.get('runs', ())
+    }
+
+    comparison = []
+    for run in results.get('runs', ()):
+        baseline_phases = params_to_baseline_phases.get(
+            _get_params_key(run['parameters']))
+        if baseline_phases is None:
+            continue
+
+        for phase_name, phase_metrics in run['phases'].items():
+            baseline_metrics = baseline_phases.get(phase_name)
+            if baseline_metrics is None:
+                continue
+
+            row = OrderedDict()
+            row['run'] = run['run']
+            row['phase'] = phase_name
+            for metric_name in ('seconds', 'peak_rss_mb'):
+                value_new = phase_metrics.get(metric_name)
+                value_old = baseline_metrics.get(metric_name)
+                row[metric_name + '_ratio'] = (
+                    value_new/value_old if value_new and value_old else
+                    float('nan'))
+            comparison.append(row)
+
+    return comparison
+
+# ....................{ WRITERS                           }....................
+@type_check
+def write_bench_results(filename: str, results: MappingType) -> None:
+    '''
+    Serialize the passed benchmark results to the JSON file with the passed
+    filename.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute or relative filename of the JSON file to be written. If this
+        file already exists, this file is silently overwritten.
+    results : MappingType
+        Benchmark results returned by the :func:`bench` function.
+    '''
+
+    logs.log_debug('Writing JSON file: %s', filename)
+    dirs.make_parent_unless_dir(filename)
+
+    with open(filename, 'w') as results_file:
+        json.dump(results, results_file, indent=2)
+
+# ....................{ PRIVATE                           }....................
+def _get_commit_or_none() -> StrOrNoneTypes:
+    '''
+    Full Git commit hash of this application if this application is a Git
+    working tree *or* ``None`` otherwise (e.g., if this application was
+    installed by ``pip`` or Git is unavailable).
+    '''
+
+    # Defer heavyweight imports.
+    import betse
+    from betse.util.os.command import cmdrun
+    from betse.util.path import gits
+
+    worktree_dirname = gits.get_package_worktree_dirname_or_none(betse)
+    if worktree_dirname is None:
+        return None
+
+    try:
+        return cmdrun.get_stdout_or_die(
+            command_words=('git', 'rev-parse', 'HEAD'),
+            popen_kwargs={'cwd': worktree_dirname},
+        ).strip()
+    except Exception:
+        return None
+
+
+def _get_params_key(params: MappingType) -> str:
+    '''
+    JSON serialization of the passed benchmark parameters with sorted keys,
+    uniquely identifying benchmark runs with these parameters.
+    '''
+
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def _get_rss_peak_mb() -> object:
+    '''
+    Peak resident set size in MiB of the current process *or* ``None`` if the
+    current platform fails to report this size.
+    '''
+
+    # Defer platform-specific imports.
+    try:
+        import resource
+    except ImportError:
+        return None
+    from betse.util.os.brand import macos
+
+    # Peak size in platform-specific units: bytes under macOS and KiB under
+    # all other POSIX-compatible platforms.
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss_peak/(1024**2 if macos.is_macos() else 1024), 1)
+
+
+def _run_bench_phase(conf_filename: str, phase_name: str) -> OrderedDict:
+    '''
+    Run the phase with the passed name of the simulation configuration with
+    the passed filename, returning the metrics documented by the
+    :func:`bench_phase` function.
+
+    This function is run in a benchmark subprocess where supported.
+    '''
+
+    metrics = OrderedDict()
+    metrics['start_rss_mb'] = _get_rss_peak_mb()
+
+    time_start = time.perf_counter()
+    runner = SimRunner(p=Parameters.make(conf_filename))
+    phase = getattr(runner, _PHASE_NAME_TO_RUNNER_METHOD_NAME[phase_name])()
+    metrics['seconds'] = round(time.perf_counter() - time_start, 3)
+    metrics['peak_rss_mb'] = _get_rss_peak_mb()
+
+    if phase_name == 'seed':
+        metrics['cells'] = len(phase.cells.cell_i)
+
+    return metrics
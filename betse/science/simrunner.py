@@ -23,7 +23,8 @@ from betse.util.path import files, pathnames
 from betse.util.type.decorator.decorators import deprecated
 from betse.util.type.decorator.decprof import log_time_seconds
 from betse.util.type.text.string import strs
-from betse.util.type.types import type_check
+from betse.util.type.types import (
+    type_check, IntOrNoneTypes, MappingType, StrOrNoneTypes)
 from matplotlib.collections import LineCollection, PolyCollection
 
 # ....................{ CLASSES                           }....................
@@ -241,7 +242,7 @@ class SimRunner(object):
 
 
     @log_time_seconds(noun='simulation')
-    def sim(self) -> SimPhase:
+    def sim(self, resume: bool = False) -> SimPhase:
         '''
         Simulate this simulation with the cell cluster initialized by a prior
         call to the :meth:`init` method and cache this simulation to an output
@@ -250,6 +251,14 @@ class SimRunner(object):
         This method *must* be called prior to the :meth:`:meth:`plot_sim`
         method, which consumes this output as input.
 
+        Parameters
+        ----------
+        resume : optional[bool]
+            ``True`` only if resuming this simulation from the checkpoint most
+            recently saved by a prior interrupted call to this method (see the
+            ``checkpoint interval`` option). If no such checkpoint exists,
+            this simulation is run from the beginning. Defaults to ``False``.
+
         Returns
         ----------
         SimPhase
@@ -263,6 +272,40 @@ class SimRunner(object):
         # Simulation phase type.
         phase_kind = SimPhaseKind.SIM
 
+        # If resuming this simulation from an existing checkpoint, do so.
+        if resume:
+            if files.is_file(self._p.sim_checkpoint_filename):
+                logs.log_info(
+                    'Loading simulation checkpoint:\n\t%s',
+                    self._p.sim_checkpoint_filename)
+
+                # Load this checkpoint from cache.
+                sim, cells, p_old = fh.loadSim(self._p.sim_checkpoint_filename)
+
+                # Ensure compatibility between original and present config
+                # files.
+                self._die_if_seed_differs(p_old, self._p)
+
+                # Simulation phase, created *AFTER* unpickling these objects.
+                phase = SimPhase(
+                    kind=phase_kind,
+                    cells=cells,
+                    p=self._p,
+                    sim=sim,
+                    callbacks=self._callbacks,
+                )
+
+                # Resume and save the simulation to the cache.
+                sim.sim_info_report(phase)
+                sim.run_sim_core(phase, is_resuming=True)
+
+                # Return this phase.
+                return phase
+
+            logs.log_warning(
+                'Simulation checkpoint not found; '
+                'running simulation from the beginning.')
+
         if not files.is_file(self._p.init_pickle_filename):
             if not self._p.autoInit:
                 raise BetseSimException(
@@ -295,6 +338,58 @@ class SimRunner(object):
         # Return this phase.
         return phase
 
+    # ..................{ RUNNERS ~ sweep                   }..................
+    @log_time_seconds(noun='sweep')
+    @type_check
+    def sweep(
+        self,
+
+        # Mandatory parameters.
+        grid: MappingType,
+
+        # Optional parameters.
+        sweep_dirname: StrOrNoneTypes = None,
+        jobs: IntOrNoneTypes = None,
+    ) -> list:
+        '''
+        Simulate this simulation at each point of the passed parameter grid in
+        parallel, reusing a single seed and initialization across all points
+        where the swept options permit.
+
+        See the :func:`betse.science.simsweep.sweep` function for further
+        details.
+
+        Parameters
+        ----------
+        grid : MappingType
+            **Sweep grid** (i.e., dictionary mapping from each ``/``-delimited
+            key of a simulation configuration option to the sequence of all
+            values to sweep that option across), such as
+            ``{'internal parameters/alpha_NaK': [1.0e-7, 2.0e-7]}``.
+        sweep_dirname : optional[str]
+            Dirname of the directory to save all sweep configurations and
+            results to. Defaults to ``None``, in which case this is the
+            ``SWEEP`` subdirectory of the directory containing the current
+            configuration file.
+        jobs : optional[int]
+            Maximum number of points to simulate in parallel. Defaults to
+            ``None``, in which case this is the number of processors on this
+            machine.
+
+        Returns
+        ----------
+        list
+            List of one ordered dictionary for each point of this grid,
+            mapping from the name of each summary metric to the value of that
+            metric for that point.
+        '''
+
+        # Avoid circular import dependencies.
+        from betse.science import simsweep
+
+        return simsweep.sweep(
+            p=self._p, grid=grid, sweep_dirname=sweep_dirname, jobs=jobs)
+
     # ..................{ RUNNERS ~ grn                     }..................
     @log_time_seconds(noun='network')
     def sim_grn(self) -> SimPhase:
@@ -685,12 +780,20 @@ class SimRunner(object):
 
 
     @log_time_seconds(noun='initialization', verb='exported')
-    def plot_init(self) -> SimPhase:
+    def plot_init(self, jobs: int = 1) -> SimPhase:
         '''
         Visualize the cell cluster initialized by a prior call to the
         :meth:`init` method and export the resulting plots and animations to
         various output files, specified by the current configuration file.
 
+        Parameters
+        ----------
+        jobs : int
+            Maximum number of subprocesses to export plots, animations, and
+            CSV files with in parallel, where 0 implies one subprocess per
+            processor. Defaults to 1, exporting in the current process. See
+            :meth:`SimPipesExport.export`.
+
         Returns
         ----------
         SimPhase
@@ -731,7 +834,7 @@ class SimRunner(object):
         phase.dyna.init_profiles(phase)
 
         # Display and/or save all initialization exports (e.g., animations).
-        SimPipesExport().export(phase)
+        SimPipesExport().export(phase, jobs=jobs)
 
         #FIXME: All of the following crash if image saving is not turned on, but
         #due to whatever way this is set up, it's not possible to readily fix
@@ -774,12 +877,20 @@ class SimRunner(object):
 
 
     @log_time_seconds(noun='simulation', verb='exported')
-    def plot_sim(self) -> SimPhase:
+    def plot_sim(self, jobs: int = 1) -> SimPhase:
         '''
         Visualize the cell cluster simulated by a prior call to the :meth:`sim`
         method and export the resulting plots and animations to various output
         files, specified by the current configuration file.
 
+        Parameters
+        ----------
+        jobs : int
+            Maximum number of subprocesses to export plots, animations, and
+            CSV files with in parallel, where 0 implies one subprocess per
+            processor. Defaults to 1, exporting in the current process. See
+            :meth:`SimPipesExport.export`.
+
         Returns
         ----------
         SimPhase
@@ -820,7 +931,7 @@ class SimRunner(object):
         phase.dyna.init_profiles(phase)
 
         # Display and/or save all simulation exports (e.g., animations).
-        SimPipesExport().export(phase)
+        SimPipesExport().export(phase, jobs=jobs)
 
         #FIXME: Split each of the following blocks performing both plotting and
         #animating into their appropriate plotpipe.pipeline() or
@@ -0,0 +1,686 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+High-level **parameter sweep** (i.e., simulation of the same base simulation
+configuration across the cartesian product of one or more lists of values of
+one or more options of that configuration) facilities.
+
+Each point of a sweep is simulated in a separate subprocess from a separate
+simulation configuration file saved to a separate subdirectory of the sweep
+directory. Where the swept options permit, all points share a single seed and
+initialization run once in the current process *before* any point is simulated.
+'''
+
+# ....................{ IMPORTS                           }....................
+import csv, fnmatch, itertools, multiprocessing, time
+import numpy as np
+from betse.exceptions import BetseSimConfException
+from betse.science.parameters import Parameters
+from betse.science.phase.phasecls import SimPhase
+from betse.science.simrunner import SimRunner
+from betse.util.io.log import logs
+from betse.util.path import dirs, files, pathnames
+from betse.util.path.dirs import DirOverwritePolicy
+from betse.util.type.types import (
+    type_check,
+    GeneratorType,
+    IntOrNoneTypes,
+    MappingType,
+    SequenceTypes,
+    StrOrNoneTypes,
+    is_sequence_nonstr,
+)
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# ....................{ CONSTANTS                         }....................
+SWEEP_KEY_DELIMITER = '/'
+'''
+Delimiter separating the keys of successively nested YAML containers in each
+**sweep key** (i.e., string identifying a swept simulation configuration
+option), such as ``internal parameters/alpha_NaK``.
+'''
+
+
+SWEEP_SUMMARY_BASENAME = 'sweep_summary.csv'
+'''
+Basename of the CSV file tabulating per-run summary metrics of each sweep,
+saved to the top-level directory of that sweep.
+'''
+
+
+_SEED_INDEPENDENT_SECTION_NAMES = frozenset((
+    'automatically run initialization',
+    'init time settings',
+    'sim time settings',
+    'sim file saving',
+    'results file saving',
+    'results options',
+    'modulator function properties',
+
+    # Scheduled interventions, which only fire during simulation phases.
+    # Cutting events are excluded, as seeds precompute their cut profiles.
+    'change Na mem',
+    'change K mem',
+    'change Cl mem',
+    'change Ca mem',
+    'apply pressure',
+    'apply external voltage',
+    'break ecm junctions',
+    'change K env',
+    'change Cl env',
+    'change Na env',
+    'change temperature',
+    'block gap junctions',
+    'block NaKATP pump',
+))
+'''
+Set of the names of all top-level sections of simulation configurations on
+which seeded cell clusters are known *not* to depend.
+
+Sweeping *only* options in these sections (or matching the
+:data:`_SEED_INDEPENDENT_OPTION_GLOBS` globs) permits all points of that sweep
+to share a single seed. Since seeds depend on many sections besides the general
+and world options compared by the :meth:`SimRunner._die_if_seed_differs`
+method (e.g., tissue and cut profiles, the matrix backend, deformations,
+internal geometric parameters), sweeping *any* other option in a section absent
+from this set conservatively reseeds each point of that sweep.
+'''
+
+
+_SEED_INDEPENDENT_OPTION_GLOBS = (
+    # Membrane and pump rates, applied by initialization and simulation.
+    'internal parameters/Do_*',
+    'internal parameters/alpha_NaK',
+    'internal parameters/alpha_Ca',
+    'internal parameters/membrane capacitance',
+    'internal parameters/dielectric constant',
+
+    # Physical conditions and gap junction permeability. Gap junction
+    # connectivity is seeded, but *NOT* the permeability of those junctions.
+    'variable settings/temperature',
+    'variable settings/gap junctions/*',
+
+    # Membrane diffusion constants of tissue profiles. The cells targeted by
+    # these profiles are picked on seeding, but *NOT* these constants.
+    'tissue profile definition/tissue/default/diffusion constants/*',
+    'tissue profile definition/tissue/profiles/*/diffusion constants/*',
+)
+'''
+Tuple of shell-style globs matching the ``/``-delimited keys of all individual
+options of simulation configurations on which seeded cell clusters are known
+*not* to depend, despite residing in sections on which seeds do depend.
+
+Seeds pickle only the cell cluster, which depends on none of these options.
+'''
+
+
+_SIM_SECTION_NAMES = frozenset((
+    'sim time settings',
+    'sim file saving',
+    'results file saving',
+    'results options',
+
+    # Scheduled interventions, which only fire during simulation phases.
+    'change Na mem',
+    'change K mem',
+    'change Cl mem',
+    'change Ca mem',
+    'apply pressure',
+    'apply external voltage',
+    'break ecm junctions',
+    'cutting event',
+    'change K env',
+    'change Cl env',
+    'change Na env',
+    'change temperature',
+    'block gap junctions',
+    'block NaKATP pump',
+))
+'''
+Set of the names of all top-level sections of simulation configurations on
+which *only* simulation phases depend.
+
+Sweeping *only* options in these sections permits all points of that sweep to
+share a single initialization.
+'''
+
+# ....................{ ITERATORS                         }....................
+@type_check
+def iter_sweep_points(grid: MappingType) -> GeneratorType:
+    '''
+    Generator iteratively yielding each **sweep point** (i.e., ordered
+    dictionary mapping from each sweep key of the passed grid to one value of
+    that key) of the cartesian product of the passed grid.
+
+    Points are yielded in row-major order, such that the values of the last
+    sweep key of this grid vary fastest.
+
+    Parameters
+    ----------
+    grid : MappingType
+        **Sweep grid** (i.e., dictionary mapping from each sweep key to the
+        sequence of all values to sweep that key across).
+
+    Yields
+    ----------
+    OrderedDict
+        Each sweep point of this grid.
+
+    Raises
+    ----------
+    BetseSimConfException
+        If any value of this grid is *not* a non-empty sequence.
+    '''
+
+    # Sweep keys of this grid.
+    keys = tuple(grid.keys())
+
+    # If this grid is empty, raise an exception.
+    if not keys:
+        raise BetseSimConfException('Parameter sweep grid empty.')
+
+    # For each sweep key, raise an exception unless its values are non-empty.
+    for key in keys:
+        values = grid[key]
+        if not is_sequence_nonstr(values):
+            raise BetseSimConfException(
+                'Parameter sweep key "{}" values {!r} not a list.'.format(
+                    key, values))
+        if not values:
+            raise BetseSimConfException(
+                'Parameter sweep key "{}" values empty.'.format(key))
+
+    for values in itertools.product(*(grid[key] for key in keys)):
+        yield OrderedDict(zip(keys, values))
+
+# ....................{ GETTERS                           }....................
+@type_check
+def get_sweep_key_names(key: str) -> tuple:
+    '''
+    Tuple of the keys of all successively nested YAML containers identified by
+    the passed sweep key.
+
+    Each such key consisting only of digits is converted into an integer,
+    indexing a YAML sequence (e.g., a specific tissue profile).
+
+    Raises
+    ----------
+    BetseSimConfException
+        If this sweep key is empty or contains empty keys.
+    '''
+
+    key_names = tuple(
+        key_name.strip() for key_name in key.split(SWEEP_KEY_DELIMITER))
+
+    if not all(key_names):
+        raise BetseSimConfException(
+            'Parameter sweep key "{}" empty or contains empty keys.'.format(
+                key))
+
+    return tuple(
+        int(key_name) if key_name.isdigit() else key_name
+        for key_name in key_names)
+
+
+@type_check
+def is_sweep_seed_shareable(grid: MappingType) -> bool:
+    '''
+    ``True`` only if all points of the passed sweep grid may share a single
+    seeded cell cluster (i.e., if all options this grid sweeps either reside
+    in sections on which seeds are known *not* to depend or match the
+    :data:`_SEED_INDEPENDENT_OPTION_GLOBS` globs).
+    '''
+
+    for key in grid.keys():
+        key_names = get_sweep_key_names(key)
+        if key_names[0] in _SEED_INDEPENDENT_SECTION_NAMES:
+            continue
+
+        # Normalized key of this option, stripped of extraneous whitespace.
+        key_normalized = SWEEP_KEY_DELIMITER.join(
+            str(key_name) for key_name in key_names)
+        if not any(
+            fnmatch.fnmatchcase(key_normalized, option_glob)
+            for option_glob in _SEED_INDEPENDENT_OPTION_GLOBS
+        ):
+            return False
+
+    return True
+
+
+@type_check
+def is_sweep_init_shareable(grid: MappingType) -> bool:
+    '''
+    ``True`` only if all points of the passed sweep grid may share a single
+    initialization (i.e., if all options this grid sweeps reside in sections
+    on which *only* simulation phases depend).
+    '''
+
+    return all(
+        get_sweep_key_names(key)[0] in _SIM_SECTION_NAMES
+        for key in grid.keys())
+
+# ....................{ SETTERS                           }....................
+@type_check
+def set_sweep_option(conf: MappingType, key: str, value: object) -> None:
+    '''
+    Set the option identified by the passed sweep key in the passed low-level
+    simulation configuration dictionary to the passed value.
+
+    Raises
+    ----------
+    BetseSimConfException
+        If this option is *not* already defined by this configuration. Since
+        sweeping an option unrecognized by this application silently reduces
+        to a noop, this condition is almost certainly a typo.
+    '''
+
+    # Keys of all successively nested YAML containers identified by this key.
+    key_names = get_sweep_key_names(key)
+
+    # Container directly containing this option.
+    container = conf
+
+    for key_index, key_name in enumerate(key_names):
+        # If this container does *NOT* contain this key, raise an exception.
+        if isinstance(container, MappingType):
+            is_key = key_name in container
+        else:
+            is_key = (
+                isinstance(container, list) and
+                isinstance(key_name, int) and
+                key_name < len(container)
+            )
+
+        if not is_key:
+            raise BetseSimConfException(
+                'Parameter sweep key "{}" not found '
+                '(i.e., "{}" undefined).'.format(
+                    key,
+                    SWEEP_KEY_DELIMITER.join(
+                        str(key_name_prior)
+                        for key_name_prior in key_names[:key_index + 1])))
+
+        # If this is the last such key, set this option and we're done.
+        if key_index == len(key_names) - 1:
+            container[key_name] = value
+        # Else, descend into this container.
+        else:
+            container = container[key_name]
+
+# ....................{ RUNNERS                           }....................
+@type_check
+def sweep(
+    # Mandatory parameters.
+    p: Parameters,
+    grid: MappingType,
+
+    # Optional parameters.
+    sweep_dirname: StrOrNoneTypes = None,
+    jobs: IntOrNoneTypes = None,
+) -> list:
+    '''
+    Simulate the passed base simulation configuration at each point of the
+    passed sweep grid in parallel, returning a table of per-run summary metrics
+    also saved to the :data:`SWEEP_SUMMARY_BASENAME` file of the sweep
+    directory.
+
+    Specifically, this function (in order):
+
+    #. Saves the base configuration to the ``base`` subdirectory of the sweep
+       directory and, if all points may share a seed and/or initialization (see
+       the :func:`is_sweep_seed_shareable` and :func:`is_sweep_init_shareable`
+       functions), seeds and/or initializes that configuration.
+    #. Saves the configuration of each point to the ``run_{index}``
+       subdirectory of the sweep directory, copying all shared seed and
+       initialization pickles (and the time series of those pickles) into that
+       subdirectory.
+    #. Seeds (if needed), initializes (if needed), and simulates each point in
+       a process pool of the passed size.
+
+    Points failing with an exception are logged and tabulated as failed rather
+    than halting the sweep.
+
+    Parameters
+    ----------
+    p : Parameters
+        Base simulation configuration to be swept.
+    grid : MappingType
+        **Sweep grid** (i.e., dictionary mapping from each sweep key to the
+        sequence of all values to sweep that key across). See the
+        :func:`iter_sweep_points` function.
+    sweep_dirname : optional[str]
+        Absolute or relative dirname of the directory to save all sweep
+        configurations and results to. Defaults to ``None``, in which case
+        this is the ``SWEEP`` subdirectory of the directory containing the base
+        configuration.
+    jobs : optional[int]
+        Maximum number of points to simulate in parallel. Defaults to ``None``,
+        in which case this is the number of processors on this machine.
+
+    Returns
+    ----------
+    list
+        List of one ordered dictionary for each point of this grid, mapping
+        from the name of each summary metric to the value of that metric for
+        that point. See the :func:`get_phase_metrics` function.
+    '''
+
+    # Default all unpassed parameters.
+    if sweep_dirname is None:
+        sweep_dirname = pathnames.join(p.conf_dirname, 'SWEEP')
+
+    # Canonicalize and create this directory if needed.
+    sweep_dirname = dirs.canonicalize_and_make_unless_dir(sweep_dirname)
+
+    # List of all sweep points, validating this grid *BEFORE* running anything.
+    points = list(iter_sweep_points(grid))
+
+    # If all points share a seed and/or initialization.
+    is_seed_shared = is_sweep_seed_shareable(grid)
+    is_init_shared = is_seed_shared and is_sweep_init_shareable(grid)
+
+    logs.log_info(
+        'Sweeping %d parameter(s) across %d simulation(s) in "%s"...',
+        len(grid), len(points), sweep_dirname)
+
+    # Absolute filenames of all pickles shared between all points.
+    shared_filenames = []
+
+    # If sharing a seed, seed (and possibly initialize) the base configuration.
+    if is_seed_shared:
+        p_base = make_sweep_conf(
+            p=p, point={}, conf_dirname=pathnames.join(sweep_dirname, 'base'))
+        runner_base = SimRunner(p=p_base)
+
+        logs.log_info('Seeding cell cluster shared by all sweep runs...')
+        runner_base.seed()
+        shared_filenames.append(p_base.seed_pickle_filename)
+
+        if is_init_shared:
+            logs.log_info('Initializing cell cluster shared by all sweep runs...')
+            runner_base.init()
+            shared_filenames.append(p_base.init_pickle_filename)
+
+    # List of the absolute filenames of the configurations of all points.
+    conf_filenames = []
+
+    for point_index, point in enumerate(points):
+        p_point = make_sweep_conf(
+            p=p,
+            point=point,
+            conf_dirname=pathnames.join(
+                sweep_dirname, 'run_{:03d}'.format(point_index + 1)),
+        )
+
+        # Copy all shared pickles into the directory this point loads from.
+        for shared_filename in shared_filenames:
+            _copy_shared_pickle(
+                pickle_filename=shared_filename,
+                trg_dirname=p_point.init_pickle_dirname)
+
+        conf_filenames.append(p_point.conf_filename)
+
+    # List of all summary metrics for all points, in point order.
+    metrics = []
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=_get_mp_context()) as executor:
+        futures = [
+            executor.submit(
+                _run_sweep_point,
+                conf_filename,
+                not is_seed_shared,
+                not is_init_shared,
+            )
+            for conf_filename in conf_filenames
+        ]
+
+        for point_index, (point, future) in enumerate(zip(points, futures)):
+            point_metrics = OrderedDict()
+            point_metrics['run'] = point_index + 1
+            point_metrics.update(point)
+
+            try:
+                point_metrics.update(future.result())
+            except Exception as exception:
+                logs.log_warning(
+                    'Sweep run %d failed: %s', point_index + 1, exception)
+                point_metrics['status'] = 'failed'
+            else:
+                logs.log_info('Sweep run %d complete.', point_index + 1)
+
+            metrics.append(point_metrics)
+
+    # Tabulate these metrics.
+    summary_filename = pathnames.join(sweep_dirname, SWEEP_SUMMARY_BASENAME)
+    write_sweep_summary(filename=summary_filename, metrics=metrics)
+    logs.log_info('Sweep summary saved to "%s".', summary_filename)
+
+    return metrics
+
+
+@type_check
+def sweep_conf(conf_filename: str, jobs: IntOrNoneTypes = None) -> list:
+    '''
+    Run the parameter sweep configured by the YAML-formatted **sweep file**
+    with the passed filename, returning the table of per-run summary metrics
+    returned by the :func:`sweep` function.
+
+    This file is expected to define the following keys, where all relative
+    paths are relative to the directory containing this file:
+
+    * ``sim config``, the relative or absolute filename of the base
+      simulation configuration to be swept.
+    * ``parameters``, the sweep grid mapping from each ``/``-delimited sweep
+      key to the list of all values to sweep that option across.
+    * ``sweep directory``, the optional relative or absolute dirname of the
+      directory to save all sweep configurations and results to. Defaults to
+      the ``SWEEP`` subdirectory of the directory containing this file.
+
+    Parameters
+    ----------
+    conf_filename : str
+        Absolute or relative filename of this sweep file.
+    jobs : optional[int]
+        Maximum number of points to simulate in parallel. Defaults to ``None``,
+        in which case this is the number of processors on this machine.
+
+    Raises
+    ----------
+    BetseSimConfException
+        If this file fails to define a mandatory key.
+    '''
+
+    # Avoid circular import dependencies.
+    from betse.lib.yaml import yamls
+
+    # Low-level dictionary deserialized from this file.
+    conf = yamls.load(filename=conf_filename)
+
+    # If this file fails to define a mandatory key, raise an exception.
+    for key in ('sim config', 'parameters'):
+        if not isinstance(conf, MappingType) or key not in conf:
+            raise BetseSimConfException(
+                'Parameter sweep file "{}" key "{}" not found.'.format(
+                    conf_filename, key))
+
+    # Absolute dirname of the directory containing this file.
+    conf_dirname = pathnames.get_dirname(
+        pathnames.canonicalize(conf_filename))
+
+    # Base simulation configuration to be swept.
+    p = Parameters.make(pathnames.join(conf_dirname, conf['sim config']))
+
+    return sweep(
+        p=p,
+        grid=conf['parameters'],
+        sweep_dirname=pathnames.join(
+            conf_dirname, conf.get('sweep directory', 'SWEEP')),
+        jobs=jobs,
+    )
+
+
+@type_check
+def write_sweep_summary(filename: str, metrics: SequenceTypes) -> None:
+    '''
+    Serialize the passed per-run summary metrics to the CSV file with the
+    passed filename, one row per run and one column per metric.
+
+    Since runs may define differing metrics (e.g., failed runs, which define no
+    simulation metrics), columns are the ordered union of the metrics of all
+    runs. Metrics undefined by a run are empty in that row.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute or relative filename of the CSV file to be written. If this
+        file already exists, this file is silently overwritten.
+    metrics : SequenceTypes
+        Sequence of one dictionary for each run, mapping from the name of each
+        summary metric to the value of that metric for that run.
+    '''
+
+    # Ordered union of the names of all metrics of all runs.
+    column_names = OrderedDict()
+    for run_metrics in metrics:
+        column_names.update((name, None) for name in run_metrics.keys())
+
+    logs.log_debug('Writing CSV file: %s', filename)
+    dirs.make_parent_unless_dir(filename)
+
+    with open(filename, 'w', newline='') as csv_file:
+        csv_writer = csv.DictWriter(
+            csv_file, fieldnames=list(column_names.keys()), restval='')
+        csv_writer.writeheader()
+        csv_writer.writerows(metrics)
+
+
+@type_check
+def get_phase_metrics(phase: SimPhase) -> OrderedDict:
+    '''
+    Ordered dictionary of all **summary metrics** (i.e., scalars synopsizing
+    the final state of the passed simulation phase) of that phase.
+
+    These metrics include the mean, minimum, and maximum transmembrane voltage
+    across all cell membranes in millivolts as well as the mean concentration
+    of each ion across all cells in mmol/L at the last time step.
+    '''
+
+    sim = phase.sim
+
+    metrics = OrderedDict()
+    metrics['status'] = 'ok'
+    metrics['vmem_mean_mV'] = 1e3*float(np.mean(sim.vm))
+    metrics['vmem_min_mV'] = 1e3*float(np.min(sim.vm))
+    metrics['vmem_max_mV'] = 1e3*float(np.max(sim.vm))
+
+    for ion_index in range(len(sim.ionlabel)):
+        metrics['cell_{}_mmol/L'.format(sim.ionlabel[ion_index])] = float(
+            np.mean(sim.cc_cells[ion_index]))
+
+    return metrics
+
+# ....................{ MAKERS                            }....................
+@type_check
+def make_sweep_conf(
+    p: Parameters, point: MappingType, conf_dirname: str) -> Parameters:
+    '''
+    Save a copy of the passed base simulation configuration with all options
+    of the passed sweep point set to the corresponding values to a file with
+    the same basename in the passed directory, returning this copy.
+    '''
+
+    # Copy of this base configuration, preserving the base configuration.
+    p_point = Parameters.make(p.conf_filename)
+
+    for key, value in point.items():
+        set_sweep_option(conf=p_point.conf, key=key, value=value)
+
+    # Save this copy (and all subdirectories it requires) to this directory.
+    dirs.make_unless_dir(conf_dirname)
+    p_point.save(
+        conf_filename=pathnames.join(conf_dirname, p.conf_basename),
+        is_conf_file_overwritable=True,
+    )
+
+    # Reload this copy, redefining all options and paths derived from options.
+    p_point.load(p_point.conf_filename)
+
+    return p_point
+
+# ....................{ PRIVATE                           }....................
+def _copy_shared_pickle(pickle_filename: str, trg_dirname: str) -> None:
+    '''
+    Copy the shared phase pickle with the passed filename *and* the time series
+    directory of that pickle (if any) into the target directory with the
+    passed dirname.
+
+    Since pickles reference the files persisting their time series (e.g.,
+    ``init_1_series/vm_time.npy`` for ``init_1.betse.gz``) relative to the
+    directory containing those pickles, copying only a pickle would leave that
+    copy referencing nonexistent files.
+    '''
+
+    files.copy_overwritable(
+        src_filename=pickle_filename,
+        trg_filename=pathnames.join(
+            trg_dirname, pathnames.get_basename(pickle_filename)),
+    )
+
+    # Basename of the time series directory of this pickle, mirroring the
+    # Simulator._get_time_series_dirname() method.
+    series_basename = pathnames.get_pathname_sans_filetypes(
+        pathnames.get_basename(pickle_filename)) + '_series'
+    series_dirname = pathnames.join(
+        pathnames.get_dirname(pickle_filename), series_basename)
+
+    if dirs.is_dir(series_dirname):
+        dirs.copy_dir(
+            src_dirname=series_dirname,
+            trg_dirname=pathnames.join(trg_dirname, series_basename),
+            overwrite_policy=DirOverwritePolicy.OVERWRITE,
+        )
+
+
+def _get_mp_context() -> object:
+    '''
+    Multiprocessing context with which to create sweep subprocesses.
+
+    Where supported, subprocesses are forked to inherit the application
+    metadata and logging configuration of the current process; else, the
+    platform-specific default start method is used.
+    '''
+
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def _run_sweep_point(
+    conf_filename: str, is_seeding: bool, is_initing: bool) -> OrderedDict:
+    '''
+    Seed (if requested), initialize (if requested), and simulate the sweep
+    point whose simulation configuration is the file with the passed filename,
+    returning the summary metrics of that simulation.
+
+    This function is run in a sweep subprocess.
+    '''
+
+    start_time = time.time()
+
+    runner = SimRunner(p=Parameters.make(conf_filename))
+
+    if is_seeding:
+        runner.seed()
+    if is_initing:
+        runner.init()
+    phase = runner.sim()
+
+    metrics = get_phase_metrics(phase)
+    metrics['seconds'] = round(time.time() - start_time, 3)
+    return metrics
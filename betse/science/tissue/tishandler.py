@@ -1306,7 +1306,7 @@ class TissueHandler(object):
         # dd = dmem_x*cells.mem_vects_flat[:,2] + dmem_y*cells.mem_vects_flat[:,3]
         #
         # # strain is the divergence of the displacement:
-        # eta = np.dot(cells.M_sum_mems, dd*cells.mem_sa)/cells.cell_vol
+        # eta = cells.M_sum_mems.dot(dd*cells.mem_sa)/cells.cell_vol
 
         # self.active_NaStretch[self.targets_NaStretch] = tb.hill(sim.P_cells[cells.mem_to_cells][self.targets_NaStretch],
         #         self.NaStretch_halfmax,self.NaStretch_n)
@@ -97,7 +97,7 @@ Abstract base classes of all Matplotlib-based animation subclasses.
 # ....................{ IMPORTS                           }....................
 from betse.exceptions import BetseSimConfException
 from betse.lib.matplotlib.matplotlibs import mpl_config
-from betse.lib.matplotlib.writer import mplvideo
+from betse.lib.matplotlib.writer import mplblit, mplvideo
 from betse.lib.matplotlib.writer.mplcls import (
     ImageMovieWriter, NoopMovieWriter)
 from betse.science.enum.enumphase import SimPhaseKind
@@ -430,6 +430,71 @@ class AnimCellsABC(VisualCellsABC):
                     dpi=anim_config.video_dpi,
                 )
 
+        # If rendering frames by blitting, prepare to do so.
+        if anim_config.is_frames_fast:
+            self._init_saving_blitter()
+
+
+    def _init_saving_blitter(self) -> None:
+        '''
+        Initialize this animation to render each saved frame by blitting (i.e.,
+        by redrawing only the artists changing between frames over a cached
+        rendering of all other artists) if all enabled writers accept the
+        resulting raw RGBA frames *or* noop otherwise.
+
+        This method is intended to be called only by the :meth:`_init_saving`
+        method *after* initializing all writers.
+        '''
+
+        # If displaying this animation, noop. Interactive backends redraw the
+        # entire figure on displaying each frame regardless.
+        if self._is_show:
+            return
+        # Else if artists outside this animation's axes change between frames,
+        # the cached rendering of these artists would be stale. Noop.
+        elif not self._is_frames_blittable:
+            logs.log_debug(
+                'Rendering animation "%s" frames in full '
+                '(i.e., colorbar changes between frames)...', self._kind)
+            return
+
+        # Localize configuration subsections for convenience.
+        anim_config = self._phase.p.anim
+
+        # Tuple of all enabled writers and the DPI of each such writer.
+        writers = tuple(
+            writer for writer in (self._writer_images, self._writer_video)
+            if writer is not None)
+        writers_dpi = set(writer.dpi for writer in writers)
+
+        # If any such writer rejects raw RGBA frames (e.g., vector images,
+        # file-based video encoders), render frames in full instead.
+        if not all(mplblit.is_writer_rgba(writer) for writer in writers):
+            logs.log_debug(
+                'Rendering animation "%s" frames in full '
+                '(i.e., writers require Figure.savefig())...', self._kind)
+            return
+        # Else if these writers disagree on the DPI of these frames, these
+        # frames *CANNOT* be rendered only once. Render frames in full instead.
+        elif len(writers_dpi) > 1:
+            logs.log_warning(
+                'Animation fast frames ignored, '
+                'as image DPI %d differs from video DPI %d.',
+                anim_config.image_dpi, anim_config.video_dpi)
+            return
+
+        # Log this preparation.
+        logs.log_debug('Rendering animation "%s" frames fast...', self._kind)
+
+        # Blitter rendering all frames at the DPI of these writers.
+        self._frame_blitter = mplblit.FigureBlitter(
+            figure=self._figure,
+            axes=self._axes,
+            dpi=writers_dpi.pop(),
+            is_transparent=self._writer_savefig_kwargs.get(
+                'transparent', False),
+        )
+
     # ..................{ PROPERTIES                        }..................
     # Read-only properties, preventing callers from resetting these attributes.
 
@@ -442,6 +507,21 @@ class AnimCellsABC(VisualCellsABC):
 
         return self._time_step
 
+    # ..................{ PROPERTIES ~ private              }..................
+    @property
+    def _is_frames_blittable(self) -> bool:
+        '''
+        ``True`` only if all artists of this animation's figure *except* those
+        of its axes (e.g., colorbar, figure title) remain unchanged across all
+        frames, in which case these frames may be rendered by blitting.
+
+        Defaults to ``True``. Subclasses updating these artists between frames
+        (e.g., by autoscaling the colorbar to each frame) should redefine this
+        property to return ``False`` under those conditions.
+        '''
+
+        return True
+
     # ..................{ PREPARERS                         }..................
     # This method has been overridden to support subclasses that manually
     # handle animations rather than calling the _animate() method (e.g., the
@@ -526,6 +606,19 @@ class AnimCellsABC(VisualCellsABC):
         # Prepare for plotting immediately *BEFORE* plotting the first frame.
         self._prep_figure(*args, **kwargs)
 
+        # If rendering frames by blitting, iteratively plot and hence save
+        # each frame exactly once and finalize saving this animation. The
+        # "FuncAnimation" class is intentionally avoided, as the
+        # Animation.save() method both plots the first frame twice and fully
+        # redraws the figure after plotting each frame -- silently defeating
+        # the purpose of blitting.
+        if self._frame_blitter is not None:
+            for time_step in range(self._time_step_count):
+                self.plot_frame(time_step)
+
+            self.close()
+            return
+
         #FIXME: For efficiency, we should probably be passing "blit=True," to
         #FuncAnimation(). Unfortunately, doing so will necessitate
         #restructuring animations to conform to blitting-specific requirements,
@@ -749,3 +842,7 @@ class AnimCellsABC(VisualCellsABC):
 
             # Prevent this writer from being reused and break hard cycles.
             self._writer_video = None
+
+        # Prevent the blitter rendering frames for these writers if any from
+        # being reused and break hard cycles.
+        self._frame_blitter = None
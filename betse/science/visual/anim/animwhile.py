@@ -140,7 +140,7 @@ class AnimCellsWhileSolving(AnimCellsABC):
         #Cells.map_membranes_midpoint_to_cells_centre() method instead.
 
         # Vmem averaged over cell centres.
-        vm_o = np.dot(self._phase.cells.M_sum_mems, self._phase.sim.vm) / (
+        vm_o = self._phase.cells.M_sum_mems.dot(self._phase.sim.vm) / (
             self._phase.cells.num_mems)
 
         # self._cell_time_series = self.sim.vm_time
@@ -166,6 +166,13 @@ class AnimCellsWhileSolving(AnimCellsABC):
             color_data=cell_data,
         )
 
+    # ..................{ PROPERTIES ~ private              }..................
+    @property
+    def _is_frames_blittable(self) -> bool:
+
+        # If autoscaling colors, the colorbar is rescaled to each frame.
+        return not self._conf.is_color_autoscaled
+
     # ..................{ CONTEXTS                          }..................
     def __enter__(self) -> 'AnimCellsWhileSolving':
         '''
@@ -460,14 +460,15 @@ class LayerCellsColorfulABC(LayerCellsABC):
 
         # If colorbar autoscaling is enabled by this visual's configuration...
         if self._visual.conf.is_color_autoscaled:
-            # One-dimensional Numpy array of all colors flattened from this
-            # possibly multi-dimensional Numpy array of these values.
-            color_data_flat = self.color_data.ravel()
+            # Possibly multi-dimensional Numpy array or lazy vector view of
+            # these values. Since lazy views reduce each time step in turn,
+            # these values are reduced without flattening this array.
+            color_data = self.color_data
 
             # Set the minimum and maximum colors to the minimum and maximum
             # values in this array.
-            self._color_min = color_data_flat.min()
-            self._color_max = color_data_flat.max()
+            self._color_min = color_data.min()
+            self._color_max = color_data.max()
             # self._color_min = np.ma.min(color_data_flat)
             # self._color_max = np.ma.max(color_data_flat)
         # Else, colorbar autoscaling is disabled. In this case, set the minimum
@@ -64,7 +64,7 @@ class LayerCellsVectorDiscreteMembranesABC(LayerCellsVectorColorfulABC):
     # ..................{ SUPERCLASS                         }..................
     @property
     def color_data(self) -> SequenceOrNoneTypes:
-        return self._vector.times_membranes_vertex
+        return self._vector.times_membranes_vertex_lazy
 
 
     @type_check
@@ -72,7 +72,7 @@ class LayerCellsVectorDiscreteMembranesABC(LayerCellsVectorColorfulABC):
         # self._visual.axes.set_axis_bgcolor('black')
 
         # One-dimensional array of all membrane vertex data for this time step.
-        membranes_vertex = self._vector.times_membranes_vertex[
+        membranes_vertex = self._vector.times_membranes_vertex_lazy[
             self._visual.time_step]
 
         # List of triangulation meshes created by iteration below.
@@ -151,7 +151,7 @@ class LayerCellsVectorDiscreteMembranesFixed(
     def _layer_next(self) -> None:
 
         # One-dimensional array of all membrane vertex data for this time step.
-        membranes_vertex_data = self._vector.times_membranes_vertex[
+        membranes_vertex_data = self._vector.times_membranes_vertex_lazy[
             self._visual.time_step]
 
         # For the index and triangulation mesh for each cell...
@@ -38,7 +38,7 @@ class LayerCellsVectorSmoothGrids(LayerCellsVectorColorfulABC):
     # ..................{ SUPERCLASS                         }..................
     @property
     def color_data(self) -> SequenceOrNoneTypes:
-        return self._vector.times_grids_centre
+        return self._vector.times_grids_centre_lazy
 
 
     @type_check
@@ -49,7 +49,7 @@ class LayerCellsVectorSmoothGrids(LayerCellsVectorColorfulABC):
         self._surface_image = self._visual.axes.imshow(
             # Two-dimensional array of all grid data for this time step,
             # spatially situated at environmental grid space centres.
-            X=self._vector.times_grids_centre[self._visual.time_step],
+            X=self._vector.times_grids_centre_lazy[self._visual.time_step],
             # self._current_density_magnitude_time_series[self._visual.time_step],
 
             # Colormap converting input data values into output color values.
@@ -82,7 +82,7 @@ class LayerCellsVectorSmoothGrids(LayerCellsVectorColorfulABC):
         self._surface_image.set_data(
             # self._current_density_magnitude_time_series[-1])
             # self._current_density_magnitude_time_series[self._visual.time_step])
-            self._vector.times_grids_centre[self._visual.time_step])
+            self._vector.times_grids_centre_lazy[self._visual.time_step])
 
 
 class LayerCellsVectorSmoothRegions(LayerCellsVectorColorfulABC):
@@ -113,7 +113,7 @@ class LayerCellsVectorSmoothRegions(LayerCellsVectorColorfulABC):
     @property
     def color_data(self) -> SequenceOrNoneTypes:
 
-        return self._vector.times_regions_centre
+        return self._vector.times_regions_centre_lazy
 
 
     def _layer_first_color_mappables(self) -> IterableTypes:
@@ -125,7 +125,7 @@ class LayerCellsVectorSmoothRegions(LayerCellsVectorColorfulABC):
             self._phase.cells.mem_mids_flat[:,1])
 
         # Membrane midpoint-centred data for this time step.
-        membranes_midpoint_data = self._vector.times_membranes_midpoint[
+        membranes_midpoint_data = self._vector.times_membranes_midpoint_lazy[
             self._visual.time_step]
 
         # Gouraud-shaded triangulation mesh for this cell cluster, computed from
@@ -158,7 +158,7 @@ class LayerCellsVectorSmoothRegions(LayerCellsVectorColorfulABC):
     def _layer_next(self) -> None:
 
         # Membrane midpoint-centred data for this time step.
-        membranes_midpoint_data = self._vector.times_membranes_midpoint[
+        membranes_midpoint_data = self._vector.times_membranes_midpoint_lazy[
             self._visual.time_step]
 
         # Gouraud-shade this triangulation mesh with these color values.
@@ -412,7 +412,7 @@ def plotPrettyPolyData(data, sim, cells, p, fig=None, ax=None, clrAutoscale = Tr
             ax = plt.subplot(111)
 
         # data processing -- map to verts:
-        data_verts = np.dot(data, cells.matrixMap2Verts)
+        data_verts = cells.matrixMap2Verts.T.dot(data)
 
         # define colorbar limits for the PolyCollection
 
@@ -1018,8 +1018,8 @@ def cell_quiver(datax, datay, ax, cells, p):
     """
 
     if len(datax) == len(cells.mem_i):
-        Fx = np.dot(cells.M_sum_mems,datax)/cells.num_mems
-        Fy = np.dot(cells.M_sum_mems,datay)/cells.num_mems
+        Fx = cells.M_sum_mems.dot(datax)/cells.num_mems
+        Fy = cells.M_sum_mems.dot(datay)/cells.num_mems
     else:
         Fx = datax
         Fy = datay
@@ -1243,7 +1243,7 @@ def cell_mesh(data, ax, cells, p, clrmap):
 
     # If the data is defined on membrane midpoints get membrane midpoint coordinates
     if len(data) == len(cells.mem_i):
-        # data = np.dot(cells.M_sum_mems,data)/cells.num_mems
+        # data = cells.M_sum_mems.dot(data)/cells.num_mems
         xi = p.um*cells.mem_mids_flat[:,0]
         yi = p.um*cells.mem_mids_flat[:,1]
 
@@ -36,6 +36,7 @@ from betse.exceptions import BetseSimVisualException
 from betse.lib.matplotlib import mplfigure, mplutil
 from betse.lib.matplotlib.matplotlibs import mpl_config
 from betse.lib.matplotlib.mplzorder import ZORDER_PATCH, ZORDER_STREAM
+from betse.lib.matplotlib.writer import mplblit
 from betse.lib.numpy import nparray
 from betse.science.config.export.visual.confexpvisabc import SimConfVisualCellsABC
 from betse.science.math import mathunit
@@ -138,6 +139,11 @@ class VisualCellsABC(object, metaclass=ABCMeta):
 
     Attributes (Private: Saving)
     ----------
+    _frame_blitter : FigureBlitter
+        Matplotlib-specific object rendering each frame to be saved by
+        redrawing only the artists changing between frames if doing so *or*
+        ``None`` otherwise (i.e., if rendering each frame to be saved in full
+        via the :meth:`Figure.savefig` method).
     _writer_savefig_kwargs : dict
         Dictionary of all keyword arguments to be passed to the
         :meth:`Figure.savefig` method called to save each visual frame for
@@ -266,6 +272,7 @@ class VisualCellsABC(object, metaclass=ABCMeta):
 
         # Default all attributes to be subsequently defined.
         self._color_mappables = None
+        self._frame_blitter = None
         self._writer_frames = None
         self._writer_video = None
 
@@ -1060,17 +1067,27 @@ class VisualCellsABC(object, metaclass=ABCMeta):
         if not self._is_save:
             return
 
-        # If saving animation frames as images, save this frame as such.
-        if self._writer_images is not None:
-            self._writer_images.grab_frame(**self._writer_savefig_kwargs)
-
-        # If saving animation frames as video, save this frame as such.
-        if self._writer_video is not None:
-            # For debuggability, temporarily escalate the
-            # matplotlib-specific verbosity level.
-            with mpl_config.reducing_log_level_to_debug_if_info():
-                self._writer_video.grab_frame(
-                    **self._writer_savefig_kwargs)
+        # If rendering frames by blitting, render this frame exactly once and
+        # write the resulting pixels as is to all writers.
+        if self._frame_blitter is not None:
+            frame_rgba = self._frame_blitter.render()
+
+            for writer in (self._writer_images, self._writer_video):
+                if writer is not None:
+                    mplblit.grab_frame_rgba(writer, frame_rgba)
+        # Else, render this frame in full for each writer.
+        else:
+            # If saving animation frames as images, save this frame as such.
+            if self._writer_images is not None:
+                self._writer_images.grab_frame(**self._writer_savefig_kwargs)
+
+            # If saving animation frames as video, save this frame as such.
+            if self._writer_video is not None:
+                # For debuggability, temporarily escalate the
+                # matplotlib-specific verbosity level.
+                with mpl_config.reducing_log_level_to_debug_if_info():
+                    self._writer_video.grab_frame(
+                        **self._writer_savefig_kwargs)
 
         # If this is the last frame to be plotted, finalize all writers
         # *AFTER* instructing these writers to write this frame.
@@ -18,7 +18,12 @@ Subcommands accepted by this application's command line interface (CLI).
 from abc import ABCMeta
 from betse.util.py import pyident
 from betse.util.type.types import (
-    type_check, ArgParserType, ArgSubparsersType, SequenceTypes,)
+    type_check,
+    ArgParserType,
+    ArgSubparsersType,
+    SequenceTypes,
+    SequenceOrNoneTypes,
+)
 
 # ....................{ CLASSES ~ container               }....................
 class CLISubcommander(object):
@@ -381,15 +386,50 @@ class CLISubcommandParent(CLISubcommandABC):
 class CLISubcommandYAMLOnly(CLISubcommandABC):
     '''
     CLI subcommand accepting *only* a configuration filename as a passed
-    argument.
+    argument, optionally preceded by one or more subcommand-specific options.
+
+    Attributes
+    ----------
+    _options : SequenceTypes
+        Sequence of all subcommand-specific options accepted by this
+        subcommand, each an instance of a :class:`CLIOptionABC` subclass.
     '''
 
+    # ..................{ INITIALIZERS                      }..................
+    @type_check
+    def __init__(
+        self, *args, options: SequenceOrNoneTypes = None, **kwargs) -> None:
+        '''
+        Initialize this CLI subcommand.
+
+        Parameters
+        ----------
+        options : optional[SequenceTypes]
+            Sequence of all subcommand-specific options accepted by this
+            subcommand, each an instance of a :class:`CLIOptionABC` subclass.
+            Defaults to ``None``, in which case this subcommand accepts no
+            such options.
+
+        All remaining parameters are passed as is to the
+        :meth:`CLISubcommandABC.__init__` method.
+        '''
+
+        # Initialize our superclass with all passed parameters.
+        super().__init__(*args, **kwargs)
+
+        # Classify all remaining parameters.
+        self._options = options if options is not None else ()
+
     # ..................{ ADDERS                            }..................
     def add(self, *args, **kwargs) -> ArgParserType:
 
         # Subcommand argument subparser added by our superclass.
         arg_subparser = super().add(*args, **kwargs)
 
+        # Add all subcommand-specific options to this subparser.
+        for option in self._options:
+            option.add(arg_subparser)
+
         # Configure this subparser to require a configuration file argument.
         arg_subparser.add_argument(
             'conf_filename',
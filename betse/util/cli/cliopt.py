@@ -427,6 +427,25 @@ class CLIOptionArgEnum(CLIOptionArgABC):
         })
 
 
+class CLIOptionArgInt(CLIOptionArgABC):
+    '''
+    CLI option persisting an optional integer argument into an instance
+    variable of type :class:`int`.
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    @type_check
+    def __init__(self, *args, **kwargs) -> None:
+
+        # Initialize our superclass with the passed arguments.
+        super().__init__(*args, **kwargs)
+
+        # Convert this option's string argument into an integer.
+        self._add_argument_kwargs.update({
+            'type': int,
+        })
+
+
 class CLIOptionArgStr(CLIOptionArgABC):
     '''
     CLI option persisting an optional string argument of arbitrary format into
@@ -158,7 +158,7 @@ def is_special(pathname: str) -> bool:
     '''
 
     # Avoid circular import dependencies.
-    from betse.util.file import files
+    from betse.util.path import files
 
     # True if this path exists and...
     return is_path(pathname) and (
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Global benchmark configuration for this subpackage.
+
+``py.test`` implicitly imports all functionality defined by this module into
+all benchmark modules of this subpackage, including the autouse fixture
+skipping these benchmarks unless the ``--bench`` option is passed.
+'''
+
+# ....................{ IMPORTS ~ fixture                 }....................
+from betse_test.fixture.bencher import betse_bench, betse_bench_dirname
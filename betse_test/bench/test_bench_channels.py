@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Benchmarks timing the **gating kinetics** (i.e., voltage-dependent equilibrium
+values and time constants of the m and h gates) of all voltage-gated channel
+classes defined by the :mod:`betse.science.channels` subpackage, evaluated
+either analytically or by interpolation from precomputed gating tables.
+
+Each benchmark logs the wall time consumed per time step by each channel class
+in both modes, permitting regressions in either mode to be detected. Since
+gating tables exist only for numerical robustness, neither mode is expected to
+be faster than the other. Benchmarks are skipped unless the ``--bench`` option
+is passed.
+
+Further benchmarks time multiple instances of the same channel class (e.g.,
+the same channel applied to multiple tissue profiles), run either in isolation
+or batched by the :mod:`betse.science.channels.channelsbatch` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+import pytest
+
+# ....................{ TESTS                             }....................
+@pytest.mark.parametrize('channel_module_name', (
+    'cation',
+    'vg_ca',
+    'vg_cl',
+    'vg_funny',
+    'vg_k',
+    'vg_morrislecar',
+    'vg_na',
+))
+def test_bench_channels_gating(channel_module_name: str) -> None:
+    '''
+    Benchmark running all concrete channel classes defined by the
+    :mod:`betse.science.channels` submodule with the passed name with gating
+    tables both disabled and enabled.
+
+    Parameters
+    ----------
+    channel_module_name : str
+        Unqualified name of this submodule.
+    '''
+
+    # Defer heavyweight imports.
+    import inspect, time
+    import numpy as np
+    from betse.science.channels.channelsabc import ChannelsABC
+    from betse.util.io.log import logs
+    from importlib import import_module
+    from types import SimpleNamespace
+
+    # Number of membranes and time steps to be simulated.
+    MEMS_COUNT = 10000
+    TIME_STEPS = 20
+
+    # Submodule defining these channels.
+    channel_module = import_module(
+        'betse.science.channels.' + channel_module_name)
+
+    # Minimal cell cluster and transmembrane voltages [V] for these membranes,
+    # normally distributed about a typical resting potential.
+    cells = SimpleNamespace(mem_i=np.arange(MEMS_COUNT))
+    vm_times = -0.070 + 0.010*np.random.RandomState(0).randn(
+        TIME_STEPS + 1, MEMS_COUNT)
+
+    # For each concrete channel class defined by this submodule...
+    for channel_name, channel_cls in inspect.getmembers(
+        channel_module, inspect.isclass):
+        if (
+            not issubclass(channel_cls, ChannelsABC) or
+            inspect.isabstract(channel_cls) or
+            channel_cls.__module__ != channel_module.__name__
+        ):
+            continue
+
+        # Time per step in seconds and final open probabilities of this channel
+        # with gating tables disabled and enabled.
+        step_times = []
+        channel_probs = []
+        for is_tabled in (False, True):
+            p = SimpleNamespace(
+                dt=1e-4,
+                is_channel_gating_tabled=is_tabled,
+                channel_gating_vmem_min=-150.0,
+                channel_gating_vmem_max=100.0,
+                channel_gating_vmem_step=0.05,
+                channel_gating_tolerance=1e-4,
+            )
+            channel = channel_cls()
+            channel.init(vm_times[0], cells, p, targets=cells.mem_i)
+
+            time_start = time.perf_counter()
+            for vm in vm_times[1:]:
+                channel.run(vm, p)
+            step_times.append((time.perf_counter() - time_start)/TIME_STEPS)
+            channel_probs.append(channel.P)
+
+        # Assert both modes to produce the same open probabilities to within
+        # the accuracy of gating tables.
+        assert np.allclose(channel_probs[0], channel_probs[1], atol=1e-5)
+
+        # Log the time consumed per step in both modes.
+        logs.log_info(
+            'Channel "%s" per step: analytic %.1f us, tabled %.1f us.',
+            channel_name, 1e6*step_times[0], 1e6*step_times[1])
+
+
+@pytest.mark.parametrize(('mems_count', 'channels_count'), (
+    (1000, 8),
+    (10000, 8),
+    (10000, 32),
+    (100000, 4),
+))
+def test_bench_channels_batch(mems_count: int, channels_count: int) -> None:
+    '''
+    Benchmark running the passed number of instances of the same channel class,
+    each targeting a disjoint subset of the passed number of membranes, both
+    in isolation and batched.
+
+    Parameters
+    ----------
+    mems_count : int
+        Number of membranes.
+    channels_count : int
+        Number of channel instances partitioning these membranes.
+    '''
+
+    # Defer heavyweight imports.
+    import time
+    import numpy as np
+    from betse.science.channels.channelsbatch import batch_channels
+    from betse.science.channels.vg_k import Kv1p5
+    from betse.util.io.log import logs
+    from types import SimpleNamespace
+
+    # Number of time steps to be simulated.
+    TIME_STEPS = 20
+
+    # Minimal cell cluster, simulation configuration and transmembrane
+    # voltages [V] normally distributed about a typical resting potential.
+    cells = SimpleNamespace(mem_i=np.arange(mems_count))
+    p = SimpleNamespace(dt=1e-4, is_channel_gating_tabled=False)
+    rand = np.random.RandomState(0)
+    vm_times = -0.070 + 0.010*rand.randn(TIME_STEPS + 1, mems_count)
+
+    # Targets of each channel, randomly partitioning these membranes.
+    channels_targets = [
+        np.sort(targets) for targets in np.array_split(
+            rand.permutation(mems_count), channels_count)]
+
+    # Time per step in seconds and final open probabilities of these channels
+    # run in isolation and batched.
+    step_times = []
+    channels_probs = []
+    for is_batched in (False, True):
+        channels = []
+        for targets in channels_targets:
+            channel = Kv1p5()
+            channel.init(vm_times[0], cells, p, targets=targets)
+            channels.append(channel)
+        channel_runners = (
+            batch_channels(channels) if is_batched else channels)
+
+        time_start = time.perf_counter()
+        for vm in vm_times[1:]:
+            for channel_runner in channel_runners:
+                channel_runner.run(vm, p)
+        step_times.append((time.perf_counter() - time_start)/TIME_STEPS)
+        channels_probs.append([channel.P.copy() for channel in channels])
+
+    # Assert both modes to produce the same open probabilities.
+    for channel_probs_isolated, channel_probs_batched in zip(*channels_probs):
+        assert np.array_equal(channel_probs_isolated, channel_probs_batched)
+
+    # Log the time consumed per step in both modes.
+    logs.log_info(
+        '%d membranes, %d channels per step: '
+        'isolated %.1f us, batched %.1f us (%.2fx).',
+        mems_count, channels_count, 1e6*step_times[0], 1e6*step_times[1],
+        step_times[0]/step_times[1])
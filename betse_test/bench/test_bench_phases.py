@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Benchmarks timing and measuring the peak memory of the **seed**,
+**initialization**, **simulation** and **export** phases of the minified
+simulation configuration across world sizes, extracellular spaces, ion profiles
+and networks.
+
+Each benchmark runs each phase in its own subprocess via the
+:mod:`betse.science.simbench` submodule, logs the wall time and peak resident
+set size (RSS) of each phase and saves these results as JSON. Benchmarks are
+skipped unless the ``--bench`` option is passed. Results are saved to the
+temporary directory of each benchmark unless the ``--bench-dir`` option is
+also passed, in which case results accumulate in that directory across
+commits, permitting regressions in any phase to be compared across commits
+(e.g., with ``betse bench --baseline``).
+'''
+
+# ....................{ IMPORTS                           }....................
+import pytest
+
+# ....................{ TESTS                             }....................
+@pytest.mark.parametrize('is_networks', (False, True))
+@pytest.mark.parametrize('ion_profile_name', ('BASIC', 'MAMMAL'))
+@pytest.mark.parametrize('is_ecm', (False, True))
+@pytest.mark.parametrize('world_size', (100e-6, 200e-6))
+def test_bench_phases(
+    betse_sim_conf: 'SimConfTestInternal',
+    betse_bench_dirname: 'StrOrNoneTypes',
+    world_size: float,
+    is_ecm: bool,
+    ion_profile_name: str,
+    is_networks: bool,
+) -> None:
+    '''
+    Benchmark all phases of the minified simulation configuration modified by
+    the passed parameters.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    betse_bench_dirname : StrOrNoneTypes
+        Absolute dirname of the directory to save these results to if the
+        ``--bench-dir`` option was passed *or* ``None`` otherwise, in which
+        case these results are saved to the directory of this configuration.
+    world_size : float
+        Square dimension in meters of the world to be seeded.
+    is_ecm : bool
+        ``True`` only if extracellular spaces are to be simulated.
+    ion_profile_name : str
+        Name of the :class:`betse.science.enum.enumconf.IonProfileType` member
+        of the ion profile to be simulated.
+    is_networks : bool
+        ``True`` only if biochemical reaction and gene regulatory networks are
+        to be simulated.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.science import simbench
+    from betse.science.enum.enumconf import IonProfileType
+    from betse.util.io.log import logs
+    from betse.util.path import pathnames
+
+    # Modify and save the minified configuration, as each phase reloads this
+    # configuration in its own subprocess.
+    betse_sim_conf.config.environment_size = world_size
+    betse_sim_conf.p.is_ecm = is_ecm
+    betse_sim_conf.p.ion_profile = IonProfileType[ion_profile_name]
+    if is_networks:
+        betse_sim_conf.config.enable_networks()
+    betse_sim_conf.p.save_inplace()
+
+    with betse_sim_conf.context():
+        results = simbench.bench(
+            p=betse_sim_conf.p,
+            bench_dirname=(
+                betse_bench_dirname or
+                pathnames.join(betse_sim_conf.conf_dirname, 'BENCH')),
+        )
+
+    # Assert all phases to have succeeded with sane metrics.
+    run = results['runs'][0]
+    assert run['status'] == 'ok'
+    assert tuple(run['phases']) == simbench.BENCH_PHASE_NAMES
+    assert run['phases']['seed']['cells'] > 0
+
+    # Log the wall time and peak RSS of each phase.
+    logs.log_info(
+        '%d cells (%g um world, ECM %s, %s ions, networks %s):',
+        run['phases']['seed']['cells'],
+        world_size*1e6, is_ecm, ion_profile_name, is_networks)
+    for phase_name, phase_metrics in run['phases'].items():
+        assert phase_metrics['seconds'] >= 0
+        logs.log_info(
+            '  %s: %.2f s, %s MiB peak RSS',
+            phase_name, phase_metrics['seconds'], phase_metrics['peak_rss_mb'])
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Benchmarks timing the **seed phase** (i.e., creation of the cell cluster by the
+:meth:`betse.science.simrunner.SimRunner.seed` method) across world sizes.
+
+Each benchmark logs the wall time consumed per 1,000 cells, permitting
+seeding regressions to be detected as superlinear growth in that time with
+world size. Since fixed overhead dominates that time for the smallest worlds
+(i.e., hundreds of cells), the largest worlds seed thousands of cells to expose
+how seeding actually scales. Benchmarks are skipped unless the ``--bench``
+option is passed.
+'''
+
+# ....................{ IMPORTS                           }....................
+import pytest
+
+# ....................{ TESTS                             }....................
+@pytest.mark.parametrize('world_size', (100e-6, 200e-6, 500e-6, 1000e-6))
+def test_bench_seed(
+    betse_sim_conf: 'SimConfTestInternal', world_size: float) -> None:
+    '''
+    Benchmark seeding a cell cluster in a square world of the passed size.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    world_size : float
+        Square dimension in meters of the world to be seeded.
+    '''
+
+    # Defer heavyweight imports.
+    import time
+    from betse.science.parameters import Parameters
+    from betse.science.simrunner import SimRunner
+    from betse.util.io.log import logs
+
+    # Seed a world of this size, reusing the minified configuration otherwise.
+    # Since the world size is consumed only on loading this configuration, this
+    # configuration is saved and reloaded first.
+    betse_sim_conf.config.environment_size = world_size
+    betse_sim_conf.p.save_inplace()
+    p = Parameters.make(conf_filename=betse_sim_conf.conf_filename)
+
+    with betse_sim_conf.context():
+        time_start = time.perf_counter()
+        phase = SimRunner(p=p).seed()
+        time_seed = time.perf_counter() - time_start
+
+    # Log the time consumed per 1,000 cells.
+    cells_count = len(phase.cells.cell_i)
+    assert cells_count > 0
+    logs.log_info(
+        'Seeded %d cells in a %g um world in %.2f s (%.2f s per 1k cells).',
+        cells_count, world_size*1e6, time_seed, 1000*time_seed/cells_count)
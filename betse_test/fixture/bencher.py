@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Fixtures gating all benchmarks defined by the :mod:`betse_test.bench`
+subpackage behind the ``--bench`` option *and* locating the results of these
+benchmarks.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.util.type.types import StrOrNoneTypes
+from pytest import fixture
+
+# ....................{ FIXTURES                          }....................
+# Test-scope fixture automatically run for each benchmark, as imported by the
+# "betse_test.bench.conftest" plugin.
+@fixture(autouse=True)
+def betse_bench(request: '_pytest.python.FixtureRequest') -> None:
+    '''
+    Per-test fixture skipping the benchmark requesting this fixture unless the
+    ``--bench`` option was passed to the :mod:`pytest` command.
+
+    Benchmarks are both slow *and* meaningful only when run in isolation on
+    an otherwise idle machine, and are thus excluded from the default test
+    suite.
+
+    Parameters
+    ----------
+    request : _pytest.python.FixtureRequest
+        Builtin fixture describing the parent fixture or test of this fixture.
+    '''
+
+    # Defer heavyweight imports.
+    import pytest
+
+    # If benchmarks were not requested, skip this benchmark.
+    if not request.config.getoption('is_bench'):
+        pytest.skip('Benchmark disabled (i.e., "--bench" not passed).')
+
+
+# Test-scope fixture creating and returning a new object for each unique test.
+@fixture
+def betse_bench_dirname(
+    request: '_pytest.python.FixtureRequest') -> StrOrNoneTypes:
+    '''
+    Per-test fixture returning the absolute dirname of the directory to which
+    the benchmark requesting this fixture saves its results if the
+    ``--bench-dir`` option was passed *or* ``None`` otherwise, in which case
+    that benchmark saves its results to a temporary directory.
+
+    This directory is the subdirectory of the directory passed to that option
+    named after that benchmark and its parameters (e.g.,
+    ``test_bench_phases-0.0001-False-BASIC-False``). Since the results of each
+    benchmark are saved to a file named after the current Git commit, results
+    saved at different commits accumulate in the same directory for
+    subsequent comparison (e.g., with ``betse bench --baseline``).
+
+    Parameters
+    ----------
+    request : _pytest.python.FixtureRequest
+        Builtin fixture describing the parent fixture or test of this fixture.
+    '''
+
+    # Defer heavyweight imports.
+    import re
+    from betse.util.path import pathnames
+
+    # Dirname passed to the "--bench-dir" option if any.
+    bench_dirname = request.config.getoption('bench_dirname')
+
+    # If this option was *NOT* passed, defer to a temporary directory.
+    if bench_dirname is None:
+        return None
+
+    # Basename of this subdirectory, replacing all characters of the name of
+    # this benchmark unsafe in pathnames (e.g., "[", "]") by hyphens.
+    bench_basename = re.sub(r'[^\w.]+', '-', request.node.name).strip('-')
+
+    # Return the absolute dirname of this subdirectory.
+    return pathnames.join(pathnames.canonicalize(bench_dirname), bench_basename)
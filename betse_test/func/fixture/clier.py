@@ -141,6 +141,53 @@ class CLITester(object):
             Further details on arguments accepted by the BETSE CLI.
         '''
 
+        # Run the BETSE CLI subcommand corresponding to these arguments,
+        # capturing the exit status of that subcommand for testing.
+        exit_status, args_evolved = self._run(*args)
+
+        # If this exit status signifies failure, fail the current test.
+        assert cmdexit.is_success(exit_status), (
+            'BETSE CLI failed with exit status {} '
+            'given arguments: {}'.format(exit_status, args_evolved))
+
+
+    @type_check
+    def run_failing(self, *args: str) -> None:
+        '''
+        Run the BETSE CLI with the passed positional string arguments, extended
+        by the mandatory positional string arguments defined by the
+        :data:`_CLI_OPTIONS_MANDATORY` tuple global, expected to fail.
+
+        Parameters
+        ----------
+        args : Tuple[str]
+            Tuple of zero or more arguments to be passed to this entry point.
+
+        See Also
+        ----------
+        :meth:`run`
+            Further details.
+        '''
+
+        # Run the BETSE CLI subcommand corresponding to these arguments,
+        # capturing the exit status of that subcommand for testing.
+        exit_status, args_evolved = self._run(*args)
+
+        # If this exit status signifies success, fail the current test.
+        assert cmdexit.is_failure(exit_status), (
+            'BETSE CLI unexpectedly succeeded '
+            'given arguments: {}'.format(args_evolved))
+
+
+    def _run(self, *args: str) -> tuple:
+        '''
+        Run the BETSE CLI with the passed positional string arguments, extended
+        by the mandatory positional string arguments defined by the
+        :data:`_CLI_OPTIONS_MANDATORY` tuple global, returning the 2-tuple
+        ``(exit_status, args_evolved)`` of the exit status of this CLI and the
+        extended arguments passed to this CLI.
+        '''
+
         # Defer heavyweight imports to their point of use.
         from betse.__main__ import main
         from betse.util.app.meta import appmetaone
@@ -155,14 +202,8 @@ class CLITester(object):
         args_evolved = _CLI_OPTIONS_MANDATORY + args
         # print('BETSE arg list: {}'.format(arg_list))
 
-        # Run the BETSE CLI subcommand corresponding to these arguments,
-        # capturing the exit status of that subcommand for testing.
-        exit_status = main(args_evolved)
-
-        # If this exit status signifies failure, fail the current test.
-        assert cmdexit.is_success(exit_status), (
-            'BETSE CLI failed with exit status {} '
-            'given arguments: {}'.format(exit_status, args_evolved))
+        # Run the BETSE CLI subcommand corresponding to these arguments.
+        return main(args_evolved), args_evolved
 
 # ....................{ FIXTURES                           }....................
 # Test-scope fixture creating and returning a new object for each unique test.
@@ -46,6 +46,31 @@ def test_cli_sim_full_ecm(betse_cli_sim: 'CLISimTester') -> None:
     betse_cli_sim.run_subcommands_try()
 
 
+def test_cli_sim_full_export_parallel(betse_cli_sim: 'CLISimTester') -> None:
+    '''
+    Functional test exporting all available exports (e.g., CSVs, plots,
+    animations) with all simulation features required by these exports in
+    parallel across multiple forked processes, including the full solver but
+    excluding extracellular spaces.
+
+    Parameters
+    ----------
+    betse_cli_sim : CLISimTester
+        Object running BETSE CLI simulation subcommands.
+    '''
+
+    # Enable all exports and features required by these exports, excluding ECM.
+    betse_cli_sim.sim_state.config.enable_solver_full_exports_noecm()
+
+    # Test all simulation-specific subcommands with this configuration,
+    # exporting in parallel.
+    betse_cli_sim.run_subcommands(
+        *betse_cli_sim.SUBCOMMANDS_SIM,
+        ('plot', 'init', '--jobs', '2'),
+        ('plot', 'sim', '--jobs', '2'),
+    )
+
+
 def test_cli_sim_full_vg_ions(betse_cli_sim: 'CLISimTester') -> None:
     '''
     Functional test simulating all voltage-gated ion channels (e.g., sodium,
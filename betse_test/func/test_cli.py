@@ -75,6 +75,41 @@ def test_cli_config(
     # Assert this file to have been created.
     assert sim_config_filepath.check(file=1)
 
+
+def test_cli_jobs_negative(
+    betse_cli: 'CLITester',
+    betse_temp_dir: 'LocalPath',
+    capfd: '_pytest.capture.CaptureFixture',
+) -> None:
+    '''
+    Test the ``betse sweep`` subcommand to reject a negative ``--jobs`` option
+    with a human-readable error.
+
+    Parameters
+    ----------
+    betse_cli : CLITester
+        Object encapsulating the BETSE CLI.
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to the current
+        test.
+    capfd : _pytest.capture.CaptureFixture
+        Builtin fixture capturing all output to the stdout and stderr file
+        descriptors.
+    '''
+
+    # Absolute path of a sweep file in this temporary directory.
+    sweep_filepath = betse_temp_dir.join('sweep.yaml')
+    sweep_filepath.write(
+        'sim config: sim_config.yaml\n'
+        'parameters:\n'
+        '  sim time settings/total time: [1.0]\n'
+    )
+
+    # Assert this subcommand to fail with an error describing this option.
+    betse_cli.run_failing('sweep', '--jobs', '-1', str(sweep_filepath))
+    assert 'Option "--jobs" value -1 invalid' in ''.join(
+        capfd.readouterr())
+
 # ....................{ TESTS ~ parametrized              }....................
 @pytest.mark.parametrize(
     ('profile_type',), (
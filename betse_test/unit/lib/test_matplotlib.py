@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.lib.matplotlib` subpackage.
+'''
+
+# ....................{ IMPORTS                           }....................
+from py._path.local import LocalPath
+
+# ....................{ TESTS                             }....................
+def test_matplotlib_blitter(betse_temp_dir: LocalPath) -> None:
+    '''
+    Test that the :class:`betse.lib.matplotlib.writer.mplblit.FigureBlitter`
+    class renders each frame of an animation and the
+    :class:`betse.lib.matplotlib.writer.mplcls.ImageMovieWriter` class writes
+    these frames exactly as the :meth:`Figure.savefig` method would.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.lib.matplotlib.writer import mplblit
+    from betse.lib.matplotlib.writer.mplcls import ImageMovieWriter
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    # Figure whose axes are overlaid by an image and collection animated
+    # between frames, whose spines and ticks thus overlay that image.
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot(111)
+    image = axes.imshow(np.zeros((4, 4)), extent=(0, 1, 0, 1), vmin=0, vmax=1)
+    collection = axes.scatter((0.25, 0.75), (0.25, 0.75), c=(0.0, 1.0))
+    figure.colorbar(image)
+
+    # Blitter and writer of these frames, which write frames transparently.
+    blitter = mplblit.FigureBlitter(
+        figure=figure, axes=axes, dpi=50, is_transparent=True)
+    writer = ImageMovieWriter()
+    writer.setup(
+        fig=figure, outfile=str(betse_temp_dir.join('frame_{:02d}.png')),
+        dpi=50)
+    assert mplblit.is_writer_rgba(writer)
+
+    for frame in range(3):
+        # Animate all dynamic artists for this frame.
+        axes.set_title('Frame {}'.format(frame))
+        image.set_data(np.full((4, 4), frame / 2))
+        collection.set_array(np.array((frame / 2, 1 - frame / 2)))
+
+        # Render and write this frame by blitting.
+        mplblit.grab_frame_rgba(writer, blitter.render())
+
+        # Render and write this frame in full.
+        frame_full_filename = betse_temp_dir.join('full_{:02d}.png'.format(frame))
+        figure.savefig(
+            str(frame_full_filename), format='png', dpi=50, transparent=True)
+
+        # Assert these frames to be byte-for-byte identical.
+        frame_blit_filename = betse_temp_dir.join('frame_{:02d}.png'.format(frame))
+        assert frame_blit_filename.read_binary() == (
+            frame_full_filename.read_binary())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.cache` subpackage.
+'''
+
+# ....................{ TESTS                             }....................
+def test_cache_lru_vector() -> None:
+    '''
+    Unit test that the :class:`betse.science.math.cache.cachelru.SimPhaseCacheLRU`
+    class evicts the least recently used vector arrays on exceeding its byte
+    budget *and* that lazy vector views interpolate only the requested time
+    step of arrays exceeding that budget.
+    '''
+
+    # Defer heavyweight imports.
+    import gc
+    import numpy as np
+    from betse.science.cells import Cells
+    from betse.science.math.cache.cachelru import SimPhaseCacheLRU
+    from betse.science.math.vector.veccls import VectorCellsCache
+    from betse.science.phase.phasecls import SimPhase
+    from types import SimpleNamespace
+
+    # Minimal simulation phase whose cell cluster maps 1000 cells onto 1200
+    # Voronoi regions, bypassing the costly seeding of a full cell cluster.
+    cells = Cells.__new__(Cells)
+    cells.voronoi_centres = np.zeros((1200, 2))
+    cells.cell_to_grid = np.arange(100, 1100)
+    phase = SimPhase.__new__(SimPhase)
+    phase.cells = cells
+    phase.p = SimpleNamespace(export_cache_size_mb=1)
+    phase.cache = SimpleNamespace(lru=SimPhaseCacheLRU(phase))
+    lru = phase.cache.lru
+
+    # Cell data for 128 time steps, occupying slightly less than 1MiB. The
+    # same data mapped onto regions occupies slightly more than 1MiB.
+    times_cells_centre = np.random.RandomState(0xCAC4E).rand(128, 1000)
+    times_regions_centre = np.zeros((128, 1200))
+    times_regions_centre[:, 100:1100] = times_cells_centre
+    vector = VectorCellsCache(
+        phase=phase, times_cells_centre=times_cells_centre)
+
+    # Assert a lazy view of region data exceeding this budget to interpolate
+    # only requested time steps without caching the full array.
+    regions_lazy = vector.times_regions_centre_lazy
+    assert len(regions_lazy) == 128
+    assert np.array_equal(regions_lazy[7], times_regions_centre[7])
+    assert np.array_equal(regions_lazy[-1], times_regions_centre[-1])
+    assert regions_lazy.min() == times_regions_centre.min()
+    assert regions_lazy.max() == times_regions_centre.max()
+    assert not vector.is_times_cached('times_regions_centre')
+    assert len(lru) == 0
+
+    # Assert cell data within this budget to be cached and introspectable.
+    # Since this data is the original data retained by this vector regardless
+    # of eviction, this data occupies no space in this cache.
+    assert vector.times_cells_centre is times_cells_centre
+    assert vector.is_times_cached('times_cells_centre')
+    assert len(lru) == 1
+    assert lru.size == 0
+
+    # Assert that caching the full region data evicts the least recently used
+    # cell data but preserves the region data exceeding this budget by itself.
+    assert np.array_equal(vector.times_regions_centre, times_regions_centre)
+    assert not vector.is_times_cached('times_cells_centre')
+    assert vector.is_times_cached('times_regions_centre')
+    assert lru.size == times_regions_centre.nbytes
+
+    # Assert the lazy view now indexes the cached region data.
+    assert np.shares_memory(regions_lazy[3], vector.times_regions_centre)
+
+    # Assert that clearing this cache evicts all arrays.
+    lru.clear()
+    assert len(lru) == 0
+    assert lru.size == 0
+    assert not vector.is_times_cached('times_regions_centre')
+
+    # Assert that a lazy view of data within a larger budget caches that data.
+    phase.p.export_cache_size_mb = 4
+    vector = VectorCellsCache(
+        phase=phase, times_cells_centre=times_cells_centre)
+    assert np.array_equal(
+        vector.times_regions_centre_lazy[7], times_regions_centre[7])
+    assert vector.is_times_cached('times_regions_centre')
+    assert len(lru) == 2
+
+    # Assert that garbage-collecting a vector unregisters its cached arrays.
+    del vector
+    gc.collect()
+    assert len(lru) == 0
+
+
+def test_cache_lru_size(tmpdir: 'LocalPath') -> None:
+    '''
+    Unit test that the :class:`betse.science.math.cache.cachelru.SimPhaseCacheLRU`
+    class sizes only the memory that evicting cached objects would free,
+    excluding memory-mapped arrays, arrays viewing simulation data, and
+    arrays retained by live attributes of the objects caching these arrays.
+
+    Parameters
+    ----------
+    tmpdir : LocalPath
+        Builtin fixture object encapsulating a temporary directory.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math.cache.cachelru import (
+        PHASE_PROPERTY_CACHED_VAR_NAME_PREFIX, SimPhaseCacheLRU)
+    from betse.science.phase.phasecls import SimPhase
+    from types import SimpleNamespace
+
+    # Minimal simulation phase whose simulator samples a single time series.
+    phase = SimPhase.__new__(SimPhase)
+    phase.p = SimpleNamespace(export_cache_size_mb=1)
+    phase.sim = SimpleNamespace(vm_time=np.ones((64, 1000)))
+    phase.cache = SimpleNamespace(lru=SimPhaseCacheLRU(phase))
+    lru = phase.cache.lru
+
+    # Memory-mapped array, viewed as a non-memory-mapped array.
+    mmap_filename = str(tmpdir.join('times.npy'))
+    np.save(mmap_filename, np.ones((64, 1000)))
+    times_mmap = np.asarray(np.load(mmap_filename, mmap_mode='c'))
+    assert not isinstance(times_mmap, np.memmap)
+
+    class _Owner(object):
+        '''
+        Weakly referenceable object caching arrays.
+        '''
+
+        pass
+
+    # Object caching arrays, retaining one such array as a live attribute.
+    times_live = np.ones((64, 1000))
+    owner = _Owner()
+    owner._times_live = times_live
+
+    def cache(var_name: str, value: object) -> None:
+        '''
+        Cache the passed value as the variable of this object with the passed
+        name, prefixed as if cached by the @phase_property_cached decorator.
+        '''
+
+        var_name = PHASE_PROPERTY_CACHED_VAR_NAME_PREFIX + var_name
+        setattr(owner, var_name, value)
+        lru.add(owner, var_name)
+
+    # Assert arrays whose memory evicting these arrays fails to free to occupy
+    # no space in this cache.
+    cache('mmap', times_mmap[::2])
+    cache('sim', phase.sim.vm_time[:32])
+    cache('live', times_live.T)
+    assert len(lru) == 3
+    assert lru.size == 0
+
+    # Assert a new array to occupy the space of that array, counted once
+    # regardless of the number of views of that array.
+    times_new = np.ones((32, 1000))
+    cache('new', (times_new, times_new[1:]))
+    assert lru.size == times_new.nbytes
+
+    # Assert that exceeding this budget evicts all least recently used
+    # arrays, preserving only the most recently used array.
+    times_big = np.ones((112, 1000))
+    cache('big', times_big)
+    assert len(lru) == 1
+    assert lru.size == times_big.nbytes
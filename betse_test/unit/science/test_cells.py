@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.cells` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_cells_map_cells_centre_to_points() -> None:
+    '''
+    Unit test that the
+    :meth:`betse.science.cells.Cells.map_cells_centre_to_points` method
+    interpolating via cached sparse matrices reproduces the
+    :func:`scipy.interpolate.griddata` function for both one- and
+    two-dimensional source data *and* revalidates these matrices on modifying
+    cell centres.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.cells import Cells
+    from scipy.interpolate import griddata
+
+    # Pseudo-random number generator seeded for reproducibility.
+    rand = np.random.RandomState(0xCE115)
+
+    # Minimal cell cluster whose cell centres are scattered over the unit
+    # square, bypassing the costly seeding of a full cell cluster.
+    cells = Cells.__new__(Cells)
+    cells.cell_centres = rand.rand(40, 2)
+
+    # Grid of target points, some outside the convex hull of these centres.
+    X, Y = np.meshgrid(np.linspace(-0.1, 1.1, 9), np.linspace(-0.1, 1.1, 7))
+
+    # Source data sampled at three time steps.
+    times_cells_centre = rand.rand(3, 40)
+
+    def map_reference(data, interp_method):
+        '''
+        Source data interpolated onto this grid by griddata().
+        '''
+
+        return griddata(
+            points=(cells.cell_centres[:, 0], cells.cell_centres[:, 1]),
+            values=data,
+            xi=(X, Y),
+            method=interp_method,
+            fill_value=0,
+        )
+
+    for interp_method in ('nearest', 'linear', 'cubic'):
+        # Assert two-dimensional data to be interpolated as by griddata().
+        times_points = cells.map_cells_centre_to_points(
+            cells_centre_data=times_cells_centre,
+            target_points=(X, Y),
+            interp_method=interp_method,
+        )
+        assert times_points.shape == (3,) + X.shape
+        for time_points, time_cells_centre in zip(
+            times_points, times_cells_centre):
+            assert np.allclose(
+                time_points, map_reference(time_cells_centre, interp_method))
+
+        # Assert one-dimensional data to be interpolated as by griddata().
+        assert np.allclose(
+            cells.map_cells_centre_to_points(
+                cells_centre_data=times_cells_centre[0],
+                target_points=(X, Y),
+                interp_method=interp_method,
+            ),
+            map_reference(times_cells_centre[0], interp_method),
+        )
+
+    # Assert that moving cell centres invalidates all cached matrices.
+    cells.cell_centres = cells.cell_centres[:, ::-1].copy()
+    assert np.allclose(
+        cells.map_cells_centre_to_points(
+            cells_centre_data=times_cells_centre[0],
+            target_points=(X, Y),
+            interp_method='linear',
+        ),
+        map_reference(times_cells_centre[0], 'linear'),
+    )
+
+
+def test_cells_matrices_sparse() -> None:
+    '''
+    Unit test that the sparse matrices lazily created by properties of the
+    :class:`betse.science.cells.Cells` class reproduce the dense matrices
+    previously created by iteration *and* that the
+    :meth:`betse.science.cells.Cells.evict_matrices` method evicts these
+    matrices.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.cells import Cells
+    from betse.science.enum.enumconf import MatrixBackendType
+    from betse.science.math import matrices
+
+    # Pseudo-random number generator seeded for reproducibility.
+    rand = np.random.RandomState(0xCE115)
+
+    # Minimal cell cluster of cells containing varying numbers of membranes,
+    # bypassing the costly seeding of a full cell cluster.
+    cells = Cells.__new__(Cells)
+    cells_mems_count = np.array((3, 5, 4, 5, 6, 3))
+    mems_count = cells_mems_count.sum()
+    verts_count = 11
+    cells.cell_i = list(range(len(cells_mems_count)))
+    cells.mem_i = list(range(mems_count))
+    cells.mem_to_cells = np.repeat(cells.cell_i, cells_mems_count)
+    cells.cell_to_mems = np.empty(len(cells_mems_count), dtype=object)
+    cells.cell_to_mems[:] = [
+        np.flatnonzero(cells.mem_to_cells == cell_index)
+        for cell_index in cells.cell_i]
+    cells.num_mems = cells_mems_count
+    cells.mem_mids_flat = rand.rand(mems_count, 2)
+    cells.mem_verts = rand.rand(verts_count, 2)
+    # Indices of the two distinct vertices terminating each membrane.
+    mems_vert_first = rand.randint(verts_count, size=mems_count)
+    cells.index_to_mem_verts = np.column_stack((
+        mems_vert_first,
+        (mems_vert_first + rand.randint(1, verts_count, size=mems_count)) %
+        verts_count,
+    ))
+    cells.mem_sa = rand.rand(mems_count) + 0.5
+    cells.mem_vol = rand.rand(mems_count) + 0.5
+    cells.cell_vol = rand.rand(len(cells_mems_count)) + 0.5
+    cells.M_sum_mems = matrices.make_matrix(
+        backend=MatrixBackendType.SPARSE,
+        data=np.ones(mems_count),
+        row_indices=cells.mem_to_cells,
+        col_indices=cells.mem_i,
+        shape=(len(cells.cell_i), mems_count),
+    )
+
+    # Dense matrices created by iteration as previously.
+    matrixMap2Verts = np.zeros((mems_count, verts_count))
+    gradTheta = np.zeros((mems_count, mems_count))
+    lapGJmem = np.zeros((mems_count, mems_count))
+    divCell = np.zeros((len(cells.cell_i), mems_count))
+    radial_len = np.zeros(mems_count)
+    for mem_index, mem_verts_index in enumerate(cells.index_to_mem_verts):
+        matrixMap2Verts[mem_index, mem_verts_index[0]] = 1/2
+        matrixMap2Verts[mem_index, mem_verts_index[1]] = 1/2
+    for cell_index, mem_i in enumerate(cells.cell_to_mems):
+        mem_io = np.roll(mem_i, 1)
+        li = cells.mem_mids_flat[mem_i] - cells.mem_mids_flat[mem_io]
+        lm = np.sqrt(li[:, 0] ** 2 + li[:, 1] ** 2)
+        radial_len[mem_i] = lm
+        gradTheta[mem_i, mem_i] = 1 / lm
+        gradTheta[mem_i, mem_io] = -1 / lm
+
+        num_mems = len(mem_i)
+        for nj, j in enumerate(mem_i):
+            memjj = np.roll(mem_i, -1 - nj)[0:-1]
+            lapGJmem[j, j] = (
+                ((num_mems - 1)/num_mems)*(cells.mem_sa[j]/cells.mem_vol[j]))
+            lapGJmem[j, memjj] = (
+                -(1/num_mems)*(cells.mem_sa[memjj]/cells.mem_vol[memjj]))
+            divCell[cell_index, j] = cells.mem_sa[j]/cells.cell_vol[cell_index]
+    cells.radial_len = radial_len
+
+    # Assert these sparse matrices to reproduce these dense matrices.
+    assert matrices.is_sparse(cells.matrixMap2Verts)
+    assert np.allclose(cells.matrixMap2Verts.toarray(), matrixMap2Verts)
+    assert np.allclose(cells.gradTheta.toarray(), gradTheta)
+    assert np.allclose(
+        cells.lapGJmem_inv.toarray(), np.linalg.pinv(lapGJmem))
+    assert np.allclose(cells.divCell_inv.toarray(), np.linalg.pinv(divCell))
+
+    # Assert that evicting these matrices recreates these matrices on access.
+    matrixMap2Verts_old = cells.matrixMap2Verts
+    assert cells.matrixMap2Verts is matrixMap2Verts_old
+    cells.evict_matrices()
+    assert cells.matrixMap2Verts is not matrixMap2Verts_old
+    assert np.allclose(cells.matrixMap2Verts.toarray(), matrixMap2Verts)
+
+
+def test_cells_graph_laplacian_inverse(
+    betse_sim_conf: 'SimConfTestInternal') -> None:
+    '''
+    Regression test comparing the solver of the cell network Poisson equation
+    created by the :meth:`betse.science.cells.Cells.graphLaplacian` method
+    against the product of dense pseudo-inverses it replaced on a seeded cell
+    cluster.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.parameters import Parameters
+    from betse.science.simrunner import SimRunner
+
+    # Seed a minified cell cluster. Since this configuration is minified only
+    # in memory, this configuration is saved and reloaded first.
+    betse_sim_conf.p.save_inplace()
+    p = Parameters.make(conf_filename=betse_sim_conf.conf_filename)
+    with betse_sim_conf.context():
+        cells = SimRunner(p=p).seed().cells
+    mesh = cells.mesh
+
+    # Dense operators previously created by this method.
+    delta_tri_0 = mesh.delta_tri_0
+    if hasattr(delta_tri_0, 'toarray'):
+        delta_tri_0 = delta_tri_0.toarray()
+    delta_tri_0_inv = np.linalg.pinv(delta_tri_0)
+    star_eij_inv = np.diag(mesh.tri_edge_len/mesh.vor_edge_len)
+    lapGJinv_old = np.dot(
+        np.dot(delta_tri_0_inv, star_eij_inv),
+        np.dot(-delta_tri_0_inv.T, np.diag(mesh.vor_sa)))
+    lapGJ = cells.lapGJ
+    if hasattr(lapGJ, 'toarray'):
+        lapGJ = lapGJ.toarray()
+
+    # Random right-hand sides satisfying the compatibility condition of this
+    # pure-Neumann problem (i.e., with zero area-weighted mean).
+    rand = np.random.RandomState(0x1A9)
+    rhs = rand.rand(len(mesh.vor_sa), 4)
+    rhs -= np.dot(mesh.vor_sa, rhs)/mesh.vor_sa.sum()
+
+    # Solutions of this problem by both the current and prior operators.
+    lhs_new = np.column_stack(
+        [cells.lapGJinv.solve(rhs_col) for rhs_col in rhs.T])
+    lhs_old = np.dot(lapGJinv_old, rhs)
+
+    # Assert the current solver to solve this problem exactly, whereas the
+    # prior product of pseudo-inverses solved this problem only approximately
+    # (with a relative residual of roughly 8% on the minified cluster).
+    residual_new = np.linalg.norm(np.dot(lapGJ, lhs_new) - rhs)
+    residual_old = np.linalg.norm(np.dot(lapGJ, lhs_old) - rhs)
+    assert residual_new < 1e-10*np.linalg.norm(rhs)
+    assert residual_old > 1e3*residual_new
+
+    # Assert both solutions to agree to within the error of the prior
+    # operator (roughly 5% on the minified cluster).
+    assert np.linalg.norm(lhs_new - lhs_old) < 0.15*np.linalg.norm(lhs_old)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.channels` subpackage.
+'''
+
+# ....................{ TESTS                             }....................
+def test_channels_gating_table() -> None:
+    '''
+    Unit test that the
+    :meth:`betse.science.channels.channelsabc.ChannelsABC._init_gating_table`
+    method tabulates the gating kinetics of voltage-gated channels to within
+    the configured tolerance, falling back to analytic gating kinetics for
+    voltages outside the tabulated range and channels exceeding that
+    tolerance.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    import pytest
+    from betse.exceptions import BetseSimConfException
+    from betse.science.channels.channelsabc import GATING_VAR_NAMES
+    from betse.science.channels.vg_ca import Cav3p1
+    from betse.science.channels.vg_na import Nav1p2
+    from types import SimpleNamespace
+
+    # Minimal cell cluster and simulation configuration enabling tables.
+    cells = SimpleNamespace(mem_i=np.arange(200))
+    p = SimpleNamespace(
+        dt=1e-4,
+        is_channel_gating_tabled=True,
+        channel_gating_vmem_min=-150.0,
+        channel_gating_vmem_max=100.0,
+        channel_gating_vmem_step=0.05,
+        channel_gating_tolerance=1e-4,
+    )
+
+    # Transmembrane voltages [V] spanning the tabulated range, including the
+    # removable singularities of the analytic gating kinetics of this channel.
+    vm = np.linspace(-0.149, 0.099, len(cells.mem_i))
+    vm[:2] = (-0.025, -0.050)
+
+    # Channel whose gating kinetics are all tabulated.
+    channel = Nav1p2()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        channel.init(vm, cells, p, targets=cells.mem_i)
+    assert channel._gating_table_names == GATING_VAR_NAMES
+
+    # Assert tabulation to leave no gating kinetics evaluated at tabulated
+    # voltages rather than membrane voltages.
+    for gating_name in GATING_VAR_NAMES:
+        assert gating_name not in vars(channel)
+
+    # Assert interpolated gating kinetics to approximate analytic kinetics.
+    channel._update_gating(vm*1000)
+    gating_tabled = [getattr(channel, name) for name in GATING_VAR_NAMES]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        channel._calculate_state(vm*1000)
+    for gating_name, gating_tabled_values in zip(
+        GATING_VAR_NAMES, gating_tabled):
+        gating_exact = getattr(channel, gating_name)
+        is_finite = np.isfinite(gating_exact)
+        assert np.all(np.isfinite(gating_tabled_values))
+        assert np.allclose(
+            gating_tabled_values[is_finite], gating_exact[is_finite],
+            rtol=0, atol=1e-4*np.abs(gating_exact[is_finite]).max())
+
+    # Assert voltages outside the tabulated range to be evaluated analytically.
+    vm_high = np.full(len(cells.mem_i), 0.120)
+    channel._update_gating(vm_high*1000)
+    gating_high = [getattr(channel, name) for name in GATING_VAR_NAMES]
+    channel._calculate_state(vm_high*1000)
+    for gating_name, gating_high_values in zip(GATING_VAR_NAMES, gating_high):
+        assert np.array_equal(gating_high_values, getattr(channel, gating_name))
+
+    # Assert a channel whose piecewise time constant exceeds this tolerance
+    # to fall back to analytic gating kinetics.
+    channel = Cav3p1()
+    channel.init(vm, cells, p, targets=cells.mem_i)
+    assert channel._gating_table is None
+
+    # Assert an empty tabulated range to be rejected.
+    p.channel_gating_vmem_max = p.channel_gating_vmem_min
+    with pytest.raises(BetseSimConfException):
+        Nav1p2().init(vm, cells, p, targets=cells.mem_i)
+
+
+def test_channels_batch() -> None:
+    '''
+    Unit test that the :func:`betse.science.channels.channelsbatch.batch_channels`
+    function batches channels of the same class targeting overlapping subsets
+    of membranes into a single runner whose channels evolve exactly as if run
+    in isolation.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    import pytest
+    from betse.exceptions import BetseSimException
+    from betse.science.channels.channelsbatch import (
+        ChannelsBatch, batch_channels)
+    from betse.science.channels.vg_ca import Cav2p1
+    from betse.science.channels.vg_k import Kv1p5
+    from betse.science.channels.vg_morrislecar import Kv_ML1
+    from types import SimpleNamespace
+
+    # Minimal cell cluster and simulation configuration.
+    cells = SimpleNamespace(mem_i=np.arange(60))
+    p = SimpleNamespace(dt=1e-4, is_channel_gating_tabled=False)
+
+    # Transmembrane voltages [V] for each time step.
+    vm_times = -0.060 + 0.030*np.random.RandomState(0).rand(
+        25, len(cells.mem_i))
+
+    # Channel classes and overlapping targets of the channels to be batched,
+    # including a channel class whose inactivation gate is a scalar constant,
+    # a channel class lacking an inactivation gate and a channel class with
+    # only one channel.
+    channel_specs = (
+        (Kv1p5, np.arange(0, 40)),
+        (Cav2p1, np.arange(10, 20)),
+        (Kv1p5, np.arange(30, 60)),
+        (Kv_ML1, np.arange(0, 60, 2)),
+        (Cav2p1, np.arange(15, 25)),
+        (Kv_ML1, np.arange(0, 60, 3)),
+        (Kv1p5, np.array([5, 1, 45])),
+        (Kv1p5, np.arange(50, 55)),
+    )
+
+    def make_channels():
+        channels = []
+        for channel_cls, targets in channel_specs:
+            channel = channel_cls()
+            channel.init(vm_times[0], cells, p, targets=targets)
+            channels.append(channel)
+        return channels
+
+    # Channels run in isolation and in batches.
+    channels_isolated = make_channels()
+    channels_batched = make_channels()
+    channel_runners = batch_channels(channels_batched)
+
+    # Assert channels of the same class to be batched in order of appearance.
+    assert len(channel_runners) == 3
+    assert all(
+        isinstance(channel_runner, ChannelsBatch)
+        for channel_runner in channel_runners)
+    assert channel_runners[0].channels == tuple(channels_batched[i] for i in (
+        0, 2, 6, 7))
+
+    # Assert both to produce the same open probabilities and gate states
+    # at each time step.
+    for vm in vm_times[1:]:
+        for channel in channels_isolated:
+            channel.run(vm, p)
+        for channel_runner in channel_runners:
+            channel_runner.run(vm, p)
+
+        for channel_isolated, channel_batched in zip(
+            channels_isolated, channels_batched):
+            assert np.array_equal(channel_isolated.P, channel_batched.P)
+            assert np.array_equal(channel_isolated.m, channel_batched.m)
+
+    # Assert open probabilities to be preallocated once.
+    P_prior = channels_batched[0].P
+    channel_runners[0].run(vm_times[-1], p)
+    assert channels_batched[0].P is P_prior
+
+    # Assert a lone channel to be run as is.
+    assert batch_channels(channels_batched[:2]) == channels_batched[:2]
+
+    # Assert channels of different classes to be rejected.
+    with pytest.raises(BetseSimException):
+        ChannelsBatch(channels_batched[:2])
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.filehandling` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+from py._path.local import LocalPath
+
+# ....................{ TESTS                             }....................
+def test_filehandling_load_obsolete(betse_temp_dir: LocalPath) -> None:
+    '''
+    Unit test that the :func:`betse.science.filehandling.loadWorld` and
+    :func:`betse.science.filehandling.loadSim` functions reject cell clusters
+    seeded by older versions of this application, whose gap junction
+    Laplacian solvers were pickled as dense Numpy arrays.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.exceptions import BetseSimException
+    from betse.science import filehandling as fh
+    from betse.science.cells import Cells
+    from betse.science.enum.enumconf import MatrixBackendType
+    from betse.science.math import matrices
+    from pytest import raises
+
+    # Absolute filenames of a seed and initialization pickle.
+    seed_filename = str(betse_temp_dir.join('world_1.betse.gz'))
+    init_filename = str(betse_temp_dir.join('init_1.betse.gz'))
+
+    # Minimal cell cluster, bypassing the costly seeding of a full cluster.
+    cells = Cells.__new__(Cells)
+
+    # Assert both loaders to reject this cluster with an obsolete solver.
+    cells.lapGJinv = np.eye(3)
+    fh.saveSim(seed_filename, [cells, None])
+    fh.saveSim(init_filename, [None, cells, None])
+    with raises(BetseSimException):
+        fh.loadWorld(seed_filename)
+    with raises(BetseSimException):
+        fh.loadSim(init_filename)
+
+    # Assert both loaders to accept this cluster with a current solver.
+    cells.lapGJinv = matrices.LinearSolver(
+        matrix=np.array(((2.0, -1.0), (-1.0, 2.0))),
+        backend=MatrixBackendType.SPARSE,
+    )
+    fh.saveSim(seed_filename, [cells, None])
+    fh.saveSim(init_filename, [None, cells, None])
+    cells_loaded, _ = fh.loadWorld(seed_filename)
+    assert isinstance(cells_loaded.lapGJinv, matrices.LinearSolver)
+    _, cells_loaded, _ = fh.loadSim(init_filename)
+    assert isinstance(cells_loaded.lapGJinv, matrices.LinearSolver)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.finitediff` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_finitediff_stacked() -> None:
+    '''
+    Unit test that the finite difference operators of the
+    :mod:`betse.science.math.finitediff` submodule operate on stacks of 2D
+    grids (e.g., one grid for each ion) exactly as on each such grid.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math import finitediff as fd
+
+    # Stack of three random 2D grids.
+    grids = np.random.RandomState(0xBE75E).rand(3, 6, 7)
+
+    # Assert each operator applied to this stack is bitwise-identical to that
+    # operator applied to each grid of this stack.
+    gx, gy = fd.gradient(grids, 0.1)
+    div = fd.divergence(grids, 2*grids, 0.1, 0.2)
+    smooth = fd.integrator(grids, sharp=0.5)
+
+    for i, grid in enumerate(grids):
+        grid_gx, grid_gy = fd.gradient(grid, 0.1)
+        assert np.array_equal(gx[i], grid_gx)
+        assert np.array_equal(gy[i], grid_gy)
+        assert np.array_equal(
+            div[i], fd.divergence(grid, 2*grid, 0.1, 0.2))
+        assert np.array_equal(smooth[i], fd.integrator(grid, sharp=0.5))
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.chemistry.gene` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_gene_integrators_implicit(
+    betse_sim_conf: 'SimConfTestInternal', monkeypatch) -> None:
+    '''
+    Unit test that the implicit integrators of the ``betse sim-grn``
+    subcommand approximate the explicit integrator run at a much smaller time
+    step *and* that each implicit time step evaluates the block Jacobian,
+    clamps negative trial concentrations and restores the concentrations of
+    the network at the start of that time step.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    monkeypatch : MonkeyPatch
+        Builtin fixture object permitting object attributes to be temporarily
+        modified for the duration of this test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science import filehandling as fh
+    from betse.science.chemistry.networks import MasterOfNetworks
+    from betse.science.enum.enumconf import GrnIntegratorType
+    from betse.science.math import stiff
+    from betse.science.parameters import Parameters
+    from betse.science.simrunner import SimRunner
+
+    # Non-empty only if the system of an implicit time step has been checked.
+    systems_checked = []
+
+    def check_system(func, jac, y) -> None:
+        '''
+        Assert the passed system of the reacting substances of the default
+        network to clamp negative trial concentrations to zero *and*, on the
+        first such system only, the passed Jacobian of that system to
+        approximate the dense finite-difference Jacobian of that system.
+        '''
+
+        # Assert negative trial concentrations to evaluate as zero.
+        assert np.array_equal(func(-1.0 - y), func(np.zeros_like(y)))
+
+        # If the Jacobian has already been checked, silently reduce to a noop.
+        # Dense finite differences are expensive.
+        if systems_checked:
+            return
+        systems_checked.append(True)
+
+        # Dense Jacobian perturbing each concentration of each cell in turn.
+        rates_y = func(y)
+        jac_dense = np.empty((len(y), len(y)))
+        for k in range(len(y)):
+            step = 1.0e-6*max(abs(y[k]), 1.0e-3)
+            y_step = y.copy()
+            y_step[k] += step
+            jac_dense[:, k] = (func(y_step) - rates_y)/step
+
+        # Assert the block Jacobian to approximate this Jacobian *AND* to be
+        # no denser than one square block of reacting substances per cell.
+        jac_sparse = jac(y)
+        assert jac_sparse.shape == jac_dense.shape
+        assert np.allclose(
+            jac_sparse.toarray(), jac_dense,
+            rtol=1.0e-3, atol=1.0e-6*np.abs(jac_dense).max())
+        assert np.count_nonzero(jac_dense) <= jac_sparse.nnz
+
+    def make_stepper_checked(stepper):
+        '''
+        Wrap the passed stepper with a stepper first checking its system.
+        '''
+
+        def stepper_checked(func, jac, y, dt):
+            check_system(func, jac, y)
+            return stepper(func, jac, y, dt)
+
+        return stepper_checked
+
+    # Unwrapped implicit method of the network class.
+    get_delta_conc_implicit = MasterOfNetworks._get_delta_conc_implicit
+
+    def get_delta_conc_implicit_checked(self, *args, **kwargs):
+        '''
+        Assert the wrapped method to restore all cellular concentrations of
+        this network, which the trial states of each implicit step overwrite.
+        '''
+
+        cell_concs_old = {
+            name: conc.copy() for name, conc in self.cell_concs.items()}
+        delta_conc = get_delta_conc_implicit(self, *args, **kwargs)
+        for name, conc in cell_concs_old.items():
+            assert np.array_equal(self.cell_concs[name], conc)
+        return delta_conc
+
+    monkeypatch.setattr(
+        stiff, 'step_rosenbrock', make_stepper_checked(stiff.step_rosenbrock))
+    monkeypatch.setattr(
+        stiff, 'step_bdf', make_stepper_checked(stiff.step_bdf))
+    monkeypatch.setattr(
+        MasterOfNetworks, '_get_delta_conc_implicit',
+        get_delta_conc_implicit_checked)
+
+    # Minified simulation configuration enabling the default network, saved
+    # to apply this minification.
+    betse_sim_conf.config.enable_networks()
+    betse_sim_conf.p.save_inplace()
+
+    def sim_grn(integrator: GrnIntegratorType, time_step: float) -> tuple:
+        '''
+        Run the default network over 30 seconds sampled every 10 seconds with
+        the passed integrator and time step, returning a 2-tuple of the
+        parameters of this run and the network unpickled from this run.
+        '''
+
+        # Minify the sim-grn time settings, which the "minify()" method of
+        # the "betse_sim_conf" fixture currently ignores.
+        p = Parameters.make(conf_filename=betse_sim_conf.conf_filename)
+        p.grn_integrator = integrator
+        p.grn_dt = time_step
+        p.grn_total_time = 30.0
+        p.grn_tsample = 10.0
+
+        with betse_sim_conf.context():
+            SimRunner(p=p).sim_grn()
+            MoG, _, _ = fh.loadSim(p.grn_pickle_filename)
+
+        return p, MoG
+
+    # Explicit run at a small time step, serving as the reference solution.
+    _, MoG = sim_grn(GrnIntegratorType.EULER, 0.01)
+    cell_concs_euler = MoG.core.cell_concs
+    assert not systems_checked
+
+    for integrator in (GrnIntegratorType.ROSENBROCK, GrnIntegratorType.BDF):
+        del systems_checked[:]
+
+        # Implicit run at a time step not evenly dividing the sampling rate.
+        p, MoG = sim_grn(integrator, 4.0)
+        cell_concs = MoG.core.cell_concs
+        assert systems_checked
+
+        # Assert the time step to have been reset to the largest time step no
+        # larger than this time step evenly dividing the sampling rate *AND*
+        # this run to have sampled exactly each multiple of that rate.
+        assert p.t_resample == 3
+        assert p.dt == 10.0/3
+        assert np.allclose(MoG.time, (10.0, 20.0, 30.0))
+
+        # Assert all final concentrations to approximate the reference.
+        assert cell_concs.keys() == cell_concs_euler.keys()
+        for name, conc in cell_concs.items():
+            assert np.all(conc >= 0.0)
+            assert np.allclose(
+                conc, cell_concs_euler[name], rtol=1.0e-5, atol=1.0e-9)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.matrices` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_make_matrix_backends() -> None:
+    '''
+    Unit test the :func:`betse.science.math.matrices.make_matrix` function
+    with both dense and sparse matrix backends.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.enum.enumconf import MatrixBackendType
+    from betse.science.math import matrices
+
+    # Membrane-to-cell mapping of a toy cluster of three cells containing
+    # three, two, and four membranes respectively.
+    mem_to_cells = np.array((0, 0, 0, 1, 1, 2, 2, 2, 2))
+    mem_i = np.arange(len(mem_to_cells))
+    shape = (3, len(mem_i))
+
+    # Membrane-specific data to be summed over each cell.
+    mem_data = np.linspace(1.0, 9.0, len(mem_i))
+
+    # Dense and sparse matrices summing membrane data over each cell.
+    M_dense = matrices.make_matrix(
+        backend=MatrixBackendType.DENSE,
+        data=np.ones(len(mem_i)),
+        row_indices=mem_to_cells,
+        col_indices=mem_i,
+        shape=shape,
+    )
+    M_sparse = matrices.make_matrix(
+        backend=MatrixBackendType.SPARSE,
+        data=np.ones(len(mem_i)),
+        row_indices=mem_to_cells,
+        col_indices=mem_i,
+        shape=shape,
+    )
+
+    # Assert these matrices to be of the expected types and equal.
+    assert not matrices.is_sparse(M_dense)
+    assert matrices.is_sparse(M_sparse)
+    assert np.array_equal(M_sparse.toarray(), M_dense)
+
+    # Assert both matrices to sum membrane data over each cell identically.
+    cell_sums = np.array((6.0, 9.0, 30.0))
+    assert np.allclose(M_dense.dot(mem_data), cell_sums)
+    assert np.allclose(M_sparse.dot(mem_data), cell_sums)
+
+    # Assert duplicate entries to be summed rather than overwritten.
+    M_dup = matrices.make_matrix(
+        backend=MatrixBackendType.SPARSE,
+        data=np.array((1.0, 2.0)),
+        row_indices=np.array((0, 0)),
+        col_indices=np.array((1, 1)),
+        shape=(2, 2),
+    )
+    assert M_dup[0, 1] == 3.0
+
+
+def test_scale_columns_pinv() -> None:
+    '''
+    Unit test that the :func:`betse.science.math.matrices.scale_columns`
+    function reproduces the Moore-Penrose pseudo-inverse of the
+    membrane-to-cell summation matrix for both matrix backends.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.enum.enumconf import MatrixBackendType
+    from betse.science.math import matrices
+
+    # Membrane-to-cell mapping of a toy cluster.
+    mem_to_cells = np.array((0, 0, 1, 1, 1, 2, 2, 2, 2, 2))
+    mem_i = np.arange(len(mem_to_cells))
+    num_mems = np.bincount(mem_to_cells)
+
+    for backend in MatrixBackendType:
+        M_sum_mems = matrices.make_matrix(
+            backend=backend,
+            data=np.ones(len(mem_i)),
+            row_indices=mem_to_cells,
+            col_indices=mem_i,
+            shape=(len(num_mems), len(mem_i)),
+        )
+        M_sum_mems_inv = matrices.scale_columns(M_sum_mems.T, 1/num_mems)
+
+        # Densify both matrices for comparison against pinv().
+        if matrices.is_sparse(M_sum_mems):
+            M_sum_mems = M_sum_mems.toarray()
+            M_sum_mems_inv = M_sum_mems_inv.toarray()
+
+        assert np.allclose(M_sum_mems_inv, np.linalg.pinv(M_sum_mems))
+
+
+def test_linear_solver_backends() -> None:
+    '''
+    Unit test that the :class:`betse.science.math.matrices.LinearSolver`
+    class solves both non-singular and singular grid Laplacians identically
+    (to within floating point tolerances) for both matrix backends.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    import pickle
+    from betse.science.enum.enumconf import MatrixBackendType
+    from betse.science.math.finitediff import FiniteDiffSolver
+
+    # Small rectangular environmental grid.
+    grid = FiniteDiffSolver()
+    grid.cell_grid(0.1, 0.0, 1.2, 0.0, 0.9)
+
+    # Arbitrary right-hand side vector.
+    rhs = np.random.RandomState(0).rand(grid.xy_cents.shape[0])
+
+    # For both fixed-value and zero-flux boundary conditions...
+    for bound_type in ('value', 'flux'):
+        bound = {'N': bound_type, 'S': bound_type, 'E': bound_type, 'W': bound_type}
+
+        _, solver_dense = grid.makeLaplacian(
+            bound=bound, backend=MatrixBackendType.DENSE)
+        A_sparse, solver_sparse = grid.makeLaplacian(
+            bound=bound, backend=MatrixBackendType.SPARSE)
+
+        # Only zero-flux boundaries yield a singular Laplacian.
+        assert solver_sparse.is_singular is (bound_type == 'flux')
+
+        # Assert both backends to produce the same solution.
+        sol_dense  = solver_dense.solve(rhs)
+        sol_sparse = solver_sparse.solve(rhs)
+        assert np.allclose(sol_sparse, sol_dense)
+
+        # If non-singular, assert this solution to exactly solve this system.
+        if not solver_sparse.is_singular:
+            assert np.allclose(A_sparse.dot(sol_sparse), rhs)
+
+        # Assert unpickled solvers to lazily refactorize this matrix.
+        solver_unpickled = pickle.loads(pickle.dumps(solver_sparse))
+        assert np.allclose(solver_unpickled.solve(rhs), sol_sparse)
+
+
+def test_linear_solver_singular_components() -> None:
+    '''
+    Unit test that the :class:`betse.science.math.matrices.LinearSolver`
+    class reproduces the pseudo-inverse solution of a singular graph Laplacian
+    whose graph contains multiple connected components.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.enum.enumconf import MatrixBackendType
+    from betse.science.math.matrices import LinearSolver
+
+    # Graph Laplacian of two disconnected weighted paths of 3 and 2 vertices.
+    lap = np.array((
+        (-1.0,  1.0,  0.0,  0.0,  0.0),
+        ( 1.0, -3.0,  2.0,  0.0,  0.0),
+        ( 0.0,  2.0, -2.0,  0.0,  0.0),
+        ( 0.0,  0.0,  0.0, -4.0,  4.0),
+        ( 0.0,  0.0,  0.0,  4.0, -4.0),
+    ))
+    rhs_factors = np.array((1.0, 2.0, 0.5, 1.5, 3.0))
+    rhs = np.array((0.3, -1.2, 2.0, 0.7, 0.1))
+
+    solver = LinearSolver(
+        matrix=lap,
+        backend=MatrixBackendType.SPARSE,
+        is_singular=True,
+        rhs_factors=rhs_factors,
+    )
+
+    assert np.allclose(
+        solver.solve(rhs), np.linalg.pinv(lap).dot(rhs_factors*rhs))
+
+
+def test_pseudo_inverse_solver() -> None:
+    '''
+    Unit test that the :class:`betse.science.math.matrices.PseudoInverseSolver`
+    class reproduces the Moore-Penrose pseudo-inverse of both a vertex-to-edge
+    incidence matrix with linearly dependent rows *and* an edge-to-face
+    incidence matrix with linearly independent rows.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    import pickle
+    from betse.science.enum.enumconf import MatrixBackendType
+    from betse.science.math import matrices
+    from betse.science.math.matrices import PseudoInverseSolver
+
+    # Edges of two triangles sharing the edge (1, 2) and a disconnected edge.
+    edges = np.array(((0, 1), (1, 2), (2, 0), (3, 1), (2, 3), (4, 5)))
+    delta_0 = matrices.make_matrix(
+        backend=MatrixBackendType.SPARSE,
+        data=np.tile((-1.0, 1.0), len(edges)),
+        row_indices=np.repeat(np.arange(len(edges)), 2),
+        col_indices=edges.ravel(),
+        shape=(len(edges), 6),
+    )
+
+    # Faces of these two triangles followed by a face with no edges.
+    delta_1 = matrices.make_matrix(
+        backend=MatrixBackendType.SPARSE,
+        data=np.array((1.0, 1.0, 1.0, -1.0, 1.0, 1.0)),
+        row_indices=np.array((0, 0, 0, 1, 1, 1)),
+        col_indices=np.array((0, 1, 2, 1, 3, 4)),
+        shape=(3, len(edges)),
+    )
+
+    rhs = np.random.RandomState(0).rand(len(edges))
+    for delta, is_rows_independent in ((delta_0, False), (delta_1, True)):
+        solver = PseudoInverseSolver(
+            matrix=delta, is_rows_independent=is_rows_independent)
+        delta_inv = np.linalg.pinv(delta.toarray())
+
+        # Assert this solver to apply this pseudo-inverse and its transpose.
+        rhs_rows = rhs[:delta.shape[0]]
+        assert np.allclose(solver.solve(rhs_rows), delta_inv.dot(rhs_rows))
+        assert np.allclose(
+            solver.solve_transpose(rhs[:delta.shape[1]]),
+            delta_inv.T.dot(rhs[:delta.shape[1]]))
+
+        # Assert unpickled solvers to lazily refactorize this matrix.
+        solver_unpickled = pickle.loads(pickle.dumps(solver))
+        assert np.allclose(
+            solver_unpickled.solve(rhs_rows), delta_inv.dot(rhs_rows))
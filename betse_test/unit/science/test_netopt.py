@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.chemistry.netopt` submodule.
+'''
+
+# ....................{ IMPORTS                           }....................
+from betse.util.test.pytest.mark.pytskip import skip_unless_lib_runtime_optional
+from py._path.local import LocalPath
+
+# ....................{ TESTS                             }....................
+def test_netopt_objective(betse_temp_dir: LocalPath) -> None:
+    '''
+    Unit test that the
+    :class:`betse.science.chemistry.netopt.NetworkObjective` class computes
+    the same Jacobian as reevaluating that objective for each perturbation
+    *and* that the :func:`betse.science.chemistry.netopt.optimize_network`
+    function retains the best result of multiple reproducible chains.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import csv
+    import numpy as np
+    from betse.science.chemistry import netopt
+    from betse.science.chemistry.networks import compile_expr
+    from types import SimpleNamespace
+
+    # Minimal network whose four reactions are electrodiffusion of Na and K,
+    # a voltage-dependent pump and a voltage-independent reaction.
+    sim = SimpleNamespace(vm=0.0)
+    net = SimpleNamespace(conc=np.array((1.0, 2.0, 3.0)))
+    rate_funcs = [compile_expr(expr) for expr in (
+        '0.5*self.conc*np.exp(sim.vm)',
+        '0.2*self.conc',
+        '0.1*np.exp(-20*sim.vm)*np.ones(3)',
+        '0.3',
+    )]
+    network_matrix = np.array((
+        ( 1.0,  0.0, -3.0,  0.5),
+        ( 0.0, -1.0,  2.0,  0.0),
+        ( 1.0, -1.0, -1.0,  0.2),
+    ))
+    objective = netopt.NetworkObjective(
+        rate_funcs=rate_funcs,
+        rate_args=(net, sim, None, None),
+        sim=sim,
+        network_matrix=network_matrix,
+        goldman_num=(0.2*145.0, 5.0*5.0, 0.0, 0.0),
+        goldman_den=(0.2*12.0, 5.0*140.0, 0.0, 0.0),
+        vmem_factor=0.0267,
+        vmem_target=-0.050,
+    )
+
+    # Assert the objective to assign the estimated voltage to the simulation.
+    v = np.array((1.2, -0.8, 0.6, 1.5))
+    chi_sqr = objective(v)
+    assert sim.vm == 0.0267*np.log(
+        (0.2*145.0*1.2 + 5.0*5.0*0.8)/(0.2*12.0*1.2 + 5.0*140.0*0.8))
+    assert chi_sqr > 0
+
+    # Assert the Jacobian to reproduce reevaluation of each perturbation.
+    jac_expected = np.array([
+        (objective(v + 0.05*np.eye(len(v))[i]) - chi_sqr)/0.05
+        for i in range(len(v))])
+    assert np.allclose(objective.jacobian(v), jac_expected, rtol=1e-12)
+
+    # Minimize this objective with two chains, run in parallel where forking
+    # is supported.
+    sol, alt_sols, progress = netopt.optimize_network(
+        objective=objective,
+        x0=np.ones(4),
+        chain_count=2,
+        niter=3,
+        T=1.0,
+        stepsize=0.5,
+        method='L-BFGS-B',
+        alt_chi_sqr_max=np.inf,
+    )
+
+    # Assert both chains to report the progress of each iteration (including
+    # the initial minimization under newer SciPy versions).
+    rows_count = len(progress)//2
+    assert rows_count in (3, 4)
+    assert [row['chain'] for row in progress] == [0]*rows_count + [1]*rows_count
+    assert [row['iteration'] for row in progress] == list(
+        range(1, rows_count + 1))*2
+    assert len(alt_sols) == len(progress)
+    assert np.isclose(objective(sol.x), sol.fun)
+
+    # Assert chains to be reproducible and the best chain to be retained.
+    sol_first = None
+    for _ in range(2):
+        sol_chain_first, _, _ = netopt.optimize_network(
+            objective=objective, x0=np.ones(4), chain_count=1, niter=3,
+            T=1.0, stepsize=0.5, method='L-BFGS-B')
+        assert sol_first is None or sol_chain_first.fun == sol_first.fun
+        sol_first = sol_chain_first
+    assert sol.fun <= sol_first.fun
+    if sol.chain == 0:
+        assert sol.fun == sol_first.fun
+
+    # Assert this progress to be tabulated.
+    progress_filename = str(betse_temp_dir.join(
+        netopt.OPTIMIZATION_PROGRESS_BASENAME))
+    netopt.write_optimization_progress(
+        filename=progress_filename, progress=progress)
+    with open(progress_filename, newline='') as progress_file:
+        rows = list(csv.DictReader(progress_file, delimiter='\t'))
+    assert len(rows) == len(progress)
+    assert float(rows[-1]['chi_sqr_min']) == progress[-1]['chi_sqr_min']
+
+
+@skip_unless_lib_runtime_optional('networkx', 'pydot')
+def test_netopt_optimizer(
+    betse_sim_conf: 'SimConfTestInternal', monkeypatch) -> None:
+    '''
+    Unit test that the
+    :meth:`betse.science.chemistry.networks.MasterOfNetworks.optimizer` method
+    builds and minimizes the objective of the default gene regulatory network
+    when optimization is enabled in the configuration of that network.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    monkeypatch : MonkeyPatch
+        Builtin fixture object permitting object attributes to be temporarily
+        modified for the duration of this test.
+    '''
+
+    # Defer heavyweight imports.
+    import csv
+    import numpy as np
+    from betse.science.chemistry import netopt
+    from betse.science.chemistry.networks import MasterOfNetworks
+    from betse.science.parameters import Parameters
+    from betse.science.simrunner import SimRunner
+    from betse.util.path import files, pathnames
+
+    # Minified simulation configuration enabling the default network, saved
+    # and reloaded to apply this minification.
+    betse_sim_conf.config.enable_networks()
+    betse_sim_conf.p.save_inplace()
+    p = Parameters.make(conf_filename=betse_sim_conf.conf_filename)
+
+    # Enable a brief optimization of this network and a brief run of this
+    # network after that optimization.
+    optimization = p.grn.conf['optimization']
+    optimization['optimize network'] = True
+    optimization['optimization steps'] = 2
+    p.grn_dt = 1.0
+    p.grn_total_time = 2.0
+    p.grn_tsample = 1.0
+
+    # 2-tuples of each network optimized by the "sim-grn" subcommand (which
+    # optimizes this network each time this network is read) and the
+    # directory this optimization was saved to, captured before this subcommand
+    # redirects this network to its own directory.
+    networks = []
+    optimizer = MasterOfNetworks.optimizer
+
+    def optimizer_captured(self, *args, **kwargs) -> None:
+        optimizer(self, *args, **kwargs)
+        networks.append((self, self.resultsPath))
+
+    monkeypatch.setattr(MasterOfNetworks, 'optimizer', optimizer_captured)
+
+    with betse_sim_conf.context():
+        SimRunner(p=p).sim_grn()
+
+    # Assert this network to have been optimized with one finite optimized
+    # rate per reaction.
+    assert networks
+    network, results_dirname = networks[-1]
+    assert network.sol_x.shape == (len(network.react_handler),)
+    assert np.all(np.isfinite(network.sol_x))
+
+    # Assert this optimization to have tabulated its progress and solution.
+    progress_filename = pathnames.join(
+        results_dirname, netopt.OPTIMIZATION_PROGRESS_BASENAME)
+    assert files.is_file(progress_filename)
+    with open(progress_filename, newline='') as progress_file:
+        rows = list(csv.DictReader(progress_file, delimiter='\t'))
+    assert rows
+    assert files.is_file(pathnames.join(
+        results_dirname, 'OptimizedReactionRates.csv'))
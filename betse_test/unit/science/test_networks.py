@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.chemistry.networks` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_compile_expr() -> None:
+    '''
+    Unit test the :func:`betse.science.chemistry.networks.compile_expr`
+    function.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.exceptions import BetseSimConfException
+    from betse.science.chemistry.networks import compile_expr
+    from pytest import raises
+    from types import SimpleNamespace
+
+    # Network expression referencing both parameters and submodule globals.
+    expr = 'np.exp(p.k*self.conc[cells.cell_i])*sim.scale'
+
+    # Minimal objects satisfying the attributes referenced by this expression.
+    net = SimpleNamespace(conc=np.array((0.0, 1.0, 2.0)))
+    cells = SimpleNamespace(cell_i=np.array((2, 0)))
+    p = SimpleNamespace(k=0.5)
+    sim = SimpleNamespace(scale=3.0)
+
+    # Assert this expression evaluates to the same result as "eval()".
+    expr_func = compile_expr(expr)
+    assert np.array_equal(
+        expr_func(net, sim, cells, p),
+        eval(expr, {'np': np}, {'self': net, 'sim': sim, 'cells': cells, 'p': p}))
+
+    # Assert this expression is compiled exactly once.
+    assert compile_expr(expr) is expr_func
+
+    # Assert syntactically invalid expressions are rejected.
+    with raises(BetseSimConfException):
+        compile_expr('self.conc[')
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.phase` subpackage.
+'''
+
+# ....................{ IMPORTS                           }....................
+from py._path.local import LocalPath
+
+# ....................{ TESTS                             }....................
+def test_phase_profiler(betse_temp_dir: LocalPath) -> None:
+    '''
+    Unit test that the :class:`betse.science.phase.phaseprof.SimPhaseProfiler`
+    class silently reduces to a noop unless enabled *and* otherwise accumulates
+    the timings of all solver stages and network reactions into a JSON report
+    saved alongside the pickled simulation.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import json
+    from betse.science.enum.enumphase import SimPhaseKind
+    from betse.science.enum.enumconf import SolverType
+    from betse.science.phase.phasecls import SimPhase
+    from betse.science.phase.phaseprof import SimPhaseProfiler
+    from types import SimpleNamespace
+
+    # Minimal simulation phase, bypassing the costly creation of a full phase.
+    phase = SimPhase.__new__(SimPhase)
+    phase.kind = SimPhaseKind.SIM
+    phase.p = SimpleNamespace(
+        is_solver_profiled=False,
+        solver_type=SolverType.FULL,
+        sim_pickle_filename=str(betse_temp_dir.join('sim_1.betse.gz')),
+    )
+    profiler = SimPhaseProfiler(phase=phase)
+    reaction_names = ['dimerize', 'degrade']
+
+    # Assert this profiler to silently reduce to a noop by default.
+    profiler.start()
+    assert not profiler.is_profiling
+    assert profiler.iter_timed(reaction_names) is reaction_names
+    profiler.stop()
+    assert not betse_temp_dir.join('sim_1_profile.json').check()
+
+    # Profile three time steps, each timing two stages and two reactions.
+    phase.p.is_solver_profiled = True
+    profiler.start()
+    assert profiler.is_profiling
+    for _ in range(3):
+        profiler.stage('pumps')
+        profiler.stage('grn')
+        for _ in profiler.iter_timed(reaction_names):
+            pass
+        profiler.step_end()
+    profiler.stop()
+    assert not profiler.is_profiling
+
+    # Assert this report to be saved alongside the pickled simulation.
+    assert profiler.report_filename == str(
+        betse_temp_dir.join('sim_1_profile.json'))
+    report = json.loads(betse_temp_dir.join('sim_1_profile.json').read())
+
+    # Assert this report to describe all profiled stages and reactions.
+    assert report['phase'] == 'sim'
+    assert report['solver'] == 'full'
+    assert report['time_steps'] == 3
+    assert [stage['name'] for stage in report['stages']] == ['pumps', 'grn']
+    assert all(stage['calls'] == 3 for stage in report['stages'])
+    assert [
+        (reaction['stage'], reaction['zone'], reaction['name'])
+        for reaction in report['reactions']
+    ] == [('grn', 'cell', 'dimerize'), ('grn', 'cell', 'degrade')]
+    assert all(reaction['calls'] == 3 for reaction in report['reactions'])
+    assert report['seconds'] >= sum(
+        stage['seconds'] for stage in report['stages'])
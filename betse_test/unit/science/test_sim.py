@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.sim` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_sim_update_gj() -> None:
+    '''
+    Unit test that the :meth:`betse.science.sim.Simulator.update_gj` method
+    electrodiffusing all moving ions at once is bitwise-identical to the prior
+    per-ion implementation of that method *and* updates gap junction state
+    exactly once per call.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science import sim_toolbox as stb
+    from betse.science.sim import Simulator
+    from types import SimpleNamespace
+
+    # Pseudo-random number generator seeded for reproducibility.
+    rand = np.random.RandomState(0xB375E)
+
+    # Number of membranes and ions.
+    mem_count = 12
+    ion_count = 5
+
+    # Minimal cell cluster, pairing each membrane with a random neighbour.
+    cells = SimpleNamespace(
+        mem_i=np.arange(mem_count),
+        nn_i=rand.permutation(mem_count),
+        gj_len=1.0e-8,
+        mem_vects_flat=rand.rand(mem_count, 4),
+        gj_default_weights=rand.rand(mem_count),
+        bflags_mems=np.array((0, 5, 7)),
+    )
+
+    # Minimal simulation configuration with stateless gap junctions.
+    p = SimpleNamespace(
+        v_sensitive_gj=False,
+        gj_surface=0.25,
+        T=310.0,
+        F=96485.0,
+        R=8.314,
+    )
+
+    def make_sim() -> Simulator:
+        '''
+        Minimal simulation whose attributes suffice to update gap junctions.
+        '''
+
+        sim = Simulator.__new__(Simulator)
+        sim.movingIons = [0, 1, 3, 4]
+        sim.mdl = mem_count
+        sim.vm = np.random.RandomState(1).rand(mem_count)*1.0e-2
+        sim.cc_at_mem = np.random.RandomState(2).rand(ion_count, mem_count)
+        sim.D_gj = np.random.RandomState(3).rand(ion_count)*1.0e-18
+        sim.zs = np.array((1, -1, 2, 1, -1))
+        sim.gj_block = 1.0
+        sim.fluxes_gj = np.zeros((ion_count, mem_count))
+        return sim
+
+    # Simulation updated by the per-ion implementation.
+    sim_old = make_sim()
+    for i in sim_old.movingIons:
+        sim_old.vgj = sim_old.vm[cells.nn_i] - sim_old.vm[cells.mem_i]
+        sim_old.Egj = -sim_old.vgj/cells.gj_len
+        sim_old.E_gj_x = sim_old.Egj*cells.mem_vects_flat[:,2]
+        sim_old.E_gj_y = sim_old.Egj*cells.mem_vects_flat[:,3]
+        sim_old.gjopen = (
+            sim_old.gj_block*np.ones(mem_count)*cells.gj_default_weights)
+
+        conc_mem = sim_old.cc_at_mem[i]
+        fgj_X = stb.electroflux(
+            conc_mem[cells.mem_i],
+            conc_mem[cells.nn_i],
+            sim_old.D_gj[i]*p.gj_surface*sim_old.gjopen,
+            cells.gj_len*np.ones(mem_count),
+            sim_old.zs[i]*np.ones(mem_count),
+            sim_old.vgj,
+            p.T,
+            p,
+            rho=1,
+        )
+        fgj_X[cells.bflags_mems] = 0.0
+        sim_old.fluxes_gj[i] = sim_old.fluxes_gj[i] + fgj_X
+
+    # Simulation updated by the current implementation.
+    sim_new = make_sim()
+    sim_new.update_gj(cells, p, 0.0)
+
+    # Assert all gap junction state and fluxes to be bitwise-identical.
+    for attr_name in (
+        'vgj', 'Egj', 'E_gj_x', 'E_gj_y', 'gjopen', 'fluxes_gj'):
+        assert np.array_equal(
+            getattr(sim_new, attr_name), getattr(sim_old, attr_name))
+
+    # Assert stateful gap junction gating to be advanced once per call.
+    run_count = [0]
+    def gj_run(sim, cells, p) -> None:
+        run_count[0] += 1
+        sim.gjopen = np.ones(mem_count)
+
+    p.v_sensitive_gj = True
+    sim_new.gj_funk = SimpleNamespace(run=gj_run)
+    sim_new.update_gj(cells, p, 0.0)
+    assert run_count[0] == 1
+
+
+def test_sim_checkpoint_filename(
+    betse_sim_conf: 'SimConfTestInternal') -> None:
+    '''
+    Unit test that the checkpoint of each simulation phase is saved alongside
+    the pickled results of that phase *and* is disabled by default.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.util.path import pathnames
+
+    # Simulation configuration.
+    p = betse_sim_conf.p
+
+    # Assert checkpointing to be disabled by default.
+    assert p.checkpoint_interval == 0
+
+    # Assert this checkpoint to reside in the simulation output directory and
+    # to be named after the pickled simulation, preserving all filetypes.
+    assert pathnames.get_dirname(p.sim_checkpoint_filename) == (
+        p.sim_pickle_dirname)
+    assert pathnames.get_basename(p.sim_checkpoint_filename) == (
+        'sim_1_checkpoint.betse.gz')
+
+
+def test_sim_iter_time_steps_adaptive() -> None:
+    '''
+    Unit test that the
+    :meth:`betse.science.sim.Simulator._iter_time_steps_adaptive` generator
+    yields each sampled time step exactly, grows the time step of a relaxing
+    system within the configured bounds, and restores the fixed time step.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.sim import Simulator
+    from types import SimpleNamespace
+
+    # Fixed time step, time-steps vector, and sampled time steps of a phase.
+    time_step = 1.0e-3
+    time_steps = np.linspace(0, 1000*time_step, 1000)
+    time_steps_sampled = set(time_steps[100::100])
+
+    # Minimal phase configured to adapt its time step.
+    p = SimpleNamespace(
+        dt=time_step,
+        time_step_factor_min=0.1,
+        time_step_factor_max=10.0,
+        time_step_vmem_error_max=1.0e-5,
+        time_step_conc_error_max=1.0e-4,
+    )
+    phase = SimpleNamespace(p=p)
+
+    # Minimal simulation exponentially relaxing towards equilibrium.
+    sim = Simulator.__new__(Simulator)
+    sim.vm = np.full(4, -0.05)
+    sim.cc_cells = np.full((2, 3), 10.0)
+
+    # List of all yielded time steps and the durations of these time steps.
+    times = []
+    time_step_durations = []
+    for t in sim._iter_time_steps_adaptive(
+        phase, time_steps, time_steps_sampled):
+        times.append(t)
+        time_step_durations.append(p.dt)
+        sim.vm = sim.vm*np.exp(-p.dt/0.05)
+        sim.cc_cells = sim.cc_cells + (5.0 - sim.cc_cells)*(1 - np.exp(-p.dt))
+
+    # Assert all sampled and the first and last time steps to be yielded
+    # exactly in ascending order.
+    assert time_steps_sampled <= set(times)
+    assert times[0] == time_steps[0]
+    assert times[-1] == time_steps[-1]
+    assert times == sorted(times)
+
+    # Assert this relaxation to require fewer than the fixed time steps, each
+    # within the configured bounds.
+    assert len(times) < len(time_steps)
+    assert max(time_step_durations) > time_step
+    assert max(time_step_durations) <= 10.0*time_step*(1 + 1.0e-9)
+
+    # Assert the fixed time step to be restored.
+    assert p.dt == time_step
+
+
+def test_sim_time_series_relocate(
+    betse_sim_conf: 'SimConfTestInternal') -> None:
+    '''
+    Unit test that pickled phases whose time series are backed by files (i.e.,
+    either saved ``.npy`` files or memory-mapped files) remain loadable after
+    moving the directory containing both these pickles and these files.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science import filehandling as fh
+    from betse.science.enum.enumconf import TimeSeriesFormatType
+    from betse.science.parameters import Parameters
+    from betse.science.simrunner import SimRunner
+    from betse.util.path import pathnames, paths
+
+    # Minified simulation configuration, saved and reloaded to apply this
+    # minification.
+    betse_sim_conf.p.save_inplace()
+    p = Parameters.make(conf_filename=betse_sim_conf.conf_filename)
+
+    # Initialize with time series saved to ".npy" files *AND* simulate with
+    # time series memory-mapped to raw files embedded in the pickle.
+    with betse_sim_conf.context():
+        p.time_series_format = TimeSeriesFormatType.NPY
+        vm_time_init = np.array(SimRunner(p=p).init().sim.vm_time)
+        p.time_series_format = TimeSeriesFormatType.PICKLE
+        p.is_time_series_memmapped = True
+        vm_time_sim = np.array(SimRunner(p=p).sim().sim.vm_time)
+
+    # Move the directory containing this configuration and all output.
+    conf_dirname_old = betse_sim_conf.conf_dirname
+    conf_dirname_new = conf_dirname_old + '_relocated'
+    paths.move_path(conf_dirname_old, conf_dirname_new)
+
+    # Assert both phases to load their time series from the moved directory.
+    for pickle_filename_old, vm_time_expected in (
+        (p.init_pickle_filename, vm_time_init),
+        (p.sim_pickle_filename, vm_time_sim),
+    ):
+        sim, _, _ = fh.loadSim(pathnames.join(
+            conf_dirname_new,
+            pathnames.relativize(conf_dirname_old, pickle_filename_old)))
+        assert len(sim.vm_time) == len(vm_time_expected)
+        assert np.array_equal(np.asarray(sim.vm_time), vm_time_expected)
+
+
+def test_sim_resume(betse_sim_conf: 'SimConfTestInternal') -> None:
+    '''
+    Unit test that a simulation interrupted after a checkpoint and then
+    resumed from that checkpoint is bitwise-identical to the same simulation
+    run uninterrupted.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np, pytest
+    from betse.science import filehandling as fh
+    from betse.science.parameters import Parameters
+    from betse.science.phase.phasecallbacks import SimCallbacksNoop
+    from betse.science.sim import _TIME_SERIES_NAMES
+    from betse.science.simrunner import SimRunner
+    from betse.util.path import files
+
+    class _SimInterruptedException(Exception):
+        '''
+        Exception simulating an interruption of the simulation phase.
+        '''
+
+        pass
+
+
+    class _SimCallbacksInterrupting(SimCallbacksNoop):
+        '''
+        Callbacks interrupting the simulation phase immediately *before*
+        sampling the passed number of sampled time steps.
+        '''
+
+        def __init__(self, sample_count: int) -> None:
+            super().__init__()
+            self._sample_count = sample_count
+
+        def progressed_next(self, *args, **kwargs) -> None:
+            self._sample_count -= 1
+            if not self._sample_count:
+                raise _SimInterruptedException()
+
+    # Minified simulation configuration sampling eight time steps and
+    # checkpointing every three sampled time steps, saved and reloaded to
+    # apply this minification.
+    betse_sim_conf.p.sim_time_total = betse_sim_conf.p.sim_time_step*8
+    betse_sim_conf.p.checkpoint_interval = 3
+    betse_sim_conf.p.save_inplace()
+    p = Parameters.make(conf_filename=betse_sim_conf.conf_filename)
+
+    with betse_sim_conf.context():
+        # Initialize *BEFORE* simulating, ensuring each simulation below to
+        # start from the same initialization.
+        SimRunner(p=p).init()
+
+        # Simulate uninterrupted.
+        sim_expected = SimRunner(p=p).sim().sim
+        assert not files.is_file(p.sim_checkpoint_filename)
+
+        # Simulate until interrupted immediately before sampling the fifth
+        # time step, after checkpointing the third sampled time step *AND*
+        # writing the fourth sampled time step to its memory-mapped files.
+        with pytest.raises(_SimInterruptedException):
+            SimRunner(
+                p=p, callbacks=_SimCallbacksInterrupting(sample_count=5)).sim()
+        assert files.is_file(p.sim_checkpoint_filename)
+
+        # Assert this checkpoint to reference rather than embed the time
+        # series memory-mapped to files by this simulation.
+        sim_checkpoint, _, _ = fh.loadSim(p.sim_checkpoint_filename)
+        assert len(sim_checkpoint.vm_time) == 3
+        assert sim_checkpoint.vm_time._array_source is not None
+
+        # Resume simulating from this checkpoint.
+        sim_resumed = SimRunner(p=p).sim(resume=True).sim
+        assert not files.is_file(p.sim_checkpoint_filename)
+
+    # Assert all sampled time steps and time series to be bitwise-identical.
+    assert np.array_equal(sim_resumed.time, sim_expected.time)
+    for series_name in _TIME_SERIES_NAMES:
+        series_expected = getattr(sim_expected, series_name, None)
+        if series_expected is not None:
+            series_resumed = getattr(sim_resumed, series_name)
+            assert len(series_resumed) == len(series_expected)
+            assert np.array_equal(
+                np.asarray(series_resumed), np.asarray(series_expected))
+
+    # Assert all final state to be bitwise-identical.
+    for attr_name in ('vm', 'cc_cells', 'cc_at_mem', 'cc_env'):
+        assert np.array_equal(
+            getattr(sim_resumed, attr_name), getattr(sim_expected, attr_name))
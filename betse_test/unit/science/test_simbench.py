@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.simbench` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_bench_compare(betse_temp_dir: 'LocalPath') -> None:
+    '''
+    Unit test the :func:`betse.science.simbench.compare_bench_results`
+    function against results round-tripped through the
+    :func:`betse.science.simbench.write_bench_results` function.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import json, math
+    from betse.science import simbench
+
+    # Baseline results of two runs, the second of which failed to initialize.
+    baseline = simbench.get_bench_header()
+    baseline['runs'] = [
+        {'run': 1, 'parameters': {'a/b': 1, 'c/d': False}, 'status': 'ok',
+         'phases': {
+             'seed': {'seconds': 2.0, 'peak_rss_mb': 100.0},
+             'init': {'seconds': 4.0, 'peak_rss_mb': None},
+         }},
+        {'run': 2, 'parameters': {'a/b': 2, 'c/d': False}, 'status': 'failed',
+         'phases': {'seed': {'seconds': 3.0, 'peak_rss_mb': 120.0}}},
+    ]
+
+    # Round-trip these results through JSON.
+    filename = str(betse_temp_dir.join('bench_baseline.json'))
+    simbench.write_bench_results(filename=filename, results=baseline)
+    with open(filename) as results_file:
+        baseline = json.load(results_file)
+
+    # New results reordering these runs and their parameters, whose first run
+    # has no baseline counterpart.
+    results = {'runs': [
+        {'run': 1, 'parameters': {'c/d': True, 'a/b': 1}, 'status': 'ok',
+         'phases': {'seed': {'seconds': 1.0, 'peak_rss_mb': 50.0}}},
+        {'run': 2, 'parameters': {'c/d': False, 'a/b': 2}, 'status': 'ok',
+         'phases': {
+             'seed': {'seconds': 1.5, 'peak_rss_mb': 60.0},
+             'init': {'seconds': 1.0, 'peak_rss_mb': 70.0},
+         }},
+        {'run': 3, 'parameters': {'c/d': False, 'a/b': 1}, 'status': 'ok',
+         'phases': {
+             'seed': {'seconds': 1.0, 'peak_rss_mb': 100.0},
+             'init': {'seconds': 8.0, 'peak_rss_mb': 90.0},
+         }},
+    ]}
+
+    # Assert only phases run by both results to be compared by parameters.
+    comparison = simbench.compare_bench_results(
+        baseline=baseline, results=results)
+    assert [(row['run'], row['phase']) for row in comparison] == [
+        (2, 'seed'), (3, 'seed'), (3, 'init')]
+    assert comparison[0]['seconds_ratio'] == 0.5
+    assert comparison[0]['peak_rss_mb_ratio'] == 0.5
+    assert comparison[1]['seconds_ratio'] == 0.5
+    assert comparison[1]['peak_rss_mb_ratio'] == 1.0
+    assert comparison[2]['seconds_ratio'] == 2.0
+    assert math.isnan(comparison[2]['peak_rss_mb_ratio'])
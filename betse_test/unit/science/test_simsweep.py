@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.simsweep` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_sweep_grid() -> None:
+    '''
+    Unit test the sweep grid iterators, getters, and setters of the
+    :mod:`betse.science.simsweep` submodule.
+    '''
+
+    # Defer heavyweight imports.
+    from betse.exceptions import BetseSimConfException
+    from betse.science import simsweep
+    from pytest import raises
+
+    # Sweep grid sweeping one initialization and one simulation option.
+    grid = {
+        'init time settings/total time': [1.0, 2.0],
+        'sim time settings/total time': [0.1, 0.2, 0.3],
+    }
+
+    # Assert this grid to be iterated in row-major order.
+    points = list(simsweep.iter_sweep_points(grid))
+    assert len(points) == 6
+    assert points[1] == {
+        'init time settings/total time': 1.0,
+        'sim time settings/total time': 0.2,
+    }
+
+    # Assert this grid to share a seed but *NOT* an initialization.
+    assert simsweep.is_sweep_seed_shareable(grid) is True
+    assert simsweep.is_sweep_init_shareable(grid) is False
+    assert simsweep.is_sweep_init_shareable(
+        {'sim time settings/total time': [0.1]}) is True
+
+    # Assert sweeping any option in a section on which seeds depend *OR* might
+    # depend to reseed each point.
+    for key in (
+        'world options/lattice type',
+        'general options/simulate extracellular spaces',
+        'tissue profile definition/profiles enabled',
+        'cutting event/event happens',
+        'solver options/matrix backend',
+        'variable settings/deformation/turn on',
+        'internal parameters/true cell size',
+        'tissue profile definition/tissue/profiles/0/cell targets/type',
+    ):
+        assert simsweep.is_sweep_seed_shareable({key: [None]}) is False
+
+    # Assert sweeping only individual options on which seeds do *NOT* depend
+    # to share a seed but *NOT* an initialization, even in sections on which
+    # seeds otherwise depend.
+    grid = {
+        'internal parameters/alpha_NaK': [5.0e-8, 1.0e-7],
+        'variable settings/gap junctions/gap junction surface area': [0.1],
+        'tissue profile definition/tissue/profiles/1/diffusion constants/'
+        'Dm_K': [1.0e-18],
+    }
+    assert simsweep.is_sweep_seed_shareable(grid) is True
+    assert simsweep.is_sweep_init_shareable(grid) is False
+
+    # Assert sweep keys to be split on delimiters, indexing sequences.
+    assert simsweep.get_sweep_key_names(
+        'tissue profile definition/tissue/profiles/0/name') == (
+        'tissue profile definition', 'tissue', 'profiles', 0, 'name')
+
+    # Assert options to be set in both nested mappings and sequences.
+    conf = {'a': {'b': 1, 'c': [{'d': 2}]}}
+    simsweep.set_sweep_option(conf=conf, key='a/b', value=3)
+    simsweep.set_sweep_option(conf=conf, key='a/c/0/d', value=4)
+    assert conf == {'a': {'b': 3, 'c': [{'d': 4}]}}
+
+    # Assert undefined options and invalid grids to raise exceptions.
+    with raises(BetseSimConfException):
+        simsweep.set_sweep_option(conf=conf, key='a/e', value=5)
+    with raises(BetseSimConfException):
+        simsweep.set_sweep_option(conf=conf, key='a/c/1/d', value=5)
+    with raises(BetseSimConfException):
+        simsweep.get_sweep_key_names('a//b')
+    with raises(BetseSimConfException):
+        list(simsweep.iter_sweep_points({}))
+    with raises(BetseSimConfException):
+        list(simsweep.iter_sweep_points({'a/b': []}))
+
+
+def test_sweep_summary(betse_temp_dir: 'LocalPath') -> None:
+    '''
+    Unit test the :func:`betse.science.simsweep.write_sweep_summary`
+    function.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import csv
+    from betse.science import simsweep
+    from collections import OrderedDict
+
+    # Metrics of one successful and one failed run.
+    metrics = [
+        OrderedDict((('run', 1), ('status', 'ok'), ('vmem_mean_mV', -50.0))),
+        OrderedDict((('run', 2), ('status', 'failed'))),
+    ]
+
+    # Assert this summary to tabulate the union of all metrics.
+    filename = str(betse_temp_dir.join('sweep_summary.csv'))
+    simsweep.write_sweep_summary(filename=filename, metrics=metrics)
+    with open(filename, newline='') as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert rows == [
+        ['run', 'status', 'vmem_mean_mV'],
+        ['1', 'ok', '-50.0'],
+        ['2', 'failed', ''],
+    ]
+
+
+def test_sweep_run(betse_sim_conf: 'SimConfTestInternal') -> None:
+    '''
+    Functional test of the :func:`betse.science.simsweep.sweep` function
+    simulating two-point sweeps of the minified simulation configuration that
+    share a single seed and initialization, share only a single seed, or share
+    neither.
+
+    Parameters
+    ----------
+    betse_sim_conf : SimConfTestInternal
+        Object encapsulating a temporary simulation configuration file.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science import filehandling as fh
+    from betse.science import simsweep
+    from betse.science.parameters import Parameters
+    from betse.util.path import files, pathnames
+
+    # Minified base configuration, saved and reloaded to apply this
+    # minification.
+    betse_sim_conf.p.save_inplace()
+    p = Parameters.make(conf_filename=betse_sim_conf.conf_filename)
+
+    # Simulation durations swept below.
+    sim_time_total = float(p.conf['sim time settings']['total time'])
+    sim_times_total = [sim_time_total, 2*sim_time_total]
+
+    # Sweep only the simulation duration, sharing a seed and initialization.
+    sweep_dirname = pathnames.join(p.conf_dirname, 'SWEEP_SHARED')
+    with betse_sim_conf.context():
+        metrics = simsweep.sweep(
+            p=p,
+            grid={'sim time settings/total time': sim_times_total},
+            sweep_dirname=sweep_dirname,
+            jobs=1,
+        )
+
+    # Assert the shared seed and initialization to have been run once.
+    p_base = Parameters.make(pathnames.join(
+        sweep_dirname, 'base', p.conf_basename))
+    assert files.is_file(p_base.seed_pickle_filename)
+    assert files.is_file(p_base.init_pickle_filename)
+
+    # Assert each point to have simulated its own duration from copies of
+    # this seed and initialization.
+    assert [point_metrics['status'] for point_metrics in metrics] == [
+        'ok', 'ok']
+    sim_times_sampled = []
+    for point_index, point_metrics in enumerate(metrics):
+        assert point_metrics['sim time settings/total time'] == (
+            sim_times_total[point_index])
+        p_point = Parameters.make(pathnames.join(
+            sweep_dirname, 'run_{:03d}'.format(point_index + 1),
+            p.conf_basename))
+        assert files.is_file(p_point.init_pickle_filename)
+        sim, _, _ = fh.loadSim(p_point.sim_pickle_filename)
+        sim_times_sampled.append(len(sim.time))
+
+        # Assert the time series of this copied initialization to load from
+        # this point's copy of the files persisting those series.
+        sim_init, _, _ = fh.loadSim(p_point.init_pickle_filename)
+        vm_time_init = np.asarray(sim_init.vm_time)
+        assert len(vm_time_init) == len(sim_init.time) > 0
+    assert sim_times_sampled[1] > sim_times_sampled[0]
+
+    # Sweep the Na-K-ATPase pump rate, on which initializations but *NOT*
+    # seeds depend, sharing only a seed.
+    sweep_dirname = pathnames.join(p.conf_dirname, 'SWEEP_SEED_SHARED')
+    with betse_sim_conf.context():
+        metrics = simsweep.sweep(
+            p=p,
+            grid={'internal parameters/alpha_NaK': [5.0e-8, 1.0e-7]},
+            sweep_dirname=sweep_dirname,
+            jobs=1,
+        )
+
+    # Assert the shared seed to have been run once *AND* each point to have
+    # been initialized from its own copy of this seed.
+    p_base = Parameters.make(pathnames.join(
+        sweep_dirname, 'base', p.conf_basename))
+    assert files.is_file(p_base.seed_pickle_filename)
+    assert not files.is_file(p_base.init_pickle_filename)
+    assert [point_metrics['status'] for point_metrics in metrics] == [
+        'ok', 'ok']
+    for point_index in range(2):
+        p_point = Parameters.make(pathnames.join(
+            sweep_dirname, 'run_{:03d}'.format(point_index + 1),
+            p.conf_basename))
+        assert files.is_file(p_point.seed_pickle_filename)
+        assert files.is_file(p_point.init_pickle_filename)
+        assert files.is_file(p_point.sim_pickle_filename)
+
+    # Sweep a world option, on which seeds depend.
+    sweep_dirname = pathnames.join(p.conf_dirname, 'SWEEP_UNSHARED')
+    with betse_sim_conf.context():
+        metrics = simsweep.sweep(
+            p=p,
+            grid={'world options/lattice disorder': [0.3, 0.4]},
+            sweep_dirname=sweep_dirname,
+            jobs=1,
+        )
+
+    # Assert each point to have been seeded and initialized independently.
+    assert not files.is_file(pathnames.join(
+        sweep_dirname, 'base', p.conf_basename))
+    assert [point_metrics['status'] for point_metrics in metrics] == [
+        'ok', 'ok']
+    for point_index in range(2):
+        p_point = Parameters.make(pathnames.join(
+            sweep_dirname, 'run_{:03d}'.format(point_index + 1),
+            p.conf_basename))
+        assert files.is_file(p_point.seed_pickle_filename)
+        assert files.is_file(p_point.sim_pickle_filename)
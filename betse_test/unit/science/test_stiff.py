@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.stiff` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_stiff_steppers() -> None:
+    '''
+    Unit test that the integrators of the :mod:`betse.science.math.stiff`
+    submodule stably and accurately advance a stiff linear system by time steps
+    far exceeding the stability limit of explicit Euler.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np
+    from betse.science.math import stiff
+    from scipy import sparse
+    from scipy.linalg import expm
+
+    # Stiff reaction "A -> B -> 0" in two cells, whose first rate constant
+    # limits explicit Euler to time steps smaller than 2/1000 seconds.
+    rates = np.array(((-1000.0, 0.0), (1000.0, -1.0)))
+    jac_matrix = sparse.csc_matrix(np.kron(rates, np.eye(2)))
+    y_old = np.array((1.0, 0.5, 0.0, 0.0))
+    dt = 0.05
+
+    def func(y):
+        return jac_matrix.dot(y)
+
+    def jac(y):
+        return jac_matrix
+
+    # Exact solution of this system over this time step.
+    y_exact = expm(dt*jac_matrix.toarray()).dot(y_old)
+
+    # Assert the adaptive BDF integrator approximates this solution to within
+    # its default tolerances.
+    assert np.allclose(
+        stiff.step_bdf(func, jac, y_old, dt), y_exact, rtol=1.0e-3, atol=1.0e-6)
+
+    # Assert the single-step Rosenbrock integrator damps the fast component and
+    # approximates the slow component to within its truncation error.
+    assert np.allclose(
+        stiff.step_rosenbrock(func, jac, y_old, dt), y_exact, atol=2.0e-2)
+
+    # Assert the Rosenbrock integrator remains stable for arbitrarily large
+    # time steps, decaying towards the steady state.
+    y_new = stiff.step_rosenbrock(func, jac, y_old, 1.0e3)
+    assert np.all(np.abs(y_new) < 1.0e-2)
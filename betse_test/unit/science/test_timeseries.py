@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                           )--------------------
+# Copyright 2014-2022 by Alexis Pietak & Cecil Curry.
+# See "LICENSE" for further details.
+
+'''
+Unit tests for the :mod:`betse.science.math.timeseries` submodule.
+'''
+
+# ....................{ TESTS                             }....................
+def test_time_series_memory() -> None:
+    '''
+    Unit test the :class:`betse.science.math.timeseries.TimeSeries` class
+    retained in memory, including growth beyond its preallocated capacity and
+    degradation into a list on appending arrays of differing shapes.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np, pickle
+    from betse.science.math.timeseries import TimeSeries
+
+    # Arrays to be appended, exceeding the preallocated capacity below.
+    arrays = [np.arange(4.0) + i for i in range(5)]
+
+    # Assert appended arrays are copied and the capacity grows as needed.
+    series = TimeSeries(capacity=2)
+    for array in arrays:
+        series.append(array)
+    arrays[0][0] = -1.0
+    assert len(series) == 5
+    assert series[0][0] == 0.0
+    assert np.array_equal(series[-1], arrays[-1])
+    assert np.array_equal(np.asarray(series)[1:], np.asarray(arrays)[1:])
+
+    # Assert pickling preserves only the used rows.
+    series_unpickled = pickle.loads(pickle.dumps(series))
+    assert np.array_equal(np.asarray(series_unpickled), np.asarray(series))
+    series_unpickled.append(arrays[1])
+    assert len(series_unpickled) == 6
+
+    # Assert appending an array of differing shape degrades into a list.
+    series.append(np.zeros(2))
+    assert len(series) == 6
+    assert np.array_equal(series[1], arrays[1])
+    assert series[-1].shape == (2,)
+
+
+def test_time_series_memmap(betse_temp_dir: 'LocalPath') -> None:
+    '''
+    Unit test the :class:`betse.science.math.timeseries.TimeSeries` class
+    memory-mapped to a temporary file.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np, pickle
+    from betse.science.math.timeseries import TimeSeries
+
+    # Memory-mapped time series, grown beyond its preallocated capacity.
+    filename = str(betse_temp_dir.join('vm_time.mmap'))
+    series = TimeSeries(capacity=2, filename=filename)
+    arrays = [np.linspace(0.0, 1.0, 1000)*i for i in range(3)]
+    for array in arrays:
+        series.append(array)
+
+    # Assert pickling excludes this storage, which is then remapped.
+    series_pickled = pickle.dumps(series)
+    assert len(series_pickled) < arrays[0].nbytes*len(arrays)
+    series_unpickled = pickle.loads(series_pickled)
+    assert np.array_equal(np.asarray(series_unpickled), np.asarray(arrays))
+
+
+def test_time_series_save(betse_temp_dir: 'LocalPath') -> None:
+    '''
+    Unit test the :meth:`betse.science.math.timeseries.TimeSeries.save`
+    method, including lazily loading saved time series on first access after
+    unpickling.
+
+    Parameters
+    ----------
+    betse_temp_dir : LocalPath
+        Object encapsulating a temporary directory isolated to this test.
+    '''
+
+    # Defer heavyweight imports.
+    import numpy as np, pickle
+    from betse.exceptions import BetseSimException
+    from betse.science.math.timeseries import TimeSeries
+    from pytest import raises
+
+    # Memory-mapped time series to be saved.
+    filename_mapped = str(betse_temp_dir.join('vm_time.mmap'))
+    series = TimeSeries(capacity=4, filename=filename_mapped)
+    arrays = [np.linspace(0.0, 1.0, 1000)*i for i in range(3)]
+    for array in arrays:
+        series.append(array)
+
+    # Assert saving describes this file and removes the redundant raw file.
+    filename = str(betse_temp_dir.join('vm_time.npy'))
+    assert series.save(filename) == {
+        'file': 'vm_time.npy', 'dtype': '<f8', 'shape': [3, 1000]}
+    assert betse_temp_dir.join('vm_time.mmap').check() is False
+
+    # Assert pickling excludes this storage, which is then lazily loaded.
+    series_pickled = pickle.dumps(series)
+    assert len(series_pickled) < arrays[0].nbytes
+    series_unpickled = pickle.loads(series_pickled)
+    assert series_unpickled._array is None
+    assert np.array_equal(series_unpickled[-1], arrays[-1])
+    assert np.array_equal(np.asarray(series_unpickled), np.asarray(arrays))
+
+    # Assert lazily loading a removed file raises a human-readable exception.
+    series_unpickled = pickle.loads(series_pickled)
+    betse_temp_dir.join('vm_time.npy').remove()
+    with raises(BetseSimException):
+        series_unpickled[0]
@@ -64,6 +64,32 @@ def pytest_addoption(parser: '_pytest.config.Parser') -> None:
         :mod:`argparse` API.
     '''
 
+    # Boolean options (i.e., options accepting no arguments), disabled unless
+    # explicitly passed.
+    parser.addoption(
+        '--bench',
+        dest='is_bench',
+        action='store_true',
+        help=(
+            'run all benchmarks defined by the "betse_test.bench" subpackage, '
+            'skipped by default'
+        ),
+    )
+
+    # String argument options (i.e., options requiring a string argument),
+    # disabled unless explicitly passed.
+    parser.addoption(
+        '--bench-dir',
+        dest='bench_dirname',
+        default=None,
+        help=(
+            'directory to which benchmarks enabled by "--bench" save their '
+            'results, preserving these results across test sessions '
+            '(defaults to temporary directories discarded by pytest)'
+        ),
+        metavar='DIRNAME',
+    )
+
     #FIXME: Sample option specification preserved entirely for posterity.
     # # String argument options (i.e., options requiring a string argument),
     # # disabled unless explicitly passed.
@@ -79,8 +105,6 @@ def pytest_addoption(parser: '_pytest.config.Parser') -> None:
     #     metavar='DIRNAME',
     # )
 
-    pass
-
 # ....................{ HOOKS ~ session : start           }....................
 def pytest_sessionstart(session: '_pytest.main.Session') -> None:
     '''